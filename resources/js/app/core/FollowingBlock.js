@@ -2,6 +2,7 @@ import { uniqId } from "../helpers/utils.js";
 import OneMarkup, { OneMarkupModel } from "./OneMarkup.js";
 import OneDOM from "./OneDOM.js";
 import { ViewState } from "./ViewState.js";
+import { patchKeyedRows } from "./KeyedList.js";
 
 
 export class FollowingBlock {
@@ -89,10 +90,16 @@ export class FollowingBlock {
         this.engine.onFollowUpdating();
         try {
             this.unmounted();
-            this.clear();
             if (this.closeTag && this.closeTag.parentNode) {
-                OneDOM.before(this.closeTag, this.rerender());
+                const content = this.rerender();
+                // Keyed list (App.View.foreachKeyed): chỉ các hàng thay đổi được thay trong DOM
+                if (!patchKeyedRows(this.openTag, this.closeTag, content)) {
+                    this.clear();
+                    OneDOM.before(this.closeTag, content);
+                }
                 this.mounted();
+            } else {
+                this.clear();
             }
         } catch (e) {
             console.error('FollowingBlock renew error:', e);
@@ -0,0 +1,114 @@
+import OneDOM from "./OneDOM.js";
+
+// Marker của từng hàng do App.View.foreachKeyed sinh ra
+const ROW_OPEN_PATTERN = /^\s*\[one:row key="([^"]*)"\]\s*$/;
+const ROW_CLOSE_PATTERN = /^\s*\[\/one:row key="([^"]*)"\]\s*$/;
+
+const isBlankText = node => node.nodeType === Node.TEXT_NODE && !node.textContent.trim();
+
+const rowKeyOf = (node, pattern) => {
+    if (node.nodeType !== Node.COMMENT_NODE) {
+        return null;
+    }
+    const match = pattern.exec(node.data);
+    return match ? match[1] : null;
+};
+
+/**
+ * Tách các node anh em thành các hàng có key
+ * @param {Node[]} nodes
+ * @returns {Array<{key: string, nodes: Node[]}>|null} null nếu có node nằm ngoài hàng hoặc key bị trùng
+ */
+function collectRows(nodes) {
+    const rows = [];
+    const keys = new Set();
+    let i = 0;
+    while (i < nodes.length) {
+        const node = nodes[i];
+        if (isBlankText(node)) {
+            i++;
+            continue;
+        }
+        const key = rowKeyOf(node, ROW_OPEN_PATTERN);
+        if (key === null || keys.has(key)) {
+            return null;
+        }
+        let end = i + 1;
+        while (end < nodes.length && rowKeyOf(nodes[end], ROW_CLOSE_PATTERN) !== key) {
+            end++;
+        }
+        if (end >= nodes.length) {
+            return null;
+        }
+        keys.add(key);
+        rows.push({ key, nodes: nodes.slice(i, end + 1) });
+        i = end + 1;
+    }
+    return rows;
+}
+
+const serializeNodes = nodes => nodes.map(node => {
+    if (node.nodeType === Node.ELEMENT_NODE) {
+        return node.outerHTML;
+    }
+    if (node.nodeType === Node.COMMENT_NODE) {
+        return `<!--${node.data}-->`;
+    }
+    return node.textContent;
+}).join('');
+
+const nextContentNode = node => {
+    while (node && isBlankText(node)) {
+        node = node.nextSibling;
+    }
+    return node;
+};
+
+/**
+ * Cập nhật nội dung giữa openTag và closeTag bằng html mới theo key của từng hàng:
+ * hàng có cùng key và cùng nội dung giữ nguyên DOM node (chỉ di chuyển nếu đổi vị trí),
+ * hàng mới hoặc đã thay đổi được chèn, hàng không còn bị xoá.
+ * @param {Comment} openTag
+ * @param {Comment} closeTag
+ * @param {string} html nội dung mới của block
+ * @returns {boolean} false nếu nội dung không phải keyed list (caller thay toàn bộ block)
+ */
+export function patchKeyedRows(openTag, closeTag, html) {
+    if (typeof html !== 'string' || !html.includes('[one:row ') || !openTag || openTag.parentNode !== closeTag.parentNode) {
+        return false;
+    }
+    const currentNodes = [];
+    for (let node = openTag.nextSibling; node && node !== closeTag; node = node.nextSibling) {
+        currentNodes.push(node);
+    }
+    const fragment = OneDOM.toFragment(html);
+    const newRows = collectRows(Array.from(fragment.childNodes));
+    const oldRows = collectRows(currentNodes);
+    if (!newRows || !oldRows) {
+        return false;
+    }
+
+    const oldByKey = new Map(oldRows.map(row => [row.key, row]));
+    const placed = newRows.map(row => {
+        const old = oldByKey.get(row.key);
+        if (old && serializeNodes(old.nodes) === serializeNodes(row.nodes)) {
+            oldByKey.delete(row.key);
+            return { nodes: old.nodes, reused: true };
+        }
+        return { nodes: row.nodes, reused: false };
+    });
+    oldByKey.forEach(row => row.nodes.forEach(node => node.parentNode && node.parentNode.removeChild(node)));
+
+    const parent = closeTag.parentNode;
+    let cursor = nextContentNode(openTag.nextSibling);
+    placed.forEach(({ nodes, reused }) => {
+        if (reused && nodes[0] === cursor) {
+            cursor = nextContentNode(nodes[nodes.length - 1].nextSibling);
+            return;
+        }
+        nodes.forEach(node => parent.insertBefore(node, cursor || closeTag));
+    });
+    return true;
+}
+
+export default patchKeyedRows;
@@ -1851,6 +1851,32 @@ export class View {
         return result;
     };
 
+    /**
+     * Keyed foreach: như foreach nhưng mỗi hàng được đánh dấu bằng key,
+     * khi block chứa list render lại chỉ các hàng thay đổi bị chèn/di chuyển/xoá (xem KeyedList.js)
+     * @param {Array|Object} items - Items to iterate
+     * @param {Function} keyOf - Key của hàng, cùng tham số với callback
+     * @param {Function} callback - Callback function
+     * @returns {string} Rendered content
+     */
+    foreachKeyed(items, keyOf, callback) {
+        if (!items) return '';
+
+        let result = '';
+        const renderRow = (value, key) => {
+            const rowKey = this.escString(keyOf(value, key));
+            result += `<!-- [one:row key="${rowKey}"] -->${callback(value, key)}<!-- [/one:row key="${rowKey}"] -->`;
+        };
+
+        if (Array.isArray(items)) {
+            items.forEach((item, index) => renderRow(item, index));
+        } else if (typeof items === 'object') {
+            Object.entries(items).forEach(([key, value]) => renderRow(value, key));
+        }
+
+        return result;
+    };
+
 
     /**
   * Get route URL
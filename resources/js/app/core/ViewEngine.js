@@ -972,6 +972,22 @@ export class ViewEngine {
         return this.renderFollowingBlock(stateKeys, renderBlock);
     }
 
+    /**
+     * Block do compiler sinh ra (reactive blocks) cho một biểu thức đọc state
+     * @param {string[]} stateKeys danh sách các state keys mà biểu thức đọc
+     * @param {() => string} renderBlock hàm render block
+     * @returns {string} kết quả của việc render block
+     * @example
+     * <AppViewEngine>.__reactive(["count"], () => `${App.View.escString(count)}`);
+     */
+    __reactive(stateKeys = [], renderBlock = () => '') {
+        // HTML từ server không có marker cho các block này: chỉ chạy renderBlock khi scan
+        if (this.isVirtualRendering) {
+            return renderBlock();
+        }
+        return this.renderFollowingBlock(stateKeys, renderBlock);
+    }
+
 
 
     /**
@@ -1,20 +1,31 @@
 #!/usr/bin/env python3
 """
 Blade Template Builder
-Usage: python3 build.py
+Usage: python3 build.py [--jobs N] [--no-cache] [--clear-cache] [--watch] [--shared-wrapper]
 """
 
 import os
 import sys
 import json
+import time
 import shutil
+import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Import the compiler from the modular architecture
 # Using the new modular compiler
 try:
-    from compile import compile_blade_to_js
+    from compile import compile_blade_to_js, compile_many, blade_compiler
     from compiler.config import CompilerConfig
+    from compiler.build_cache import BuildCache, write_file_if_changed
+    from compiler.dependency_graph import ViewDependencyGraph
+    from compiler.staged_output import StagedOutputDirectory
+    from compiler.build_report import BuildReport
+    from tracing import StatsAggregator, ChromeTraceExporter, MultiTracer
+    from wrapper_parser import WrapperParser, build_shared_wrapper_module, SHARED_WRAPPER_FILE
+    from main_compiler import SYSTEM_DATA_DECLARATION, build_view_file_content
     config = CompilerConfig()
     print("✓ Using modular Blade compiler")
 except ImportError as e:
@@ -39,7 +50,7 @@ def convert_path_to_view_name(file_path, views_root_path):
     
     return view_name
 
-def scan_directory(root_path):
+def scan_directory(root_path, verbose=True):
     """
     Recursively scan directory for .blade.php files
     Returns list of blade file paths (excluding files starting with *)
@@ -52,7 +63,8 @@ def scan_directory(root_path):
                 # Skip files starting with asterisk (special files)
                 # Files starting with underscore (_) will be compiled
                 if file.startswith('*'):
-                    print(f"Skipping special file: {file}")
+                    if verbose:
+                        print(f"Skipping special file: {file}")
                     continue
                     
                 file_path = os.path.join(root, file)
@@ -76,6 +88,136 @@ def compile_blade_file(file_path, root_path):
         print(f"Error compiling {file_path}: {str(e)}")
         return None
 
+# Compiler instance owned by each worker process in --jobs mode
+_worker_compiler = None
+
+def _init_compile_worker(collect_stats=False, shared_wrapper=None, reactive_blocks=False, infer_foreach_keys=False):
+    """
+    Create one BladeCompiler per worker process
+    """
+    global _worker_compiler
+    from compiler import BladeCompiler
+    _worker_compiler = BladeCompiler()
+    _worker_compiler.collect_stats = collect_stats
+    _worker_compiler.shared_wrapper = shared_wrapper
+    _worker_compiler.reactive_blocks = reactive_blocks
+    _worker_compiler.infer_foreach_keys = infer_foreach_keys
+
+def _compile_view_chunk(chunk):
+    """
+    Compile a chunk of (file_path, view_name, blade_code) jobs inside a worker process
+    Returns [(view_name, compiled_js, error, stats), ...] in chunk order
+    """
+    views = ((view_name, blade_code) for _, view_name, blade_code in chunk)
+    return [(view_name, view_data, error, _worker_compiler.last_stats)
+            for view_name, view_data, error in _worker_compiler.compile_many(views)]
+
+def read_view_source(file_path):
+    """
+    Read a blade file, returns (content, error)
+    """
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return f.read(), None
+    except Exception as e:
+        return None, str(e)
+
+def compile_view_jobs(jobs, workers=1, collect_stats=False):
+    """
+    Compile (file_path, view_name, blade_code) jobs
+    Yields (file_path, view_name, compiled_js, error, stats) in the same order as jobs,
+    so the output is identical whether the build runs in one or many processes
+    With one worker, jobs is consumed lazily: one job is taken per result
+    stats is BladeCompiler.last_stats when collect_stats is set, None otherwise
+    """
+    if workers > 1:
+        jobs = list(jobs)
+    if workers <= 1 or len(jobs) <= 1:
+        file_paths = deque()
+        
+        def views():
+            for file_path, view_name, blade_code in jobs:
+                file_paths.append(file_path)
+                yield view_name, blade_code
+        
+        blade_compiler.collect_stats = collect_stats
+        for view_name, view_data, error in compile_many(views()):
+            file_path = file_paths.popleft()
+            if error:
+                print(f"Error compiling {file_path}: {error}")
+            yield file_path, view_name, view_data, error, blade_compiler.last_stats if collect_stats else None
+        return
+
+    workers = min(workers, len(jobs))
+    chunksize = max(1, len(jobs) // (workers * 4))
+    chunks = [jobs[i:i + chunksize] for i in range(0, len(jobs), chunksize)]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_compile_worker,
+                             initargs=(collect_stats, blade_compiler.shared_wrapper, blade_compiler.reactive_blocks,
+                                       blade_compiler.infer_foreach_keys)) as executor:
+        # executor.map keeps submission order, results are gathered deterministically
+        results = (result for chunk_results in executor.map(_compile_view_chunk, chunks) for result in chunk_results)
+        for (file_path, _, _), (view_name, view_data, error, stats) in zip(jobs, results):
+            if error:
+                print(f"Error compiling {file_path}: {error}")
+            yield file_path, view_name, view_data, error, stats
+
+def compile_views(jobs, workers=1, cache=None, graph=None, report=None):
+    """
+    Compile (file_path, view_name) jobs, serving unchanged views from the build cache
+    Yields (file_path, view_name, compiled_js, error, from_cache) in job order
+    References of every view read are recorded in graph (ViewDependencyGraph) if given,
+    stage timings, sizes and errors in report (BuildReport) if given
+    
+    With one worker, sources are read one at a time as results are consumed, so memory
+    does not grow with the number of views; --jobs needs every pending source up front.
+    """
+    def prepare():
+        for file_path, view_name in jobs:
+            blade_code, error = read_view_source(file_path)
+            if blade_code is not None and graph is not None:
+                graph.set_view(view_name, blade_code)
+            cached = None
+            if blade_code is not None and cache is not None:
+                cached = cache.get(view_name, blade_code)
+            yield file_path, view_name, blade_code, error, cached
+    
+    if workers > 1:
+        prepared = list(prepare())
+        compiled = compile_view_jobs([(file_path, view_name, blade_code)
+                                      for file_path, view_name, blade_code, _, cached in prepared
+                                      if blade_code is not None and cached is None], workers, report is not None)
+    else:
+        prepared = prepare()
+        pending = deque()
+        
+        def pending_jobs():
+            # Mỗi job được đưa vào ngay trước khi lấy kết quả của nó
+            while pending:
+                yield pending.popleft()
+        
+        compiled = compile_view_jobs(pending_jobs(), workers, report is not None)
+    
+    for file_path, view_name, blade_code, error, cached in prepared:
+        if blade_code is None:
+            print(f"Error reading {file_path}: {error}")
+            if report is not None:
+                report.record(view_name, file_path, error=error)
+            yield file_path, view_name, None, error, False
+        elif cached is not None:
+            if report is not None:
+                report.record(view_name, file_path, len(blade_code.encode('utf-8')), len(cached.encode('utf-8')), cached=True)
+            yield file_path, view_name, cached, None, True
+        else:
+            if workers <= 1:
+                pending.append((file_path, view_name, blade_code))
+            _, _, view_data, error, stats = next(compiled)
+            if view_data and cache is not None:
+                cache.put(view_name, blade_code, view_data)
+            if report is not None:
+                report.record(view_name, file_path, len(blade_code.encode('utf-8')),
+                              len(view_data.encode('utf-8')) if view_data else 0, stats, error=error)
+            yield file_path, view_name, view_data, error, False
+
 def build_scope_file(scope, compiled_views, scopes_dir):
     """
     Build a single scope file with new object structure
@@ -107,74 +249,104 @@ def build_scope_file(scope, compiled_views, scopes_dir):
         print(f"Error writing to {scope_file}: {str(e)}")
         return False
 
-def build_individual_view_files(compiled_views, blade_files_data):
+def get_views_dir():
     """
-    Build individual view files for each compiled view
+    Directory receiving one JS file per compiled view
+    """
+    return os.path.join(config.js_input_path, 'views')
+
+def get_views_staging_dir():
+    """
+    Staging directory for view files of the running build (published into get_views_dir() at the end)
+    """
+    return os.path.join(config.get_build_output_path(), '.views-staging')
+
+def get_shared_wrapper_specifier():
+    """
+    Import specifier of the shared wrapper module, relative to the view files
+    """
+    return f'./{SHARED_WRAPPER_FILE}'
+
+def build_shared_wrapper_content():
+    """
+    Shared wrapper module generated from wraper.js (views import it in --shared-wrapper mode)
+    """
+    function_content, config_content = WrapperParser().parse_wrapper_file(config.get_wrapper_template_path())
+    return build_shared_wrapper_module(function_content, config_content, SYSTEM_DATA_DECLARATION)
+
+def get_view_template_path():
+    """
+    Path of the generated ViewTemplate.js importer
+    """
+    return os.path.join(config.js_input_path, 'core', 'ViewTemplate.js')
+
+class ViewFileWriter:
+    """
+    Stages each view file as soon as the view is compiled; views_dir is only touched by finish()
+    Only (view_name, function_name, path) of written views is kept, the compiled code is not
     """
-    # Create views directory if it doesn't exist
-    views_dir = os.path.join(config.js_input_path, 'views')
-    
-    # Clean views directory before building
-    if os.path.exists(views_dir):
-        shutil.rmtree(views_dir)
-        print(f"✓ Cleaned views directory: {views_dir}")
-    
-    os.makedirs(views_dir, exist_ok=True)
-    
-    created_files = []
     
-    for view_name, view_function in compiled_views.items():
+    def __init__(self, views_dir=None, staging_dir=None, shared_wrapper=None):
+        self.views_dir = views_dir or get_views_dir()
+        self.output = StagedOutputDirectory(self.views_dir, staging_dir or get_views_staging_dir())
+        self.created_files = []
+        # view_name -> index in created_files (a view compiled twice keeps one import)
+        self.positions = {}
+        self.failed = False
+        if shared_wrapper is not None:
+            # Module wrapper dùng chung được publish cùng các view file, không có trong ViewTemplate.js
+            self.output.write(SHARED_WRAPPER_FILE, shared_wrapper)
+    
+    def write(self, view_name, view_function):
+        """
+        Stage one view file, returns its (view_name, function_name, path) entry or None on error
+        """
         # Convert view name to function name (e.g., web.home -> WebHome)
         function_name = convert_view_name_to_function_name(view_name)
-        
-        # Create individual view file
-        view_file_path = os.path.join(views_dir, f'{function_name}.js')
-        
-        # Build file content
-        file_content = ""
-        
-        # Check if view_function starts with setup script (import statements)
-        if view_function.strip().startswith('import '):
-            # Split setup script and function
-            lines = view_function.split('\n')
-            setup_lines = []
-            function_lines = []
-            in_function = False
-            
-            for line in lines:
-                if line.strip().startswith('export function ') and not in_function:
-                    in_function = True
-                    # Keep the export function line as is
-                    function_lines.append(line)
-                elif in_function:
-                    function_lines.append(line)
-                else:
-                    # Only add non-empty lines to setup
-                    if line.strip():
-                        setup_lines.append(line)
-            
-            # Add setup script first (without export)
-            if setup_lines:
-                file_content += '\n'.join(setup_lines) + '\n\n'
-            
-            # Add function (already has export)
-            function_content = '\n'.join(function_lines)
-            file_content += function_content
-        else:
-            # Handle files without setup script - use as is (already has export)
-            file_content += view_function
-        
-        # Write file
+        file_name = f'{function_name}.js'
         try:
-            with open(view_file_path, 'w', encoding='utf-8') as f:
-                f.write(file_content)
-            created_files.append((view_name, function_name, view_file_path))
-            print(f"Created view file: {function_name}.js")
+            self.output.write(file_name, build_view_file_content(view_function))
         except Exception as e:
-            print(f"Error writing {view_file_path}: {str(e)}")
+            print(f"Error writing {view_name}: {str(e)}")
+            self.failed = True
+            return None
+        entry = (view_name, function_name, self.output.target_path(file_name))
+        if view_name in self.positions:
+            self.created_files[self.positions[view_name]] = entry
+        else:
+            self.positions[view_name] = len(self.created_files)
+            self.created_files.append(entry)
+        return entry
+    
+    def finish(self):
+        """
+        Publish changed view files into views_dir (files with identical content are not touched)
+        Returns the created file entries, False if any view file could not be written
+        """
+        if self.failed:
+            self.abort()
             return False
-    
-    return created_files
+        
+        changed = self.output.commit()
+        for file_name in changed:
+            print(f"Created view file: {file_name}")
+        unchanged_count = len(self.created_files) - len(changed)
+        if unchanged_count:
+            print(f"✓ {unchanged_count} view files unchanged")
+        return self.created_files
+    
+    def remove_stale(self):
+        """
+        Remove files of views that no longer exist (after ViewTemplate.js stopped importing them)
+        """
+        for entry in self.output.remove_stale():
+            print(f"Removed stale view file: {entry}")
+    
+    def abort(self):
+        """
+        Discard staged files, leaving the published views untouched
+        """
+        self.output.abort()
 
 def convert_view_name_to_function_name(view_name):
     """
@@ -209,6 +381,7 @@ def convert_view_name_to_function_name(view_name):
 def build_view_template_importer(created_files, output_path):
     """
     Build ViewTemplate.js that imports all individual view files
+    Returns True if the file was rewritten, False if its content was unchanged, None on error
     """
     # Create output directory if it doesn't exist
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
@@ -225,27 +398,22 @@ def build_view_template_importer(created_files, output_path):
         imports.append(f"import {{ {function_name} }} from './{relative_path}';")
         template_assignments.append(f"    '{view_name}': {function_name},")
     
-    # Build file content
-    file_content = "// Auto-generated ViewTemplate.js\n"
-    file_content += "// This file imports all view functions and assigns them to templates\n\n"
-    
-    # Add imports
-    file_content += "\n".join(imports) + "\n\n"
-    
-    # Add template assignment
-    file_content += "export const ViewTemplates = {\n"
-    file_content += "\n".join(template_assignments)
-    file_content += "\n};\n"
+    # Build file content in one join
+    file_content = ''.join([
+        "// Auto-generated ViewTemplate.js\n",
+        "// This file imports all view functions and assigns them to templates\n\n",
+        "\n".join(imports), "\n\n",
+        "export const ViewTemplates = {\n",
+        "\n".join(template_assignments),
+        "\n};\n",
+    ])
     
     # Write file
     try:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(file_content)
-        print(f"Successfully built ViewTemplate.js: {output_path}")
-        return True
+        return write_file_if_changed(output_path, file_content)
     except Exception as e:
         print(f"Error writing to {output_path}: {str(e)}")
-        return False
+        return None
 
 def copy_essential_files_to_build():
     """
@@ -254,22 +422,20 @@ def copy_essential_files_to_build():
     print("\n=== Copying view.templates.js to app/views ===")
     
     # Create views directory if it doesn't exist
-    views_dir = os.path.join(config.js_input_path, 'views')
-    
-    # Clean views directory before copying templates
-    if os.path.exists(views_dir):
-        shutil.rmtree(views_dir)
-        print(f"✓ Cleaned views directory before copying templates: {views_dir}")
-    
+    views_dir = get_views_dir()
     os.makedirs(views_dir, exist_ok=True)
     
     # Copy view.templates.js to resources/js/app/views/templates.js
+    # Other files in views/ are left alone; templates.js is only rewritten (atomically) when it changed
     build_templates = config.get_build_view_templates_output_path()
     app_templates = os.path.join(views_dir, 'templates.js')
     
     if os.path.exists(build_templates):
-        shutil.copy2(build_templates, app_templates)
-        print(f"✓ Copied view.templates.js: {build_templates} -> {app_templates}")
+        with open(build_templates, 'r', encoding='utf-8') as f:
+            if write_file_if_changed(app_templates, f.read()):
+                print(f"✓ Copied view.templates.js: {build_templates} -> {app_templates}")
+            else:
+                print(f"✓ templates.js unchanged: {app_templates}")
     else:
         print(f"✗ Build view.templates.js not found: {build_templates}")
         return False
@@ -357,6 +523,249 @@ def build_main_spa_file():
         print(f"Error writing to {output_path}: {str(e)}")
         return False
 
+def snapshot_view_files(build_directories):
+    """
+    Map every buildable .blade.php file to its (mtime_ns, size), in build scan order
+    """
+    snapshot = {}
+    for dir_path in build_directories:
+        if not os.path.isdir(dir_path):
+            continue
+        for file_path in scan_directory(dir_path, verbose=False):
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue
+            snapshot[file_path] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+class ViewWatcher:
+    """
+    Warm rebuild loop of build.py --watch
+    Polls the build directories, coalesces changes until they settle for `debounce`
+    seconds, then recompiles only the changed views with the in-process compiler
+    """
+    
+    def __init__(self, build_directories, cache, created_files, graph=None, poll_interval=0.05, debounce=0.05):
+        self.build_directories = build_directories
+        self.cache = cache
+        self.graph = graph if graph is not None else ViewDependencyGraph()
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self.wrapper_path = config.get_wrapper_template_path()
+        self.snapshot = snapshot_view_files(build_directories)
+        self.wrapper_stat = self._stat(self.wrapper_path)
+        # view_name -> (view_name, function_name, view_file_path) of views having an output file
+        self.outputs = {entry[0]: entry for entry in created_files}
+    
+    def _stat(self, file_path):
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    def poll(self):
+        """
+        Paths changed, added or removed since the last poll (wraper.js included)
+        """
+        current = snapshot_view_files(self.build_directories)
+        changed = {path for path, state in current.items() if self.snapshot.get(path) != state}
+        changed.update(self.snapshot.keys() - current.keys())
+        self.snapshot = current
+        
+        wrapper_stat = self._stat(self.wrapper_path)
+        if wrapper_stat != self.wrapper_stat:
+            self.wrapper_stat = wrapper_stat
+            changed.add(self.wrapper_path)
+        return changed
+    
+    def run(self):
+        print(f"\n👀 Watching {len(self.snapshot)} views for changes (Ctrl+C to stop)")
+        pending = set()
+        last_change = 0
+        try:
+            while True:
+                time.sleep(self.poll_interval)
+                changed = self.poll()
+                if changed:
+                    pending |= changed
+                    last_change = time.monotonic()
+                elif pending and time.monotonic() - last_change >= self.debounce:
+                    self.rebuild(pending)
+                    pending = set()
+        except KeyboardInterrupt:
+            print("\n🛑 Watch stopped")
+    
+    def rebuild(self, paths):
+        """
+        Recompile the views behind paths and the views depending on them, publish their files
+        through the staged writer and update ViewTemplate.js when a view appeared or disappeared
+        """
+        started = time.perf_counter()
+        shared_wrapper = None
+        
+        if self.wrapper_path in paths:
+            # wraper.js is inlined into every view: drop the parsed copy and recompile all
+            from wrapper_parser import invalidate_wrapper_cache
+            invalidate_wrapper_cache()
+            if self.cache is not None:
+                self.cache = BuildCache(config.get_build_cache_path(), self.wrapper_path, variant=self.cache.variant, config_path=config.config_file)
+            if blade_compiler.shared_wrapper:
+                # Tên được export có thể đổi nên view vẫn phải compile lại
+                shared_wrapper = build_shared_wrapper_content()
+            print("📝 wraper.js changed, recompiling all views")
+            paths = set(self.snapshot)
+        
+        jobs = [(file_path, convert_path_to_view_name(file_path, config.views_input_path))
+                for file_path in self.snapshot if file_path in paths]
+        removed = [file_path for file_path in paths
+                   if file_path not in self.snapshot and file_path != self.wrapper_path]
+        
+        # File được stage rồi publish cùng lúc như full build; view compile lỗi giữ nguyên output cũ
+        writer = ViewFileWriter(shared_wrapper=shared_wrapper)
+        
+        def compile_and_stage(jobs):
+            for file_path, view_name, view_data, error, from_cache in compile_views(jobs, 1, self.cache, self.graph):
+                if not view_data:
+                    # Giữ file output cũ để trang vẫn chạy trong lúc sửa lỗi
+                    print(f"  ✗ {view_name}: compile failed, keeping previous output")
+                    continue
+                writer.write(view_name, view_data)
+        
+        compile_and_stage(jobs)
+        
+        removed_views = [convert_path_to_view_name(file_path, config.views_input_path) for file_path in removed]
+        
+        # View phụ thuộc (extends/include/useBlock) được compile lại cùng view vừa đổi;
+        # graph đã có references mới của các view vừa compile nên view mới thêm cũng được resolve
+        changed_views = [view_name for _, view_name in jobs] + removed_views
+        affected = self.graph.dirty_set(changed_views) - set(changed_views)
+        affected_jobs = []
+        for file_path in self.snapshot:
+            view_name = convert_path_to_view_name(file_path, config.views_input_path)
+            if view_name in affected:
+                affected_jobs.append((file_path, view_name))
+        compile_and_stage(affected_jobs)
+        
+        created_files = writer.finish()
+        if created_files is False:
+            print("  ✗ could not write view files, keeping previous output")
+            created_files = []
+        view_set_changed = False
+        for entry in created_files:
+            if entry[0] not in self.outputs:
+                view_set_changed = True
+            self.outputs[entry[0]] = entry
+        rebuilt = [entry[0] for entry in created_files]
+        
+        stale_files = []
+        for view_name in removed_views:
+            self.graph.remove_view(view_name)
+            entry = self.outputs.pop(view_name, None)
+            if entry is not None:
+                view_set_changed = True
+                stale_files.append(entry)
+        
+        if view_set_changed:
+            if build_view_template_importer(self.ordered_outputs(), get_view_template_path()):
+                print("  ✓ ViewTemplate.js updated")
+        
+        # File của view bị xoá chỉ bị xoá sau khi ViewTemplate.js không còn import chúng
+        for _, function_name, view_file_path in stale_files:
+            if os.path.exists(view_file_path):
+                os.remove(view_file_path)
+            print(f"  - Removed view file: {function_name}.js")
+        
+        try:
+            self.graph.save(config.get_build_view_dependencies_path())
+        except OSError as e:
+            print(f"Warning: could not write dependency graph: {str(e)}")
+        
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if rebuilt:
+            print(f"⚡ Rebuilt {', '.join(rebuilt)} in {elapsed_ms:.0f} ms")
+        if affected_jobs:
+            print(f"  ↳ dependents: {', '.join(view_name for _, view_name in affected_jobs)}")
+    
+    def ordered_outputs(self):
+        """
+        Outputs in scan order, so ViewTemplate.js matches what a full build writes
+        """
+        ordered = []
+        seen = set()
+        for file_path in self.snapshot:
+            view_name = convert_path_to_view_name(file_path, config.views_input_path)
+            if view_name in self.outputs and view_name not in seen:
+                seen.add(view_name)
+                ordered.append(self.outputs[view_name])
+        return ordered
+
+def parse_args(argv=None):
+    """
+    Parse command line arguments
+    """
+    parser = argparse.ArgumentParser(description="Build Blade templates into JavaScript view files")
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=1,
+        help="Number of worker processes used to compile views (0 = one per CPU core, default: 1)"
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help="Recompile every view, ignoring the incremental build cache"
+    )
+    parser.add_argument(
+        '--clear-cache',
+        action='store_true',
+        help="Delete the incremental build cache before building"
+    )
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help="After the build, keep the compiler warm and recompile views as they change"
+    )
+    parser.add_argument(
+        '--report',
+        metavar='FILE',
+        help="Write per-view stage timings, sizes, PHP conversions, cache status and errors to a JSON file"
+    )
+    parser.add_argument(
+        '--trace',
+        metavar='FILE',
+        help="Write a Chrome trace (chrome://tracing, Perfetto) of every compiled view's stages and print stage totals"
+    )
+    parser.add_argument(
+        '--top',
+        type=int,
+        metavar='N',
+        help="Print the N slowest views with their per-stage timings"
+    )
+    parser.add_argument(
+        '--shared-wrapper',
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help=f"Import wraper.js from one shared module ({SHARED_WRAPPER_FILE}) instead of inlining it into every view "
+             "(default: settings.shared_wrapper in compiler.config.json)"
+    )
+    parser.add_argument(
+        '--reactive-blocks',
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Wrap template expressions that read @useState state in reactive blocks re-rendered only when that state changes "
+             "(default: settings.reactive_blocks in compiler.config.json)"
+    )
+    parser.add_argument(
+        '--infer-foreach-keys',
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Compile @foreach loops whose body reads item.id as keyed lists, like an explicit `key:` "
+             "(default: settings.infer_foreach_keys in compiler.config.json)"
+    )
+    return parser.parse_args(argv)
+
 def main():
     """
     Main build function
@@ -364,6 +773,9 @@ def main():
     print("Starting build script...")
     print(f"Arguments: {sys.argv}")
     
+    args = parse_args()
+    workers = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    
     # Get build directories from config
     build_directories = config.get_build_directories()
     
@@ -376,14 +788,48 @@ def main():
     for i, dir_path in enumerate(build_directories, 1):
         print(f"  {i}. {dir_path}")
     
+    if args.trace and workers > 1:
+        # Tracer sống trong process này; worker processes không gửi event về
+        print("--trace: compiling in-process, --jobs ignored")
+        workers = 1
+    
+    if workers > 1:
+        print(f"Parallel build: {workers} worker processes")
+    
+    shared_wrapper = config.shared_wrapper if args.shared_wrapper is None else args.shared_wrapper
+    blade_compiler.shared_wrapper = get_shared_wrapper_specifier() if shared_wrapper else None
+    if shared_wrapper:
+        print(f"Shared wrapper: views import {SHARED_WRAPPER_FILE}")
+    blade_compiler.reactive_blocks = config.reactive_blocks if args.reactive_blocks is None else args.reactive_blocks
+    if blade_compiler.reactive_blocks:
+        print("Reactive blocks: state-dependent expressions re-render per state key")
+    blade_compiler.infer_foreach_keys = config.infer_foreach_keys if args.infer_foreach_keys is None else args.infer_foreach_keys
+    if blade_compiler.infer_foreach_keys:
+        print("Infer foreach keys: @foreach reading item.id renders a keyed list")
+    
+    # Incremental build cache keyed by blade source, wraper.js, output mode and compiler version
+    cache = None
+    if not args.no_cache:
+        variant = [f"shared-wrapper:{blade_compiler.shared_wrapper}"] if shared_wrapper else []
+        if blade_compiler.reactive_blocks:
+            variant.append("reactive-blocks")
+        if blade_compiler.infer_foreach_keys:
+            variant.append("infer-foreach-keys")
+        cache = BuildCache(config.get_build_cache_path(), config.get_wrapper_template_path(), variant=','.join(variant),
+                           config_path=config.config_file)
+        if args.clear_cache:
+            cache.clear()
+            print(f"✓ Cleared build cache: {cache.cache_dir}")
+    
     # Compile all directories
-    all_compiled_views = {}
-    all_blade_files_data = {}
     total_success = 0
     total_files = 0
     
+    # Scan all directories first so views can be fanned out to the worker pool at once
+    directory_jobs = []
+    
     for dir_path in build_directories:
-        print(f"\n=== Building directory: {dir_path} ===")
+        print(f"\n=== Scanning directory: {dir_path} ===")
         
         # Validate directory
         if not os.path.exists(dir_path):
@@ -404,58 +850,105 @@ def main():
         print(f"Found {len(blade_files)} blade files")
         total_files += len(blade_files)
         
-        # Compile all blade files in this directory
-        compiled_views = {}
+        # Convert file path to view name (relative to resources/views)
+        jobs = [(file_path, convert_path_to_view_name(file_path, config.views_input_path)) for file_path in blade_files]
+        directory_jobs.append((dir_path, jobs))
+    
+    all_jobs = [job for _, jobs in directory_jobs for job in jobs]
+    
+    # Dependency graph (extends/include/useBlock) persisted next to the build output
+    graph_path = config.get_build_view_dependencies_path()
+    graph = ViewDependencyGraph.load(graph_path)
+    trace_stats = trace_exporter = None
+    if args.trace:
+        trace_stats, trace_exporter = StatsAggregator(), ChromeTraceExporter()
+        blade_compiler.tracer = MultiTracer(trace_stats, trace_exporter)
+    
+    # Per-view timings are only collected when a report is requested
+    report = BuildReport() if args.report or args.top else None
+    results = compile_views(all_jobs, workers, cache, graph, report)
+    
+    # View files are staged as soon as each view compiles; only their paths are kept
+    writer = ViewFileWriter(shared_wrapper=build_shared_wrapper_content() if shared_wrapper else None)
+    
+    for dir_path, jobs in directory_jobs:
+        print(f"\n=== Building directory: {dir_path} ===")
         success_count = 0
         
-        for file_path in blade_files:
+        for _ in jobs:
+            file_path, view_name, view_data, error, from_cache = next(results)
             print(f"Compiling: {file_path}")
             
-            try:
-                # Convert file path to view name (relative to resources/views)
-                view_name = convert_path_to_view_name(file_path, config.views_input_path)
-                
-                # Read blade code for script extraction
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    blade_code = f.read()
-                
-                # Compile the blade file
-                view_data = compile_blade_file(file_path, config.views_input_path)
-                
-                if view_data:
-                    compiled_views[view_name] = view_data
-                    all_compiled_views[view_name] = view_data
-                    all_blade_files_data[view_name] = blade_code
-                    success_count += 1
-                    total_success += 1
-                    print(f"  -> {view_name} [SUCCESS]")
-                else:
-                    print(f"  -> Failed to compile [ERROR]")
-            except Exception as e:
-                print(f"  -> Exception: {str(e)} [ERROR]")
+            if view_data:
+                success_count += 1
+                total_success += 1
+                print(f"  -> {view_name} [{'CACHED' if from_cache else 'SUCCESS'}]")
+                writer.write(view_name, view_data)
+            else:
+                print(f"  -> Failed to compile [ERROR]")
         
-        print(f"Directory completed: {success_count}/{len(blade_files)} files successfully")
+        print(f"Directory completed: {success_count}/{len(jobs)} files successfully")
     
     print(f"\n=== Overall Results ===")
     print(f"Total compiled: {total_success}/{total_files} files successfully")
+    if cache is not None:
+        removed = cache.prune()
+        print(f"Build cache: {cache.hits} hits, {cache.misses} misses" + (f", {removed} stale entries removed" if removed else ""))
+    
+    if trace_exporter is not None:
+        blade_compiler.tracer = None
+        print(f"\n=== Trace ===")
+        print(trace_stats.format())
+        try:
+            trace_exporter.save(args.trace)
+            print(f"Trace: {args.trace} ({len(trace_exporter.events)} events)")
+        except OSError as e:
+            print(f"Warning: could not write trace {args.trace}: {str(e)}")
+    
+    if report is not None:
+        if args.top:
+            print(f"\n=== Slowest views (top {args.top}) ===")
+            print(report.format_top(args.top))
+        if args.report:
+            try:
+                report.save(args.report)
+                print(f"Build report: {args.report}")
+            except OSError as e:
+                print(f"Warning: could not write build report {args.report}: {str(e)}")
     
-    if all_compiled_views:
-        # Build individual view files
+    graph.retain(view_name for _, view_name in all_jobs)
+    try:
+        graph.save(graph_path)
+        print(f"Dependency graph: {len(graph.views)} views -> {graph_path}")
+    except OSError as e:
+        print(f"Warning: could not write dependency graph {graph_path}: {str(e)}")
+    
+    if total_success:
+        # Publish the view files staged during compilation (only changed files are touched)
         print(f"\n=== Building individual view files ===")
-        created_files = build_individual_view_files(all_compiled_views, all_blade_files_data)
+        created_files = writer.finish()
         
         if created_files:
             # Build ViewTemplate.js that imports all view files
-            view_template_path = os.path.join(config.js_input_path, 'core', 'ViewTemplate.js')
-            if build_view_template_importer(created_files, view_template_path):
-                print(f"ViewTemplate.js built successfully: {view_template_path}")
+            view_template_path = get_view_template_path()
+            written = build_view_template_importer(created_files, view_template_path)
+            if written is not None:
+                if written:
+                    print(f"ViewTemplate.js built successfully: {view_template_path}")
+                else:
+                    print(f"ViewTemplate.js unchanged: {view_template_path}")
+                # Files of removed views go only once ViewTemplate.js no longer imports them
+                writer.remove_stale()
                 
                 print(f"\n✅ Python build completed successfully!")
-                print(f"📦 Total views: {len(all_compiled_views)}")
-                print(f"📄 Views: {list(all_compiled_views.keys())}")
+                print(f"📦 Total views: {len(created_files)}")
+                print(f"📄 Views: {[view_name for view_name, _, _ in created_files]}")
                 print(f"📁 ViewTemplate.js: {view_template_path}")
-                print(f"📁 Individual view files: {os.path.join(config.js_input_path, 'views')}")
+                print(f"📁 Individual view files: {get_views_dir()}")
                 print(f"\n💡 Next step: Run 'npm run compile' to build main.js")
+                
+                if args.watch:
+                    ViewWatcher(build_directories, cache, created_files, graph).run()
             else:
                 print(f"Failed to build ViewTemplate.js!")
                 sys.exit(1)
@@ -463,6 +956,7 @@ def main():
             print(f"Failed to build individual view files!")
             sys.exit(1)
     else:
+        writer.abort()
         print("No files were successfully compiled!")
         sys.exit(1)
 
@@ -18,6 +18,12 @@ def compile_blade_to_js(blade_code, view_name="view"):
     """
     return blade_compiler.compile_blade_to_js(blade_code, view_name)
 
+def compile_many(views):
+    """
+    Compile (view_name, blade_code) pairs, yields (view_name, compiled_js, error)
+    """
+    return blade_compiler.compile_many(views)
+
 def compile_blade_to_js_legacy(blade_code, view_name="view"):
     """
     Legacy wrapper function để tương thích với code cũ
@@ -66,6 +72,7 @@ def main_legacy():
 # Export functions for backward compatibility
 __all__ = [
     'compile_blade_to_js',
+    'compile_many',
     'compile_blade_to_js_legacy', 
     'test_compiler_legacy',
     'main_legacy'
@@ -0,0 +1,267 @@
+"""
+Benchmark compiler trên resources/views và các template tổng hợp (nhiều section, @if lồng sâu, @foreach lớn, nhiều event)
+
+    cd scripts
+    python3 -m compiler.bench                                   # In throughput, peak memory, thời gian từng stage
+    python3 -m compiler.bench --save-baseline bench.json        # Lưu kết quả làm baseline
+    python3 -m compiler.bench --baseline bench.json --threshold 10   # Exit 1 nếu chậm hơn baseline quá 10%
+"""
+
+import os
+import sys
+import json
+import glob
+import time
+import argparse
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from main_compiler import BladeCompiler, COMPILE_STAGES
+from config import CompilerConfig
+
+# Bump khi thay đổi format của file baseline
+BASELINE_FORMAT_VERSION = 1
+
+
+def synthetic_sections(count):
+    """A layout child with count sections"""
+    lines = ["@extends('layouts.base')", "@vars($title = 'Bench', $items = [])"]
+    for i in range(count):
+        lines.append(f"@section('section_{i}')")
+        lines.append(f'    <div class="section-{i}"><h2>{{{{ $title }}}} {i}</h2><p>Static text {i}</p></div>')
+        lines.append("@endsection")
+    return '\n'.join(lines)
+
+
+def synthetic_nested_if(depth):
+    """depth levels of @if/@else"""
+    lines = ["@vars($flags = [], $value = 0)"]
+    for i in range(depth):
+        lines.append('    ' * i + f"@if($flags[{i}] ?? false)")
+        lines.append('    ' * i + f'<div class="level-{i}">{{{{ $value + {i} }}}}')
+    for i in reversed(range(depth)):
+        lines.append('    ' * i + "</div>")
+        lines.append('    ' * i + "@else")
+        lines.append('    ' * i + f"<span>{i}</span>")
+        lines.append('    ' * i + "@endif")
+    return '\n'.join(lines)
+
+
+def synthetic_foreach(body_lines):
+    """One @foreach whose body has body_lines elements"""
+    lines = ["@vars($rows = [])", "<table>", "@foreach($rows as $index => $row)", "<tr>"]
+    for i in range(body_lines):
+        lines.append(f'    <td class="c{i}">{{{{ $row["f{i}"] ?? "" }}}}</td>')
+    lines += ["</tr>", "@endforeach", "</table>"]
+    return '\n'.join(lines)
+
+
+def synthetic_events(count):
+    """count elements with @click/@input/@change event directives"""
+    lines = ["@useState($count, 0)", "@vars($items = [])", "<div>"]
+    for i in range(count):
+        lines.append(f'    <button @click(setCount($count + {i}))>Add {i}</button>')
+        lines.append(f'    <input @input(handleInput($event, {i})) @change(save({i}, $event.target.value))>')
+    lines.append("</div>")
+    return '\n'.join(lines)
+
+
+def synthetic_views(scale=1.0):
+    """(view_name, source) of the synthetic corpus, sizes multiplied by scale"""
+    def n(base):
+        return max(1, int(base * scale))
+    return [
+        (f'bench.sections-{n(1000)}', synthetic_sections(n(1000))),
+        (f'bench.nested-if-{n(40)}', synthetic_nested_if(n(40))),
+        (f'bench.foreach-{n(500)}', synthetic_foreach(n(500))),
+        (f'bench.events-{n(300)}', synthetic_events(n(300))),
+    ]
+
+
+def project_views(views_path):
+    """(view_name, source) of every blade file under views_path"""
+    views = []
+    for file_path in sorted(glob.glob(os.path.join(views_path, '**', '*.blade.php'), recursive=True)):
+        view_name = os.path.relpath(file_path, views_path)[:-len('.blade.php')].replace(os.sep, '.')
+        with open(file_path, 'r', encoding='utf-8') as f:
+            views.append((view_name, f.read()))
+    return views
+
+
+def measure_view(compiler, view_name, source, repeat, memory=True):
+    """Best-of-repeat wall time with the stage breakdown of that run, plus peak traced memory of one extra run"""
+    best = None
+    error = None
+    compiler.collect_stats = True
+    for _ in range(repeat):
+        try:
+            compiler.compile_blade_to_js(source, view_name)
+        except Exception as e:
+            error = str(e)
+        stats = compiler.last_stats
+        if best is None or stats['total'] < best['total']:
+            best = stats
+    compiler.collect_stats = False
+
+    peak = None
+    if memory:
+        tracemalloc.start()
+        try:
+            compiler.compile_blade_to_js(source, view_name)
+        except Exception:
+            pass
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    size = len(source.encode('utf-8'))
+    seconds = best['total']
+    return {
+        'view': view_name,
+        'bytes': size,
+        'ms': round(seconds * 1000, 3),
+        'kb_per_s': round(size / 1024 / seconds, 1) if seconds else None,
+        'peak_kb': round(peak / 1024, 1) if peak is not None else None,
+        'stages_ms': {stage: round(value * 1000, 3) for stage, value in best['stages'].items()},
+        'error': error,
+    }
+
+
+def run_benchmark(views, repeat=5, memory=True, quiet=False):
+    compiler = BladeCompiler()
+    # Warm-up: wraper.js cache, lazy imports, regex cache
+    for view_name, source in views[:1]:
+        try:
+            compiler.compile_blade_to_js(source, view_name)
+        except Exception:
+            pass
+
+    results = []
+    devnull = open(os.devnull, 'w')
+    for view_name, source in views:
+        # Compiler in warning ra stdout; không để lẫn vào bảng kết quả
+        stdout = sys.stdout
+        if quiet:
+            sys.stdout = devnull
+        try:
+            results.append(measure_view(compiler, view_name, source, repeat, memory))
+        finally:
+            sys.stdout = stdout
+    devnull.close()
+
+    total_seconds = sum(result['ms'] for result in results) / 1000
+    total_bytes = sum(result['bytes'] for result in results)
+    stage_totals = {stage: 0.0 for stage in COMPILE_STAGES}
+    for result in results:
+        for stage, ms in result['stages_ms'].items():
+            stage_totals[stage] = stage_totals.get(stage, 0.0) + ms
+    peaks = [result['peak_kb'] for result in results if result['peak_kb'] is not None]
+    return {
+        'version': BASELINE_FORMAT_VERSION,
+        'python': sys.version.split()[0],
+        'repeat': repeat,
+        'aggregate': {
+            'views': len(results),
+            'bytes': total_bytes,
+            'ms': round(total_seconds * 1000, 3),
+            'kb_per_s': round(total_bytes / 1024 / total_seconds, 1) if total_seconds else None,
+            'views_per_s': round(len(results) / total_seconds, 1) if total_seconds else None,
+            'peak_kb': max(peaks) if peaks else None,
+            'stages_ms': {stage: round(ms, 3) for stage, ms in stage_totals.items()},
+        },
+        'views': results,
+    }
+
+
+def format_results(data):
+    lines = [f"{'view':<40} {'KB':>8} {'ms':>9} {'KB/s':>9} {'peak KB':>9}"]
+    lines.append('-' * len(lines[0]))
+    for result in data['views']:
+        note = '  (error)' if result['error'] else ''
+        peak = f"{result['peak_kb']:>9.1f}" if result['peak_kb'] is not None else f"{'-':>9}"
+        lines.append(f"{result['view'][:40]:<40} {result['bytes'] / 1024:>8.1f} {result['ms']:>9.2f} "
+                     f"{result['kb_per_s'] or 0:>9.1f} {peak}{note}")
+    aggregate = data['aggregate']
+    lines.append('-' * len(lines[0]))
+    lines.append(f"{aggregate['views']} views, {aggregate['bytes'] / 1024:.1f} KB in {aggregate['ms']:.2f}ms: "
+                 f"{aggregate['kb_per_s']} KB/s, {aggregate['views_per_s']} views/s"
+                 + (f", peak {aggregate['peak_kb']:.1f} KB" if aggregate['peak_kb'] is not None else ""))
+    total = aggregate['ms'] or 1e-9
+    lines.append("Stages: " + ', '.join(f"{stage} {ms:.2f}ms ({ms / total * 100:.1f}%)"
+                                        for stage, ms in aggregate['stages_ms'].items()))
+    return '\n'.join(lines)
+
+
+def compare_with_baseline(data, baseline, threshold, min_ms=1.0):
+    """Regressions beyond threshold percent: total time of the views present in both runs,
+    and single views slower by more than min_ms
+    """
+    regressions = []
+    limit = 1 + threshold / 100
+    old_views = {result['view']: result for result in baseline['views']}
+    old_total = new_total = 0.0
+    for result in data['views']:
+        old = old_views.get(result['view'])
+        if not old or not old['ms']:
+            continue
+        old_total += old['ms']
+        new_total += result['ms']
+        if result['ms'] > old['ms'] * limit and result['ms'] - old['ms'] > min_ms:
+            regressions.append(f"{result['view']}: {old['ms']:.2f}ms -> {result['ms']:.2f}ms (+{(result['ms'] / old['ms'] - 1) * 100:.1f}%)")
+    if old_total and new_total > old_total * limit:
+        regressions.insert(0, f"total: {old_total:.2f}ms -> {new_total:.2f}ms (+{(new_total / old_total - 1) * 100:.1f}%)")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Blade compiler on resources/views and synthetic templates")
+    parser.add_argument('--views', help="Blade views directory (default: views_input from compiler.config.json)")
+    parser.add_argument('--no-project', action='store_true', help="Only run the synthetic templates")
+    parser.add_argument('--no-synthetic', action='store_true', help="Only run the project views")
+    parser.add_argument('--scale', type=float, default=1.0, help="Size multiplier of the synthetic templates (default: 1.0)")
+    parser.add_argument('--repeat', type=int, default=5, help="Runs per view, the fastest is kept (default: 5)")
+    parser.add_argument('--no-memory', action='store_true', help="Skip the tracemalloc pass used for peak memory")
+    parser.add_argument('--json', metavar='FILE', help="Write the results as JSON")
+    parser.add_argument('--save-baseline', metavar='FILE', help="Write the results as a baseline for later runs")
+    parser.add_argument('--baseline', metavar='FILE', help="Compare with a saved baseline and exit 1 on regressions")
+    parser.add_argument('--threshold', type=float, default=10.0, help="Allowed slowdown against the baseline in percent (default: 10)")
+    args = parser.parse_args(argv)
+
+    views = []
+    if not args.no_project:
+        views += project_views(args.views or CompilerConfig().views_input_path)
+    if not args.no_synthetic:
+        views += synthetic_views(args.scale)
+    if not views:
+        print("No views to benchmark")
+        return 1
+
+    started = time.perf_counter()
+    data = run_benchmark(views, max(1, args.repeat), memory=not args.no_memory, quiet=True)
+    print(format_results(data))
+    print(f"(benchmark took {time.perf_counter() - started:.1f}s)")
+
+    for file_path in (args.json, args.save_baseline):
+        if file_path:
+            with open(file_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+                f.write('\n')
+            print(f"Results written to {file_path}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get('version') != BASELINE_FORMAT_VERSION:
+            print(f"Baseline {args.baseline} has another format version, run --save-baseline again")
+            return 1
+        regressions = compare_with_baseline(data, baseline, args.threshold)
+        if regressions:
+            print(f"\nRegressions beyond {args.threshold:g}%:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print(f"\nNo regressions beyond {args.threshold:g}% against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
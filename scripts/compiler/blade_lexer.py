@@ -0,0 +1,259 @@
+"""
+Blade lexer - quét source một lần và sinh token stream
+(directive, echo, raw echo, comment, verbatim, script/style, text) kèm offset trong source
+"""
+
+import re
+import tracing
+
+TEXT = 'text'
+DIRECTIVE = 'directive'
+ECHO = 'echo'
+RAW_ECHO = 'raw_echo'
+COMMENT = 'comment'
+VERBATIM = 'verbatim'
+SCRIPT = 'script'
+STYLE = 'style'
+
+# Vị trí có thể bắt đầu một token không phải text
+TOKEN_START_PATTERN = re.compile(r'@|\{\{|\{!!|<(?:script|style)\b', re.IGNORECASE)
+DIRECTIVE_NAME_PATTERN = re.compile(r'@([A-Za-z_]\w*(?:::\w+)?)(\s*)')
+VERBATIM_END_PATTERN = re.compile(r'@endverbatim\b', re.IGNORECASE)
+SCRIPT_END_PATTERN = re.compile(r'</script\s*>', re.IGNORECASE)
+STYLE_END_PATTERN = re.compile(r'</style\s*>', re.IGNORECASE)
+COMMENT_PATTERN = re.compile(r'{{--.*?--}}', re.DOTALL)
+
+
+class BladeToken:
+    """One lexed piece of a Blade template
+
+    text is the exact source slice [start, end). For directives, name/args hold the
+    directive name and the content of its balanced parentheses (args is None without
+    parentheses). For echo/comment/verbatim/script/style, content holds the inner part;
+    script/style tokens also keep the opening tag attributes in attrs.
+    """
+
+    def __init__(self, kind, text, start, name=None, args=None, content=None, attrs=None):
+        self.kind = kind
+        self.text = text
+        self.start = start
+        self.end = start + len(text)
+        self.name = name
+        self.args = args
+        self.content = content
+        self.attrs = attrs
+
+    def moved_to(self, start):
+        """Copy of the token at another offset (used when the source is rewritten)"""
+        return BladeToken(self.kind, self.text, start, self.name, self.args, self.content, self.attrs)
+
+    def __repr__(self):
+        label = f"@{self.name}" if self.kind == DIRECTIVE else self.kind
+        return f"<BladeToken {label} {self.start}:{self.end} {self.text[:30]!r}>"
+
+
+def _find_closing_paren(source, open_pos):
+    """Index of the ')' matching source[open_pos] == '(', skipping quoted strings; -1 if unbalanced"""
+    depth = 0
+    i = open_pos
+    length = len(source)
+    while i < length:
+        char = source[i]
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+            if depth == 0:
+                return i
+        elif char in ('"', "'"):
+            end = i + 1
+            while end < length and source[end] != char:
+                end += 2 if source[end] == '\\' else 1
+            if end >= length:
+                break
+            i = end
+        i += 1
+
+    # Quote không đóng (vd. dấu nháy trong text) - thử lại không tính quotes như extract_balanced_parentheses
+    depth = 0
+    for i in range(open_pos, length):
+        if source[i] == '(':
+            depth += 1
+        elif source[i] == ')':
+            depth -= 1
+            if depth == 0:
+                return i
+    return -1
+
+
+class BladeLexer:
+    """Single forward scan over a Blade source"""
+
+    def tokenize(self, source):
+        """Return a BladeTokenStream for source"""
+        tokens = []
+        pos = 0
+        text_start = 0
+        length = len(source)
+
+        def flush_text(until):
+            if until > text_start:
+                tokens.append(BladeToken(TEXT, source[text_start:until], text_start))
+
+        while pos < length:
+            match = TOKEN_START_PATTERN.search(source, pos)
+            if not match:
+                break
+            start = match.start()
+            token = self._lex_at(source, start)
+            if token is None:
+                pos = start + 1
+                continue
+            flush_text(start)
+            tokens.append(token)
+            pos = text_start = token.end
+
+        flush_text(length)
+        return BladeTokenStream(source, tokens)
+
+    def _lex_at(self, source, start):
+        """Token starting at start, or None if the candidate is plain text"""
+        char = source[start]
+        if char == '@':
+            return self._lex_directive(source, start)
+        if char == '<':
+            return self._lex_raw_block(source, start)
+        if source.startswith('{{--', start):
+            end = source.find('--}}', start + 4)
+            if end != -1:
+                return BladeToken(COMMENT, source[start:end + 4], start, content=source[start + 4:end])
+        if source.startswith('{!!', start):
+            end = source.find('!!}', start + 3)
+            if end != -1:
+                return BladeToken(RAW_ECHO, source[start:end + 3], start, content=source[start + 3:end])
+            return None
+        end = source.find('}}', start + 2)
+        if end != -1:
+            return BladeToken(ECHO, source[start:end + 2], start, content=source[start + 2:end])
+        return None
+
+    def _lex_directive(self, source, start):
+        # @ sau ký tự chữ/số là text (email, ...); @@name là escape của Blade
+        if start > 0 and (source[start - 1].isalnum() or source[start - 1] in '_@'):
+            return None
+        match = DIRECTIVE_NAME_PATTERN.match(source, start)
+        if not match:
+            return None
+        name = match.group(1)
+
+        if name.lower() == 'verbatim':
+            end_match = VERBATIM_END_PATTERN.search(source, match.end())
+            if end_match:
+                return BladeToken(VERBATIM, source[start:end_match.end()], start, name=name,
+                                  content=source[start + len('@verbatim'):end_match.start()])
+
+        args = None
+        end = start + 1 + len(name)
+        open_pos = match.end()
+        if open_pos < len(source) and source[open_pos] == '(':
+            close_pos = _find_closing_paren(source, open_pos)
+            if close_pos != -1:
+                args = source[open_pos + 1:close_pos]
+                end = close_pos + 1
+        return BladeToken(DIRECTIVE, source[start:end], start, name=name, args=args)
+
+    def _lex_raw_block(self, source, start):
+        is_script = source[start + 1] in 'sS' and source[start + 1:start + 7].lower() == 'script'
+        tag_end = source.find('>', start)
+        if tag_end == -1:
+            return None
+        end_pattern = SCRIPT_END_PATTERN if is_script else STYLE_END_PATTERN
+        end_match = end_pattern.search(source, tag_end + 1)
+        if not end_match:
+            return None
+        name_length = 7 if is_script else 6
+        return BladeToken(SCRIPT if is_script else STYLE, source[start:end_match.end()], start,
+                          name='script' if is_script else 'style',
+                          attrs=source[start + name_length:tag_end].strip(),
+                          content=source[tag_end + 1:end_match.start()])
+
+
+class BladeTokenStream:
+    """Source + its tokens, with the queries the parsers need"""
+
+    def __init__(self, source, tokens):
+        self.source = source
+        self.tokens = tokens
+
+    def __iter__(self):
+        return iter(self.tokens)
+
+    def __len__(self):
+        return len(self.tokens)
+
+    def directives(self, *names, include_scripts=False):
+        """Directive tokens with one of names (all directives if no names), in source order
+
+        Directives inside <script>/<style> blocks are skipped unless include_scripts,
+        directives inside @verbatim are never returned.
+        """
+        wanted = set(names)
+        for token in self.tokens:
+            if token.kind == DIRECTIVE:
+                if not wanted or token.name in wanted:
+                    yield token
+            elif include_scripts and token.kind in (SCRIPT, STYLE) and '@' in token.content:
+                offset = token.start + token.text.find('>') + 1
+                for inner in tokenize_blade(token.content).directives(*names):
+                    yield inner.moved_to(offset + inner.start)
+
+    def has_directive(self, name, include_scripts=False):
+        for _ in self.directives(name, include_scripts=include_scripts):
+            return True
+        return False
+
+    def without(self, *kinds):
+        """Source with every token of the given kinds removed"""
+        return ''.join(token.text for token in self.tokens if token.kind not in kinds)
+
+    def without_comments(self):
+        """New stream for the source with {{-- --}} comments removed
+
+        Comments are also stripped inside script/style and verbatim blocks, as the
+        regex pass this replaces did.
+        """
+        tokens = []
+        pieces = []
+        offset = 0
+        for token in self.tokens:
+            if token.kind == COMMENT:
+                continue
+            if token.kind in (SCRIPT, STYLE, VERBATIM) and '{{--' in token.text:
+                token = self._strip_nested_comments(token)
+            if token.kind == TEXT and tokens and tokens[-1].kind == TEXT:
+                merged = tokens[-1].text + token.text
+                tokens[-1] = BladeToken(TEXT, merged, tokens[-1].start)
+            else:
+                tokens.append(token.moved_to(offset))
+            pieces.append(token.text)
+            offset += len(token.text)
+        return BladeTokenStream(''.join(pieces), tokens)
+
+    def _strip_nested_comments(self, token):
+        text = tracing.sub(COMMENT_PATTERN, '', token.text)
+        if token.kind == VERBATIM:
+            end_match = list(VERBATIM_END_PATTERN.finditer(text))[-1]
+            return BladeToken(VERBATIM, text, token.start, name=token.name,
+                              content=text[len('@verbatim'):end_match.start()])
+        tag_end = text.find('>')
+        close_start = text.rfind('</')
+        return BladeToken(token.kind, text, token.start, name=token.name, attrs=token.attrs,
+                          content=text[tag_end + 1:close_start])
+
+
+_lexer = BladeLexer()
+
+
+def tokenize_blade(source):
+    """Lex a Blade source into a BladeTokenStream"""
+    return _lexer.tokenize(source)
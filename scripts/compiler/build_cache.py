@@ -0,0 +1,180 @@
+"""
+Persistent content-hash cache cho compiled views
+Key = hash(blade source) + hash(wraper.js) + hash(compiler.config.json) + PHP có sẵn hay không + compiler version
+Entry của mỗi output mode (variant) nằm trong thư mục riêng, nên đổi qua lại giữa các mode không làm mất cache.
+"""
+
+import os
+import shutil
+import hashlib
+
+# Bump khi thay đổi format của cache entry
+CACHE_FORMAT_VERSION = "2"
+VARIANT_DIR_PREFIX = 'variant-'
+
+
+def hash_content(content):
+    """Return sha256 hex digest of str/bytes content"""
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    return hashlib.sha256(content).hexdigest()
+
+
+def compute_compiler_version(compiler_dir=None):
+    """
+    Fingerprint of the compiler: cache format + source of every compiler module.
+    Any edit to the compiler invalidates all cached views.
+    """
+    if compiler_dir is None:
+        compiler_dir = os.path.dirname(os.path.abspath(__file__))
+
+    digest = hashlib.sha256(CACHE_FORMAT_VERSION.encode('utf-8'))
+    for file_name in sorted(os.listdir(compiler_dir)):
+        if not file_name.endswith('.py'):
+            continue
+        with open(os.path.join(compiler_dir, file_name), 'rb') as f:
+            digest.update(file_name.encode('utf-8'))
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def php_available(php_binary='php'):
+    """True if the PHP binary used by php_converter's worker is on PATH (PHP-only arrays compile differently without it)"""
+    return shutil.which(php_binary) is not None
+
+
+def write_file_if_changed(file_path, content):
+    """
+    Write content to file_path only when the bytes differ from what is on disk.
+    Keeps mtimes stable so downstream bundlers (webpack/vite) can reuse their cache.
+    The new content goes to a temp file that is renamed over file_path, so readers never see a half-written file.
+    Returns True if the file was written.
+    """
+    data = content.encode('utf-8')
+    try:
+        with open(file_path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+
+    os.makedirs(os.path.dirname(file_path) or '.', exist_ok=True)
+    tmp_path = f"{file_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return True
+
+
+class BuildCache:
+    """On-disk cache of compiled views keyed by content hash"""
+
+    def __init__(self, cache_dir, wrapper_path=None, compiler_version=None, variant='', config_path=None, has_php=None):
+        self.cache_dir = cache_dir
+        self.compiler_version = compiler_version or compute_compiler_version()
+        self.wrapper_hash = self._hash_file(wrapper_path)
+        if config_path is None:
+            config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'compiler.config.json')
+        self.config_hash = self._hash_file(config_path)
+        self.has_php = php_available() if has_php is None else has_php
+        # Output mode ảnh hưởng tới JS sinh ra (vd. shared wrapper), là một phần của key
+        self.variant = variant
+        self.variant_dir = os.path.join(cache_dir, VARIANT_DIR_PREFIX + hash_content(variant)[:16])
+        self.hits = 0
+        self.misses = 0
+        self.used_keys = set()
+
+    def _hash_file(self, file_path):
+        """Hash a file's bytes, empty hash if missing"""
+        if not file_path or not os.path.exists(file_path):
+            return hash_content(b'')
+        with open(file_path, 'rb') as f:
+            return hash_content(f.read())
+
+    def make_key(self, view_name, blade_code):
+        """Cache key for one view; view name is part of the generated code so it is part of the key"""
+        return hash_content('\0'.join([
+            self.compiler_version,
+            self.wrapper_hash,
+            self.config_hash,
+            'php' if self.has_php else 'no-php',
+            self.variant,
+            view_name,
+            hash_content(blade_code),
+        ]))
+
+    def _entry_path(self, key):
+        return os.path.join(self.variant_dir, key[:2], key + '.js')
+
+    def get(self, view_name, blade_code):
+        """Return cached compiled JS or None"""
+        key = self.make_key(view_name, blade_code)
+        self.used_keys.add(key)
+        try:
+            with open(self._entry_path(key), 'r', encoding='utf-8', newline='') as f:
+                compiled = f.read()
+        except (FileNotFoundError, OSError, UnicodeDecodeError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return compiled
+
+    def put(self, view_name, blade_code, compiled):
+        """Store compiled JS for a view"""
+        key = self.make_key(view_name, blade_code)
+        self.used_keys.add(key)
+        entry_path = self._entry_path(key)
+        os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+        tmp_path = f"{entry_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+                f.write(compiled)
+            os.replace(tmp_path, entry_path)
+        except OSError as e:
+            print(f"Warning: could not write build cache entry: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def prune(self):
+        """Remove entries of this variant that were not used by this build (old sources, old compiler versions)
+
+        Entries of other variants are kept; anything outside a variant directory (older cache format) is removed.
+        """
+        if not os.path.isdir(self.cache_dir):
+            return 0
+        removed = 0
+        for entry in os.listdir(self.cache_dir):
+            entry_path = os.path.join(self.cache_dir, entry)
+            if entry.startswith(VARIANT_DIR_PREFIX):
+                continue
+            try:
+                if os.path.isdir(entry_path):
+                    shutil.rmtree(entry_path)
+                else:
+                    os.remove(entry_path)
+                removed += 1
+            except OSError:
+                pass
+        if not os.path.isdir(self.variant_dir):
+            return removed
+        for root, dirs, files in os.walk(self.variant_dir):
+            for file_name in files:
+                if not file_name.endswith('.js'):
+                    continue
+                if file_name[:-3] not in self.used_keys:
+                    try:
+                        os.remove(os.path.join(root, file_name))
+                        removed += 1
+                    except OSError:
+                        pass
+        return removed
+
+    def clear(self):
+        """Drop the whole cache directory"""
+        if os.path.isdir(self.cache_dir):
+            shutil.rmtree(self.cache_dir)
@@ -0,0 +1,79 @@
+"""
+Build report: thời gian từng stage, kích thước input/output, số lần convert PHP,
+cache hit/miss và lỗi của mỗi view trong một lần build (build.py --report / --top)
+"""
+
+import os
+import json
+
+from main_compiler import COMPILE_STAGES
+
+# Bump khi thay đổi format của file report
+REPORT_FORMAT_VERSION = 1
+
+
+class BuildReport:
+    """Per-view compile statistics of one build"""
+
+    def __init__(self):
+        self.views = []
+
+    def record(self, view_name, file_path, input_bytes=0, output_bytes=0, stats=None, cached=False, error=None):
+        """Add one view; stats is BladeCompiler.last_stats (None for cache hits and read errors)"""
+        stats = stats or {}
+        self.views.append({
+            'view': view_name,
+            'file': file_path,
+            'cache': 'hit' if cached else 'miss',
+            'input_bytes': input_bytes,
+            'output_bytes': output_bytes,
+            'total_ms': round(stats.get('total', 0.0) * 1000, 3),
+            'stages_ms': {stage: round(seconds * 1000, 3) for stage, seconds in stats.get('stages', {}).items()},
+            'php_to_js': stats.get('counters', {}).get('php_to_js', 0),
+            'php_arrays': stats.get('counters', {}).get('php_array', 0),
+            'counters': dict(stats.get('counters', {})),
+            'error': error,
+        })
+
+    def slowest(self, n):
+        return sorted(self.views, key=lambda view: view['total_ms'], reverse=True)[:n]
+
+    def summary(self):
+        stage_totals = {stage: 0.0 for stage in COMPILE_STAGES}
+        counters = {}
+        for view in self.views:
+            for stage, ms in view['stages_ms'].items():
+                stage_totals[stage] = stage_totals.get(stage, 0.0) + ms
+            for counter, value in view['counters'].items():
+                counters[counter] = counters.get(counter, 0) + value
+        return {
+            'views': len(self.views),
+            'compiled': sum(1 for view in self.views if view['cache'] == 'miss' and not view['error']),
+            'cache_hits': sum(1 for view in self.views if view['cache'] == 'hit'),
+            'errors': sum(1 for view in self.views if view['error']),
+            'input_bytes': sum(view['input_bytes'] for view in self.views),
+            'output_bytes': sum(view['output_bytes'] for view in self.views),
+            'total_ms': round(sum(view['total_ms'] for view in self.views), 3),
+            'stages_ms': {stage: round(ms, 3) for stage, ms in stage_totals.items()},
+            'counters': counters,
+        }
+
+    def to_dict(self):
+        return {'version': REPORT_FORMAT_VERSION, 'summary': self.summary(), 'views': self.views}
+
+    def save(self, file_path):
+        os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+            f.write('\n')
+
+    def format_top(self, n):
+        """Console table of the n slowest views with their per-stage times"""
+        header = f"{'view':<40} {'total':>9} " + ' '.join(f"{stage:>12}" for stage in COMPILE_STAGES) + f" {'in':>8} {'out':>8} {'php':>5}"
+        lines = [header, '-' * len(header)]
+        for view in self.slowest(n):
+            stages = ' '.join(f"{view['stages_ms'].get(stage, 0.0):>10.2f}ms" for stage in COMPILE_STAGES)
+            note = ' (cached)' if view['cache'] == 'hit' else ' (error)' if view['error'] else ''
+            lines.append(f"{view['view'][:40]:<40} {view['total_ms']:>7.2f}ms {stages} "
+                         f"{view['input_bytes']:>8} {view['output_bytes']:>8} {view['php_to_js'] + view['php_arrays']:>5}{note}")
+        return '\n'.join(lines)
@@ -0,0 +1,285 @@
+"""
+Compile server: giữ BladeCompiler trong bộ nhớ và compile view qua HTTP (localhost hoặc Unix socket)
+
+Tooling (Laravel, Node build, editor) gửi batch (view_name, source) thay vì chạy python cho mỗi lần compile,
+nên chi phí khởi động interpreter và import compiler chỉ trả một lần cho cả dev session.
+
+    POST /compile   {"views": [{"name": "web.home", "source": "..."}]}
+                    -> {"results": [{"name": "web.home", "code": "..."} | {"name": ..., "error": "..."}], ...}
+    GET  /health    -> {"status": "ok", ...stats}
+    GET  /stats     -> pool size, cache size, hits/misses
+"""
+
+import os
+import sys
+import json
+import queue
+import socket
+import socketserver
+import argparse
+import threading
+from collections import OrderedDict
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from main_compiler import BladeCompiler
+from build_cache import hash_content
+from config import CompilerConfig
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+# Giới hạn body của một request (batch lớn nhất chấp nhận được)
+MAX_REQUEST_BYTES = 64 * 1024 * 1024
+
+
+class LRUCache:
+    """Bounded, thread-safe mapping that evicts the least recently used entry"""
+
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self.lock:
+            value = self.entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        if self.max_entries <= 0:
+            return
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def __len__(self):
+        return len(self.entries)
+
+
+class CompilerPool:
+    """Fixed set of BladeCompiler instances; a compiler is used by one request at a time"""
+
+    def __init__(self, size=2):
+        self.size = max(1, size)
+        self.compilers = queue.Queue()
+        for _ in range(self.size):
+            self.compilers.put(BladeCompiler())
+
+    def acquire(self):
+        return self.compilers.get()
+
+    def release(self, compiler):
+        self.compilers.put(compiler)
+
+
+class CompileService:
+    """Batch compilation with an LRU of recent results
+
+    Cache key = view name + blade source + (mtime, size) của wraper.js, nên sửa wraper.js
+    không trả về kết quả cũ. Code compiler thay đổi thì cần restart server.
+    """
+
+    def __init__(self, pool_size=2, cache_size=512, wrapper_path=None):
+        self.pool = CompilerPool(pool_size)
+        self.cache = LRUCache(cache_size)
+        self.wrapper_path = wrapper_path or CompilerConfig().get_wrapper_template_path()
+        self.compiled = 0
+        self.errors = 0
+        self.stats_lock = threading.Lock()
+
+    def _wrapper_signature(self):
+        try:
+            stat = os.stat(self.wrapper_path)
+            return f"{stat.st_mtime_ns}:{stat.st_size}"
+        except OSError:
+            return ""
+
+    def compile_batch(self, views):
+        """Compile [(view_name, source), ...], returns one result dict per view in the same order"""
+        signature = self._wrapper_signature()
+        results = []
+        pending = []
+        for view_name, source in views:
+            key = hash_content('\0'.join([signature, view_name, source]))
+            code = self.cache.get(key)
+            if code is not None:
+                results.append({'name': view_name, 'code': code, 'cached': True})
+            else:
+                results.append(None)
+                pending.append((len(results) - 1, key, view_name, source))
+        if not pending:
+            return results
+
+        compiler = self.pool.acquire()
+        try:
+            compiled = compiler.compile_many((view_name, source) for _, _, view_name, source in pending)
+            for (index, key, _, _), (view_name, code, error) in zip(pending, compiled):
+                if error:
+                    with self.stats_lock:
+                        self.errors += 1
+                    results[index] = {'name': view_name, 'error': error}
+                    continue
+                with self.stats_lock:
+                    self.compiled += 1
+                self.cache.put(key, code)
+                results[index] = {'name': view_name, 'code': code, 'cached': False}
+        finally:
+            self.pool.release(compiler)
+        return results
+
+    def stats(self):
+        return {
+            'pool_size': self.pool.size,
+            'cache_entries': len(self.cache),
+            'cache_max_entries': self.cache.max_entries,
+            'cache_hits': self.cache.hits,
+            'cache_misses': self.cache.misses,
+            'compiled': self.compiled,
+            'errors': self.errors,
+        }
+
+
+def parse_batch(payload):
+    """Accept {"views": [{"name", "source"}, ...]}, {"name", "source"} or [[name, source], ...]"""
+    if isinstance(payload, dict) and 'views' in payload:
+        payload = payload['views']
+    elif isinstance(payload, dict):
+        payload = [payload]
+    if not isinstance(payload, list):
+        raise ValueError("expected a list of views")
+
+    views = []
+    for item in payload:
+        if isinstance(item, dict):
+            view_name, source = item.get('name', 'view'), item.get('source')
+        elif isinstance(item, (list, tuple)) and len(item) == 2:
+            view_name, source = item
+        else:
+            raise ValueError("each view must be {\"name\", \"source\"} or [name, source]")
+        if not isinstance(view_name, str) or not isinstance(source, str):
+            raise ValueError("view name and source must be strings")
+        views.append((view_name, source))
+    return views
+
+
+class CompileRequestHandler(BaseHTTPRequestHandler):
+    server_version = "BladeCompileServer/1.0"
+    protocol_version = "HTTP/1.1"
+
+    def _send_json(self, status, data):
+        body = json.dumps(data).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        service = self.server.service
+        if self.path == '/health':
+            self._send_json(200, dict(status='ok', **service.stats()))
+        elif self.path == '/stats':
+            self._send_json(200, service.stats())
+        else:
+            self._send_json(404, {'error': f"unknown path {self.path}"})
+
+    def do_POST(self):
+        if self.path != '/compile':
+            self._send_json(404, {'error': f"unknown path {self.path}"})
+            return
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            length = -1
+        if length < 0 or length > MAX_REQUEST_BYTES:
+            self._send_json(413 if length > 0 else 400, {'error': "invalid Content-Length"})
+            return
+        try:
+            views = parse_batch(json.loads(self.rfile.read(length).decode('utf-8')))
+        except (ValueError, UnicodeDecodeError) as e:
+            self._send_json(400, {'error': str(e)})
+            return
+
+        service = self.server.service
+        results = service.compile_batch(views)
+        self._send_json(200, {'results': results, 'stats': service.stats()})
+
+    def address_string(self):
+        # Unix socket không có địa chỉ client
+        return self.client_address[0] if self.client_address else 'unix'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class CompileHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, service, verbose=False):
+        self.service = service
+        self.verbose = verbose
+        super().__init__(address, CompileRequestHandler)
+
+
+class UnixCompileHTTPServer(CompileHTTPServer):
+    address_family = socket.AF_UNIX
+
+    def server_bind(self):
+        # HTTPServer.server_bind đọc host/port từ địa chỉ, không áp dụng cho Unix socket
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+        socketserver.TCPServer.server_bind(self)
+        self.server_name = 'localhost'
+        self.server_port = 0
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+
+
+def create_server(service, host=DEFAULT_HOST, port=DEFAULT_PORT, socket_path=None, verbose=False):
+    """HTTP server bound to host:port, or to a Unix socket when socket_path is given"""
+    if socket_path:
+        return UnixCompileHTTPServer(socket_path, service, verbose)
+    return CompileHTTPServer((host, port), service, verbose)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve Blade compilation over HTTP with a warm compiler pool")
+    parser.add_argument('--host', default=DEFAULT_HOST, help=f"Bind address (default: {DEFAULT_HOST})")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f"Port (default: {DEFAULT_PORT})")
+    parser.add_argument('--socket', help="Listen on this Unix socket instead of host:port")
+    parser.add_argument('--pool', type=int, default=2, help="Number of compiler instances (default: 2)")
+    parser.add_argument('--cache-size', type=int, default=512, help="Compiled results kept in the LRU cache (default: 512)")
+    parser.add_argument('-v', '--verbose', action='store_true', help="Log every request")
+    args = parser.parse_args(argv)
+
+    service = CompileService(pool_size=args.pool, cache_size=args.cache_size)
+    server = create_server(service, args.host, args.port, args.socket, args.verbose)
+    where = args.socket or f"http://{args.host}:{server.server_port}"
+    print(f"Blade compile server listening on {where} (pool: {service.pool.size}, cache: {args.cache_size})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nStopping compile server")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,9 +2,9 @@
 Handlers cho các conditional directives (@if, @switch, etc.)
 """
 
-from config import JS_FUNCTION_PREFIX
 from php_converter import php_to_js
 from utils import extract_balanced_parentheses
+from template_ast import IfNode, SwitchNode, CaseNode, innermost_kind
 import re
 
 class ConditionalHandlers:
@@ -18,9 +18,9 @@ class ConditionalHandlers:
             condition_text, end_pos = extract_balanced_parentheses(line, if_pos)
             if condition_text is not None:
                 condition = php_to_js(condition_text.strip())
-                result = f"${{{JS_FUNCTION_PREFIX}.execute(() => {{ if({condition}){{ return `"
-                output.append(result)
-                stack.append(('if', len(output)))
+                node = IfNode(condition)
+                output.append(node)
+                stack.append(node)
                 return True
         return False
     
@@ -31,24 +31,26 @@ class ConditionalHandlers:
             condition_text, end_pos = extract_balanced_parentheses(line, elseif_pos)
             if condition_text is not None:
                 condition = php_to_js(condition_text.strip())
-                result = f"`; }} else if({condition}){{ return `"
-                output.append(result)
+                if innermost_kind(stack) == 'if':
+                    stack[-1].add_branch(condition)
+                else:
+                    # @elseif ngoài @if - giữ nguyên fragment
+                    output.append(f"`; }} else if({condition}){{ return `")
                 return True
         return False
     
     def process_else_directive(self, line, stack, output):
         """Process @else directive"""
-        result = f"`; }} else {{ return `"
-        output.append(result)
+        if innermost_kind(stack) == 'if':
+            stack[-1].add_branch(None)
+        else:
+            output.append("`; } else { return `")
         return True
     
     def process_endif_directive(self, stack, output):
         """Process @endif directive"""
-        if stack and stack[-1][0] == 'if':
-            stack.pop()
-            output.append('`; }')
-            output.append("return '';")
-            output.append('})}')
+        if innermost_kind(stack) == 'if':
+            stack.pop().closed = True
         return True
     
     def process_switch_directive(self, line, stack, output):
@@ -58,10 +60,10 @@ class ConditionalHandlers:
             switch_content, end_pos = extract_balanced_parentheses(line, switch_pos)
             if switch_content is not None:
                 condition = php_to_js(switch_content.strip())
-                # Generate switch statement with output variable
-                result = f"${{{JS_FUNCTION_PREFIX}.execute(() => {{\nlet __switchOutputContent__ = '';\nswitch({condition}) {{"
-                output.append(result)
-                stack.append(('switch', len(output)))
+                # Switch statement with output variable
+                node = SwitchNode(condition)
+                output.append(node)
+                stack.append(node)
                 return True
         return False
     
@@ -72,30 +74,38 @@ class ConditionalHandlers:
             case_content, end_pos = extract_balanced_parentheses(line, case_pos)
             if case_content is not None:
                 condition = php_to_js(case_content.strip())
-                result = f"\ncase {condition}:\n__switchOutputContent__ += `"
-                output.append(result)
-                stack.append(('case', len(output)))
-                return True
+                return self._open_case(condition, stack, output, f"\ncase {condition}:\n__switchOutputContent__ += `")
         return False
     
     def process_default_directive(self, line, stack, output):
         """Process @default directive"""
-        result = f"\ndefault:\n__switchOutputContent__ += `"
-        output.append(result)
-        stack.append(('default', len(output)))
+        return self._open_case(None, stack, output, "\ndefault:\n__switchOutputContent__ += `")
+    
+    def _open_case(self, condition, stack, output, fragment):
+        """Close the previous @case of the switch and open a new one"""
+        if innermost_kind(stack) == 'case':
+            stack.pop().closed = True
+        if innermost_kind(stack) != 'switch':
+            # @case ngoài @switch - giữ nguyên fragment
+            output.append(fragment)
+            return True
+        node = CaseNode(condition)
+        stack[-1].body.append(node)
+        stack.append(node)
         return True
     
     def process_break_directive(self, line, stack, output):
         """Process @break directive"""
-        result = f"`;\nbreak;"
-        output.append(result)
+        output.append("`;\nbreak;")
+        if innermost_kind(stack) == 'case':
+            stack[-1].has_break = True
         return True
     
     def process_endswitch_directive(self, stack, output):
         """Process @endswitch directive"""
-        if stack and stack[-1][0] in ['switch', 'case', 'default']:
-            stack.pop()
-            result = "`;\n}\nreturn __switchOutputContent__;\n})}"
-            output.append(result)
+        if innermost_kind(stack) == 'case':
+            stack.pop().closed = True
+        if innermost_kind(stack) == 'switch':
+            stack.pop().closed = True
             return True
         return False
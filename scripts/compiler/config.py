@@ -15,6 +15,7 @@ class CompilerConfig:
         if config_file is None:
             config_file = os.path.join(os.path.dirname(__file__), 'compiler.config.json')
         
+        self.config_file = config_file
         self.config_data = self._load_config(config_file)
         
         # Input paths
@@ -25,6 +26,9 @@ class CompilerConfig:
         self.build_output_path = os.path.join(self.project_root, self.config_data['paths']['build_output'])
         self.build_scopes_path = os.path.join(self.project_root, self.config_data['paths']['build_scopes'])
         
+        # Incremental build cache (compiled views keyed by content hash)
+        self.build_cache_path = os.path.join(self.project_root, self.config_data['paths'].get('build_cache', 'storage/framework/cache/blade-compiler'))
+        
         # Output paths (final deployment location)
         self.public_static_path = os.path.join(self.project_root, self.config_data['paths']['public_static'])
         self.app_output_path = os.path.join(self.project_root, self.config_data['paths']['app_output'])
@@ -38,11 +42,21 @@ class CompilerConfig:
         self.view_templates_file = self.config_data['files']['view_templates']
         self.wrapper_file = self.config_data['files']['wrapper']
         self.main_file = self.config_data['files']['main']
+        self.view_dependencies_file = self.config_data['files'].get('view_dependencies', 'view-dependencies.json')
+        
+        # Source wraper.js (inlined into every compiled view, or built into the shared wrapper module)
+        self.wrapper_template_path = os.path.join(self.project_root, 'resources', 'js', 'templates', self.wrapper_file)
         
         # Settings
         self.default_scope = self.config_data['settings']['default_scope']
         self.auto_create_dirs = self.config_data['settings']['auto_create_dirs']
         self.verbose = self.config_data['settings']['verbose']
+        # Views import one shared wrapper module instead of inlining wraper.js
+        self.shared_wrapper = self.config_data['settings'].get('shared_wrapper', False)
+        # Hole đọc @useState state được bọc trong reactive block (this.__reactive)
+        self.reactive_blocks = self.config_data['settings'].get('reactive_blocks', False)
+        # @foreach đọc item.id được sinh thành keyed list
+        self.infer_foreach_keys = self.config_data['settings'].get('infer_foreach_keys', False)
         
         # Build directories
         self.build_directories = self.config_data.get('build_directories', [])
@@ -67,6 +81,7 @@ class CompilerConfig:
             "paths": {
                 "views_input": "resources/views",
                 "js_input": "resources/js/app",
+                "build_cache": "storage/framework/cache/blade-compiler",
                 "public_static": "public/static",
                 "app_output": "public/static/app",
                 "scopes_output": "public/static/app/scopes"
@@ -74,7 +89,8 @@ class CompilerConfig:
             "files": {
                 "view_templates": "view.templates.js",
                 "wrapper": "wraper.js",
-                "main": "main.js"
+                "main": "main.js",
+                "view_dependencies": "view-dependencies.json"
             },
             "patterns": {
                 "blade": "**/*.blade.php",
@@ -83,7 +99,10 @@ class CompilerConfig:
             "settings": {
                 "default_scope": "web",
                 "auto_create_dirs": True,
-                "verbose": False
+                "verbose": False,
+                "shared_wrapper": False,
+                "reactive_blocks": False,
+                "infer_foreach_keys": False
             }
         }
         
@@ -133,6 +152,18 @@ class CompilerConfig:
         """Get build main output path"""
         return os.path.join(self.build_output_path, self.main_file)
     
+    def get_build_view_dependencies_path(self):
+        """Get view dependency graph path (written next to the build output)"""
+        return os.path.join(self.build_output_path, self.view_dependencies_file)
+    
+    def get_build_cache_path(self):
+        """Get incremental build cache path"""
+        return self.build_cache_path
+    
+    def get_wrapper_template_path(self):
+        """Get source wraper.js path"""
+        return self.wrapper_template_path
+    
     def get_build_directories(self):
         """Get list of directories to build (relative to resources/views)"""
         return [os.path.join(self.views_input_path, dir_path) for dir_path in self.build_directories]
@@ -150,6 +181,7 @@ class CompilerConfig:
         if config_file is None:
             config_file = os.path.join(os.path.dirname(__file__), 'compiler.config.json')
         
+        self.config_file = config_file
         self.config_data = self._load_config(config_file)
         
         # Update paths
@@ -163,6 +195,9 @@ class CompilerConfig:
         self.default_scope = self.config_data['settings']['default_scope']
         self.auto_create_dirs = self.config_data['settings']['auto_create_dirs']
         self.verbose = self.config_data['settings']['verbose']
+        self.shared_wrapper = self.config_data['settings'].get('shared_wrapper', False)
+        self.reactive_blocks = self.config_data['settings'].get('reactive_blocks', False)
+        self.infer_foreach_keys = self.config_data['settings'].get('infer_foreach_keys', False)
     
     def print_config(self):
         """Print current configuration"""
@@ -172,12 +207,16 @@ class CompilerConfig:
         print(f"JS Input: {self.js_input_path}")
         print(f"Build Output: {self.build_output_path}")
         print(f"Build Scopes: {self.build_scopes_path}")
+        print(f"Build Cache: {self.build_cache_path}")
         print(f"Public Static: {self.public_static_path}")
         print(f"App Output: {self.app_output_path}")
         print(f"Scopes Output: {self.scopes_output_path}")
         print(f"Default Scope: {self.default_scope}")
         print(f"Auto Create Dirs: {self.auto_create_dirs}")
         print(f"Verbose: {self.verbose}")
+        print(f"Shared Wrapper: {self.shared_wrapper}")
+        print(f"Reactive Blocks: {self.reactive_blocks}")
+        print(f"Infer Foreach Keys: {self.infer_foreach_keys}")
         print(f"Build Directories: {len(self.build_directories)} directories")
         for i, dir_path in enumerate(self.build_directories, 1):
             print(f"  {i}. {dir_path}")
@@ -2,8 +2,8 @@
 Declaration Tracker - Track thứ tự khai báo của @vars, @let, @const, @useState
 """
 
-import re
-from utils import extract_balanced_parentheses
+import tracing
+from blade_lexer import tokenize_blade
 from php_converter import php_to_js, convert_php_array_to_json
 
 class DeclarationTracker:
@@ -16,97 +16,39 @@ class DeclarationTracker:
         """Reset tracker state"""
         self.declarations = []  # List of {type, position, content, variables}
         
-    def parse_all_declarations(self, blade_code):
-        """Parse all declarations and track their order"""
+    def parse_all_declarations(self, blade_code, tokens=None):
+        """Parse all declarations and track their order
+        tokens: BladeTokenStream of blade_code (lexed here if not given)
+        """
         # Reset to avoid contamination from previous parses
         self.reset()
         
-        # Remove script tags to avoid parsing JS code
-        blade_code_filtered = self._remove_script_tags(blade_code)
+        if tokens is None:
+            tokens = tokenize_blade(blade_code)
         
-        # Remove @verbatim blocks to avoid parsing declarations inside them
-        blade_code_filtered = self._remove_verbatim_blocks(blade_code_filtered)
-        
-        # Find all @vars, @let, @const, @useState with their positions
-        self._find_vars_declarations(blade_code_filtered)
-        self._find_let_declarations(blade_code_filtered)
-        self._find_const_declarations(blade_code_filtered)
-        self._find_usestate_declarations(blade_code_filtered)
-        
-        # Sort by position
-        self.declarations.sort(key=lambda x: x['position'])
+        # Directive tokens exclude <script> tags and @verbatim blocks, in source order
+        parsers = {
+            'vars': self._parse_vars_content,
+            'let': self._parse_let_content,
+            'const': self._parse_const_content,
+            'useState': self._parse_usestate_content,
+        }
+        for token in tokens.directives(*parsers):
+            content = token.args.strip() if token.args is not None else ''
+            if not content:
+                continue
+            variables = parsers[token.name](content)
+            if token.name == 'useState' and not variables:
+                continue  # Only add if we found valid variables
+            self.declarations.append({
+                'type': token.name,
+                'position': token.start,
+                'content': content,
+                'variables': variables
+            })
         
         return self.declarations
     
-    def _remove_script_tags(self, blade_code):
-        """Remove JavaScript code in <script> tags"""
-        return re.sub(r'<script[^>]*>.*?</script>', '', blade_code, flags=re.DOTALL | re.IGNORECASE)
-    
-    def _remove_verbatim_blocks(self, blade_code):
-        """Remove @verbatim...@endverbatim blocks to avoid parsing declarations inside them"""
-        return re.sub(r'@verbatim\s*.*?\s*@endverbatim', '', blade_code, flags=re.DOTALL | re.IGNORECASE)
-    
-    def _find_vars_declarations(self, blade_code):
-        """Find all @vars declarations"""
-        pattern = r'@vars\s*\('
-        for match in re.finditer(pattern, blade_code):
-            start_pos = match.end() - 1
-            content, end_pos = extract_balanced_parentheses(blade_code, start_pos)
-            if content is not None and content.strip():
-                variables = self._parse_vars_content(content.strip())
-                self.declarations.append({
-                    'type': 'vars',
-                    'position': match.start(),
-                    'content': content.strip(),
-                    'variables': variables
-                })
-    
-    def _find_let_declarations(self, blade_code):
-        """Find all @let declarations"""
-        pattern = r'@let\s*\('
-        for match in re.finditer(pattern, blade_code):
-            start_pos = match.end() - 1
-            content, end_pos = extract_balanced_parentheses(blade_code, start_pos)
-            if content is not None and content.strip():
-                variables = self._parse_let_content(content.strip())
-                self.declarations.append({
-                    'type': 'let',
-                    'position': match.start(),
-                    'content': content.strip(),
-                    'variables': variables
-                })
-    
-    def _find_const_declarations(self, blade_code):
-        """Find all @const declarations"""
-        pattern = r'@const\s*\('
-        for match in re.finditer(pattern, blade_code):
-            start_pos = match.end() - 1
-            content, end_pos = extract_balanced_parentheses(blade_code, start_pos)
-            if content is not None and content.strip():
-                variables = self._parse_const_content(content.strip())
-                self.declarations.append({
-                    'type': 'const',
-                    'position': match.start(),
-                    'content': content.strip(),
-                    'variables': variables
-                })
-    
-    def _find_usestate_declarations(self, blade_code):
-        """Find all @useState declarations with format @useState($value, $varName, $setVarName)"""
-        pattern = r'@useState\s*\('
-        for match in re.finditer(pattern, blade_code):
-            start_pos = match.end() - 1
-            content, end_pos = extract_balanced_parentheses(blade_code, start_pos)
-            if content is not None and content.strip():
-                variables = self._parse_usestate_content(content.strip())
-                if variables:  # Only add if we found valid variables
-                    self.declarations.append({
-                        'type': 'useState',
-                        'position': match.start(),
-                        'content': content.strip(),
-                        'variables': variables
-                    })
-    
     def _parse_vars_content(self, content):
         """Parse @vars content and extract variables"""
         variables = []
@@ -319,7 +261,7 @@ class DeclarationTracker:
         # Use existing converter
         expr = php_to_js(expr)
         # Remove $ from variables
-        expr = re.sub(r'\$(\w+)', r'\1', expr)
+        expr = tracing.sub(r'\$(\w+)', r'\1', expr)
         return expr
     
     def _parse_usestate_content(self, content):
@@ -0,0 +1,275 @@
+"""
+Dependency graph giữa các view: @extends, @include/@includeIf/@includeWhen và @useBlock
+
+Chỉ những target là string literal tĩnh mới tạo cạnh trong graph; target động
+(biến, nối chuỗi, ...) được đếm trong `dynamic` để tooling biết graph chưa đầy đủ.
+Target được resolve theo tên view của build: `layouts.base` trong `web.pages.home` là
+`layouts.base` nếu view đó có trong build, không thì `web.pages.layouts.base`, `web.layouts.base`.
+Graph được lưu thành JSON cạnh build output và trả lời câu hỏi "view nào bị ảnh hưởng".
+"""
+
+import os
+import json
+import hashlib
+
+from blade_lexer import tokenize_blade
+
+# Bump khi thay đổi format của file graph
+GRAPH_FORMAT_VERSION = 1
+
+# Directive include -> vị trí tham số chứa tên view
+INCLUDE_DIRECTIVES = {'include': 0, 'includeif': 0, 'includewhen': 1}
+USE_BLOCK_DIRECTIVES = ('useBlock', 'useblock')
+
+
+def split_directive_arguments(args):
+    """Split directive arguments on top-level commas (quotes, (), [] and {} are respected)"""
+    parts = []
+    depth = 0
+    quote = None
+    current = []
+    i = 0
+    while i < len(args):
+        char = args[i]
+        if quote:
+            if char == '\\' and i + 1 < len(args):
+                current.append(args[i:i + 2])
+                i += 2
+                continue
+            if char == quote:
+                quote = None
+        elif char in ('"', "'"):
+            quote = char
+        elif char in '([{':
+            depth += 1
+        elif char in ')]}':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            parts.append(''.join(current).strip())
+            current = []
+            i += 1
+            continue
+        current.append(char)
+        i += 1
+    if ''.join(current).strip():
+        parts.append(''.join(current).strip())
+    return parts
+
+
+def static_string(expr):
+    """Value of a plain '...' / "..." literal, None for anything dynamic"""
+    expr = expr.strip()
+    if len(expr) < 2 or expr[0] not in ('"', "'") or expr[-1] != expr[0]:
+        return None
+    value = expr[1:-1]
+    if expr[0] in value or '\\' in value or (expr[0] == '"' and '$' in value):
+        return None
+    return value
+
+
+def extract_view_dependencies(blade_code, tokens=None):
+    """Static references of one view
+
+    Returns {'extends': [...], 'includes': [...], 'uses_blocks': [...], 'blocks': [...], 'dynamic': n}
+    """
+    if tokens is None:
+        tokens = tokenize_blade(blade_code)
+
+    dependencies = {'extends': [], 'includes': [], 'uses_blocks': [], 'blocks': [], 'dynamic': 0}
+
+    def add(kind, expr):
+        value = static_string(expr) if expr is not None else None
+        if value is None:
+            dependencies['dynamic'] += 1
+        elif value not in dependencies[kind]:
+            dependencies[kind].append(value)
+
+    # @include trong <script> vẫn được compile như template line nên cũng được tính
+    for token in tokens.directives(include_scripts=True):
+        if token.args is None:
+            continue
+        name = token.name
+        arguments = split_directive_arguments(token.args)
+        if not arguments:
+            continue
+        if name == 'extends':
+            add('extends', arguments[0])
+        elif name.lower() in INCLUDE_DIRECTIVES:
+            position = INCLUDE_DIRECTIVES[name.lower()]
+            add('includes', arguments[position] if len(arguments) > position else None)
+        elif name in USE_BLOCK_DIRECTIVES:
+            add('uses_blocks', arguments[0])
+        elif name == 'block':
+            add('blocks', arguments[0])
+
+    return dependencies
+
+
+class ViewDependencyGraph:
+    """Per-view static references plus the reverse edges needed for dirty-set queries"""
+
+    def __init__(self):
+        # view_name -> {'hash': source hash, 'extends': [...], 'includes': [...], ...}
+        self.views = {}
+
+    def set_view(self, view_name, blade_code, tokens=None):
+        """Record the references of a view (skipped when its source did not change)"""
+        source_hash = hashlib.sha256(blade_code.encode('utf-8')).hexdigest()
+        entry = self.views.get(view_name)
+        if entry and entry['hash'] == source_hash:
+            return entry
+        entry = extract_view_dependencies(blade_code, tokens)
+        entry['hash'] = source_hash
+        self.views[view_name] = entry
+        return entry
+
+    def remove_view(self, view_name):
+        self.views.pop(view_name, None)
+
+    def retain(self, view_names):
+        """Drop views that are no longer part of the build"""
+        keep = set(view_names)
+        for view_name in list(self.views):
+            if view_name not in keep:
+                del self.views[view_name]
+
+    def block_owners(self):
+        """block name -> views defining it with @block"""
+        owners = {}
+        for view_name, entry in self.views.items():
+            for block in entry['blocks']:
+                owners.setdefault(block, []).append(view_name)
+        return owners
+
+    def resolve(self, view_name, target):
+        """Build view name of a target referenced by view_name (the target itself if no view matches)
+
+        Views reference others relative to their context (web/admin/...): the target as written is tried
+        first, then prefixed by the enclosing directories of view_name, nearest first.
+        """
+        if target in self.views:
+            return target
+        parts = view_name.split('.')[:-1]
+        while parts:
+            candidate = '.'.join(parts) + '.' + target
+            if candidate in self.views:
+                return candidate
+            parts.pop()
+        return target
+
+    def dependencies(self, view_name, block_owners=None):
+        """Views that view_name references directly"""
+        entry = self.views.get(view_name)
+        if entry is None:
+            return set()
+        if block_owners is None:
+            block_owners = self.block_owners()
+        result = {self.resolve(view_name, target) for target in entry['extends'] + entry['includes']}
+        for block in entry['uses_blocks']:
+            result.update(block_owners.get(block, ()))
+        result.discard(view_name)
+        return result
+
+    def dependents(self):
+        """Reverse edges: view -> views referencing it directly"""
+        block_owners = self.block_owners()
+        reverse = {}
+        for view_name in self.views:
+            for dependency in self.dependencies(view_name, block_owners):
+                reverse.setdefault(dependency, set()).add(view_name)
+        return reverse
+
+    def dirty_set(self, changed_views):
+        """changed_views plus every view depending on them, directly or transitively"""
+        reverse = self.dependents()
+        dirty = set(changed_views)
+        queue = list(dirty)
+        while queue:
+            for dependent in reverse.get(queue.pop(), ()):
+                if dependent not in dirty:
+                    dirty.add(dependent)
+                    queue.append(dependent)
+        return dirty
+
+    def to_dict(self):
+        return {'version': GRAPH_FORMAT_VERSION, 'views': self.views}
+
+    def save(self, file_path):
+        """Write the graph as JSON (temp file + rename, only when the content changed)"""
+        content = json.dumps(self.to_dict(), indent=2, sort_keys=True) + '\n'
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                if f.read() == content:
+                    return False
+        except (FileNotFoundError, OSError):
+            pass
+        os.makedirs(os.path.dirname(file_path) or '.', exist_ok=True)
+        tmp_path = f"{file_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_path, file_path)
+        return True
+
+    @classmethod
+    def load(cls, file_path):
+        """Graph saved by a previous build, empty if missing or from another format version"""
+        graph = cls()
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, OSError, ValueError):
+            return graph
+        if data.get('version') == GRAPH_FORMAT_VERSION:
+            graph.views = data.get('views', {})
+        return graph
+
+    def format(self, view_names=None):
+        """Printable listing: each view with what it references and what references it"""
+        reverse = self.dependents()
+        block_owners = self.block_owners()
+        lines = []
+        for view_name in sorted(view_names or self.views):
+            entry = self.views.get(view_name)
+            if entry is None:
+                continue
+            lines.append(view_name)
+            for label, key in (('extends', 'extends'), ('includes', 'includes'), ('uses blocks', 'uses_blocks'), ('defines blocks', 'blocks')):
+                if entry[key]:
+                    lines.append(f"  {label}: {', '.join(entry[key])}")
+            if entry['dynamic']:
+                lines.append(f"  dynamic references: {entry['dynamic']}")
+            used_by = sorted(reverse.get(view_name, ()))
+            if used_by:
+                lines.append(f"  used by: {', '.join(used_by)}")
+            missing = sorted(dep for dep in self.dependencies(view_name, block_owners) if dep not in self.views)
+            if missing:
+                lines.append(f"  not in build: {', '.join(missing)}")
+        return '\n'.join(lines)
+
+
+def main(argv=None):
+    """Print the persisted graph: dependency_graph.py [--dirty view ...]"""
+    import sys
+    import argparse
+    from config import CompilerConfig
+
+    parser = argparse.ArgumentParser(description="Print the view dependency graph written by build.py")
+    parser.add_argument('--file', help="Graph JSON (default: build output view-dependencies.json)")
+    parser.add_argument('--dirty', nargs='+', metavar='VIEW', help="Print the views affected by a change of VIEW")
+    args = parser.parse_args(argv)
+
+    file_path = args.file or CompilerConfig().get_build_view_dependencies_path()
+    graph = ViewDependencyGraph.load(file_path)
+    if not graph.views:
+        print(f"No dependency graph found at {file_path}, run build.py first")
+        sys.exit(1)
+
+    if args.dirty:
+        for view_name in sorted(graph.dirty_set(args.dirty)):
+            print(view_name)
+    else:
+        print(graph.format())
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ Processors cho các Blade directives khác nhau
 from config import JS_FUNCTION_PREFIX, HTML_ATTR_PREFIX
 from php_converter import php_to_js, convert_php_array_to_json
 from utils import extract_balanced_parentheses
+from template_ast import DirectiveBlockNode, WrapperNode, innermost_kind
 import re
 
 class DirectiveProcessor:
@@ -108,8 +109,9 @@ class DirectiveProcessor:
             if empty_match:
                 variable = empty_match.group(1)
                 result = f'${{{JS_FUNCTION_PREFIX}.execute(() => {{\nif({JS_FUNCTION_PREFIX}.isEmpty({variable})){{\nreturn `'
-                output.append(result)
-                stack.append(('empty', len(output)))
+                node = DirectiveBlockNode('empty', result, "`;\n    }\n})}")
+                output.append(node)
+                stack.append(node)
                 return True
         return False
     
@@ -121,26 +123,23 @@ class DirectiveProcessor:
             if isset_match:
                 variable = isset_match.group(1)
                 result = f'${{{JS_FUNCTION_PREFIX}.execute(() => {{\nif({JS_FUNCTION_PREFIX}.isSet({variable})){{\nreturn `'
-                output.append(result)
-                stack.append(('isset', len(output)))
+                node = DirectiveBlockNode('isset', result, "`;\n    }\n})}")
+                output.append(node)
+                stack.append(node)
                 return True
         return False
     
     def process_endempty_directive(self, stack, output):
         """Process @endempty directive"""
-        if stack and stack[-1][0] == 'empty':
-            stack.pop()
-            result = "`;\n    }\n})}"
-            output.append(result)
+        if innermost_kind(stack) == 'empty':
+            stack.pop().closed = True
             return True
         return False
     
     def process_endisset_directive(self, stack, output):
         """Process @endisset directive"""
-        if stack and stack[-1][0] == 'isset':
-            stack.pop()
-            result = "`;\n    }\n})}"
-            output.append(result)
+        if innermost_kind(stack) == 'isset':
+            stack.pop().closed = True
             return True
         return False
     
@@ -163,18 +162,16 @@ class DirectiveProcessor:
     def process_php_directive(self, line, stack, output):
         """Process @php directive"""
         if line.startswith('@php'):
-            result = f'${{{JS_FUNCTION_PREFIX}.execute(() => {{'
-            output.append(result)
-            stack.append(('php', len(output)))
+            node = DirectiveBlockNode('php', f'${{{JS_FUNCTION_PREFIX}.execute(() => {{', '})}')
+            output.append(node)
+            stack.append(node)
             return True
         return False
     
     def process_endphp_directive(self, stack, output):
         """Process @endphp directive"""
-        if stack and stack[-1][0] == 'php':
-            stack.pop()
-            result = '})}'
-            output.append(result)
+        if innermost_kind(stack) == 'php':
+            stack.pop().closed = True
             return True
         return False
     
@@ -213,15 +210,17 @@ class DirectiveProcessor:
         """Process @register directive - chỉ để đánh dấu, không tạo output"""
         if line.startswith('@register'):
             # Chỉ đánh dấu để parser biết bắt đầu @register block
-            stack.append(('register', len(output)))
+            node = DirectiveBlockNode('register')
+            output.append(node)
+            stack.append(node)
             return True
         return False
     
     def process_endregister_directive(self, stack, output):
         """Process @endregister directive - chỉ để đánh dấu, không tạo output"""
-        if stack and stack[-1][0] == 'register':
-            stack.pop()
+        if innermost_kind(stack) == 'register':
             # Không tạo output, chỉ đóng register block
+            stack.pop().closed = True
             return True
         return False
     
@@ -261,18 +260,18 @@ class DirectiveProcessor:
             arg1_js = php_to_js(arg1)
             arg2_js = php_to_js(arg2)
             
-            # Tạo output với function call
-            wrapper_output = '${' + JS_FUNCTION_PREFIX + '.startWrapper(' + arg1_js + ', ' + arg2_js + ', __VIEW_ID__)}'
-            
-            stack.append(('wrapper', len(output)))
-            return wrapper_output
+            # startWrapper/endWrapper calls được sinh bởi TemplateCodeGenerator
+            node = WrapperNode(arg1_js, arg2_js)
+            output.append(node)
+            stack.append(node)
+            return True
         return False
     
     def process_endwrapper_directive(self, stack, output):
         """Process @endwrapper directive"""
-        if stack and stack[-1][0] == 'wrapper':
-            stack.pop()
-            return '${' + JS_FUNCTION_PREFIX + '.endWrapper(__VIEW_ID__)}'
+        if innermost_kind(stack) == 'wrapper':
+            stack.pop().closed = True
+            return True
         return False
     
     def _parse_wrapper_params(self, params_str):
@@ -3,14 +3,20 @@ Generators cho các functions (render, prerender, init, etc.)
 """
 
 from config import JS_FUNCTION_PREFIX, HTML_ATTR_PREFIX
+from reactive_blocks import wrap_reactive_holes
 import re
+import tracing
 
 class FunctionGenerators:
     def __init__(self):
         pass
     
-    def generate_render_function(self, template_content, vars_declaration, extended_view, extends_expression, extends_data, sections_info=None, has_prerender=False, setup_script="", directives_line="", outer_before="", outer_after=""):
-        """Generate render function with support for outer content (junk content)"""
+    def generate_render_function(self, template_content, vars_declaration, extended_view, extends_expression, extends_data, sections_info=None, has_prerender=False, setup_script="", directives_line="", outer_before="", outer_after="", reactive_state_keys=None, reactive_dependencies=None):
+        """Generate render function with support for outer content (junk content)
+        
+        reactive_state_keys: state keys whose holes are wrapped in reactive blocks (None = tắt);
+        số block của mỗi key được cộng vào reactive_dependencies.
+        """
         # NOTE: vars_line and directives_line are now handled in wrapper scope
         # No need to call updateVariableData here
         vars_line = ""  # Don't generate vars line anymore
@@ -56,15 +62,19 @@ class FunctionGenerators:
                 if not use_vars:
                     if section_type == 'short':
                         pattern = fr'\$\{{{JS_FUNCTION_PREFIX}\.section\([\'"]{re.escape(section_name)}[\'"],\s*[^)]+\)\}}'
-                        filtered_template = re.sub(pattern, '', filtered_template)
+                        filtered_template = tracing.sub(pattern, '', filtered_template)
                     else:  # long section
                         pattern = fr'\$\{{{JS_FUNCTION_PREFIX}\.section\([\'"]{re.escape(section_name)}[\'"],\s*\`[^\`]*\`,\s*[\'"]html[\'"]\)\}}'
-                        filtered_template = re.sub(pattern, '', filtered_template, flags=re.DOTALL)
+                        filtered_template = tracing.sub(pattern, '', filtered_template, flags=re.DOTALL)
                 # If section uses vars, keep it in render (dynamic sections)
         
         # Không cần escape template content vì đã được xử lý đúng cách
         filtered_template_escaped = filtered_template
         
+        # Hole đọc state chỉ render lại khi state đó thay đổi
+        if reactive_state_keys:
+            filtered_template_escaped, _ = wrap_reactive_holes(filtered_template_escaped, reactive_state_keys, reactive_dependencies)
+        
         # Replace updateStateByKey('stateKey', value) with update$stateKey(value)
         if directives_line and 'updateStateByKey' in directives_line:
             # Extract all state keys from directives_line
@@ -73,7 +83,7 @@ class FunctionGenerators:
                 # Replace updateStateByKey('stateKey', value) with update$stateKey(value)
                 pattern = rf"updateStateByKey\('{re.escape(state_key)}',\s*([^)]+)\)"
                 replacement = rf"update${state_key}(\1)"
-                filtered_template_escaped = re.sub(pattern, replacement, filtered_template_escaped)
+                filtered_template_escaped = tracing.sub(pattern, replacement, filtered_template_escaped)
         
         # Thêm setup script nhưng loại bỏ useState declarations nếu đã có cơ chế register & update
         setup_line = ""
@@ -97,10 +107,10 @@ class FunctionGenerators:
                 for state_key in state_keys:
                     # Tìm và loại bỏ const [stateKey, setStateKey] = useState(...);
                     pattern = rf'const\s+\[{re.escape(state_key)},\s*[^]]+\]\s*=\s*useState\([^)]+\);'
-                    filtered_setup = re.sub(pattern, '', filtered_setup)
+                    filtered_setup = tracing.sub(pattern, '', filtered_setup)
                 
                 # Loại bỏ dòng trống nếu có
-                filtered_setup = re.sub(r'^\s*\n', '', filtered_setup)
+                filtered_setup = tracing.sub(r'^\s*\n', '', filtered_setup)
                 
                 setup_line = "    " + filtered_setup + "\n" if filtered_setup.strip() else ""
             else:
@@ -108,13 +118,13 @@ class FunctionGenerators:
                 setup_line = "    " + setup_script + "\n"
         
         # Replace App.View.section with this.__section in render function (for short sections)
-        filtered_template_escaped = re.sub(r'App\.View\.section\(', 'this.__section(', filtered_template_escaped)
+        filtered_template_escaped = tracing.sub(r'App\.View\.section\(', 'this.__section(', filtered_template_escaped)
         # Replace App.View.text with this.__text in render function
-        filtered_template_escaped = re.sub(r'App\.View\.text\(', 'this.__text(', filtered_template_escaped)
+        filtered_template_escaped = tracing.sub(r'App\.View\.text\(', 'this.__text(', filtered_template_escaped)
         # Add __ prefix to methods that don't have it yet
-        filtered_template_escaped = re.sub(r'this\.subscribeBlock\(', 'this.__subscribeBlock(', filtered_template_escaped)
-        filtered_template_escaped = re.sub(r'this\.useBlock\(', 'this.__useBlock(', filtered_template_escaped)
-        filtered_template_escaped = re.sub(r'this\.showError\(', 'this.__showError(', filtered_template_escaped)
+        filtered_template_escaped = tracing.sub(r'this\.subscribeBlock\(', 'this.__subscribeBlock(', filtered_template_escaped)
+        filtered_template_escaped = tracing.sub(r'this\.useBlock\(', 'this.__useBlock(', filtered_template_escaped)
+        filtered_template_escaped = tracing.sub(r'this\.showError\(', 'this.__showError(', filtered_template_escaped)
         
         if extended_view:
             data_param = ", " + extends_data if extends_data else ""
@@ -249,35 +259,35 @@ class FunctionGenerators:
         processed_template = template_content
         
         # Replace all methods with Scan versions
-        processed_template = re.sub(r'this\.addBlock\(', 'this.__blockScan(', processed_template)
-        processed_template = re.sub(r'this\.renderFollowingBlock\(', 'this.__followScan(', processed_template)
-        processed_template = re.sub(r'this\.__include\(', 'this.__includeScan(', processed_template)
-        processed_template = re.sub(r'this\.__includeif\(', 'this.__includeifScan(', processed_template)
-        processed_template = re.sub(r'this\.__includewhen\(', 'this.__includewhenScan(', processed_template)
-        processed_template = re.sub(r'this\.__extends\(', 'this.__extendsScan(', processed_template)
-        processed_template = re.sub(r'this\.__showError\(', 'this.__showErrorScan(', processed_template)
+        processed_template = tracing.sub(r'this\.addBlock\(', 'this.__blockScan(', processed_template)
+        processed_template = tracing.sub(r'this\.renderFollowingBlock\(', 'this.__followScan(', processed_template)
+        processed_template = tracing.sub(r'this\.__include\(', 'this.__includeScan(', processed_template)
+        processed_template = tracing.sub(r'this\.__includeif\(', 'this.__includeifScan(', processed_template)
+        processed_template = tracing.sub(r'this\.__includewhen\(', 'this.__includewhenScan(', processed_template)
+        processed_template = tracing.sub(r'this\.__extends\(', 'this.__extendsScan(', processed_template)
+        processed_template = tracing.sub(r'this\.__showError\(', 'this.__showErrorScan(', processed_template)
         # Replace App.View.section with this.__sectionScan (for short sections)
-        processed_template = re.sub(r'App\.View\.section\(', 'this.__sectionScan(', processed_template)
+        processed_template = tracing.sub(r'App\.View\.section\(', 'this.__sectionScan(', processed_template)
         # Replace this.__section with this.__sectionScan (for long sections)
-        processed_template = re.sub(r'this\.__section\(', 'this.__sectionScan(', processed_template)
+        processed_template = tracing.sub(r'this\.__section\(', 'this.__sectionScan(', processed_template)
         # Replace App.View.text with this.__textScan
-        processed_template = re.sub(r'App\.View\.text\(', 'this.__textScan(', processed_template)
+        processed_template = tracing.sub(r'App\.View\.text\(', 'this.__textScan(', processed_template)
         # Replace this.__text with this.__textScan
-        processed_template = re.sub(r'this\.__text\(', 'this.__textScan(', processed_template)
-        processed_template = re.sub(r'this\.subscribe\(', 'this.__subscribeScan(', processed_template)
-        processed_template = re.sub(r'this\.__subscribe\(', 'this.__subscribeScan(', processed_template)
-        processed_template = re.sub(r'this\.__follow\(', 'this.__followScan(', processed_template)
-        processed_template = re.sub(r'this\.__block\(', 'this.__blockScan(', processed_template)
+        processed_template = tracing.sub(r'this\.__text\(', 'this.__textScan(', processed_template)
+        processed_template = tracing.sub(r'this\.subscribe\(', 'this.__subscribeScan(', processed_template)
+        processed_template = tracing.sub(r'this\.__subscribe\(', 'this.__subscribeScan(', processed_template)
+        processed_template = tracing.sub(r'this\.__follow\(', 'this.__followScan(', processed_template)
+        processed_template = tracing.sub(r'this\.__block\(', 'this.__blockScan(', processed_template)
         # Replace block-related methods (both with and without __ prefix)
-        processed_template = re.sub(r'this\.subscribeBlock\(', 'this.__subscribeBlockScan(', processed_template)
-        processed_template = re.sub(r'this\.__subscribeBlock\(', 'this.__subscribeBlockScan(', processed_template)
-        processed_template = re.sub(r'this\.useBlock\(', 'this.__useBlockScan(', processed_template)
-        processed_template = re.sub(r'this\.__useBlock\(', 'this.__useBlockScan(', processed_template)
+        processed_template = tracing.sub(r'this\.subscribeBlock\(', 'this.__subscribeBlockScan(', processed_template)
+        processed_template = tracing.sub(r'this\.__subscribeBlock\(', 'this.__subscribeBlockScan(', processed_template)
+        processed_template = tracing.sub(r'this\.useBlock\(', 'this.__useBlockScan(', processed_template)
+        processed_template = tracing.sub(r'this\.__useBlock\(', 'this.__useBlockScan(', processed_template)
         # Replace event-related methods
-        processed_template = re.sub(r'this\.__addEventConfig\(', 'this.__addEventConfigScan(', processed_template)
-        processed_template = re.sub(r'this\.__addEventQuickHandle\(', 'this.__addEventQuickHandleScan(', processed_template)
+        processed_template = tracing.sub(r'this\.__addEventConfig\(', 'this.__addEventConfigScan(', processed_template)
+        processed_template = tracing.sub(r'this\.__addEventQuickHandle\(', 'this.__addEventQuickHandleScan(', processed_template)
         # Replace App.View.renderView with App.View.scanRenderedView
-        processed_template = re.sub(r'App\.View\.renderView\(', 'App.View.scanRenderedView(', processed_template)
+        processed_template = tracing.sub(r'App\.View\.renderView\(', 'App.View.scanRenderedView(', processed_template)
         
         return processed_template
     
@@ -288,18 +298,18 @@ class FunctionGenerators:
             content = match.group(2)
             
             # Revert Scan methods inside the content
-            content = re.sub(r'this\.__blockScan\(', 'this.__block(', content)
-            content = re.sub(r'this\.__includeScan\(', 'this.__include(', content)
-            content = re.sub(r'this\.__includeifScan\(', 'this.__includeif(', content)
-            content = re.sub(r'this\.__includewhenScan\(', 'this.__includewhen(', content)
-            content = re.sub(r'this\.__extendsScan\(', 'this.__extends(', content)
-            content = re.sub(r'this\.showErrorScan\(', 'this.showError(', content)
-            content = re.sub(r'this\.__sectionScan\(', 'this.__section(', content)
-            content = re.sub(r'this\.__subscribeScan\(', 'this.__subscribe(', content)
-            content = re.sub(r'this\.__followScan\(', 'this.__follow(', content)
-            content = re.sub(r'this\.__addEventConfigScan\(', 'this.__addEventConfig(', content)
-            content = re.sub(r'this\.__addEventQuickHandleScan\(', 'this.__addEventQuickHandle(', content)
-            content = re.sub(r'App\.View\.scanRenderedView\(', 'App.View.renderView(', content)
+            content = tracing.sub(r'this\.__blockScan\(', 'this.__block(', content)
+            content = tracing.sub(r'this\.__includeScan\(', 'this.__include(', content)
+            content = tracing.sub(r'this\.__includeifScan\(', 'this.__includeif(', content)
+            content = tracing.sub(r'this\.__includewhenScan\(', 'this.__includewhen(', content)
+            content = tracing.sub(r'this\.__extendsScan\(', 'this.__extends(', content)
+            content = tracing.sub(r'this\.showErrorScan\(', 'this.showError(', content)
+            content = tracing.sub(r'this\.__sectionScan\(', 'this.__section(', content)
+            content = tracing.sub(r'this\.__subscribeScan\(', 'this.__subscribe(', content)
+            content = tracing.sub(r'this\.__followScan\(', 'this.__follow(', content)
+            content = tracing.sub(r'this\.__addEventConfigScan\(', 'this.__addEventConfig(', content)
+            content = tracing.sub(r'this\.__addEventQuickHandleScan\(', 'this.__addEventQuickHandle(', content)
+            content = tracing.sub(r'App\.View\.scanRenderedView\(', 'App.View.renderView(', content)
             
             # Keep the outer __followScan but revert inner content
             return f"${{this.__followScan({params}, () => `{content}`)}}"
@@ -308,7 +318,7 @@ class FunctionGenerators:
         pattern = r'\$\{this\.__followScan\((\[[^\]]+\])\s*,\s*\(\)\s*=>\s*`(.*?)`\s*\)\}'
         
         # Process all matches
-        processed_template = re.sub(pattern, revert_follow_content, template_content, flags=re.DOTALL)
+        processed_template = tracing.sub(pattern, revert_follow_content, template_content, flags=re.DOTALL)
         
         return processed_template
     
@@ -324,17 +334,17 @@ class FunctionGenerators:
             content = match.group(2)
             
             # Revert Scan methods inside the content
-            content = re.sub(r'this\.__blockScan\(', 'this.__block(', content)
-            content = re.sub(r'this\.__includeScan\(', 'this.__include(', content)
-            content = re.sub(r'this\.__includeifScan\(', 'this.__includeif(', content)
-            content = re.sub(r'this\.__includewhenScan\(', 'this.__includewhen(', content)
-            content = re.sub(r'this\.__extendsScan\(', 'this.__extends(', content)
-            content = re.sub(r'this\.showErrorScan\(', 'this.showError(', content)
-            content = re.sub(r'this\.__sectionScan\(', 'this.__section(', content)
-            content = re.sub(r'this\.__subscribeScan\(', 'this.__subscribe(', content)
-            content = re.sub(r'this\.__followScan\(', 'this.__follow(', content)
-            content = re.sub(r'this\.__addEventConfigScan\(', 'this.__addEventConfig(', content)
-            content = re.sub(r'App\.View\.scanRenderedView\(', 'App.View.renderView(', content)
+            content = tracing.sub(r'this\.__blockScan\(', 'this.__block(', content)
+            content = tracing.sub(r'this\.__includeScan\(', 'this.__include(', content)
+            content = tracing.sub(r'this\.__includeifScan\(', 'this.__includeif(', content)
+            content = tracing.sub(r'this\.__includewhenScan\(', 'this.__includewhen(', content)
+            content = tracing.sub(r'this\.__extendsScan\(', 'this.__extends(', content)
+            content = tracing.sub(r'this\.showErrorScan\(', 'this.showError(', content)
+            content = tracing.sub(r'this\.__sectionScan\(', 'this.__section(', content)
+            content = tracing.sub(r'this\.__subscribeScan\(', 'this.__subscribe(', content)
+            content = tracing.sub(r'this\.__followScan\(', 'this.__follow(', content)
+            content = tracing.sub(r'this\.__addEventConfigScan\(', 'this.__addEventConfig(', content)
+            content = tracing.sub(r'App\.View\.scanRenderedView\(', 'App.View.renderView(', content)
             
             # Convert to __followScan format
             return f"${{this.__followScan({params}, () => `{content}`)}}"
@@ -344,7 +354,7 @@ class FunctionGenerators:
         
         
         # Process all matches
-        processed_template = re.sub(pattern, process_follow_match, template_content, flags=re.DOTALL)
+        processed_template = tracing.sub(pattern, process_follow_match, template_content, flags=re.DOTALL)
         
         return processed_template
     
@@ -402,15 +412,15 @@ class FunctionGenerators:
         content = follow_block[backtick_start+1:backtick_end]
         
         # Revert Scan methods inside the content
-        content = re.sub(r'this\.__blockScan\(', 'this.__block(', content)
-        content = re.sub(r'this\.__includeScan\(', 'this.__include(', content)
-        content = re.sub(r'this\.__includeifScan\(', 'this.__includeif(', content)
-        content = re.sub(r'this\.__includewhenScan\(', 'this.__includewhen(', content)
-        content = re.sub(r'this\.__extendsScan\(', 'this.__extends(', content)
-        content = re.sub(r'this\.showErrorScan\(', 'this.showError(', content)
-        content = re.sub(r'this\.__sectionScan\(', 'this.__section(', content)
-        content = re.sub(r'this\.__subscribeScan\(', 'this.__subscribe(', content)
-        content = re.sub(r'this\.__followScan\(', 'this.__follow(', content)
+        content = tracing.sub(r'this\.__blockScan\(', 'this.__block(', content)
+        content = tracing.sub(r'this\.__includeScan\(', 'this.__include(', content)
+        content = tracing.sub(r'this\.__includeifScan\(', 'this.__includeif(', content)
+        content = tracing.sub(r'this\.__includewhenScan\(', 'this.__includewhen(', content)
+        content = tracing.sub(r'this\.__extendsScan\(', 'this.__extends(', content)
+        content = tracing.sub(r'this\.showErrorScan\(', 'this.showError(', content)
+        content = tracing.sub(r'this\.__sectionScan\(', 'this.__section(', content)
+        content = tracing.sub(r'this\.__subscribeScan\(', 'this.__subscribe(', content)
+        content = tracing.sub(r'this\.__followScan\(', 'this.__follow(', content)
         
         # Convert to __followScan format
         result = f"${{this.__followScan({params}, () => `{content}`)}}"
@@ -421,59 +431,59 @@ class FunctionGenerators:
         processed_template = template_content
         
         # Replace addBlock with __blockScan
-        processed_template = re.sub(r'this\.addBlock\(', 'this.__blockScan(', processed_template)
+        processed_template = tracing.sub(r'this\.addBlock\(', 'this.__blockScan(', processed_template)
         
         # Replace renderFollowingBlock with __followScan
-        processed_template = re.sub(r'this\.renderFollowingBlock\(', 'this.__followScan(', processed_template)
+        processed_template = tracing.sub(r'this\.renderFollowingBlock\(', 'this.__followScan(', processed_template)
         
         # Replace __include with __includeScan
-        processed_template = re.sub(r'this\.__include\(', 'this.__includeScan(', processed_template)
+        processed_template = tracing.sub(r'this\.__include\(', 'this.__includeScan(', processed_template)
         
         # Replace __includeif with __includeifScan
-        processed_template = re.sub(r'this\.__includeif\(', 'this.__includeifScan(', processed_template)
+        processed_template = tracing.sub(r'this\.__includeif\(', 'this.__includeifScan(', processed_template)
         
         # Replace __includewhen with __includewhenScan
-        processed_template = re.sub(r'this\.__includewhen\(', 'this.__includewhenScan(', processed_template)
+        processed_template = tracing.sub(r'this\.__includewhen\(', 'this.__includewhenScan(', processed_template)
         
         # Replace __extends with __extendsScan
-        processed_template = re.sub(r'this\.__extends\(', 'this.__extendsScan(', processed_template)
+        processed_template = tracing.sub(r'this\.__extends\(', 'this.__extendsScan(', processed_template)
         
         # Replace showError with showErrorScan
-        processed_template = re.sub(r'this\.__showError\(', 'this.__showErrorScan(', processed_template)
+        processed_template = tracing.sub(r'this\.__showError\(', 'this.__showErrorScan(', processed_template)
         
         # Replace App.View.section with this.__sectionScan (for short sections)
-        processed_template = re.sub(r'App\.View\.section\(', 'this.__sectionScan(', processed_template)
+        processed_template = tracing.sub(r'App\.View\.section\(', 'this.__sectionScan(', processed_template)
         
         # Replace this.__section with this.__sectionScan (for long sections)
-        processed_template = re.sub(r'this\.__section\(', 'this.__sectionScan(', processed_template)
+        processed_template = tracing.sub(r'this\.__section\(', 'this.__sectionScan(', processed_template)
         
         # Replace App.View.text with this.__textScan
-        processed_template = re.sub(r'App\.View\.text\(', 'this.__textScan(', processed_template)
+        processed_template = tracing.sub(r'App\.View\.text\(', 'this.__textScan(', processed_template)
         
         # Replace this.__text with this.__textScan
-        processed_template = re.sub(r'this\.__text\(', 'this.__textScan(', processed_template)
+        processed_template = tracing.sub(r'this\.__text\(', 'this.__textScan(', processed_template)
         
         # Replace this.subscribe with this.__subscribeScan
-        processed_template = re.sub(r'this\.subscribe\(', 'this.__subscribeScan(', processed_template)
+        processed_template = tracing.sub(r'this\.subscribe\(', 'this.__subscribeScan(', processed_template)
         
         # Replace this.__subscribe with this.__subscribeScan
-        processed_template = re.sub(r'this\.__subscribe\(', 'this.__subscribeScan(', processed_template)
+        processed_template = tracing.sub(r'this\.__subscribe\(', 'this.__subscribeScan(', processed_template)
         
         # Replace this.__follow with this.__followScan
-        processed_template = re.sub(r'this\.__follow\(', 'this.__followScan(', processed_template)
+        processed_template = tracing.sub(r'this\.__follow\(', 'this.__followScan(', processed_template)
         
         # Replace this.__block with this.__blockScan
-        processed_template = re.sub(r'this\.__block\(', 'this.__blockScan(', processed_template)
+        processed_template = tracing.sub(r'this\.__block\(', 'this.__blockScan(', processed_template)
         
         # Replace block-related methods (both with and without __ prefix)
-        processed_template = re.sub(r'this\.subscribeBlock\(', 'this.__subscribeBlockScan(', processed_template)
-        processed_template = re.sub(r'this\.__subscribeBlock\(', 'this.__subscribeBlockScan(', processed_template)
-        processed_template = re.sub(r'this\.useBlock\(', 'this.__useBlockScan(', processed_template)
-        processed_template = re.sub(r'this\.__useBlock\(', 'this.__useBlockScan(', processed_template)
+        processed_template = tracing.sub(r'this\.subscribeBlock\(', 'this.__subscribeBlockScan(', processed_template)
+        processed_template = tracing.sub(r'this\.__subscribeBlock\(', 'this.__subscribeBlockScan(', processed_template)
+        processed_template = tracing.sub(r'this\.useBlock\(', 'this.__useBlockScan(', processed_template)
+        processed_template = tracing.sub(r'this\.__useBlock\(', 'this.__useBlockScan(', processed_template)
         # Replace event-related methods
-        processed_template = re.sub(r'this\.__addEventConfig\(', 'this.__addEventConfigScan(', processed_template)
+        processed_template = tracing.sub(r'this\.__addEventConfig\(', 'this.__addEventConfigScan(', processed_template)
         # Replace App.View.renderView with App.View.scanRenderedView
-        processed_template = re.sub(r'App\.View\.renderView\(', 'App.View.scanRenderedView(', processed_template)
+        processed_template = tracing.sub(r'App\.View\.renderView\(', 'App.View.scanRenderedView(', processed_template)
         
         return processed_template
     
@@ -504,15 +514,15 @@ class FunctionGenerators:
             lambda_content = lambda_match.group(2)
             
             # Revert Scan methods inside lambda content
-            lambda_content = re.sub(r'this\.__blockScan\(', 'this.__block(', lambda_content)
-            lambda_content = re.sub(r'this\.__includeScan\(', 'this.__include(', lambda_content)
-            lambda_content = re.sub(r'this\.__includeifScan\(', 'this.__includeif(', lambda_content)
-            lambda_content = re.sub(r'this\.__includewhenScan\(', 'this.__includewhen(', lambda_content)
-            lambda_content = re.sub(r'this\.__extendsScan\(', 'this.__extends(', lambda_content)
-            lambda_content = re.sub(r'this\.showErrorScan\(', 'this.showError(', lambda_content)
-            lambda_content = re.sub(r'this\.__sectionScan\(', 'this.__section(', lambda_content)
-            lambda_content = re.sub(r'this\.__subscribeScan\(', 'this.__subscribe(', lambda_content)
-            lambda_content = re.sub(r'this\.__followScan\(', 'this.__follow(', lambda_content)
+            lambda_content = tracing.sub(r'this\.__blockScan\(', 'this.__block(', lambda_content)
+            lambda_content = tracing.sub(r'this\.__includeScan\(', 'this.__include(', lambda_content)
+            lambda_content = tracing.sub(r'this\.__includeifScan\(', 'this.__includeif(', lambda_content)
+            lambda_content = tracing.sub(r'this\.__includewhenScan\(', 'this.__includewhen(', lambda_content)
+            lambda_content = tracing.sub(r'this\.__extendsScan\(', 'this.__extends(', lambda_content)
+            lambda_content = tracing.sub(r'this\.showErrorScan\(', 'this.showError(', lambda_content)
+            lambda_content = tracing.sub(r'this\.__sectionScan\(', 'this.__section(', lambda_content)
+            lambda_content = tracing.sub(r'this\.__subscribeScan\(', 'this.__subscribe(', lambda_content)
+            lambda_content = tracing.sub(r'this\.__followScan\(', 'this.__follow(', lambda_content)
             
             # Reconstruct the follow block with reverted lambda content
             result = f"${{this.__followScan({params}, () => `{lambda_content}`)}}"
@@ -582,47 +592,47 @@ class FunctionGenerators:
         virtual_render = render_function
         
         # Replace addBlock with __blockScan
-        virtual_render = re.sub(r'this\.addBlock\(', 'this.__blockScan(', virtual_render)
+        virtual_render = tracing.sub(r'this\.addBlock\(', 'this.__blockScan(', virtual_render)
         
         # Replace renderFollowingBlock with __followScan
-        virtual_render = re.sub(r'this\.renderFollowingBlock\(', 'this.__followScan(', virtual_render)
+        virtual_render = tracing.sub(r'this\.renderFollowingBlock\(', 'this.__followScan(', virtual_render)
         
         # Replace __include with __includeScan
-        virtual_render = re.sub(r'this\.__include\(', 'this.__includeScan(', virtual_render)
+        virtual_render = tracing.sub(r'this\.__include\(', 'this.__includeScan(', virtual_render)
         
         # Replace __includeif with __includeifScan
-        virtual_render = re.sub(r'this\.__includeif\(', 'this.__includeifScan(', virtual_render)
+        virtual_render = tracing.sub(r'this\.__includeif\(', 'this.__includeifScan(', virtual_render)
         
         # Replace __includewhen with __includewhenScan
-        virtual_render = re.sub(r'this\.__includewhen\(', 'this.__includewhenScan(', virtual_render)
+        virtual_render = tracing.sub(r'this\.__includewhen\(', 'this.__includewhenScan(', virtual_render)
         
         # Replace __extends with __extendsScan
-        virtual_render = re.sub(r'this\.__extends\(', 'this.__extendsScan(', virtual_render)
+        virtual_render = tracing.sub(r'this\.__extends\(', 'this.__extendsScan(', virtual_render)
         
         # Replace showError with showErrorScan
-        virtual_render = re.sub(r'this\.__showError\(', 'this.__showErrorScan(', virtual_render)
+        virtual_render = tracing.sub(r'this\.__showError\(', 'this.__showErrorScan(', virtual_render)
         
         # Replace App.View.section with this.__sectionScan (for short sections)
-        virtual_render = re.sub(r'App\.View\.section\(', 'this.__sectionScan(', virtual_render)
+        virtual_render = tracing.sub(r'App\.View\.section\(', 'this.__sectionScan(', virtual_render)
         
         # Replace this.__section with this.__sectionScan (for long sections)
-        virtual_render = re.sub(r'this\.__section\(', 'this.__sectionScan(', virtual_render)
+        virtual_render = tracing.sub(r'this\.__section\(', 'this.__sectionScan(', virtual_render)
         
         # Replace App.View.text with this.__textScan
-        virtual_render = re.sub(r'App\.View\.text\(', 'this.__textScan(', virtual_render)
+        virtual_render = tracing.sub(r'App\.View\.text\(', 'this.__textScan(', virtual_render)
         
         # Replace this.__text with this.__textScan
-        virtual_render = re.sub(r'this\.__text\(', 'this.__textScan(', virtual_render)
+        virtual_render = tracing.sub(r'this\.__text\(', 'this.__textScan(', virtual_render)
         
         # Replace block-related methods (both with and without __ prefix)
-        virtual_render = re.sub(r'this\.subscribeBlock\(', 'this.__subscribeBlockScan(', virtual_render)
-        virtual_render = re.sub(r'this\.__subscribeBlock\(', 'this.__subscribeBlockScan(', virtual_render)
-        virtual_render = re.sub(r'this\.useBlock\(', 'this.__useBlockScan(', virtual_render)
-        virtual_render = re.sub(r'this\.__useBlock\(', 'this.__useBlockScan(', virtual_render)
+        virtual_render = tracing.sub(r'this\.subscribeBlock\(', 'this.__subscribeBlockScan(', virtual_render)
+        virtual_render = tracing.sub(r'this\.__subscribeBlock\(', 'this.__subscribeBlockScan(', virtual_render)
+        virtual_render = tracing.sub(r'this\.useBlock\(', 'this.__useBlockScan(', virtual_render)
+        virtual_render = tracing.sub(r'this\.__useBlock\(', 'this.__useBlockScan(', virtual_render)
         # Replace event-related methods
-        virtual_render = re.sub(r'this\.__addEventConfig\(', 'this.__addEventConfigScan(', virtual_render)
+        virtual_render = tracing.sub(r'this\.__addEventConfig\(', 'this.__addEventConfigScan(', virtual_render)
         # Replace App.View.renderView with App.View.scanRenderedView
-        virtual_render = re.sub(r'App\.View\.renderView\(', 'App.View.scanRenderedView(', virtual_render)
+        virtual_render = tracing.sub(r'App\.View\.renderView\(', 'App.View.scanRenderedView(', virtual_render)
         
         # Process @follow blocks: remove HTML/text outside @follow, keep directives
         virtual_render = self._process_follow_blocks_for_virtual_render(virtual_render)
@@ -0,0 +1,387 @@
+"""
+Golden-output test của compiler: so sánh JS sinh ra với snapshot đã ghi trong compiler/snapshots
+
+Corpus: mọi view trong resources/views, các code block ```blade trong docs/*.md và README.md,
+một corpus fuzz sinh ngẫu nhiên từ seed cố định, và corpus shared: view file (build_view_file_content)
+của resources/views cùng vài fixture setup script ở chế độ --shared-wrapper. So sánh sau khi chuẩn hoá
+whitespace (bỏ khoảng trắng đầu/cuối dòng và dòng trống), riêng corpus shared so sánh nguyên văn vì dòng
+trống trong template literal là nội dung; nội dung wraper.js được thay bằng một marker nên sửa wraper.js
+không làm hỏng snapshot.
+
+    cd scripts
+    python3 -m compiler.golden                   # Exit 1 nếu output khác snapshot
+    python3 -m compiler.golden --update          # Ghi lại snapshot sau một thay đổi output có chủ đích
+    python3 -m compiler.golden --check-syntax    # Kiểm tra thêm cú pháp JS bằng `node --check`
+"""
+
+import os
+import re
+import sys
+import glob
+import random
+import shutil
+import difflib
+import argparse
+import tempfile
+import subprocess
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from main_compiler import BladeCompiler, build_view_file_content
+from config import CompilerConfig
+from wrapper_parser import SHARED_WRAPPER_FILE
+from bench import project_views
+
+SNAPSHOTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'snapshots')
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+CORPORA = ('views', 'docs', 'fuzz', 'shared')
+# Corpus so sánh nguyên văn thay vì sau normalize()
+EXACT_CORPORA = ('shared',)
+WRAPPER_MARKER = '/* wraper.js */'
+# View có output hiện tại không parse được bằng node (lỗi đã biết của compiler), ghi bởi --update --check-syntax
+KNOWN_SYNTAX_ERRORS_FILE = os.path.join(SNAPSHOTS_DIR, 'known-syntax-errors.txt')
+# Corpus không được có lỗi đã biết: fuzzer chỉ sinh template hợp lệ nên mọi lỗi cú pháp đều fail
+STRICT_SYNTAX_CORPORA = ('fuzz',)
+
+DEFAULT_FUZZ_SEED = 20240101
+DEFAULT_FUZZ_COUNT = 40
+
+
+# View có setup script: phần trước `export function` của view file phải giữ nguyên từng dòng
+SHARED_FIXTURES = [
+    ('setup-blank-lines', """@vars($title = 'Setup')
+<div>{{ $title }}</div>
+@register
+<script setup>
+import { marked } from '@app/lib/marked.js';
+
+function renderSample(text) {
+    const html = marked(text);
+
+    return html;
+}
+</script>
+@endregister
+"""),
+    ('setup-multiple-scripts', """<section>
+<pre><code>line one
+
+line two</code></pre>
+</section>
+@register
+<script setup>
+import { ViewEngine } from '@app/core/ViewEngine.js';
+</script>
+<script>
+const banner = 'top';
+
+const footer = 'bottom';
+export default {
+    mounted() {
+        console.log(banner, footer);
+    }
+}
+</script>
+@endregister
+"""),
+]
+
+
+def docs_views(root=PROJECT_ROOT):
+    """(name, source) of every ```blade block in docs/*.md and README.md, named <file>-<n>"""
+    views = []
+    files = sorted(glob.glob(os.path.join(root, 'docs', '*.md'))) + [os.path.join(root, 'README.md')]
+    for file_path in files:
+        if not os.path.exists(file_path):
+            continue
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        stem = os.path.splitext(os.path.basename(file_path))[0]
+        blocks = re.findall(r'^```blade[^\n]*\n(.*?)^```', content, re.MULTILINE | re.DOTALL)
+        for index, block in enumerate(blocks, 1):
+            if block.strip():
+                views.append((f"{stem}-{index:02d}", block))
+    return views
+
+
+class TemplateFuzzer:
+    """Random but reproducible Blade templates built from the directives the compiler supports
+
+    Chỉ sinh cú pháp mà compiler dịch ra JS hợp lệ: output fuzz không parse được là lỗi mới,
+    không được ghi vào known-syntax-errors.txt
+    """
+
+    VARIABLES = ['$title', '$count', '$user->name', "$user['email']", '$items', '$flag', '$page']
+    # Giá trị mảng của @include chỉ là biến đơn/literal: truy cập thuộc tính, phần tử và lời gọi hàm
+    # trong mảng không được chuyển sang JS
+    INCLUDE_VALUES = ['$title', '$count', '$items', '$flag', '$page', "'static'", '42']
+
+    def __init__(self, seed):
+        self.random = random.Random(seed)
+
+    def expression(self):
+        choice = self.random.randrange(5)
+        variable = self.random.choice(self.VARIABLES)
+        if choice == 0:
+            return f"{variable} ?? 'none'"
+        if choice == 1:
+            return f"count($items) + {self.random.randrange(10)}"
+        if choice == 2:
+            return f"strtoupper({variable})"
+        if choice == 3:
+            return f"$flag ? 'yes' : 'no'"
+        return variable
+
+    def element(self, depth):
+        tag = self.random.choice(['div', 'span', 'p', 'section', 'li'])
+        choice = self.random.randrange(7)
+        if choice == 0:
+            return f'<{tag} class="c{self.random.randrange(100)}">{{{{ {self.expression()} }}}}</{tag}>'
+        if choice == 1:
+            return f'<{tag}>{{!! $html !!}}</{tag}>'
+        if choice == 2:
+            return f'<button @click(setCount($count + {self.random.randrange(5)}))>+</button>'
+        if choice == 3:
+            return f'<input type="text" @input(handleInput($event)) value="{{{{ $title }}}}">'
+        if choice == 4:
+            return f"@include('partials.item', ['value' => {self.random.choice(self.INCLUDE_VALUES)}])"
+        if choice == 5:
+            return f'<a href="/page/{{{{ $page }}}}" data-id="{self.random.randrange(1000)}">Link</a>'
+        return f'<{tag}>Static text {self.random.randrange(1000)}</{tag}>'
+
+    def block(self, depth):
+        lines = []
+        for _ in range(self.random.randint(1, 4)):
+            choice = self.random.randrange(8) if depth < 3 else 7
+            if choice == 0:
+                lines.append(f"@if({self.expression()})")
+                lines += self.block(depth + 1)
+                if self.random.random() < 0.4:
+                    lines.append(f"@elseif($count > {self.random.randrange(10)})")
+                    lines += self.block(depth + 1)
+                if self.random.random() < 0.5:
+                    lines.append("@else")
+                    lines += self.block(depth + 1)
+                lines.append("@endif")
+            elif choice == 1:
+                lines.append(self.random.choice(["@foreach($items as $item)", "@foreach($items as $key => $item)"]))
+                lines.append("<li>{{ $item }}</li>")
+                lines += self.block(depth + 1)
+                lines.append("@endforeach")
+            elif choice == 2:
+                lines.append(f"@for($i = 0; $i < {self.random.randint(1, 5)}; $i++)")
+                lines.append("<span>{{ $i }}</span>")
+                lines += self.block(depth + 1)
+                lines.append("@endfor")
+            elif choice == 3:
+                lines += ["@php", f"$local = {self.random.randrange(100)};", "@endphp"]
+                lines.append("<p>{{ $local }}</p>")
+            else:
+                lines.append(self.element(depth))
+        return lines
+
+    def template(self):
+        lines = ["@vars($title = 'Fuzz', $count = 0, $items = [], $flag = false, $page = 1, $html = '', $user = null)"]
+        if self.random.random() < 0.5:
+            lines.append("@useState($count, 0)")
+        if self.random.random() < 0.3:
+            lines.insert(0, "@extends('layouts.base')")
+            for index in range(self.random.randint(1, 3)):
+                lines.append(f"@section('section_{index}')")
+                lines += self.block(0)
+                lines.append("@endsection")
+        else:
+            lines.append("<div>")
+            lines += self.block(0)
+            lines.append("</div>")
+        return '\n'.join(lines) + '\n'
+
+
+def fuzz_views(seed=DEFAULT_FUZZ_SEED, count=DEFAULT_FUZZ_COUNT):
+    fuzzer = TemplateFuzzer(seed)
+    return [(f"fuzz-{index:03d}", fuzzer.template()) for index in range(count)]
+
+
+def shared_views(views_path=None):
+    """Project views plus SHARED_FIXTURES, compiled by compile_corpus in shared wrapper mode"""
+    return project_views(views_path or CompilerConfig().views_input_path) + SHARED_FIXTURES
+
+
+def normalize(code):
+    """Whitespace-insensitive form used for comparison: stripped lines, blank lines dropped"""
+    return '\n'.join(line.strip() for line in code.replace('\r\n', '\n').split('\n') if line.strip())
+
+
+def compile_corpus(compiler, views, wrapper_content, shared_wrapper=False):
+    """(name, output) per view; compile errors become a comment so they are snapshotted too
+
+    shared_wrapper: compile like build.py --shared-wrapper and return the view file content
+    """
+    results = []
+    devnull = open(os.devnull, 'w')
+    previous = compiler.shared_wrapper
+    compiler.shared_wrapper = f'./{SHARED_WRAPPER_FILE}' if shared_wrapper else None
+    try:
+        for view_name, source in views:
+            try:
+                # Compiler in warning ra stdout
+                with redirect_stdout(devnull):
+                    code = compiler.compile_blade_to_js(source, view_name)
+                if shared_wrapper:
+                    code = build_view_file_content(code)
+            except Exception as e:
+                code = f"// compile error: {type(e).__name__}: {e}\n"
+            if wrapper_content:
+                code = code.replace(wrapper_content, WRAPPER_MARKER)
+            results.append((view_name, code))
+    finally:
+        compiler.shared_wrapper = previous
+        devnull.close()
+    return results
+
+
+def snapshot_path(corpus, view_name):
+    return os.path.join(SNAPSHOTS_DIR, corpus, f"{view_name}.js")
+
+
+def check_syntax(code, node='node'):
+    """Error message of `node --check` on code as an ES module, None if it parses"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, 'view.mjs')
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(code)
+        result = subprocess.run([node, '--check', file_path], capture_output=True, text=True)
+    if result.returncode == 0:
+        return None
+    lines = [line for line in result.stderr.splitlines() if line.strip()]
+    return next((line for line in lines if 'Error' in line), lines[-1] if lines else 'syntax error')
+
+
+def load_known_syntax_errors():
+    """name -> error of the recorded known failures"""
+    if not os.path.exists(KNOWN_SYNTAX_ERRORS_FILE):
+        return {}
+    known = {}
+    with open(KNOWN_SYNTAX_ERRORS_FILE, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip() and not line.startswith('#'):
+                name, _, error = line.partition(':')
+                known[name.strip()] = error.strip()
+    return known
+
+
+def save_known_syntax_errors(syntax_errors):
+    with open(KNOWN_SYNTAX_ERRORS_FILE, 'w', encoding='utf-8') as f:
+        f.write("# Output không parse được bằng `node --check`; golden --check-syntax chỉ fail với lỗi mới\n")
+        for name, error in sorted(syntax_errors):
+            f.write(f"{name}: {error}\n")
+
+
+def collect_corpora(corpora, views_path=None, fuzz_seed=DEFAULT_FUZZ_SEED, fuzz_count=DEFAULT_FUZZ_COUNT):
+    sources = {}
+    if 'views' in corpora:
+        sources['views'] = project_views(views_path or CompilerConfig().views_input_path)
+    if 'docs' in corpora:
+        sources['docs'] = docs_views()
+    if 'fuzz' in corpora:
+        sources['fuzz'] = fuzz_views(fuzz_seed, fuzz_count)
+    if 'shared' in corpora:
+        sources['shared'] = shared_views(views_path)
+    return sources
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare compiler output with the recorded golden snapshots")
+    parser.add_argument('--update', action='store_true', help="Rewrite the snapshots with the current output")
+    parser.add_argument('--corpus', action='append', choices=CORPORA, help="Only this corpus (repeatable, default: all)")
+    parser.add_argument('--views', help="Blade views directory (default: views_input from compiler.config.json)")
+    parser.add_argument('--fuzz-seed', type=int, default=DEFAULT_FUZZ_SEED, help=f"Seed of the fuzzed corpus (default: {DEFAULT_FUZZ_SEED})")
+    parser.add_argument('--fuzz-count', type=int, default=DEFAULT_FUZZ_COUNT, help=f"Templates in the fuzzed corpus (default: {DEFAULT_FUZZ_COUNT})")
+    parser.add_argument('--check-syntax', action='store_true', help="Also parse every output with `node --check`")
+    parser.add_argument('--node', default='node', help="Node.js executable for --check-syntax (default: node)")
+    parser.add_argument('--diff', type=int, default=20, metavar='LINES', help="Diff lines shown per mismatch (default: 20)")
+    args = parser.parse_args(argv)
+
+    if args.check_syntax and shutil.which(args.node) is None:
+        print(f"--check-syntax: {args.node} not found")
+        return 1
+
+    corpora = args.corpus or list(CORPORA)
+    compiler = BladeCompiler()
+    wrapper_content = compiler.wrapper_parser.parse_wrapper_file()[0]
+    sources = collect_corpora(corpora, args.views, args.fuzz_seed, args.fuzz_count)
+
+    mismatches, missing, syntax_errors, written = [], [], [], 0
+    total = 0
+    for corpus, views in sources.items():
+        exact = corpus in EXACT_CORPORA
+        outputs = compile_corpus(compiler, views, wrapper_content, shared_wrapper=corpus == 'shared')
+        total += len(outputs)
+        names = set()
+        for view_name, code in outputs:
+            names.add(view_name)
+            path = snapshot_path(corpus, view_name)
+            if args.check_syntax and not code.startswith('// compile error'):
+                error = check_syntax(code.replace(WRAPPER_MARKER, wrapper_content), args.node)
+                if error:
+                    syntax_errors.append((f"{corpus}/{view_name}", error))
+
+            expected = None
+            if os.path.exists(path):
+                with open(path, 'r', encoding='utf-8') as f:
+                    expected = f.read()
+            if args.update:
+                if expected != code:
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    with open(path, 'w', encoding='utf-8') as f:
+                        f.write(code)
+                    written += 1
+                continue
+            if expected is None:
+                missing.append(f"{corpus}/{view_name}")
+            elif (expected != code) if exact else (normalize(expected) != normalize(code)):
+                expected_lines, code_lines = (expected.split('\n'), code.split('\n')) if exact else \
+                    (normalize(expected).split('\n'), normalize(code).split('\n'))
+                diff = list(difflib.unified_diff(expected_lines, code_lines, 'snapshot', 'output', n=1, lineterm=''))
+                mismatches.append((f"{corpus}/{view_name}", diff))
+
+        # Snapshot của view không còn trong corpus
+        corpus_dir = os.path.join(SNAPSHOTS_DIR, corpus)
+        if args.update and os.path.isdir(corpus_dir):
+            for entry in sorted(os.listdir(corpus_dir)):
+                if entry.endswith('.js') and entry[:-3] not in names:
+                    os.remove(os.path.join(corpus_dir, entry))
+                    written += 1
+
+    for name, diff in mismatches:
+        print(f"MISMATCH {name}")
+        for line in diff[:args.diff]:
+            print(f"    {line}")
+        if len(diff) > args.diff:
+            print(f"    ... {len(diff) - args.diff} more lines")
+    for name in missing:
+        print(f"MISSING  {name} (run with --update)")
+    known = load_known_syntax_errors()
+    strict = [(name, error) for name, error in syntax_errors if name.split('/', 1)[0] in STRICT_SYNTAX_CORPORA]
+    new_syntax_errors = [(name, error) for name, error in syntax_errors if name not in known or (name, error) in strict]
+    if args.update and args.check_syntax:
+        # Giữ lỗi đã biết của các corpus không chạy lần này
+        preserved = [(name, error) for name, error in known.items()
+                     if name.split('/', 1)[0] not in sources and name.split('/', 1)[0] not in STRICT_SYNTAX_CORPORA]
+        save_known_syntax_errors([item for item in syntax_errors if item not in strict] + preserved)
+        new_syntax_errors = strict
+    for name, error in new_syntax_errors:
+        print(f"SYNTAX   {name}: {error}")
+
+    if args.update:
+        print(f"{total} views, {written} snapshot files updated in {SNAPSHOTS_DIR}")
+    else:
+        print(f"{total} views: {total - len(mismatches) - len(missing)} match, {len(mismatches)} differ, {len(missing)} missing")
+    if args.check_syntax:
+        print(f"Syntax check: {len(new_syntax_errors)} new errors, {len(syntax_errors) - len(new_syntax_errors)} known")
+    failed = mismatches or missing or new_syntax_errors
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
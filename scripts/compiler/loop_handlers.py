@@ -2,9 +2,9 @@
 Handlers cho các loop directives (@foreach, @for, etc.)
 """
 
-from config import JS_FUNCTION_PREFIX
 from php_converter import php_to_js
 from utils import extract_balanced_parentheses
+from template_ast import ForeachNode, ForNode, WhileNode, innermost_kind
 import re
 
 class LoopHandlers:
@@ -17,30 +17,31 @@ class LoopHandlers:
         if foreach_pos != -1:
             foreach_content, end_pos = extract_balanced_parentheses(line, foreach_pos)
             if foreach_content is not None:
+                # @foreach($items as $item, key: $item->id) - key của từng hàng cho keyed list
+                row_key = None
+                key_match = re.match(r'(.*?\s+as\s+.*?)\s*,\s*key\s*:\s*(.+?)\s*$', foreach_content, re.DOTALL)
+                if key_match:
+                    foreach_content = key_match.group(1)
+                    row_key = php_to_js(key_match.group(2))
                 as_match = re.match(r'\s*(.*?)\s+as\s+\$?(\w+)(\s*=>\s*\$?(\w+))?\s*$', foreach_content)
                 if as_match:
                     array_expr = php_to_js(as_match.group(1))
                     first_var = as_match.group(2)
                     
                     if as_match.group(3):  # Has key => value
-                        key_var = first_var
-                        value_var = as_match.group(4)
-                        callback = f'({value_var}, {key_var}, __loopIndex, loop) => `'
+                        node = ForeachNode(array_expr, as_match.group(4), first_var, row_key)
                     else:  # Only value
-                        value_var = first_var
-                        callback = f'({value_var}, __loopKey, __loopIndex, loop) => `'
+                        node = ForeachNode(array_expr, first_var, row_key=row_key)
                     
-                    result = f"${{{JS_FUNCTION_PREFIX}.foreach({array_expr}, {callback}"
-                    output.append(result)
-                    stack.append(('foreach', len(output)))
+                    output.append(node)
+                    stack.append(node)
                     return True
         return False
     
     def process_endforeach_directive(self, stack, output):
         """Process @endforeach directive"""
-        if stack and stack[-1][0] == 'foreach':
-            stack.pop()
-            output.append('`)}')
+        if innermost_kind(stack) == 'foreach':
+            stack.pop().closed = True
         return True
     
     def process_for_directive(self, line, stack, output):
@@ -57,19 +58,18 @@ class LoopHandlers:
                     operator = for_match.group(3)
                     end_value = php_to_js(for_match.group(4))
                     
-                    # Generate for loop with output variable
-                    result = f"${{{JS_FUNCTION_PREFIX}.execute(() => {{\nlet __forOutputContent__ = ``;\nfor(let {var_name} = {start_value}; {var_name} {operator} {end_value}; {var_name}++) {{"
-                    output.append(result)
-                    stack.append(('for', len(output)))
+                    # For loop with output variable
+                    node = ForNode(var_name, start_value, operator, end_value)
+                    output.append(node)
+                    stack.append(node)
                     return True
         return False
     
     def process_endfor_directive(self, stack, output):
         """Process @endfor directive"""
-        if stack and stack[-1][0] == 'for':
-            stack.pop()
-            result = "\n}\nreturn __forOutputContent__;\n})}"
-            return result
+        if innermost_kind(stack) == 'for':
+            stack.pop().closed = True
+            return True
         return False
     
     def process_while_directive(self, line, stack, output):
@@ -79,17 +79,16 @@ class LoopHandlers:
             while_content, end_pos = extract_balanced_parentheses(line, while_pos)
             if while_content is not None:
                 condition = php_to_js(while_content)
-                # Generate while loop with output variable
-                result = f"${{{JS_FUNCTION_PREFIX}.execute(() => {{\nlet __whileOutputContent__ = ``;\nwhile({condition}) {{"
-                output.append(result)
-                stack.append(('while', len(output)))
+                # While loop with output variable
+                node = WhileNode(condition)
+                output.append(node)
+                stack.append(node)
                 return True
         return False
     
     def process_endwhile_directive(self, stack, output):
         """Process @endwhile directive"""
-        if stack and stack[-1][0] == 'while':
-            stack.pop()
-            result = "\n}\nreturn __whileOutputContent__;\n})}"
-            return result
+        if innermost_kind(stack) == 'while':
+            stack.pop().closed = True
+            return True
         return False
@@ -10,11 +10,41 @@ from template_processor import TemplateProcessor
 from template_analyzer import TemplateAnalyzer
 from function_generators import FunctionGenerators
 from compiler_utils import CompilerUtils
-from wrapper_parser import WrapperParser
+from wrapper_parser import WrapperParser, SHARED_WRAPPER_FACTORY, wrapper_exports
 from register_parser import RegisterParser
 from config import ViewConfig
 from declaration_tracker import DeclarationTracker
 from binding_directive_service import BindingDirectiveService
+from blade_lexer import BladeLexer, SCRIPT, DIRECTIVE
+import tracing
+
+# <script ...> blocks chỉ dùng cho import/setup, không thuộc render function
+SETUP_SCRIPT_TYPES = ('setup', 'import', 'imports', 'scope', 'scoped')
+
+# Các bước của compile_blade_to_js, theo thứ tự chạy
+COMPILE_STAGES = ('lex', 'declarations', 'directives', 'template', 'analysis', 'codegen')
+
+# Dòng đầu của mọi view function (và của factory trong shared wrapper module)
+SYSTEM_DATA_DECLARATION = "const {App, View, __base__, __layout__, __page__, __component__, __partial__, __system__, __env = {}, __helper = {}} = systemData;"
+
+
+def build_view_file_content(view_function):
+    """
+    Content of an individual view file: setup script imports first, then the exported function
+    """
+    if not view_function.strip().startswith('import '):
+        return view_function
+    lines = view_function.split('\n')
+    for index, line in enumerate(lines):
+        if line.strip().startswith('export function '):
+            break
+    else:
+        return view_function
+    # Giữ nguyên setup script (template literal trong đó có thể chứa dòng trống), chỉ bỏ dòng trống ở hai đầu
+    setup = '\n'.join(lines[:index]).strip('\n')
+    function = '\n'.join(lines[index:])
+    return f"{setup}\n\n{function}" if setup.strip() else function
+
 
 class BladeCompiler:
     def __init__(self):
@@ -27,6 +57,21 @@ class BladeCompiler:
         self.register_parser = RegisterParser()
         self.declaration_tracker = DeclarationTracker()
         self.binding_directive_service = BindingDirectiveService()
+        self.lexer = BladeLexer()
+        # (function_content, config_content) của wraper.js, cố định trong một compile_many batch
+        self._batch_wrapper = None
+        # Tracer (tracing.Tracer) nhận start/end của từng stage và các counter; None = tắt
+        self.tracer = None
+        # Khi bật, last_stats chứa thời gian từng stage và các counter của view vừa compile
+        self.collect_stats = False
+        self.last_stats = None
+        self._stage_tracer = None
+        # Module specifier của shared wrapper runtime (vd. './_ViewWrapper.js'); None = inline wraper.js vào mỗi view
+        self.shared_wrapper = None
+        # Bọc hole đọc @useState state trong this.__reactive(...): state thay đổi chỉ render lại các hole phụ thuộc
+        self.reactive_blocks = False
+        # @foreach đọc item.id/item['id'] được sinh thành keyed list (App.View.foreachKeyed) như khi có `key:`
+        self.infer_foreach_keys = False
     
     def convert_view_path_to_function_name(self, view_path):
         """Convert view path to function name (e.g., web.demo-if -> WebDemoIf)"""
@@ -36,8 +81,63 @@ class BladeCompiler:
         function_name = ''.join(part.capitalize() for part in parts)
         return function_name
         
+    def compile_many(self, views):
+        """Compile an iterable of (view_name, blade_code), yielding (view_name, compiled_js, error) per view
+        
+        Results are streamed in input order. wraper.js is read once for the whole batch and the
+        template processor, directive table and PHP worker are reused; a view that fails yields
+        its error message and the batch continues. With collect_stats, last_stats belongs to the
+        view that was just yielded.
+        """
+        self._batch_wrapper = self.wrapper_parser.parse_wrapper_file()
+        try:
+            for view_name, blade_code in views:
+                try:
+                    yield view_name, self.compile_blade_to_js(blade_code, view_name), None
+                except Exception as e:
+                    yield view_name, None, str(e)
+        finally:
+            self._batch_wrapper = None
+        
     def compile_blade_to_js(self, blade_code, view_name):
         """Main compiler function"""
+        tracer = self.tracer
+        if not self.collect_stats and tracer is None:
+            return self._compile_blade_to_js(blade_code, view_name)
+        
+        view_stats = None
+        if self.collect_stats:
+            view_stats = tracing.ViewStatsTracer()
+            tracer = view_stats if tracer is None else tracing.MultiTracer(view_stats, tracer)
+        
+        error = None
+        with tracing.activate(tracer):
+            tracer.view_start(view_name)
+            self._stage_tracer, self._stage_view, self._stage_name = tracer, view_name, COMPILE_STAGES[0]
+            tracer.stage_start(self._stage_name, view_name)
+            try:
+                return self._compile_blade_to_js(blade_code, view_name)
+            except Exception as e:
+                error = str(e)
+                raise
+            finally:
+                self._stage(None)
+                self._stage_tracer = None
+                tracer.view_end(view_name, error)
+                if view_stats is not None:
+                    self.last_stats = view_stats.stats
+    
+    def _stage(self, name):
+        """End the running stage and start name (None only ends it); no-op unless tracing"""
+        tracer = self._stage_tracer
+        if tracer is None:
+            return
+        tracer.stage_end(self._stage_name, self._stage_view)
+        if name is not None:
+            tracer.stage_start(name, self._stage_view)
+        self._stage_name = name
+    
+    def _compile_blade_to_js(self, blade_code, view_name):
         blade_code = blade_code.strip()
         
         # Escape backticks in blade code to prevent JavaScript syntax errors
@@ -51,10 +151,13 @@ class BladeCompiler:
         # Reset parser states to avoid data leakage between views
         if hasattr(self.register_parser, 'reset'):
             self.register_parser.reset()
-        # Note: wrapper_parser không reset vì dữ liệu từ wraper.js không thay đổi
+        # Note: wrapper_parser không reset; nội dung wraper.js được cache theo (path, mtime, size)
         
         # Parse wrapper content
-        wrapper_function_content, wrapper_config_content = self.wrapper_parser.parse_wrapper_file()
+        if self._batch_wrapper is not None:
+            wrapper_function_content, wrapper_config_content = self._batch_wrapper
+        else:
+            wrapper_function_content, wrapper_config_content = self.wrapper_parser.parse_wrapper_file()
         
         # Convert view path to function name
         function_name = self.convert_view_path_to_function_name(view_name)
@@ -62,8 +165,12 @@ class BladeCompiler:
         # Initialize update_functions list for storing update$stateKey functions
         self.update_functions = []
         
-        # Remove Blade comments
-        blade_code = re.sub(r'{{--.*?--}}', '', blade_code, flags=re.DOTALL)
+        # Lex once and remove Blade comments; declaration parsers share the token stream
+        blade_tokens = self.lexer.tokenize(blade_code).without_comments()
+        blade_code = blade_tokens.source
+        
+        # Mảng PHP của mọi directive được convert trong một round trip tới PHP worker
+        self.template_processor.prefetch_php_arrays(blade_code, blade_tokens)
         
         # Check for directives
         has_await = '@await(' in blade_code
@@ -71,23 +178,25 @@ class BladeCompiler:
         has_subscribe = ('@subscribe(' in blade_code) or re.search(r'@dontsubscribe\b', blade_code, flags=re.IGNORECASE)
         
         # NEW: Use DeclarationTracker to parse all declarations in order
-        all_declarations = self.declaration_tracker.parse_all_declarations(blade_code)
+        self._stage('declarations')
+        all_declarations = self.declaration_tracker.parse_all_declarations(blade_code, blade_tokens)
         
         # Generate wrapper declarations from tracked declarations
         wrapper_declarations_code, variable_list, state_declarations = self._generate_wrapper_declarations(all_declarations)
         
         # Parse main components (keep for compatibility, but we'll use DeclarationTracker results)
+        self._stage('directives')
         extended_view, extends_expression, extends_data = self.parsers.parse_extends(blade_code)
-        vars_declaration = self.parsers.parse_vars(blade_code)
-        let_declarations = self.parsers.parse_let_directives(blade_code)
-        const_declarations = self.parsers.parse_const_directives(blade_code)
-        usestate_declarations = self.parsers.parse_usestate_directives(blade_code)
+        vars_declaration = self.parsers.parse_vars(blade_code, blade_tokens)
+        let_declarations = self.parsers.parse_let_directives(blade_code, blade_tokens)
+        const_declarations = self.parsers.parse_const_directives(blade_code, blade_tokens)
+        usestate_declarations = self.parsers.parse_usestate_directives(blade_code, blade_tokens)
         
         # Extract usestate_variables for event processor
         usestate_variables = self._extract_usestate_variables(usestate_declarations, all_declarations)
         
         # Update template_processor with usestate_variables
-        self.template_processor = TemplateProcessor(usestate_variables)
+        self.template_processor.reset(usestate_variables)
         
         # Parse block directives
         blade_code = self.parsers.parse_block_directives(blade_code)
@@ -108,21 +217,16 @@ class BladeCompiler:
         
         # Remove script setup/import/imports/scope content from blade_code before processing
         # These should only be used for import statements, not for render function content
-        script_types = ['setup', 'import', 'imports', 'scope', 'scoped']
-        for script_type in script_types:
-            pattern = rf'<script\s+{script_type}[^>]*>.*?</script>'
-            blade_code = re.sub(pattern, '', blade_code, flags=re.DOTALL | re.IGNORECASE)
-        
-        # Remove @viewType directive after parsing
-        blade_code = re.sub(r'@viewtype\s*\([^)]*\)', '', blade_code, flags=re.IGNORECASE)
+        # @viewType directive is removed in the same pass (after parsing)
+        blade_code = self._remove_setup_scripts(blade_code, remove_viewtype=True)
         
         # Then remove script setup/import/imports/scope content from register_content for template processing
         if register_content:
-            for script_type in script_types:
-                pattern = rf'<script\s+{script_type}[^>]*>.*?</script>'
-                register_content = re.sub(pattern, '', register_content, flags=re.DOTALL | re.IGNORECASE)
+            register_content = self._remove_setup_scripts(register_content)
         
         # Process template content
+        self._stage('template')
+        self.template_processor.code_generator.infer_foreach_keys = self.infer_foreach_keys
         template_content, sections = self.template_processor.process_template(blade_code)
         
         # Extract wrapper config from template content
@@ -142,7 +246,7 @@ class BladeCompiler:
         # Remove __WRAPPER_CONFIG__ and __WRAPPER_END__ from template content
         if wrapper_config:
             # Remove __WRAPPER_END__ marker first
-            template_content = re.sub(r'__WRAPPER_END__\s*', '', template_content)
+            template_content = tracing.sub(r'__WRAPPER_END__\s*', '', template_content)
             
             # Use same logic as extraction to handle nested braces for config
             match = re.search(r'__WRAPPER_CONFIG__\s*=\s*', template_content)
@@ -184,6 +288,7 @@ class BladeCompiler:
                                     break
         
         # Generate sections info
+        self._stage('analysis')
         sections_info = self.template_analyzer.analyze_sections_info(sections, vars_declaration, has_await, has_fetch)
         
         # Integrate register_data vào sections_info
@@ -211,6 +316,7 @@ class BladeCompiler:
         conditional_content = self.template_analyzer.analyze_conditional_structures(template_content, vars_declaration, has_await, has_fetch)
         
         # Generate components
+        self._stage('codegen')
         vars_line = "    " + vars_declaration + "\n" if vars_declaration else ""
         
         # Combine all directive declarations
@@ -420,7 +526,9 @@ class BladeCompiler:
         template_content = self.binding_directive_service.process_all_binding_directives(template_content)
         
         # Generate render function (setup script will be added to view function instead)
-        render_function = self.function_generators.generate_render_function(template_content, vars_declaration, extended_view, extends_expression, extends_data, sections_info, has_prerender, "", directives_line, outer_before, outer_after)
+        reactive_state_keys = [state['stateKey'] for state in state_declarations] if self.reactive_blocks else None
+        state_dependencies = {}
+        render_function = self.function_generators.generate_render_function(template_content, vars_declaration, extended_view, extends_expression, extends_data, sections_info, has_prerender, "", directives_line, outer_before, outer_after, reactive_state_keys, state_dependencies)
         
         # Generate init function
         init_code = '\n    '.join(init_functions) if init_functions else ''
@@ -539,7 +647,9 @@ class BladeCompiler:
         # Prepare WRAPPER_CONFIG properties to add to view config (from wraper.js)
         # These are separate properties, NOT nested in wrapperConfig
         wrapper_props_line = ""
-        if wrapper_config_content:
+        if wrapper_config_content and self.shared_wrapper:
+            wrapper_props_line = "\n        ...__WRAPPER__.config,"
+        elif wrapper_config_content:
             config_content = wrapper_config_content.strip()
             # Remove trailing comma if exists
             if config_content.endswith(','):
@@ -550,7 +660,10 @@ class BladeCompiler:
         state_keys = self._detect_state_keys(blade_code, let_declarations, const_declarations, "")
         
         # Add wrapper function content to view function
-        wrapper_function_line = self._add_wrapper_content(wrapper_function_content)
+        if self.shared_wrapper:
+            wrapper_function_line = self._add_shared_wrapper_call(wrapper_function_content)
+        else:
+            wrapper_function_line = self._add_wrapper_content(wrapper_function_content)
         
         # NEW: Add wrapper declarations (vars, let, const, useState) at the beginning
         if wrapper_declarations_code:
@@ -574,6 +687,9 @@ class BladeCompiler:
                     # This is remaining content after export removal
                     setup_scripts.append(script['content'])
         
+        if self.shared_wrapper and wrapper_function_content:
+            setup_scripts.insert(0, f"import {{ {SHARED_WRAPPER_FACTORY} }} from '{self.shared_wrapper}';")
+        
         if setup_scripts:
             setup_script_line = '\n\n'.join(setup_scripts) + "\n\n"
         
@@ -760,15 +876,15 @@ class BladeCompiler:
                     wrapper_subscribe_val = m.group(1)
                     # Remove the subscribe property from wrapper_config_value (handle commas)
                     # Case 1: preceding comma
-                    wrapper_config_value = _re_sub.sub(r',\s*subscribe\s*:\s*(true|false|\[[^\]]*\])', '', wrapper_config_value)
+                    wrapper_config_value = tracing.sub(r',\s*subscribe\s*:\s*(true|false|\[[^\]]*\])', '', wrapper_config_value)
                     # Case 2: following comma
-                    wrapper_config_value = _re_sub.sub(r'subscribe\s*:\s*(true|false|\[[^\]]*\])\s*,', '', wrapper_config_value)
+                    wrapper_config_value = tracing.sub(r'subscribe\s*:\s*(true|false|\[[^\]]*\])\s*,', '', wrapper_config_value)
                     # Case 3: standalone (no commas)
-                    wrapper_config_value = _re_sub.sub(r'subscribe\s*:\s*(true|false|\[[^\]]*\])', '', wrapper_config_value)
+                    wrapper_config_value = tracing.sub(r'subscribe\s*:\s*(true|false|\[[^\]]*\])', '', wrapper_config_value)
                     # Normalize multiple commas
-                    wrapper_config_value = _re_sub.sub(r',\s*,', ',', wrapper_config_value)
+                    wrapper_config_value = tracing.sub(r',\s*,', ',', wrapper_config_value)
                     # Also clean up possible trailing comma before closing brace
-                    wrapper_config_value = _re_sub.sub(r',\s*}', '}', wrapper_config_value)
+                    wrapper_config_value = tracing.sub(r',\s*}', '}', wrapper_config_value)
                     # Set subscribe_config from wrapper
                     if wrapper_subscribe_val in ('true', 'false'):
                         subscribe_config = (wrapper_subscribe_val == 'true')
@@ -803,8 +919,13 @@ class BladeCompiler:
         else:
             subscribe_js = json.dumps(subscribe_config, ensure_ascii=False)
 
+        # Số reactive block theo dõi mỗi state key
+        state_dependencies_line = ""
+        if state_dependencies:
+            state_dependencies_line = "\n        stateDependencies: " + json.dumps(state_dependencies, ensure_ascii=False) + ","
+
         return_template = setup_script_line + """export function """ + function_name + """($$$DATA$$$ = {}, systemData = {}) {
-    const {App, View, __base__, __layout__, __page__, __component__, __partial__, __system__, __env = {}, __helper = {}} = systemData;
+    """ + SYSTEM_DATA_DECLARATION + """
     const __VIEW_PATH__ = '""" + view_name + """';
     const __VIEW_ID__ = $$$DATA$$$.__SSR_VIEW_ID__ || """ + JS_FUNCTION_PREFIX + """.generateViewId();
     const __VIEW_TYPE__ = '""" + view_type + """';
@@ -817,7 +938,7 @@ class BladeCompiler:
         wrapperConfig: """ + wrapper_config_value + """,""" + wrapper_props_line + """
         hasAwaitData: """ + str(has_await).lower() + """,
         hasFetchData: """ + str(has_fetch).lower() + """,
-        subscribe: """ + subscribe_js + """,
+        subscribe: """ + subscribe_js + """,""" + state_dependencies_line + """
         fetch: """ + (self.compiler_utils.format_fetch_config(fetch_config) if fetch_config else 'null') + """,
         data: $$$DATA$$$,
         viewId: __VIEW_ID__,
@@ -864,12 +985,35 @@ class BladeCompiler:
         
         return return_template
     
+    def _remove_setup_scripts(self, blade_code, remove_viewtype=False):
+        """Drop <script setup|import|imports|scope|scoped> blocks (and @viewType) in one lexer pass"""
+        lower_code = blade_code.lower()
+        if '<script' not in lower_code and not (remove_viewtype and '@viewtype' in lower_code):
+            return blade_code
+        
+        kept = []
+        for token in self.lexer.tokenize(blade_code):
+            if token.kind == SCRIPT and token.attrs.lower().startswith(SETUP_SCRIPT_TYPES):
+                continue
+            if remove_viewtype and token.kind == DIRECTIVE and token.args is not None and token.name.lower() == 'viewtype':
+                continue
+            kept.append(token.text)
+        return ''.join(kept)
+    
     def _add_wrapper_content(self, wrapper_function_content):
         """Add wrapper content to view function"""
         if wrapper_function_content:
             return wrapper_function_content + "\n"
         return ""
     
+    def _add_shared_wrapper_call(self, wrapper_function_content):
+        """Call the shared wrapper factory and bind its top-level names, instead of inlining the body"""
+        if not wrapper_function_content:
+            return ""
+        names = ', '.join(wrapper_exports(wrapper_function_content))
+        return (f"const __WRAPPER__ = {SHARED_WRAPPER_FACTORY}($$$DATA$$$, systemData, {{__VIEW_PATH__, __VIEW_ID__, __VIEW_TYPE__}});\n"
+                f"    const {{{names}}} = __WRAPPER__;\n")
+    
     def _extract_sections_from_template(self, template_content, sections_info):
         """Extract section names that are used in the template content"""
         sections_used = []
@@ -1506,7 +1650,7 @@ class BladeCompiler:
                 return "${App.View.escString(" + expression + ")}"
         
         # Replace all {{ expression }} with template string format
-        result = re.sub(r'\{\{\s*([^}]+)\s*\}\}', replace_blade_expression, blade_expression)
+        result = tracing.sub(r'\{\{\s*([^}]+)\s*\}\}', replace_blade_expression, blade_expression)
         return result
 
     def _generate_state_updates(self, state_declarations):
@@ -3,26 +3,16 @@ Parsers cho các directive (@extends, @vars, @fetch, @onInit)
 """
 
 import re
+import tracing
 import json
 from utils import extract_balanced_parentheses
+from blade_lexer import tokenize_blade
 from php_converter import php_to_js, convert_php_array_to_json, convert_php_array_with_php_r
 
 class DirectiveParsers:
     def __init__(self):
         pass
     
-    def _remove_script_tags(self, blade_code):
-        """Loại bỏ JavaScript code trong <script> tags để tránh xử lý useState trong JS"""
-        # Loại bỏ tất cả content trong <script> tags
-        filtered_code = re.sub(r'<script[^>]*>.*?</script>', '', blade_code, flags=re.DOTALL | re.IGNORECASE)
-        return filtered_code
-    
-    def _remove_verbatim_blocks(self, blade_code):
-        """Loại bỏ @verbatim...@endverbatim blocks để tránh xử lý directives bên trong"""
-        # Loại bỏ tất cả content trong @verbatim blocks
-        filtered_code = re.sub(r'@verbatim\s*.*?\s*@endverbatim', '', blade_code, flags=re.DOTALL | re.IGNORECASE)
-        return filtered_code
-    
     def parse_extends(self, blade_code):
         """Parse @extends directive"""
         extends_match = re.search(r'@extends\s*\(\s*([^)]+)\s*\)', blade_code, re.DOTALL)
@@ -52,15 +42,20 @@ class DirectiveParsers:
         
         return extended_view, extends_expression, extends_data
     
-    def parse_vars(self, blade_code):
+    def _directive_arguments(self, blade_code, tokens, name, include_scripts=False):
+        """Arguments of every @name(...) outside @verbatim (and <script> unless include_scripts)"""
+        if tokens is None:
+            tokens = tokenize_blade(blade_code)
+        return [token.args for token in tokens.directives(name, include_scripts=include_scripts) if token.args is not None]
+    
+    def parse_vars(self, blade_code, tokens=None):
         """Parse @vars directive - improved to handle complex arrays like Event directive"""
-        # Loại bỏ @verbatim blocks để tránh parse directives bên trong
-        blade_code = self._remove_verbatim_blocks(blade_code)
-        vars_match = re.search(r'@vars\s*\(\s*(.*?)\s*\)', blade_code, re.DOTALL)
-        if not vars_match:
+        # Directive tokens không bao gồm @verbatim blocks
+        vars_arguments = self._directive_arguments(blade_code, tokens, 'vars', include_scripts=True)
+        if not vars_arguments:
             return ''
             
-        vars_content = vars_match.group(1)
+        vars_content = vars_arguments[0].strip()
         var_parts = []
         
         # Special handling for object destructuring syntax {var1, var2}
@@ -92,21 +87,10 @@ class DirectiveParsers:
         
         return "let {" + ', '.join(var_parts) + "} = __$spaViewData$__ || {};"
     
-    def parse_let_directives(self, blade_code):
+    def parse_let_directives(self, blade_code, tokens=None):
         """Parse @let directives - chỉ xử lý Blade directives, không xử lý JavaScript code"""
-        # Loại bỏ JavaScript code trong <script> tags trước khi parse
-        blade_code_filtered = self._remove_script_tags(blade_code)
-        # Loại bỏ @verbatim blocks để tránh parse directives bên trong
-        blade_code_filtered = self._remove_verbatim_blocks(blade_code_filtered)
-        
-        # Sử dụng balanced parentheses để parse đúng
-        let_matches = []
-        pattern = r'@let\s*\('
-        for match in re.finditer(pattern, blade_code_filtered):
-            start_pos = match.end() - 1
-            content, _ = extract_balanced_parentheses(blade_code_filtered, start_pos)
-            if content is not None and content.strip():
-                let_matches.append(content.strip())
+        # Directive tokens bỏ qua <script> tags và @verbatim blocks, arguments đã balanced
+        let_matches = [content.strip() for content in self._directive_arguments(blade_code, tokens, 'let') if content.strip()]
         
         if not let_matches:
             return ''
@@ -122,7 +106,7 @@ class DirectiveParsers:
                     continue
                 
                 # Loại bỏ dấu $ ở đầu part nếu có
-                part = re.sub(r'^\s*\$\s*', '', part)
+                part = tracing.sub(r'^\s*\$\s*', '', part)
                     
                 # Xử lý destructuring syntax đặc biệt
                 if '[' in part and ']' in part and '=' in part:
@@ -145,7 +129,7 @@ class DirectiveParsers:
                 js_expression = self._convert_php_expression_with_arrays(part)
                 
                 # Loại bỏ dấu $ từ biến (nếu có) - cải thiện regex
-                js_expression = re.sub(r'\$(\w+)', r'\1', js_expression)
+                js_expression = tracing.sub(r'\$(\w+)', r'\1', js_expression)
                 
                 # Loại bỏ dấu $ ở đầu assignment nếu có
                 if '=' in js_expression:
@@ -154,7 +138,7 @@ class DirectiveParsers:
                         left_part = parts[0].strip()
                         right_part = parts[1].strip()
                         # Loại bỏ $ ở đầu left part
-                        left_part = re.sub(r'^\s*\$\s*', '', left_part)
+                        left_part = tracing.sub(r'^\s*\$\s*', '', left_part)
                         js_expression = f'{left_part} = {right_part}'
                 
                 # Thêm prefix 'let ' và dấu ; nếu chưa có
@@ -193,7 +177,7 @@ class DirectiveParsers:
         result = php_to_js(expression)
         
         # Loại bỏ dấu $ từ biến (nếu có)
-        result = re.sub(r'\$(\w+)', r'\1', result)
+        result = tracing.sub(r'\$(\w+)', r'\1', result)
         
         return result
     
@@ -229,21 +213,10 @@ class DirectiveParsers:
         
         return assignments
     
-    def parse_const_directives(self, blade_code):
+    def parse_const_directives(self, blade_code, tokens=None):
         """Parse @const directives - chỉ xử lý Blade directives, không xử lý JavaScript code"""
-        # Loại bỏ JavaScript code trong <script> tags trước khi parse
-        blade_code_filtered = self._remove_script_tags(blade_code)
-        # Loại bỏ @verbatim blocks để tránh parse directives bên trong
-        blade_code_filtered = self._remove_verbatim_blocks(blade_code_filtered)
-        
-        # Sử dụng balanced parentheses để parse đúng
-        const_matches = []
-        pattern = r'@const\s*\('
-        for match in re.finditer(pattern, blade_code_filtered):
-            start_pos = match.end() - 1
-            content, _ = extract_balanced_parentheses(blade_code_filtered, start_pos)
-            if content is not None and content.strip():
-                const_matches.append(content.strip())
+        # Directive tokens bỏ qua <script> tags và @verbatim blocks, arguments đã balanced
+        const_matches = [content.strip() for content in self._directive_arguments(blade_code, tokens, 'const') if content.strip()]
         
         if not const_matches:
             return ''
@@ -316,14 +289,10 @@ class DirectiveParsers:
         
         return f'const {left_part_js} = {right_part_js};'
     
-    def parse_usestate_directives(self, blade_code):
+    def parse_usestate_directives(self, blade_code, tokens=None):
         """Parse @useState directives - chỉ xử lý Blade directives, không xử lý JavaScript code"""
-        # Loại bỏ JavaScript code trong <script> tags trước khi parse
-        blade_code_filtered = self._remove_script_tags(blade_code)
-        # Loại bỏ @verbatim blocks để tránh parse directives bên trong
-        blade_code_filtered = self._remove_verbatim_blocks(blade_code_filtered)
-        
-        usestate_matches = re.findall(r'@useState\s*\(\s*(.*?)\s*\)', blade_code_filtered, re.DOTALL)
+        # Directive tokens bỏ qua <script> tags và @verbatim blocks
+        usestate_matches = self._directive_arguments(blade_code, tokens, 'useState')
         if not usestate_matches:
             return ''
         
@@ -458,15 +427,15 @@ class DirectiveParsers:
             # Convert PHP array syntax to JavaScript object syntax
             js_str = php_array_str
             # Remove $ prefix from variables
-            js_str = re.sub(r'(?<!")\$(\w+)(?!")', r'\1', js_str)
+            js_str = tracing.sub(r'(?<!")\$(\w+)(?!")', r'\1', js_str)
             # Convert array syntax to object syntax
-            js_str = re.sub(r'\[', '{', js_str)
-            js_str = re.sub(r'\]', '}', js_str)
-            js_str = re.sub(r'\s*=>\s*', ': ', js_str)
-            js_str = re.sub(r'\s+\.\s+', ' + ', js_str)
+            js_str = tracing.sub(r'\[', '{', js_str)
+            js_str = tracing.sub(r'\]', '}', js_str)
+            js_str = tracing.sub(r'\s*=>\s*', ': ', js_str)
+            js_str = tracing.sub(r'\s+\.\s+', ' + ', js_str)
             
             # Handle single quotes to double quotes for JSON
-            js_str = re.sub(r"'([^']*)'", r'"\1"', js_str)
+            js_str = tracing.sub(r"'([^']*)'", r'"\1"', js_str)
             
             # Parse the JavaScript object
             import json
@@ -691,11 +660,11 @@ class DirectiveParsers:
     def _convert_extends_data(self, data_expr):
         """Convert extends data expression"""
         extends_data = convert_php_array_to_json(data_expr)
-        extends_data = re.sub(r'(?<!")\$(\w+)(?!")', r'\1', extends_data)
-        extends_data = re.sub(r'\[', '{', extends_data)
-        extends_data = re.sub(r'\]', '}', extends_data)
-        extends_data = re.sub(r'\s*=>\s*', ': ', extends_data)
-        extends_data = re.sub(r'\s+\.\s+', ' + ', extends_data)
+        extends_data = tracing.sub(r'(?<!")\$(\w+)(?!")', r'\1', extends_data)
+        extends_data = tracing.sub(r'\[', '{', extends_data)
+        extends_data = tracing.sub(r'\]', '}', extends_data)
+        extends_data = tracing.sub(r'\s*=>\s*', ': ', extends_data)
+        extends_data = tracing.sub(r'\s+\.\s+', ' + ', extends_data)
         return extends_data
     
     def _split_vars_content(self, content):
@@ -958,18 +927,18 @@ class DirectiveParsers:
             # Associative array - convert to JavaScript object
             js_content = inner_content
             # Replace => with :
-            js_content = re.sub(r'\s*=>\s*', ': ', js_content)
+            js_content = tracing.sub(r'\s*=>\s*', ': ', js_content)
             # Replace single quotes with double quotes for keys
-            js_content = re.sub(r"'([^']+)'\s*:", r'"\1":', js_content)
+            js_content = tracing.sub(r"'([^']+)'\s*:", r'"\1":', js_content)
             # Replace single quotes with double quotes for string values
-            js_content = re.sub(r":\s*'([^']+)'", r': "\1"', js_content)
+            js_content = tracing.sub(r":\s*'([^']+)'", r': "\1"', js_content)
             
             return '{' + js_content + '}'
         else:
             # Indexed array - keep as JavaScript array
             js_content = inner_content
             # Replace single quotes with double quotes for string values
-            js_content = re.sub(r"'([^']+)'", r'"\1"', js_content)
+            js_content = tracing.sub(r"'([^']+)'", r'"\1"', js_content)
             
             return '[' + js_content + ']'
     
@@ -1157,18 +1126,18 @@ class DirectiveParsers:
             # Convert name to JavaScript
             js_name = self._convert_php_to_js(name_expr)
             # Remove $ prefix from variables
-            js_name = re.sub(r'\$(\w+)', r'\1', js_name)
+            js_name = tracing.sub(r'\$(\w+)', r'\1', js_name)
             
             # Convert defaultValue to JavaScript if provided
             if default_expr:
                 js_default = self._convert_php_to_js(default_expr)
                 # Remove $ prefix from variables
-                js_default = re.sub(r'\$(\w+)', r'\1', js_default)
+                js_default = tracing.sub(r'\$(\w+)', r'\1', js_default)
                 return f"${{this.useBlock({js_name}, {js_default})}}"
             else:
                 return f"${{this.useBlock({js_name})}}"
         
-        return re.sub(pattern, replace_useblock, blade_code)
+        return tracing.sub(pattern, replace_useblock, blade_code)
 
     def parse_onblock_directives(self, blade_code):
         """Parse @onBlock/@onblock/@onBlockChange directives with subscribeBlock"""
@@ -1186,17 +1155,17 @@ class DirectiveParsers:
                 from php_converter import convert_php_array_to_json
                 js_params = convert_php_array_to_json(params_expr)
                 # Format with proper spacing
-                js_params = re.sub(r'":', r'": ', js_params)
-                js_params = re.sub(r',"', r', "', js_params)
+                js_params = tracing.sub(r'":', r'": ', js_params)
+                js_params = tracing.sub(r',"', r', "', js_params)
                 return f"${{this.subscribeBlock({js_params})}}"
             else:
                 # Single parameter: 'title' or $blockName
                 js_param = self._convert_php_to_js(params_expr)
                 # Remove $ prefix from variables
-                js_param = re.sub(r'\$(\w+)', r'\1', js_param)
+                js_param = tracing.sub(r'\$(\w+)', r'\1', js_param)
                 return f"${{this.subscribeBlock({js_param})}}"
         
-        return re.sub(pattern, replace_onblock, blade_code)
+        return tracing.sub(pattern, replace_onblock, blade_code)
 
     def _parse_block_expression(self, expression):
         """Parse block expression to extract name and attributes"""
@@ -1389,7 +1358,7 @@ class DirectiveParsers:
             # Return the __follow call
             return f"${{this.__follow({js_state_keys}, () => `{content}`)}}"
         
-        return re.sub(pattern, replace_follow, blade_code, flags=re.DOTALL | re.IGNORECASE)
+        return tracing.sub(pattern, replace_follow, blade_code, flags=re.DOTALL | re.IGNORECASE)
 
     def _parse_follow_parameters(self, params_expr):
         """Parse @follow parameters to extract state keys"""
@@ -5,38 +5,513 @@ Chuyển đổi các biểu thức PHP sang JavaScript
 from config import JS_FUNCTION_PREFIX
 from utils import normalize_quotes
 from php_js_converter import php_to_js_advanced
+import tracing
 import re
+import json
+import atexit
+import queue
+import threading
 import subprocess
 
-def convert_php_array_with_php_r(php_array_expr):
-    """Convert PHP array to JSON using php -r command"""
-    try:
-        # Tạo PHP code để convert array sang JSON
-        php_code = f"try {{ echo json_encode({php_array_expr}); }} catch (Exception $e) {{ echo '[]'; }}"
-        
-        # Chạy php -r command
-        result = subprocess.run(
-            ['php', '-r', php_code],
-            capture_output=True,
-            text=True,
-            timeout=5,  # 5 giây timeout
-            check=False  # Không raise exception khi return code != 0
-        )
-        
-        if result.returncode == 0:
-            # Parse JSON output
-            json_output = result.stdout.strip()
-            return json_output
+# PHP loop chạy trong worker: mỗi dòng stdin là một JSON array các biểu thức,
+# mỗi dòng stdout là một JSON array kết quả (json_encode string, '[]' khi Exception, null khi Error)
+PHP_WORKER_SCRIPT = r"""
+error_reporting(0);
+$__evaluate = function ($__expr) {
+    return eval('return ' . $__expr . ';');
+};
+while (($__line = fgets(STDIN)) !== false) {
+    $__results = [];
+    foreach ((array) json_decode($__line, true) as $__expr) {
+        try {
+            $__json = json_encode($__evaluate($__expr));
+            $__results[] = $__json === false ? '' : $__json;
+        } catch (Exception $e) {
+            $__results[] = '[]';
+        } catch (Throwable $e) {
+            $__results[] = null;
+        }
+    }
+    echo json_encode($__results), "\n";
+    fflush(STDOUT);
+}
+"""
+
+# Giới hạn số kết quả được nhớ (compile server / watch mode chạy lâu)
+PHP_EVAL_CACHE_LIMIT = 4096
+
+
+class PhpEvalWorker:
+    """Long-lived `php -r` process evaluating PHP array expressions over stdin/stdout"""
+
+    def __init__(self, php_binary='php', timeout=5):
+        self.php_binary = php_binary
+        self.timeout = timeout  # giây cho mỗi batch
+        self.process = None
+        self.lines = None
+        self.unavailable = False
+        # Một batch ghi stdin rồi đọc đúng một dòng stdout; compile server gọi từ nhiều thread
+        self.lock = threading.Lock()
+
+    def start(self):
+        """Spawn the PHP process (once); returns False if php cannot be started"""
+        if self.process is not None and self.process.poll() is None:
+            return True
+        if self.unavailable:
+            return False
+        try:
+            self.process = subprocess.Popen(
+                [self.php_binary, '-r', PHP_WORKER_SCRIPT],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                encoding='utf-8',
+                bufsize=1,
+            )
+        except (subprocess.SubprocessError, OSError) as e:
+            print(f"Error running php -r: {e}")
+            self.unavailable = True
+            self.process = None
+            return False
+
+        # Reader thread để có thể timeout khi đọc stdout (select không dùng được với pipe trên Windows)
+        self.lines = queue.Queue()
+        threading.Thread(target=self._read_stdout, args=(self.process, self.lines), daemon=True).start()
+        return True
+
+    def _read_stdout(self, process, lines):
+        for line in process.stdout:
+            lines.put(line)
+        lines.put(None)
+
+    def evaluate_many(self, expressions):
+        """Evaluate a batch of PHP expressions in one round trip; returns list of JSON strings or None"""
+        if not expressions:
+            return []
+        with self.lock:
+            return self._evaluate_many(expressions)
+
+    def _evaluate_many(self, expressions):
+        if not self.start():
+            return [None] * len(expressions)
+
+        try:
+            self.process.stdin.write(json.dumps(expressions) + '\n')
+            self.process.stdin.flush()
+            line = self.lines.get(timeout=self.timeout)
+        except queue.Empty:
+            print(f"Error running php -r: timed out after {self.timeout} seconds")
+            self.close()
+            return [None] * len(expressions)
+        except (OSError, ValueError) as e:
+            print(f"Error running php -r: {e}")
+            self.close()
+            return [None] * len(expressions)
+
+        if line is None:
+            # Worker chết giữa chừng (vd. exit() trong biểu thức) - sẽ được spawn lại ở lần sau
+            self.close()
+            return [None] * len(expressions)
+
+        try:
+            results = json.loads(line)
+        except ValueError:
+            results = None
+        if not isinstance(results, list) or len(results) != len(expressions):
+            print(f"PHP error: unexpected worker output: {line.strip()}")
+            return [None] * len(expressions)
+        return results
+
+    def close(self):
+        """Terminate the PHP process"""
+        process, self.process = self.process, None
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+        except OSError:
+            pass
+        try:
+            process.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+# ---------------------------------------------------------------------------
+# Pure-Python parser cho PHP array literals (không cần php binary)
+# ---------------------------------------------------------------------------
+
+PHP_ARRAY_TOKEN_PATTERN = re.compile(r"""
+    (?P<ws>\s+)
+  | (?P<arrow>=>)
+  | (?P<punct>[\[\](),])
+  | (?P<sq>'(?:[^'\\]|\\.)*')
+  | (?P<dq>"(?:[^"\\]|\\.)*")
+  | (?P<number>0[xX][0-9a-fA-F]+(?:_[0-9a-fA-F]+)*|0[bB][01]+(?:_[01]+)*|(?:\d+(?:_\d+)*)?\.?\d+(?:_\d+)*(?:[eE][+-]?\d+)?)
+  | (?P<minus>-)
+  | (?P<plus>\+)
+  | (?P<variable>\$[A-Za-z_]\w*)
+  | (?P<name>[A-Za-z_]\w*)
+""", re.VERBOSE | re.DOTALL)
+
+# Escape sequences trong chuỗi nháy kép của PHP
+PHP_DOUBLE_QUOTE_ESCAPES = {
+    'n': '\n', 't': '\t', 'r': '\r', 'v': '\v', 'e': '\x1b', 'f': '\f',
+    '\\': '\\', '$': '$', '"': '"',
+}
+
+
+class UnsupportedPhpArraySyntax(Exception):
+    """Raised when a PHP array literal contains something the pure-Python parser cannot prove safe"""
+
+
+class _PhpVariable:
+    """`$name` reference inside an array literal, emitted as a JS identifier"""
+
+    def __init__(self, name):
+        self.name = name
+
+
+def _tokenize_php_array(expr):
+    """Split a PHP array literal into (kind, text) tokens"""
+    tokens = []
+    pos = 0
+    while pos < len(expr):
+        match = PHP_ARRAY_TOKEN_PATTERN.match(expr, pos)
+        if not match:
+            raise UnsupportedPhpArraySyntax(expr[pos:pos + 20])
+        pos = match.end()
+        kind = match.lastgroup
+        if kind != 'ws':
+            tokens.append((kind, match.group(kind)))
+    return tokens
+
+
+def _decode_php_single_quoted(body):
+    # Chỉ \\ và \' là escape trong chuỗi nháy đơn
+    return tracing.sub(r"\\([\\'])", r'\1', body)
+
+
+def _php_byte_escape(byte, body):
+    if byte >= 0x80:
+        # Byte đơn lẻ ngoài ASCII không phải UTF-8 hợp lệ - để PHP quyết định
+        raise UnsupportedPhpArraySyntax(body)
+    return chr(byte)
+
+
+def _decode_php_double_quoted(body):
+    if re.search(r'\$[A-Za-z_{]|\{\$', body):
+        # String interpolation - để PHP xử lý
+        raise UnsupportedPhpArraySyntax(body)
+
+    result = []
+    i = 0
+    while i < len(body):
+        char = body[i]
+        if char != '\\' or i + 1 >= len(body):
+            result.append(char)
+            i += 1
+            continue
+        nxt = body[i + 1]
+        if nxt in PHP_DOUBLE_QUOTE_ESCAPES:
+            result.append(PHP_DOUBLE_QUOTE_ESCAPES[nxt])
+            i += 2
+        elif nxt in '01234567':
+            octal = re.match(r'[0-7]{1,3}', body[i + 1:]).group(0)
+            result.append(_php_byte_escape(int(octal, 8) & 0xFF, body))
+            i += 1 + len(octal)
+        elif nxt == 'x' and re.match(r'[0-9a-fA-F]', body[i + 2:i + 3]):
+            hex_digits = re.match(r'[0-9a-fA-F]{1,2}', body[i + 2:]).group(0)
+            result.append(_php_byte_escape(int(hex_digits, 16), body))
+            i += 2 + len(hex_digits)
+        elif nxt == 'u' and body[i + 2:i + 3] == '{':
+            end = body.find('}', i + 3)
+            if end == -1:
+                raise UnsupportedPhpArraySyntax(body)
+            result.append(chr(int(body[i + 3:end], 16)))
+            i = end + 1
         else:
-            print(f"PHP error: {result.stderr}")
-            return None
-            
-    except (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError) as e:
-        print(f"Error running php -r: {e}")
+            # Escape không hợp lệ được giữ nguyên như PHP
+            result.append(char)
+            i += 1
+    return ''.join(result)
+
+
+class PhpArrayLiteralParser:
+    """Recursive-descent parser for static PHP array literals
+
+    Supports `[...]` and `array(...)`, `=>` pairs, nested arrays, quoted strings,
+    numbers, true/false/null and (optionally) plain `$var` references.
+    """
+
+    def __init__(self, expr, allow_variables=False):
+        self.tokens = _tokenize_php_array(expr)
+        self.pos = 0
+        self.allow_variables = allow_variables
+
+    def _peek(self, offset=0):
+        index = self.pos + offset
+        return self.tokens[index] if index < len(self.tokens) else (None, None)
+
+    def _next(self):
+        token = self._peek()
+        if token[0] is None:
+            raise UnsupportedPhpArraySyntax('unexpected end of expression')
+        self.pos += 1
+        return token
+
+    def _expect(self, text):
+        kind, value = self._next()
+        if value != text:
+            raise UnsupportedPhpArraySyntax(f"expected {text}, got {value}")
+
+    def parse(self):
+        value = self._parse_array()
+        if self._peek()[0] is not None:
+            raise UnsupportedPhpArraySyntax('trailing tokens')
+        return value
+
+    def _parse_array(self):
+        kind, value = self._next()
+        if value == '[':
+            closing = ']'
+        elif kind == 'name' and value.lower() == 'array' and self._peek()[1] == '(':
+            self._next()
+            closing = ')'
+        else:
+            raise UnsupportedPhpArraySyntax(value)
+
+        # PHP array: ordered map, key tự tăng theo key số nguyên lớn nhất
+        items = {}
+        next_index = 0
+        while self._peek()[1] != closing:
+            first = self._parse_value()
+            if self._peek()[0] == 'arrow':
+                self._next()
+                key = self._normalize_key(first)
+                item_value = self._parse_value()
+            else:
+                key = next_index
+                item_value = first
+            items[key] = item_value
+            if isinstance(key, int) and key >= next_index:
+                next_index = key + 1
+
+            if self._peek()[1] == ',':
+                self._next()
+            elif self._peek()[1] != closing:
+                raise UnsupportedPhpArraySyntax(f"unexpected {self._peek()[1]}")
+        self._expect(closing)
+        return items
+
+    def _normalize_key(self, key):
+        # Quy tắc ép kiểu key của PHP
+        if isinstance(key, bool):
+            return int(key)
+        if key is None:
+            return ''
+        # Chỉ chuỗi số nguyên thập phân dạng chuẩn ("0", "-12", không phải "-0", "012", "+1")
+        if isinstance(key, str) and re.fullmatch(r'0|-?[1-9]\d*', key) and -2 ** 63 <= int(key) < 2 ** 63:
+            return int(key)
+        if isinstance(key, (int, str)):
+            return key
+        # float, array và biến làm key - không an toàn để tự xử lý
+        raise UnsupportedPhpArraySyntax('unsupported array key')
+
+    def _parse_value(self):
+        kind, value = self._peek()
+        if value == '[' or (kind == 'name' and value.lower() == 'array' and self._peek(1)[1] == '('):
+            return self._parse_array()
+
+        self._next()
+        if kind == 'sq':
+            return _decode_php_single_quoted(value[1:-1])
+        if kind == 'dq':
+            return _decode_php_double_quoted(value[1:-1])
+        if kind in ('minus', 'plus'):
+            number = self._parse_value()
+            if isinstance(number, bool) or not isinstance(number, (int, float)):
+                raise UnsupportedPhpArraySyntax('unary operator on non-number')
+            return -number if kind == 'minus' else number
+        if kind == 'number':
+            return self._parse_number(value)
+        if kind == 'name':
+            lowered = value.lower()
+            if lowered in ('true', 'false'):
+                return lowered == 'true'
+            if lowered == 'null':
+                return None
+            # Constants / function calls cần PHP
+            raise UnsupportedPhpArraySyntax(value)
+        if kind == 'variable' and self.allow_variables:
+            if self._peek()[1] not in (',', ']', ')'):
+                # $obj->prop, $arr['x'], $fn() ...
+                raise UnsupportedPhpArraySyntax(value)
+            return _PhpVariable(value[1:])
+        raise UnsupportedPhpArraySyntax(value)
+
+    def _parse_number(self, text):
+        text = text.replace('_', '')
+        if text[:2] in ('0x', '0X'):
+            return int(text, 16)
+        if text[:2] in ('0b', '0B'):
+            return int(text, 2)
+        if re.fullmatch(r'\d+', text):
+            if len(text) > 1 and text[0] == '0':
+                return int(text, 8)
+            number = int(text)
+            if number >= 2 ** 63:
+                raise UnsupportedPhpArraySyntax(text)
+            return number
+        number = float(text)
+        if number != number or number in (float('inf'), float('-inf')):
+            raise UnsupportedPhpArraySyntax(text)
+        return number
+
+
+def _php_value_to_js(value):
+    """Encode a parsed PHP value the way json_encode() does (compact, escaped slashes)"""
+    if isinstance(value, _PhpVariable):
+        return value.name
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        encoded = repr(value)
+        if 'e' in encoded or 'inf' in encoded or 'nan' in encoded:
+            # Định dạng số mũ của PHP khác Python
+            raise UnsupportedPhpArraySyntax(encoded)
+        return encoded
+    if isinstance(value, str):
+        return json.dumps(value).replace('/', '\\/')
+
+    # dict: list nếu key là 0..n-1 liên tiếp, ngược lại là object
+    if list(value.keys()) == list(range(len(value))):
+        return '[' + ','.join(_php_value_to_js(item) for item in value.values()) + ']'
+    return '{' + ','.join(
+        _php_value_to_js(str(key)) + ':' + _php_value_to_js(item) for key, item in value.items()
+    ) + '}'
+
+
+def parse_php_array_literal(expr, allow_variables=False):
+    """Convert a PHP array literal to JS source without running PHP
+
+    Output matches json_encode() for static literals. With allow_variables,
+    plain `$var` values are emitted as JS identifiers.
+    Returns None when the expression is not a literal the parser can prove safe.
+    """
+    if not expr or not isinstance(expr, str):
         return None
+    try:
+        return _php_value_to_js(PhpArrayLiteralParser(expr.strip(), allow_variables).parse())
+    except (UnsupportedPhpArraySyntax, ValueError, OverflowError, RecursionError):
+        return None
+
+
+_php_worker = None
+_php_worker_lock = threading.Lock()
+_php_eval_cache = {}
+_php_eval_cache_lock = threading.Lock()
+
+
+def get_php_worker():
+    """Shared PHP worker of this process (one per build worker in --jobs mode)"""
+    global _php_worker
+    with _php_worker_lock:
+        if _php_worker is None:
+            _php_worker = PhpEvalWorker()
+            atexit.register(_php_worker.close)
+        return _php_worker
+
+
+def convert_php_arrays_with_php_r(php_array_exprs, report_errors=True):
+    """Convert many PHP arrays to JSON in one round trip to the PHP worker
+    Static literals are converted by the pure-Python parser and never reach PHP
+    """
+    results = {}
+    pending = []
+    for expr in dict.fromkeys(php_array_exprs):
+        with _php_eval_cache_lock:
+            cached = _php_eval_cache.get(expr)
+        if cached is not None:
+            results[expr] = cached
+            continue
+        json_output = parse_php_array_literal(expr)
+        if json_output is not None:
+            results[expr] = json_output
+        else:
+            pending.append(expr)
+    if pending:
+        worker = get_php_worker()
+        evaluated = worker.evaluate_many(pending)
+        with _php_eval_cache_lock:
+            if len(_php_eval_cache) + len(pending) > PHP_EVAL_CACHE_LIMIT:
+                _php_eval_cache.clear()
+            for expr, json_output in zip(pending, evaluated):
+                if json_output is not None:
+                    _php_eval_cache[expr] = json_output
+        for expr, json_output in zip(pending, evaluated):
+            results[expr] = json_output
+            if json_output is None and report_errors and not worker.unavailable:
+                print(f"PHP error: cannot evaluate {expr}")
+    return [results[expr] for expr in php_array_exprs]
+
+
+def find_php_array_literals(code):
+    """Outermost [...] array literals of PHP code, stripped (array access such as $a['x'] is skipped)"""
+    literals = []
+    depth = 0
+    start = -1
+    prev = ''
+    i = 0
+    length = len(code)
+    while i < length:
+        char = code[i]
+        if char in ('"', "'"):
+            i += 1
+            while i < length and code[i] != char:
+                i += 2 if code[i] == '\\' else 1
+            prev = char
+            i += 1
+            continue
+        if char == '[':
+            if depth == 0:
+                start = -1 if prev and (prev.isalnum() or prev in '_$])}\'"') else i
+            depth += 1
+        elif char == ']' and depth:
+            depth -= 1
+            if depth == 0 and start != -1:
+                literals.append(code[start:i + 1])
+        if not char.isspace():
+            prev = char
+        i += 1
+    return literals
+
+
+def prefetch_php_arrays(php_array_exprs):
+    """Evaluate in one round trip the arrays of a view that need PHP, so later conversions hit the cache
+
+    Expressions the pure-Python parser handles (also with $variables) are skipped; nothing is sent
+    unless at least two expressions need PHP, a single one costs the same round trip later.
+    """
+    pending = [expr for expr in dict.fromkeys(php_array_exprs)
+               if parse_php_array_literal(expr, allow_variables=True) is None]
+    if len(pending) > 1:
+        convert_php_arrays_with_php_r(pending, report_errors=False)
+
+
+def convert_php_array_with_php_r(php_array_expr):
+    """Convert PHP array to JSON using the persistent php worker"""
+    return convert_php_arrays_with_php_r([php_array_expr])[0]
+
 
 def convert_php_array_to_json(expr):
-    """Convert PHP array syntax to JSON object/array syntax using php -r"""
+    """Convert PHP array syntax to JSON object/array syntax (pure-Python parser, then php -r)"""
+    tracing.count('php_array')
     if not expr or '[' not in expr:
         return expr
     
@@ -62,13 +537,18 @@ def convert_php_array_to_json(expr):
         # Fallback to old method if php -r fails
         return _convert_php_array_legacy(full_array)
     
+    # Literal tĩnh (có thể chứa $var) - không cần PHP
+    js_result = parse_php_array_literal(expr, allow_variables=True)
+    if js_result is not None:
+        return js_result
+    
     # Thử sử dụng php -r cho toàn bộ expression trước
     json_result = convert_php_array_with_php_r(expr)
     if json_result is not None and 'PHP error' not in str(json_result):
         return json_result
     
     # Fallback: chỉ xử lý quotes đơn giản
-    expr = re.sub(r"'([^']*)'", r'"\1"', expr)
+    expr = tracing.sub(r"'([^']*)'", r'"\1"', expr)
     return expr
 
 def _process_array_content(inner_content):
@@ -381,11 +861,12 @@ def _convert_php_array_legacy(expr):
 
 def php_to_js(expr):
     """Convert PHP expression to JavaScript using advanced converter"""
+    tracing.count('php_to_js')
     if expr is None:
         return "''"
     
     # Remove PHP closure use(...) syntax
-    expr = re.sub(r'\s+use\s*\([^)]*\)', '', expr)
+    expr = tracing.sub(r'\s+use\s*\([^)]*\)', '', expr)
     
     # Handle foreach BEFORE converting => to :
     foreach_pattern = r'\bforeach\s*\(\s*(.*?)\s*as\s*\$?(\w+)(\s*=>\s*\$?(\w+))?\s*\)(\s*)\{'
@@ -403,7 +884,7 @@ def php_to_js(expr):
             value_var = first_var
             return f'{JS_FUNCTION_PREFIX}.foreach({array_expr}, ({value_var}, __loopKey, __loopIndex, loop) =>{space_before_brace}{{'
     
-    expr = re.sub(foreach_pattern, replace_foreach, expr)
+    expr = tracing.sub(foreach_pattern, replace_foreach, expr)
     
     # Use advanced converter for complex structures
     expr = php_to_js_advanced(expr)
@@ -424,11 +905,11 @@ def convert_php_to_js(php_expr):
     php_expr = convert_string_concatenation(php_expr)
     
     # Step 2: Convert object accessor (->) to (.)
-    php_expr = re.sub(r'->', '.', php_expr)
+    php_expr = tracing.sub(r'->', '.', php_expr)
     
     # Step 3: Convert static accessor (::) to (.)
     # Handle $Class::$property and Class::method patterns
-    php_expr = re.sub(r'::', '.', php_expr)
+    php_expr = tracing.sub(r'::', '.', php_expr)
     
     # Remove $ prefix from variables (but keep it in template strings)
     php_expr = convert_php_variables(php_expr)
@@ -444,12 +925,12 @@ def convert_string_concatenation(php_expr):
     # Look for dots that are surrounded by non-digit characters or are at word boundaries
     pattern = r'(\w|\]|\))\s*\.\s*(?=\w|\$|\'|"|\()'
     
-    result = re.sub(pattern, r'\1+', php_expr)
+    result = tracing.sub(pattern, r'\1+', php_expr)
     return result
 
 def convert_php_variables(php_expr):
     """Convert $variable to variable (remove $ prefix)"""
     # Don't convert $ in template strings (between backticks)
     # Simple approach: convert $word patterns that are not in template strings
-    result = re.sub(r'\$([a-zA-Z_][a-zA-Z0-9_]*)', r'\1', php_expr)
+    result = tracing.sub(r'\$([a-zA-Z_][a-zA-Z0-9_]*)', r'\1', php_expr)
     return result
\ No newline at end of file
@@ -0,0 +1,232 @@
+"""
+Reactive blocks: bọc các ${...} hole của render template đọc state (@useState) trong this.__reactive([keys], () => `...`)
+
+Mỗi block là một FollowingBlock (cùng cơ chế với @follow/@watch): khi một state key thay đổi, chỉ các block
+đọc key đó được render lại thay vì cả view. Chỉ hole ở vị trí text (không nằm trong tag, comment, <script>,
+<style>, <textarea>, <title>) và không gọi vào view engine (this.*: include, section, block, event, ...) được bọc;
+nội dung section dài (App.View.section(name, `...`, 'html')) được xử lý đệ quy.
+
+    template, dependencies = wrap_reactive_holes(template_content, ['count', 'items'])
+    # dependencies: {'count': 2, 'items': 1} - số block theo dõi mỗi state key
+"""
+
+import re
+import json
+
+REACTIVE_BLOCK_METHOD = 'this.__reactive'
+
+# Nội dung của các tag này là raw text, comment marker của FollowingBlock không dùng được trong đó
+RAW_TEXT_TAGS = ('script', 'style', 'textarea', 'title')
+
+# App.View.* an toàn trong một block: không đăng ký gì với view engine
+PURE_VIEW_HELPERS = ('escString', 'execute', 'foreach', 'foreachKeyed', 'route')
+
+_IDENTIFIER_PATTERN = re.compile(r'(?:(?<=\.\.\.)|(?<![\w$.]))([A-Za-z_$][\w$]*)')
+_TAG_NAME_PATTERN = re.compile(r'[A-Za-z][\w-]*')
+_VIEW_HELPER_PATTERN = re.compile(r'\bApp\.View\.(\w+)')
+_THIS_PATTERN = re.compile(r'(?<![\w$.])this\b')
+
+
+def _skip_string(code, i):
+    """Index after the '...' / "..." literal starting at i"""
+    quote = code[i]
+    i += 1
+    length = len(code)
+    while i < length and code[i] != quote:
+        i += 2 if code[i] == '\\' else 1
+    return i + 1
+
+
+def _scan_code(code, i=0, on_template=None):
+    """Walk JS code from i until the } closing the enclosing ${...} hole (or the end of code)
+
+    Returns (end, code_only): end là index của } đóng hole (len(code) nếu không có), code_only là code
+    với string/template text bị bỏ (chỉ giữ code và code trong các hole lồng nhau).
+    on_template(start, end) được gọi cho mỗi template literal ở cấp ngoài cùng của đoạn code.
+    """
+    # Mỗi phần tử: ['code', brace_depth] hoặc ['template', start]
+    stack = [['code', 0]]
+    code_only = []
+    length = len(code)
+    while i < length:
+        char = code[i]
+        top = stack[-1]
+        if top[0] == 'template':
+            if char == '\\':
+                i += 2
+                continue
+            if char == '`':
+                stack.pop()
+                if len(stack) == 1 and on_template:
+                    on_template(top[1], i + 1)
+                code_only.append('``')
+            elif code.startswith('${', i):
+                stack.append(['code', 0])
+                i += 2
+                continue
+            i += 1
+            continue
+
+        if char in ('"', "'"):
+            i = _skip_string(code, i)
+            code_only.append("''")
+            continue
+        if char == '/' and code.startswith('//', i):
+            newline = code.find('\n', i)
+            i = length if newline == -1 else newline
+            continue
+        if char == '/' and code.startswith('/*', i):
+            close = code.find('*/', i + 2)
+            i = length if close == -1 else close + 2
+            continue
+        if char == '`':
+            stack.append(['template', i])
+        elif char == '{':
+            top[1] += 1
+        elif char == '}':
+            if top[1] == 0:
+                if len(stack) == 1:
+                    return i, ''.join(code_only)
+                # Hết ${...} lồng nhau, quay lại template
+                stack.pop()
+                i += 1
+                continue
+            top[1] -= 1
+        code_only.append(char)
+        i += 1
+    return length, ''.join(code_only)
+
+
+def read_identifiers(expression):
+    """Identifiers an expression reads (property names after '.' excluded, spread '...x' included)"""
+    _, code_only = _scan_code(expression)
+    return set(_IDENTIFIER_PATTERN.findall(code_only))
+
+
+def is_pure_expression(expression):
+    """True if the expression does not touch the view engine (this.*) or App.View helpers with side effects"""
+    _, code_only = _scan_code(expression)
+    if _THIS_PATTERN.search(code_only):
+        return False
+    return all(helper in PURE_VIEW_HELPERS for helper in _VIEW_HELPER_PATTERN.findall(code_only))
+
+
+class _TagState:
+    """Vị trí trong HTML của template text: text, tag (kể cả attribute), comment hoặc raw text"""
+
+    def __init__(self):
+        self.mode = 'text'
+        self.quote = None
+        self.tag_name = ''
+        self.raw_tag = ''
+
+    def feed(self, text, i):
+        """Advance over text[i]; returns the number of characters consumed"""
+        char = text[i]
+        mode = self.mode
+        if mode == 'text':
+            if char == '<':
+                if text.startswith('<!--', i):
+                    self.mode = 'comment'
+                    return 4
+                match = _TAG_NAME_PATTERN.match(text, i + 1)
+                if match:
+                    self.mode = 'tag'
+                    self.tag_name = match.group(0).lower()
+                elif text.startswith('</', i):
+                    self.mode = 'tag'
+                    self.tag_name = ''
+        elif mode == 'tag':
+            if self.quote:
+                if char == self.quote:
+                    self.quote = None
+            elif char in ('"', "'"):
+                self.quote = char
+            elif char == '>':
+                self_closing = text[i - 1:i] == '/'
+                if self.tag_name in RAW_TEXT_TAGS and not self_closing:
+                    self.mode = 'raw'
+                    self.raw_tag = self.tag_name
+                else:
+                    self.mode = 'text'
+        elif mode == 'comment':
+            if text.startswith('-->', i):
+                self.mode = 'text'
+                return 3
+        elif mode == 'raw':
+            if char == '<' and text[i + 2:i + 2 + len(self.raw_tag)].lower() == self.raw_tag and text.startswith('</', i):
+                self.mode = 'tag'
+                self.tag_name = ''
+        return 1
+
+
+def wrap_reactive_holes(template, state_keys, dependencies=None):
+    """Wrap the state-reading ${...} holes of a template literal body in reactive blocks
+
+    dependencies (state key -> số block) được cập nhật và trả về cùng template mới.
+    """
+    if dependencies is None:
+        dependencies = {}
+    state_keys = [key for key in state_keys if key]
+    if not state_keys or '${' not in template:
+        return template, dependencies
+
+    parts = []
+    tag_state = _TagState()
+    last = 0
+    i = 0
+    length = len(template)
+    while i < length:
+        char = template[i]
+        if char == '\\':
+            i += 2
+            continue
+        if char == '$' and template.startswith('${', i):
+            end, _ = _scan_code(template, i + 2)
+            if end >= length:
+                break
+            expression = template[i + 2:end]
+            replacement = _wrap_hole(expression, tag_state.mode == 'text', state_keys, dependencies)
+            if replacement is not None:
+                parts.append(template[last:i])
+                parts.append(replacement)
+                last = end + 1
+            i = end + 1
+            continue
+        i += tag_state.feed(template, i)
+    if not parts:
+        return template, dependencies
+    parts.append(template[last:])
+    return ''.join(parts), dependencies
+
+
+def _wrap_hole(expression, text_position, state_keys, dependencies):
+    """New source of one ${...} hole, or None to keep it"""
+    if expression.lstrip().startswith('App.View.section('):
+        return _wrap_section_content(expression, state_keys, dependencies)
+    if not text_position or not is_pure_expression(expression):
+        return None
+    identifiers = read_identifiers(expression)
+    keys = [key for key in state_keys if key in identifiers]
+    if not keys:
+        return None
+    for key in keys:
+        dependencies[key] = dependencies.get(key, 0) + 1
+    return f"${{{REACTIVE_BLOCK_METHOD}({json.dumps(keys)}, () => `${{{expression}}}`)}}"
+
+
+def _wrap_section_content(expression, state_keys, dependencies):
+    """Process the template literal arguments of App.View.section(...) recursively"""
+    spans = []
+    _scan_code(expression, 0, lambda start, end: spans.append((start, end)))
+    if not spans:
+        return None
+    parts = []
+    last = 0
+    for start, end in spans:
+        content, _ = wrap_reactive_holes(expression[start + 1:end - 1], state_keys, dependencies)
+        parts.append(expression[last:start + 1])
+        parts.append(content)
+        last = end - 1
+    parts.append(expression[last:])
+    return '${' + ''.join(parts) + '}'
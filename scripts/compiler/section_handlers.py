@@ -4,11 +4,12 @@ Handlers cho các section directives (@section, @endsection, @yield, etc.)
 
 from config import JS_FUNCTION_PREFIX
 from php_converter import php_to_js
+from template_ast import SectionNode, BlockNode, TemplateCodeGenerator, innermost_kind
 import re
 
 class SectionHandlers:
     def __init__(self):
-        pass
+        self.code_generator = TemplateCodeGenerator()
     
     def process_section_directive(self, line, stack, output, sections):
         """Process @section directive"""
@@ -37,25 +38,20 @@ class SectionHandlers:
         match_one = re.match(r'@section\s*\(\s*[\'"]([^\'"]*)[\'"]|([^)]*)\s*\)', line)
         if match_one:
             section_name = match_one.group(1) or php_to_js(match_one.group(2))
-            stack.append(('section', section_name, len(output)))
+            node = SectionNode(section_name)
+            output.append(node)
+            stack.append(node)
             return True
         
         return False
     
     def process_endsection_directive(self, stack, output, sections):
         """Process @endsection directive"""
-        if stack and stack[-1][0] == 'section':
-            _, section_name, start_idx = stack.pop()
-            # Filter out boolean values and join strings
-            section_content = '\n'.join([str(item) for item in output[start_idx:] if isinstance(item, str)])
-            output[:] = output[:start_idx]  # Modify output in place
-            
-            # Determine section type based on content
-            section_type = 'html' if self._contains_html_tags(section_content) else 'string'
-            
-            section_line = '${' + JS_FUNCTION_PREFIX + '.section(\'' + section_name + '\', `' + section_content + '`, \'' + section_type + '\')}'
-            output.append(section_line)
-            sections.append(section_line)
+        if innermost_kind(stack) == 'section':
+            node = stack.pop()
+            node.closed = True
+            # Section node đã nằm trong body của node cha, chỉ cần render để ghi nhận
+            sections.append(self.code_generator.render_node(node))
         return True
     
     def process_block_directive(self, line, stack, output, sections):
@@ -66,40 +62,30 @@ class SectionHandlers:
             block_name = match_two.group(1)
             block_attributes = match_two.group(2)
             block_attributes_js = php_to_js(block_attributes) if block_attributes else "{}"
-            result = '${this.__block(\'' + block_name + '\', ' + block_attributes_js + ', `'
-            stack.append(('block', block_name, len(output), block_attributes_js))
+            node = BlockNode(block_name, block_attributes_js)
+            output.append(node)
+            stack.append(node)
             return True
         
         # Single parameter version: @block('name')
         match_one = re.match(r'@block\s*\(\s*[\'"]([^\'"]*)[\'"]|([^)]*)\s*\)', line)
         if match_one:
             block_name = match_one.group(1) or php_to_js(match_one.group(2))
-            result = '${this.__block(\'' + block_name + '\', {}, `'
-            stack.append(('block', block_name, len(output), '{}'))
+            node = BlockNode(block_name, '{}')
+            output.append(node)
+            stack.append(node)
             return True
         
         return False
     
     def process_endblock_directive(self, stack, output, sections):
         """Process @endblock/@endBlock directive - similar to @endsection"""
-        if stack and stack[-1][0] == 'block':
-            _, block_name, start_idx, block_attributes = stack.pop()
-            # Filter out boolean values and join strings
-            block_content = '\n'.join([str(item) for item in output[start_idx:] if isinstance(item, str)])
-            output[:] = output[:start_idx]  # Modify output in place
-            
-            # Complete the block call
-            block_line = '${this.__block(\'' + block_name + '\', ' + block_attributes + ', `' + block_content + '`)}'
-            output.append(block_line)
-            sections.append(block_line)
+        if innermost_kind(stack) == 'block':
+            node = stack.pop()
+            node.closed = True
+            sections.append(self.code_generator.render_node(node))
         return True
 
-    def _contains_html_tags(self, content):
-        """Check if content contains HTML tags"""
-        # Simple check for HTML tags
-        html_pattern = r'<[a-zA-Z][^>]*>'
-        return bool(re.search(html_pattern, content))
-
     def _ensure_proper_escaping(self, section_value):
         """Ensure section value is properly escaped for JavaScript string literals"""
         # If it's already a string literal (starts and ends with quotes), fix escaping
@@ -0,0 +1,95 @@
+export function Custom_directives02($$$DATA$$$ = {}, systemData = {}) {
+    const {App, View, __base__, __layout__, __page__, __component__, __partial__, __system__, __env = {}, __helper = {}} = systemData;
+    const __VIEW_PATH__ = 'CUSTOM_DIRECTIVES-02';
+    const __VIEW_ID__ = $$$DATA$$$.__SSR_VIEW_ID__ || App.View.generateViewId();
+    const __VIEW_TYPE__ = 'view';
+    /* wraper.js */
+    const __UPDATE_DATA_TRAIT__ = {};
+    let {user, posts = [], count = 0} = $$$DATA$$$;
+    __UPDATE_DATA_TRAIT__.user = value => user = value;
+    __UPDATE_DATA_TRAIT__.posts = value => posts = value;
+    __UPDATE_DATA_TRAIT__.count = value => count = value;
+    const __VARIABLE_LIST__ = ["user", "posts", "count"];
+
+    self.setup('CUSTOM_DIRECTIVES-02', {
+        superView: null,
+        hasSuperView: false,
+        viewType: 'view',
+        sections: {},
+        wrapperConfig: { enable: false, tag: null, follow: true, attributes: {} },
+        __props__: ["__WRAPPER_ELEMENT__", "createHtml", "__REFS__", "parseRefs"],
+            __WRAPPER_ELEMENT__: __WRAPPER_ELEMENT__,
+            refs: __REFS__,
+            states: __STATE__,
+            parseRefs: parseRefs,
+            createHtml: createHtml,
+        hasAwaitData: false,
+        hasFetchData: false,
+        subscribe: true,
+        fetch: null,
+        data: $$$DATA$$$,
+        viewId: __VIEW_ID__,
+        path: __VIEW_PATH__,
+        usesVars: true,
+        hasSections: false,
+        hasSectionPreload: false,
+        hasPrerender: false,
+        renderLongSections: [],
+        renderSections: [],
+        prerenderSections: [],
+        userDefined: {},
+        scripts: [],
+        styles: [],
+        resources: [],
+        commitConstructorData: function() {
+            // Then update states from data
+            
+            // Finally lock state updates
+            
+        },
+        updateVariableData: function(data) {
+            // Update all variables first
+            for (const key in data) {
+                if (data.hasOwnProperty(key)) {
+                    this.updateVariableItem(key, data[key]);
+                }
+            }
+            // Then update states from data
+            
+            // Finally lock state updates
+            
+        },
+        updateVariableItem: function(key, value) {
+            this.data[key] = value;
+            if (typeof __UPDATE_DATA_TRAIT__[key] === "function") {
+                __UPDATE_DATA_TRAIT__[key](value);
+            }
+        },
+        loadServerData: function() {
+    
+},
+        prerender: function() {
+    return null;
+},
+        render: function() {
+                
+    let __outputRenderedContent__ = '';
+            try {
+                __outputRenderedContent__ = `
+
+<div>
+<h1>Welcome ${App.View.escString(user.name ?? 'Guest')}</h1>
+<p>Posts: ${App.View.escString(App.Helper.count(posts))}</p>
+<p>Count: ${App.View.escString(count)}</p>
+</div>`;
+            } catch(e) {
+                __outputRenderedContent__ = this.__showError(e.message);
+                console.warn(e);
+            }
+            return __outputRenderedContent__;
+            },
+        init: function() {  },
+        destroy: function() {}
+    });
+    return self;
+        }
\ No newline at end of file
@@ -0,0 +1,109 @@
+export function Custom_directives03($$$DATA$$$ = {}, systemData = {}) {
+    const {App, View, __base__, __layout__, __page__, __component__, __partial__, __system__, __env = {}, __helper = {}} = systemData;
+    const __VIEW_PATH__ = 'CUSTOM_DIRECTIVES-03';
+    const __VIEW_ID__ = $$$DATA$$$.__SSR_VIEW_ID__ || App.View.generateViewId();
+    const __VIEW_TYPE__ = 'view';
+    /* wraper.js */
+    const __UPDATE_DATA_TRAIT__ = {};
+    let count = 0;
+    let name = 'John';
+    let age = 25;
+    let {name, email} = user;
+    __UPDATE_DATA_TRAIT__.count = value => count = value;
+    __UPDATE_DATA_TRAIT__.name = value => name = value;
+    __UPDATE_DATA_TRAIT__.age = value => age = value;
+    __UPDATE_DATA_TRAIT__.name = value => name = value;
+    __UPDATE_DATA_TRAIT__.email = value => email = value;
+    const __VARIABLE_LIST__ = ["count", "name", "age", "name", "email"];
+    const set$count = __STATE__.__register('count');
+    let count = null;
+    const setCount = (state) => {
+        count = state;
+        set$count(state);
+    };
+    __STATE__.__setters__.setCount = setCount;
+    const update$count = (value) => {
+        if(__STATE__._canUpdateStateByKey){
+            updateStateByKey('count', value);
+            count = value;
+        }
+    };
+
+    self.setup('CUSTOM_DIRECTIVES-03', {
+        superView: null,
+        hasSuperView: false,
+        viewType: 'view',
+        sections: {},
+        wrapperConfig: { enable: false, tag: null, follow: true, attributes: {} },
+        __props__: ["__WRAPPER_ELEMENT__", "createHtml", "__REFS__", "parseRefs"],
+            __WRAPPER_ELEMENT__: __WRAPPER_ELEMENT__,
+            refs: __REFS__,
+            states: __STATE__,
+            parseRefs: parseRefs,
+            createHtml: createHtml,
+        hasAwaitData: false,
+        hasFetchData: false,
+        subscribe: true,
+        fetch: null,
+        data: $$$DATA$$$,
+        viewId: __VIEW_ID__,
+        path: __VIEW_PATH__,
+        usesVars: false,
+        hasSections: false,
+        hasSectionPreload: false,
+        hasPrerender: false,
+        renderLongSections: [],
+        renderSections: [],
+        prerenderSections: [],
+        userDefined: {},
+        scripts: [],
+        styles: [],
+        resources: [],
+        commitConstructorData: function() {
+            // Then update states from data
+            update$count(0);
+            // Finally lock state updates
+            lockUpdateRealState();
+        },
+        updateVariableData: function(data) {
+            // Update all variables first
+            for (const key in data) {
+                if (data.hasOwnProperty(key)) {
+                    this.updateVariableItem(key, data[key]);
+                }
+            }
+            // Then update states from data
+            update$count(0);
+            // Finally lock state updates
+            lockUpdateRealState();
+        },
+        updateVariableItem: function(key, value) {
+            this.data[key] = value;
+            if (typeof __UPDATE_DATA_TRAIT__[key] === "function") {
+                __UPDATE_DATA_TRAIT__[key](value);
+            }
+        },
+        loadServerData: function() {
+    
+},
+        prerender: function() {
+    return null;
+},
+        render: function() {
+                
+    let __outputRenderedContent__ = '';
+            try {
+                __outputRenderedContent__ = `
+
+`;
+            } catch(e) {
+                __outputRenderedContent__ = this.__showError(e.message);
+                console.warn(e);
+            }
+            return __outputRenderedContent__;
+            },
+        init: function() {  },
+        destroy: function() {}
+    });
+    return self;
+        }
\ No newline at end of file
@@ -0,0 +1,146 @@
+export function Custom_directives07($$$DATA$$$ = {}, systemData = {}) {
+    const {App, View, __base__, __layout__, __page__, __component__, __partial__, __system__, __env = {}, __helper = {}} = systemData;
+    const __VIEW_PATH__ = 'CUSTOM_DIRECTIVES-07';
+    const __VIEW_ID__ = $$$DATA$$$.__SSR_VIEW_ID__ || App.View.generateViewId();
+    const __VIEW_TYPE__ = 'view';
+    /* wraper.js */
+    const __UPDATE_DATA_TRAIT__ = {};
+    const __VARIABLE_LIST__ = [];
+    const set$count = __STATE__.__register('count');
+    let count = null;
+    const setCount = (state) => {
+        count = state;
+        set$count(state);
+    };
+    __STATE__.__setters__.setCount = setCount;
+    const update$count = (value) => {
+        if(__STATE__._canUpdateStateByKey){
+            updateStateByKey('count', value);
+            count = value;
+        }
+    };
+    const set$name = __STATE__.__register('name');
+    let name = null;
+    const setName = (state) => {
+        name = state;
+        set$name(state);
+    };
+    __STATE__.__setters__.setName = setName;
+    const update$name = (value) => {
+        if(__STATE__._canUpdateStateByKey){
+            updateStateByKey('name', value);
+            name = value;
+        }
+    };
+    const set$items = __STATE__.__register('items');
+    let items = null;
+    const setItems = (state) => {
+        items = state;
+        set$items(state);
+    };
+    __STATE__.__setters__.setItems = setItems;
+    const update$items = (value) => {
+        if(__STATE__._canUpdateStateByKey){
+            updateStateByKey('items', value);
+            items = value;
+        }
+    };
+    const set$'count' = __STATE__.__register(''count'');
+    let 'count' = null;
+    const 'setCount' = (state) => {
+        'count' = state;
+        set$'count'(state);
+    };
+    __STATE__.__setters__.'setCount' = 'setCount';
+    const update$'count' = (value) => {
+        if(__STATE__._canUpdateStateByKey){
+            updateStateByKey(''count'', value);
+            'count' = value;
+        }
+    };
+
+    self.setup('CUSTOM_DIRECTIVES-07', {
+        superView: null,
+        hasSuperView: false,
+        viewType: 'view',
+        sections: {},
+        wrapperConfig: { enable: false, tag: null, follow: true, attributes: {} },
+        __props__: ["__WRAPPER_ELEMENT__", "createHtml", "__REFS__", "parseRefs"],
+            __WRAPPER_ELEMENT__: __WRAPPER_ELEMENT__,
+            refs: __REFS__,
+            states: __STATE__,
+            parseRefs: parseRefs,
+            createHtml: createHtml,
+        hasAwaitData: false,
+        hasFetchData: false,
+        subscribe: false,
+        fetch: null,
+        data: $$$DATA$$$,
+        viewId: __VIEW_ID__,
+        path: __VIEW_PATH__,
+        usesVars: false,
+        hasSections: false,
+        hasSectionPreload: false,
+        hasPrerender: false,
+        renderLongSections: [],
+        renderSections: [],
+        prerenderSections: [],
+        userDefined: {},
+        scripts: [],
+        styles: [],
+        resources: [],
+        commitConstructorData: function() {
+            // Then update states from data
+            update$count(0);
+            update$name('');
+            update$items([]);
+            update$'count'(0);
+            // Finally lock state updates
+            lockUpdateRealState();
+        },
+        updateVariableData: function(data) {
+            // Update all variables first
+            for (const key in data) {
+                if (data.hasOwnProperty(key)) {
+                    this.updateVariableItem(key, data[key]);
+                }
+            }
+            // Then update states from data
+            update$count(0);
+            update$name('');
+            update$items([]);
+            update$'count'(0);
+            // Finally lock state updates
+            lockUpdateRealState();
+        },
+        updateVariableItem: function(key, value) {
+            this.data[key] = value;
+            if (typeof __UPDATE_DATA_TRAIT__[key] === "function") {
+                __UPDATE_DATA_TRAIT__[key](value);
+            }
+        },
+        loadServerData: function() {
+    
+},
+        prerender: function() {
+    return null;
+},
+        render: function() {
+                
+    let __outputRenderedContent__ = '';
+            try {
+                __outputRenderedContent__ = `
+
+
+// Có thể dùng string thay vì variable`;
+            } catch(e) {
+                __outputRenderedContent__ = this.__showError(e.message);
+                console.warn(e);
+            }
+            return __outputRenderedContent__;
+            },
+        init: function() {  },
+        destroy: function() {}
+    });
+    return self;
+        }
\ No newline at end of file
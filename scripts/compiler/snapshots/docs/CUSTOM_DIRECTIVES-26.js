@@ -0,0 +1 @@
+// compile error: TypeError: pop expected at most 1 argument, got 2
@@ -0,0 +1,123 @@
+export function Fuzz002($$$DATA$$$ = {}, systemData = {}) {
+    const {App, View, __base__, __layout__, __page__, __component__, __partial__, __system__, __env = {}, __helper = {}} = systemData;
+    const __VIEW_PATH__ = 'fuzz-002';
+    const __VIEW_ID__ = $$$DATA$$$.__SSR_VIEW_ID__ || App.View.generateViewId();
+    const __VIEW_TYPE__ = 'view';
+    /* wraper.js */
+    const __UPDATE_DATA_TRAIT__ = {};
+    let {title = 'Fuzz', count = 0, items = [], flag = false, page = 1, html = '', user = null} = $$$DATA$$$;
+    __UPDATE_DATA_TRAIT__.title = value => title = value;
+    __UPDATE_DATA_TRAIT__.count = value => count = value;
+    __UPDATE_DATA_TRAIT__.items = value => items = value;
+    __UPDATE_DATA_TRAIT__.flag = value => flag = value;
+    __UPDATE_DATA_TRAIT__.page = value => page = value;
+    __UPDATE_DATA_TRAIT__.html = value => html = value;
+    __UPDATE_DATA_TRAIT__.user = value => user = value;
+    const __VARIABLE_LIST__ = ["title", "count", "items", "flag", "page", "html", "user"];
+
+    self.setup('fuzz-002', {
+        superView: null,
+        hasSuperView: false,
+        viewType: 'view',
+        sections: {},
+        wrapperConfig: { enable: false, tag: null, follow: true, attributes: {} },
+        __props__: ["__WRAPPER_ELEMENT__", "createHtml", "__REFS__", "parseRefs"],
+            __WRAPPER_ELEMENT__: __WRAPPER_ELEMENT__,
+            refs: __REFS__,
+            states: __STATE__,
+            parseRefs: parseRefs,
+            createHtml: createHtml,
+        hasAwaitData: false,
+        hasFetchData: false,
+        subscribe: true,
+        fetch: null,
+        data: $$$DATA$$$,
+        viewId: __VIEW_ID__,
+        path: __VIEW_PATH__,
+        usesVars: true,
+        hasSections: false,
+        hasSectionPreload: false,
+        hasPrerender: false,
+        renderLongSections: [],
+        renderSections: [],
+        prerenderSections: [],
+        userDefined: {},
+        scripts: [],
+        styles: [],
+        resources: [],
+        commitConstructorData: function() {
+            // Then update states from data
+            
+            // Finally lock state updates
+            
+        },
+        updateVariableData: function(data) {
+            // Update all variables first
+            for (const key in data) {
+                if (data.hasOwnProperty(key)) {
+                    this.updateVariableItem(key, data[key]);
+                }
+            }
+            // Then update states from data
+            
+            // Finally lock state updates
+            
+        },
+        updateVariableItem: function(key, value) {
+            this.data[key] = value;
+            if (typeof __UPDATE_DATA_TRAIT__[key] === "function") {
+                __UPDATE_DATA_TRAIT__[key](value);
+            }
+        },
+        loadServerData: function() {
+    
+},
+        prerender: function() {
+    return null;
+},
+        render: function() {
+                
+    let __outputRenderedContent__ = '';
+            try {
+                __outputRenderedContent__ = `
+
+<div>
+${App.View.foreach(items, (item, __loopKey, __loopIndex, loop) => `
+<li>${App.View.escString(item)}</li>
+<span>Static text 319</span>
+${App.View.execute(() => {
+let __forOutputContent__ = [];
+for(let i = 0; i < 5; i++) {
+__forOutputContent__.push(`
+<span>${App.View.escString(i)}</span>
+<span class="c14">${App.View.escString(App.Helper.strtoupper(items))}</span>
+${App.View.execute(() => {
+let __forOutputContent__ = [];
+for(let i = 0; i < 5; i++) {
+__forOutputContent__.push(`
+<span>${App.View.escString(i)}</span>
+<a href="/page/${App.View.escString(page)}" data-id="663">Link</a>
+<input type="text" ${this.__addEventConfig("input", [{"handler":"handleInput","params":[() => event]}])} value="${App.View.escString(title)}">
+<p class="c82">${App.View.escString(App.Helper.strtoupper(title))}</p>
+`);
+}
+return __forOutputContent__.join('');
+})}
+${App.View.renderView(this.__include('partials.item', {"value":"static"}))}
+`);
+}
+return __forOutputContent__.join('');
+})}
+`)}
+</div>`;
+            } catch(e) {
+                __outputRenderedContent__ = this.__showError(e.message);
+                console.warn(e);
+            }
+            return __outputRenderedContent__;
+            },
+        init: function() {  },
+        destroy: function() {}
+    });
+    return self;
+        }
\ No newline at end of file
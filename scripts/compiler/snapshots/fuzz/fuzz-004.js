@@ -0,0 +1,217 @@
+export function Fuzz004($$$DATA$$$ = {}, systemData = {}) {
+    const {App, View, __base__, __layout__, __page__, __component__, __partial__, __system__, __env = {}, __helper = {}} = systemData;
+    const __VIEW_PATH__ = 'fuzz-004';
+    const __VIEW_ID__ = $$$DATA$$$.__SSR_VIEW_ID__ || App.View.generateViewId();
+    const __VIEW_TYPE__ = 'view';
+    /* wraper.js */
+    const __UPDATE_DATA_TRAIT__ = {};
+    let {title = 'Fuzz', count = 0, items = [], flag = false, page = 1, html = '', user = null} = $$$DATA$$$;
+    __UPDATE_DATA_TRAIT__.title = value => title = value;
+    __UPDATE_DATA_TRAIT__.count = value => count = value;
+    __UPDATE_DATA_TRAIT__.items = value => items = value;
+    __UPDATE_DATA_TRAIT__.flag = value => flag = value;
+    __UPDATE_DATA_TRAIT__.page = value => page = value;
+    __UPDATE_DATA_TRAIT__.html = value => html = value;
+    __UPDATE_DATA_TRAIT__.user = value => user = value;
+    const __VARIABLE_LIST__ = ["title", "count", "items", "flag", "page", "html", "user"];
+
+    self.setup('fuzz-004', {
+        superView: null,
+        hasSuperView: false,
+        viewType: 'view',
+        sections: {},
+        wrapperConfig: { enable: false, tag: null, follow: true, attributes: {} },
+        __props__: ["__WRAPPER_ELEMENT__", "createHtml", "__REFS__", "parseRefs"],
+            __WRAPPER_ELEMENT__: __WRAPPER_ELEMENT__,
+            refs: __REFS__,
+            states: __STATE__,
+            parseRefs: parseRefs,
+            createHtml: createHtml,
+        hasAwaitData: false,
+        hasFetchData: false,
+        subscribe: true,
+        fetch: null,
+        data: $$$DATA$$$,
+        viewId: __VIEW_ID__,
+        path: __VIEW_PATH__,
+        usesVars: true,
+        hasSections: false,
+        hasSectionPreload: false,
+        hasPrerender: false,
+        renderLongSections: [],
+        renderSections: [],
+        prerenderSections: [],
+        userDefined: {},
+        scripts: [],
+        styles: [],
+        resources: [],
+        commitConstructorData: function() {
+            // Then update states from data
+            
+            // Finally lock state updates
+            
+        },
+        updateVariableData: function(data) {
+            // Update all variables first
+            for (const key in data) {
+                if (data.hasOwnProperty(key)) {
+                    this.updateVariableItem(key, data[key]);
+                }
+            }
+            // Then update states from data
+            
+            // Finally lock state updates
+            
+        },
+        updateVariableItem: function(key, value) {
+            this.data[key] = value;
+            if (typeof __UPDATE_DATA_TRAIT__[key] === "function") {
+                __UPDATE_DATA_TRAIT__[key](value);
+            }
+        },
+        loadServerData: function() {
+    
+},
+        prerender: function() {
+    return null;
+},
+        render: function() {
+                
+    let __outputRenderedContent__ = '';
+            try {
+                __outputRenderedContent__ = `
+
+<div>
+${App.View.foreach(items, (item, __loopKey, __loopIndex, loop) => `
+<li>${App.View.escString(item)}</li>
+${App.View.execute(() => { if(user.name ?? 'none'){ return `
+${App.View.execute(() => {
+    local = 61;
+})}
+<p>${App.View.escString(local)}</p>
+${App.View.execute(() => {
+let __forOutputContent__ = [];
+for(let i = 0; i < 5; i++) {
+__forOutputContent__.push(`
+<span>${App.View.escString(i)}</span>
+<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 3]}])}>+</button>
+<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 1]}])}>+</button>
+<a href="/page/${App.View.escString(page)}" data-id="816">Link</a>
+`);
+}
+return __forOutputContent__.join('');
+})}
+<a href="/page/${App.View.escString(page)}" data-id="203">Link</a>
+`; }
+return '';
+})}
+<p>Static text 504</p>
+`)}
+${App.View.execute(() => {
+    local = 14;
+})}
+<p>${App.View.escString(local)}</p>
+${App.View.execute(() => {
+let __forOutputContent__ = [];
+for(let i = 0; i < 5; i++) {
+__forOutputContent__.push(`
+<span>${App.View.escString(i)}</span>
+<input type="text" ${this.__addEventConfig("input", [{"handler":"handleInput","params":[() => event]}])} value="${App.View.escString(title)}">
+<a href="/page/${App.View.escString(page)}" data-id="836">Link</a>
+${APP.View.execute(() => {
+    local = 2;
+})}
+<p>${App.View.escString(local)}</p>
+${App.View.execute(() => {
+let __forOutputContent__ = [];
+for(let i = 0; i < 4; i++) {
+__forOutputContent__.push(`
+<span>${App.View.escString(i)}</span>
+${App.View.execute(() => { if(items ?? 'none'){ return `
+<span>Static text 344</span>
+<div>Static text 577</div>
+<span>Static text 578</span>
+<a href="/page/${App.View.escString(page)}" data-id="788">Link</a>
+`; } else if(count > 9){ return `
+<input type="text" ${this.__addEventConfig("input", [{"handler":"handleInput","params":[() => event]}])} value="${App.View.escString(title)}">
+<span>${html}</span>
+`; } else { return `
+<span>Static text 22</span>
+<li>Static text 829</li>
+`; }
+return '';
+})}
+<li>Static text 675</li>
+<p>Static text 960</p>
+<input type="text" ${this.__addEventConfig("input", [{"handler":"handleInput","params":[() => event]}])} value="${App.View.escString(title)}">
+`);
+}
+return __forOutputContent__.join('');
+})}
+`);
+}
+return __forOutputContent__.join('');
+})}
+${App.View.execute(() => {
+let __forOutputContent__ = [];
+for(let i = 0; i < 1; i++) {
+__forOutputContent__.push(`
+<span>${App.View.escString(i)}</span>
+<span class="c27">${App.View.escString(App.Helper.strtoupper(items))}</span>
+<input type="text" ${this.__addEventConfig("input", [{"handler":"handleInput","params":[() => event]}])} value="${App.View.escString(title)}">
+${App.View.foreach(items, (item, __loopKey, __loopIndex, loop) => `
+<li>${App.View.escString(item)}</li>
+${App.View.execute(() => {
+let __forOutputContent__ = [];
+for(let i = 0; i < 3; i++) {
+__forOutputContent__.push(`
+<span>${App.View.escString(i)}</span>
+<li>Static text 166</li>
+<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 0]}])}>+</button>
+<a href="/page/${App.View.escString(page)}" data-id="142">Link</a>
+<a href="/page/${App.View.escString(page)}" data-id="219">Link</a>
+`);
+}
+return __forOutputContent__.join('');
+})}
+${App.View.renderView(this.__include('partials.item', {"value":42}))}
+<p class="c24">${App.View.escString(count)}</p>
+<section>Static text 954</section>
+`)}
+${App.View.execute(() => {
+let __forOutputContent__ = [];
+for(let i = 0; i < 1; i++) {
+__forOutputContent__.push(`
+<span>${App.View.escString(i)}</span>
+<li>${html}</li>
+${App.View.execute(() => { if(count ?? 'none'){ return `
+<section class="c92">${App.View.escString(page ?? 'none')}</section>
+<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 2]}])}>+</button>
+`; } else if(count > 2){ return `
+<div>Static text 18</div>
+<input type="text" ${this.__addEventConfig("input", [{"handler":"handleInput","params":[() => event]}])} value="${App.View.escString(title)}">
+`; }
+return '';
+})}
+<input type="text" ${this.__addEventConfig("input", [{"handler":"handleInput","params":[() => event]}])} value="${App.View.escString(title)}">
+${App.View.renderView(this.__include('partials.item', {"value":flag}))}
+`);
+}
+return __forOutputContent__.join('');
+})}
+`);
+}
+return __forOutputContent__.join('');
+})}
+</div>`;
+            } catch(e) {
+                __outputRenderedContent__ = this.__showError(e.message);
+                console.warn(e);
+            }
+            return __outputRenderedContent__;
+            },
+        init: function() {  },
+        destroy: function() {}
+    });
+    return self;
+        }
\ No newline at end of file
@@ -0,0 +1,143 @@
+export function Fuzz006($$$DATA$$$ = {}, systemData = {}) {
+    const {App, View, __base__, __layout__, __page__, __component__, __partial__, __system__, __env = {}, __helper = {}} = systemData;
+    const __VIEW_PATH__ = 'fuzz-006';
+    const __VIEW_ID__ = $$$DATA$$$.__SSR_VIEW_ID__ || App.View.generateViewId();
+    const __VIEW_TYPE__ = 'view';
+    /* wraper.js */
+    const __UPDATE_DATA_TRAIT__ = {};
+    let {title = 'Fuzz', count = 0, items = [], flag = false, page = 1, html = '', user = null} = $$$DATA$$$;
+    __UPDATE_DATA_TRAIT__.title = value => title = value;
+    __UPDATE_DATA_TRAIT__.count = value => count = value;
+    __UPDATE_DATA_TRAIT__.items = value => items = value;
+    __UPDATE_DATA_TRAIT__.flag = value => flag = value;
+    __UPDATE_DATA_TRAIT__.page = value => page = value;
+    __UPDATE_DATA_TRAIT__.html = value => html = value;
+    __UPDATE_DATA_TRAIT__.user = value => user = value;
+    const __VARIABLE_LIST__ = ["title", "count", "items", "flag", "page", "html", "user"];
+
+    self.setup('fuzz-006', {
+        superView: null,
+        hasSuperView: false,
+        viewType: 'view',
+        sections: {},
+        wrapperConfig: { enable: false, tag: null, follow: true, attributes: {} },
+        __props__: ["__WRAPPER_ELEMENT__", "createHtml", "__REFS__", "parseRefs"],
+            __WRAPPER_ELEMENT__: __WRAPPER_ELEMENT__,
+            refs: __REFS__,
+            states: __STATE__,
+            parseRefs: parseRefs,
+            createHtml: createHtml,
+        hasAwaitData: false,
+        hasFetchData: false,
+        subscribe: true,
+        fetch: null,
+        data: $$$DATA$$$,
+        viewId: __VIEW_ID__,
+        path: __VIEW_PATH__,
+        usesVars: true,
+        hasSections: false,
+        hasSectionPreload: false,
+        hasPrerender: false,
+        renderLongSections: [],
+        renderSections: [],
+        prerenderSections: [],
+        userDefined: {},
+        scripts: [],
+        styles: [],
+        resources: [],
+        commitConstructorData: function() {
+            // Then update states from data
+            
+            // Finally lock state updates
+            
+        },
+        updateVariableData: function(data) {
+            // Update all variables first
+            for (const key in data) {
+                if (data.hasOwnProperty(key)) {
+                    this.updateVariableItem(key, data[key]);
+                }
+            }
+            // Then update states from data
+            
+            // Finally lock state updates
+            
+        },
+        updateVariableItem: function(key, value) {
+            this.data[key] = value;
+            if (typeof __UPDATE_DATA_TRAIT__[key] === "function") {
+                __UPDATE_DATA_TRAIT__[key](value);
+            }
+        },
+        loadServerData: function() {
+    
+},
+        prerender: function() {
+    return null;
+},
+        render: function() {
+                
+    let __outputRenderedContent__ = '';
+            try {
+                __outputRenderedContent__ = `
+<div>
+${App.View.foreach(items, (item, __loopKey, __loopIndex, loop) => `
+<li>${App.View.escString(item)}</li>
+<input type="text" ${this.__addEventConfig("input", [{"handler":"handleInput","params":[() => event]}])} value="${App.View.escString(title)}">
+<input type="text" ${this.__addEventConfig("input", [{"handler":"handleInput","params":[() => event]}])} value="${App.View.escString(title)}">
+`)}
+${App.View.execute(() => {
+let __forOutputContent__ = [];
+for(let i = 0; i < 4; i++) {
+__forOutputContent__.push(`
+<span>${App.View.escString(i)}</span>
+${App.View.renderView(this.__include('partials.item', {"value":flag}))}
+${APP.View.execute(() => {
+    local = 2;
+})}
+<p>${App.View.escString(local)}</p>
+`);
+}
+return __forOutputContent__.join('');
+})}
+<a href="/page/${App.View.escString(page)}" data-id="508">Link</a>
+${App.View.execute(() => {
+let __forOutputContent__ = [];
+for(let i = 0; i < 4; i++) {
+__forOutputContent__.push(`
+<span>${App.View.escString(i)}</span>
+<li>Static text 858</li>
+<div>Static text 843</div>
+${App.View.renderView(this.__include('partials.item', {"value":count}))}
+${App.View.execute(() => {
+let __forOutputContent__ = [];
+for(let i = 0; i < 5; i++) {
+__forOutputContent__.push(`
+<span>${App.View.escString(i)}</span>
+<a href="/page/${App.View.escString(page)}" data-id="67">Link</a>
+<a href="/page/${App.View.escString(page)}" data-id="334">Link</a>
+<span>Static text 454</span>
+${App.View.foreach(items, (item, key, __loopIndex, loop) => `
+<li>${App.View.escString(item)}</li>
+<p class="c25">${App.View.escString(App.Helper.count(items) + 2)}</p>
+`)}
+`);
+}
+return __forOutputContent__.join('');
+})}
+`);
+}
+return __forOutputContent__.join('');
+})}
+</div>`;
+            } catch(e) {
+                __outputRenderedContent__ = this.__showError(e.message);
+                console.warn(e);
+            }
+            return __outputRenderedContent__;
+            },
+        init: function() {  },
+        destroy: function() {}
+    });
+    return self;
+        }
\ No newline at end of file
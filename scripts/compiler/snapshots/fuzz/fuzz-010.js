@@ -0,0 +1,225 @@
+export function Fuzz010($$$DATA$$$ = {}, systemData = {}) {
+    const {App, View, __base__, __layout__, __page__, __component__, __partial__, __system__, __env = {}, __helper = {}} = systemData;
+    const __VIEW_PATH__ = 'fuzz-010';
+    const __VIEW_ID__ = $$$DATA$$$.__SSR_VIEW_ID__ || App.View.generateViewId();
+    const __VIEW_TYPE__ = 'view';
+    /* wraper.js */
+    const __UPDATE_DATA_TRAIT__ = {};
+    let {title = 'Fuzz', count = 0, items = [], flag = false, page = 1, html = '', user = null} = $$$DATA$$$;
+    __UPDATE_DATA_TRAIT__.title = value => title = value;
+    __UPDATE_DATA_TRAIT__.count = value => count = value;
+    __UPDATE_DATA_TRAIT__.items = value => items = value;
+    __UPDATE_DATA_TRAIT__.flag = value => flag = value;
+    __UPDATE_DATA_TRAIT__.page = value => page = value;
+    __UPDATE_DATA_TRAIT__.html = value => html = value;
+    __UPDATE_DATA_TRAIT__.user = value => user = value;
+    const __VARIABLE_LIST__ = ["title", "count", "items", "flag", "page", "html", "user"];
+
+    self.setup('fuzz-010', {
+        superView: null,
+        hasSuperView: false,
+        viewType: 'view',
+        sections: {},
+        wrapperConfig: { enable: false, tag: null, follow: true, attributes: {} },
+        __props__: ["__WRAPPER_ELEMENT__", "createHtml", "__REFS__", "parseRefs"],
+            __WRAPPER_ELEMENT__: __WRAPPER_ELEMENT__,
+            refs: __REFS__,
+            states: __STATE__,
+            parseRefs: parseRefs,
+            createHtml: createHtml,
+        hasAwaitData: false,
+        hasFetchData: false,
+        subscribe: true,
+        fetch: null,
+        data: $$$DATA$$$,
+        viewId: __VIEW_ID__,
+        path: __VIEW_PATH__,
+        usesVars: true,
+        hasSections: false,
+        hasSectionPreload: false,
+        hasPrerender: false,
+        renderLongSections: [],
+        renderSections: [],
+        prerenderSections: [],
+        userDefined: {},
+        scripts: [],
+        styles: [],
+        resources: [],
+        commitConstructorData: function() {
+            // Then update states from data
+            
+            // Finally lock state updates
+            
+        },
+        updateVariableData: function(data) {
+            // Update all variables first
+            for (const key in data) {
+                if (data.hasOwnProperty(key)) {
+                    this.updateVariableItem(key, data[key]);
+                }
+            }
+            // Then update states from data
+            
+            // Finally lock state updates
+            
+        },
+        updateVariableItem: function(key, value) {
+            this.data[key] = value;
+            if (typeof __UPDATE_DATA_TRAIT__[key] === "function") {
+                __UPDATE_DATA_TRAIT__[key](value);
+            }
+        },
+        loadServerData: function() {
+    
+},
+        prerender: function() {
+    return null;
+},
+        render: function() {
+                
+    let __outputRenderedContent__ = '';
+            try {
+                __outputRenderedContent__ = `
+
+<div>
+<input type="text" ${this.__addEventConfig("input", [{"handler":"handleInput","params":[() => event]}])} value="${App.View.escString(title)}">
+${App.View.execute(() => {
+let __forOutputContent__ = [];
+for(let i = 0; i < 5; i++) {
+__forOutputContent__.push(`
+<span>${App.View.escString(i)}</span>
+${App.View.execute(() => { if(items){ return `
+${App.View.execute(() => {
+let __forOutputContent__ = [];
+for(let i = 0; i < 2; i++) {
+__forOutputContent__.push(`
+<span>${App.View.escString(i)}</span>
+${App.View.renderView(this.__include('partials.item', {"value":count}))}
+`);
+}
+return __forOutputContent__.join('');
+})}
+`; } else if(count > 7){ return `
+${App.View.renderView(this.__include('partials.item', {"value":items}))}
+`; }
+return '';
+})}
+<input type="text" ${this.__addEventConfig("input", [{"handler":"handleInput","params":[() => event]}])} value="${App.View.escString(title)}">
+`);
+}
+return __forOutputContent__.join('');
+})}
+<section>${html}</section>
+${App.View.execute(() => { if(App.Helper.count(items) + 6){ return `
+${App.View.execute(() => { if(App.Helper.strtoupper(user['email'])){ return `
+${App.View.execute(() => {
+let __forOutputContent__ = [];
+for(let i = 0; i < 5; i++) {
+__forOutputContent__.push(`
+<span>${App.View.escString(i)}</span>
+<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 4]}])}>+</button>
+<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 0]}])}>+</button>
+${App.View.renderView(this.__include('partials.item', {"value":title}))}
+${App.View.renderView(this.__include('partials.item', {"value":page}))}
+`);
+}
+return __forOutputContent__.join('');
+})}
+`; } else if(count > 2){ return `
+<div>Static text 528</div>
+${App.View.renderView(this.__include('partials.item', {"value":title}))}
+${App.View.execute(() => {
+let __forOutputContent__ = [];
+for(let i = 0; i < 3; i++) {
+__forOutputContent__.push(`
+<span>${App.View.escString(i)}</span>
+<p class="c47">${App.View.escString(App.Helper.count(items) + 2)}</p>
+<li class="c32">${App.View.escString(App.Helper.count(items) + 7)}</li>
+${App.View.renderView(this.__include('partials.item', {"value":42}))}
+<li>Static text 56</li>
+`);
+}
+return __forOutputContent__.join('');
+})}
+<a href="/page/${App.View.escString(page)}" data-id="960">Link</a>
+`; }
+return '';
+})}
+${App.View.execute(() => { if(App.Helper.strtoupper(flag)){ return `
+${App.View.execute(() => {
+let __forOutputContent__ = [];
+for(let i = 0; i < 2; i++) {
+__forOutputContent__.push(`
+<span>${App.View.escString(i)}</span>
+<input type="text" ${this.__addEventConfig("input", [{"handler":"handleInput","params":[() => event]}])} value="${App.View.escString(title)}">
+<div>Static text 862</div>
+<a href="/page/${App.View.escString(page)}" data-id="839">Link</a>
+`);
+}
+return __forOutputContent__.join('');
+})}
+${App.View.foreach(items, (item, key, __loopIndex, loop) => `
+<li>${App.View.escString(item)}</li>
+<li>Static text 789</li>
+<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 2]}])}>+</button>
+<section>Static text 145</section>
+<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 0]}])}>+</button>
+`)}
+<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 1]}])}>+</button>
+${App.View.foreach(items, (item, __loopKey, __loopIndex, loop) => `
+<li>${App.View.escString(item)}</li>
+${App.View.renderView(this.__include('partials.item', {"value":items}))}
+${App.View.renderView(this.__include('partials.item', {"value":"static"}))}
+<li class="c84">${App.View.escString(flag ? 'yes' : 'no')}</li>
+${App.View.renderView(this.__include('partials.item', {"value":title}))}
+`)}
+`; }
+return '';
+})}
+${App.View.execute(() => {
+    local = 92;
+})}
+<p>${App.View.escString(local)}</p>
+`; } else if(count > 6){ return `
+${App.View.execute(() => {
+    local = 50;
+})}
+<p>${App.View.escString(local)}</p>
+${App.View.foreach(items, (item, key, __loopIndex, loop) => `
+<li>${App.View.escString(item)}</li>
+<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 0]}])}>+</button>
+<div>${html}</div>
+`)}
+${App.View.execute(() => {
+    local = 56;
+})}
+<p>${App.View.escString(local)}</p>
+${App.View.execute(() => { if(user['email']){ return `
+${App.View.renderView(this.__include('partials.item', {"value":42}))}
+${App.View.foreach(items, (item, key, __loopIndex, loop) => `
+<li>${App.View.escString(item)}</li>
+<div class="c86">${App.View.escString(App.Helper.count(items) + 7)}</div>
+${App.View.renderView(this.__include('partials.item', {"value":count}))}
+<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 0]}])}>+</button>
+`)}
+`; }
+return '';
+})}
+`; } else { return `
+<input type="text" ${this.__addEventConfig("input", [{"handler":"handleInput","params":[() => event]}])} value="${App.View.escString(title)}">
+<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 2]}])}>+</button>
+`; }
+return '';
+})}
+</div>`;
+            } catch(e) {
+                __outputRenderedContent__ = this.__showError(e.message);
+                console.warn(e);
+            }
+            return __outputRenderedContent__;
+            },
+        init: function() {  },
+        destroy: function() {}
+    });
+    return self;
+        }
\ No newline at end of file
@@ -0,0 +1,157 @@
+export function Fuzz011($$$DATA$$$ = {}, systemData = {}) {
+    const {App, View, __base__, __layout__, __page__, __component__, __partial__, __system__, __env = {}, __helper = {}} = systemData;
+    const __VIEW_PATH__ = 'fuzz-011';
+    const __VIEW_ID__ = $$$DATA$$$.__SSR_VIEW_ID__ || App.View.generateViewId();
+    const __VIEW_TYPE__ = 'view';
+    /* wraper.js */
+    const __UPDATE_DATA_TRAIT__ = {};
+    let {title = 'Fuzz', count = 0, items = [], flag = false, page = 1, html = '', user = null} = $$$DATA$$$;
+    __UPDATE_DATA_TRAIT__.title = value => title = value;
+    __UPDATE_DATA_TRAIT__.count = value => count = value;
+    __UPDATE_DATA_TRAIT__.items = value => items = value;
+    __UPDATE_DATA_TRAIT__.flag = value => flag = value;
+    __UPDATE_DATA_TRAIT__.page = value => page = value;
+    __UPDATE_DATA_TRAIT__.html = value => html = value;
+    __UPDATE_DATA_TRAIT__.user = value => user = value;
+    const __VARIABLE_LIST__ = ["title", "count", "items", "flag", "page", "html", "user"];
+
+    self.setup('fuzz-011', {
+        superView: 'layouts.base',
+        hasSuperView: true,
+        viewType: 'view',
+        sections: {
+        "section_0":{
+            "type":"long",
+            "preloader":false,
+            "useVars":true,
+            "script":{}
+        },
+        "section_1":{
+            "type":"long",
+            "preloader":false,
+            "useVars":true,
+            "script":{}
+        },
+        "section_2":{
+            "type":"long",
+            "preloader":false,
+            "useVars":true,
+            "script":{}
+        }
+    },
+        wrapperConfig: { enable: false, tag: null, follow: true, attributes: {} },
+        __props__: ["__WRAPPER_ELEMENT__", "createHtml", "__REFS__", "parseRefs"],
+            __WRAPPER_ELEMENT__: __WRAPPER_ELEMENT__,
+            refs: __REFS__,
+            states: __STATE__,
+            parseRefs: parseRefs,
+            createHtml: createHtml,
+        hasAwaitData: false,
+        hasFetchData: false,
+        subscribe: true,
+        fetch: null,
+        data: $$$DATA$$$,
+        viewId: __VIEW_ID__,
+        path: __VIEW_PATH__,
+        usesVars: true,
+        hasSections: true,
+        hasSectionPreload: false,
+        hasPrerender: false,
+        renderLongSections: ["section_0","section_1","section_2"],
+        renderSections: ["section_0","section_1","section_2"],
+        prerenderSections: [],
+        userDefined: {},
+        scripts: [],
+        styles: [],
+        resources: [],
+        commitConstructorData: function() {
+            // Then update states from data
+            
+            // Finally lock state updates
+            
+        },
+        updateVariableData: function(data) {
+            // Update all variables first
+            for (const key in data) {
+                if (data.hasOwnProperty(key)) {
+                    this.updateVariableItem(key, data[key]);
+                }
+            }
+            // Then update states from data
+            
+            // Finally lock state updates
+            
+        },
+        updateVariableItem: function(key, value) {
+            this.data[key] = value;
+            if (typeof __UPDATE_DATA_TRAIT__[key] === "function") {
+                __UPDATE_DATA_TRAIT__[key](value);
+            }
+        },
+        loadServerData: function() {
+    
+},
+        prerender: function() {
+    return null;
+},
+        render: function() {
+                
+    let __outputRenderedContent__ = '';
+            try {
+                __outputRenderedContent__ = `
+
+
+${this.__section('section_0', `${App.View.execute(() => {
+let __forOutputContent__ = [];
+for(let i = 0; i < 1; i++) {
+__forOutputContent__.push(`
+<span>${App.View.escString(i)}</span>
+<section class="c48">${App.View.escString(flag ?? 'none')}</section>
+${App.View.execute(() => { if(items ?? 'none'){ return `
+<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 0]}])}>+</button>
+<a href="/page/${App.View.escString(page)}" data-id="639">Link</a>
+`; } else { return `
+<span class="c14">${App.View.escString(flag ? 'yes' : 'no')}</span>
+${App.View.execute(() => {
+let __forOutputContent__ = [];
+for(let i = 0; i < 1; i++) {
+__forOutputContent__.push(`
+<span>${App.View.escString(i)}</span>
+<a href="/page/${App.View.escString(page)}" data-id="621">Link</a>
+${App.View.renderView(this.__include('partials.item', {"value":title}))}
+`);
+}
+return __forOutputContent__.join('');
+})}
+`; }
+return '';
+})}
+<li>Static text 989</li>
+<li class="c21">${App.View.escString(flag ? 'yes' : 'no')}</li>
+`);
+}
+return __forOutputContent__.join('');
+})}`, 'html')}
+${this.__section('section_1', `<a href="/page/${App.View.escString(page)}" data-id="802">Link</a>
+${App.View.execute(() => {
+    local = 66;
+})}
+<p>${App.View.escString(local)}</p>
+${App.View.execute(() => {
+    local = 85;
+})}
+<p>${App.View.escString(local)}</p>`, 'html')}
+${this.__section('section_2', `<span>${html}</span>
+<span>${html}</span>
+<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 4]}])}>+</button>`, 'html')}`;
+            } catch(e) {
+                __outputRenderedContent__ = this.__showError(e.message);
+                console.warn(e);
+            }
+            return this.__extends('layouts.base');
+            },
+        init: function() {  },
+        destroy: function() {}
+    });
+    return self;
+        }
\ No newline at end of file
@@ -0,0 +1,180 @@
+export function Fuzz012($$$DATA$$$ = {}, systemData = {}) {
+    const {App, View, __base__, __layout__, __page__, __component__, __partial__, __system__, __env = {}, __helper = {}} = systemData;
+    const __VIEW_PATH__ = 'fuzz-012';
+    const __VIEW_ID__ = $$$DATA$$$.__SSR_VIEW_ID__ || App.View.generateViewId();
+    const __VIEW_TYPE__ = 'view';
+    /* wraper.js */
+    const __UPDATE_DATA_TRAIT__ = {};
+    let {title = 'Fuzz', count = 0, items = [], flag = false, page = 1, html = '', user = null} = $$$DATA$$$;
+    __UPDATE_DATA_TRAIT__.title = value => title = value;
+    __UPDATE_DATA_TRAIT__.count = value => count = value;
+    __UPDATE_DATA_TRAIT__.items = value => items = value;
+    __UPDATE_DATA_TRAIT__.flag = value => flag = value;
+    __UPDATE_DATA_TRAIT__.page = value => page = value;
+    __UPDATE_DATA_TRAIT__.html = value => html = value;
+    __UPDATE_DATA_TRAIT__.user = value => user = value;
+    const __VARIABLE_LIST__ = ["title", "count", "items", "flag", "page", "html", "user"];
+
+    self.setup('fuzz-012', {
+        superView: 'layouts.base',
+        hasSuperView: true,
+        viewType: 'view',
+        sections: {
+        "section_0":{
+            "type":"long",
+            "preloader":false,
+            "useVars":true,
+            "script":{}
+        },
+        "section_1":{
+            "type":"long",
+            "preloader":false,
+            "useVars":true,
+            "script":{}
+        }
+    },
+        wrapperConfig: { enable: false, tag: null, follow: true, attributes: {} },
+        __props__: ["__WRAPPER_ELEMENT__", "createHtml", "__REFS__", "parseRefs"],
+            __WRAPPER_ELEMENT__: __WRAPPER_ELEMENT__,
+            refs: __REFS__,
+            states: __STATE__,
+            parseRefs: parseRefs,
+            createHtml: createHtml,
+        hasAwaitData: false,
+        hasFetchData: false,
+        subscribe: true,
+        fetch: null,
+        data: $$$DATA$$$,
+        viewId: __VIEW_ID__,
+        path: __VIEW_PATH__,
+        usesVars: true,
+        hasSections: true,
+        hasSectionPreload: false,
+        hasPrerender: false,
+        renderLongSections: ["section_0","section_1"],
+        renderSections: ["section_0","section_1"],
+        prerenderSections: [],
+        userDefined: {},
+        scripts: [],
+        styles: [],
+        resources: [],
+        commitConstructorData: function() {
+            // Then update states from data
+            
+            // Finally lock state updates
+            
+        },
+        updateVariableData: function(data) {
+            // Update all variables first
+            for (const key in data) {
+                if (data.hasOwnProperty(key)) {
+                    this.updateVariableItem(key, data[key]);
+                }
+            }
+            // Then update states from data
+            
+            // Finally lock state updates
+            
+        },
+        updateVariableItem: function(key, value) {
+            this.data[key] = value;
+            if (typeof __UPDATE_DATA_TRAIT__[key] === "function") {
+                __UPDATE_DATA_TRAIT__[key](value);
+            }
+        },
+        loadServerData: function() {
+    
+},
+        prerender: function() {
+    return null;
+},
+        render: function() {
+                
+    let __outputRenderedContent__ = '';
+            try {
+                __outputRenderedContent__ = `
+
+
+${this.__section('section_0', `${App.View.renderView(this.__include('partials.item', {"value":flag}))}
+<section>${html}</section>
+${App.View.execute(() => {
+let __forOutputContent__ = [];
+for(let i = 0; i < 4; i++) {
+__forOutputContent__.push(`
+<span>${App.View.escString(i)}</span>
+${APP.View.execute(() => {
+    local = 9;
+})}
+<p>${App.View.escString(local)}</p>
+`);
+}
+return __forOutputContent__.join('');
+})}`, 'html')}
+${this.__section('section_1', `${App.View.execute(() => {
+let __forOutputContent__ = [];
+for(let i = 0; i < 4; i++) {
+__forOutputContent__.push(`
+<span>${App.View.escString(i)}</span>
+<a href="/page/${App.View.escString(page)}" data-id="630">Link</a>
+`);
+}
+return __forOutputContent__.join('');
+})}
+${App.View.execute(() => {
+let __forOutputContent__ = [];
+for(let i = 0; i < 5; i++) {
+__forOutputContent__.push(`
+<span>${App.View.escString(i)}</span>
+${App.View.foreach(items, (item, key, __loopIndex, loop) => `
+<li>${App.View.escString(item)}</li>
+<div class="c10">${App.View.escString(flag ? 'yes' : 'no')}</div>
+<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 2]}])}>+</button>
+<a href="/page/${App.View.escString(page)}" data-id="762">Link</a>
+`)}
+<a href="/page/${App.View.escString(page)}" data-id="141">Link</a>
+<section>Static text 488</section>
+${APP.View.execute(() => {
+    local = 52;
+})}
+<p>${App.View.escString(local)}</p>
+`);
+}
+return __forOutputContent__.join('');
+})}
+${App.View.foreach(items, (item, __loopKey, __loopIndex, loop) => `
+<li>${App.View.escString(item)}</li>
+${App.View.execute(() => {
+let __forOutputContent__ = [];
+for(let i = 0; i < 1; i++) {
+__forOutputContent__.push(`
+<span>${App.View.escString(i)}</span>
+${App.View.foreach(items, (item, __loopKey, __loopIndex, loop) => `
+<li>${App.View.escString(item)}</li>
+<a href="/page/${App.View.escString(page)}" data-id="372">Link</a>
+<section class="c36">${App.View.escString(flag ? 'yes' : 'no')}</section>
+`)}
+${APP.View.execute(() => {
+    local = 36;
+})}
+<p>${App.View.escString(local)}</p>
+`);
+}
+return __forOutputContent__.join('');
+})}
+${App.View.execute(() => {
+    local = 64;
+})}
+<p>${App.View.escString(local)}</p>
+`)}
+<li>Static text 864</li>`, 'html')}`;
+            } catch(e) {
+                __outputRenderedContent__ = this.__showError(e.message);
+                console.warn(e);
+            }
+            return this.__extends('layouts.base');
+            },
+        init: function() {  },
+        destroy: function() {}
+    });
+    return self;
+        }
\ No newline at end of file
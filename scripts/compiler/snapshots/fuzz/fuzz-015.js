@@ -0,0 +1,283 @@
+export function Fuzz015($$$DATA$$$ = {}, systemData = {}) {
+    const {App, View, __base__, __layout__, __page__, __component__, __partial__, __system__, __env = {}, __helper = {}} = systemData;
+    const __VIEW_PATH__ = 'fuzz-015';
+    const __VIEW_ID__ = $$$DATA$$$.__SSR_VIEW_ID__ || App.View.generateViewId();
+    const __VIEW_TYPE__ = 'view';
+    /* wraper.js */
+    const __UPDATE_DATA_TRAIT__ = {};
+    let {title = 'Fuzz', count = 0, items = [], flag = false, page = 1, html = '', user = null} = $$$DATA$$$;
+    __UPDATE_DATA_TRAIT__.title = value => title = value;
+    __UPDATE_DATA_TRAIT__.count = value => count = value;
+    __UPDATE_DATA_TRAIT__.items = value => items = value;
+    __UPDATE_DATA_TRAIT__.flag = value => flag = value;
+    __UPDATE_DATA_TRAIT__.page = value => page = value;
+    __UPDATE_DATA_TRAIT__.html = value => html = value;
+    __UPDATE_DATA_TRAIT__.user = value => user = value;
+    const __VARIABLE_LIST__ = ["title", "count", "items", "flag", "page", "html", "user"];
+
+    self.setup('fuzz-015', {
+        superView: 'layouts.base',
+        hasSuperView: true,
+        viewType: 'view',
+        sections: {
+        "section_0":{
+            "type":"long",
+            "preloader":false,
+            "useVars":true,
+            "script":{}
+        },
+        "section_1":{
+            "type":"long",
+            "preloader":false,
+            "useVars":true,
+            "script":{}
+        }
+    },
+        wrapperConfig: { enable: false, tag: null, follow: true, attributes: {} },
+        __props__: ["__WRAPPER_ELEMENT__", "createHtml", "__REFS__", "parseRefs"],
+            __WRAPPER_ELEMENT__: __WRAPPER_ELEMENT__,
+            refs: __REFS__,
+            states: __STATE__,
+            parseRefs: parseRefs,
+            createHtml: createHtml,
+        hasAwaitData: false,
+        hasFetchData: false,
+        subscribe: true,
+        fetch: null,
+        data: $$$DATA$$$,
+        viewId: __VIEW_ID__,
+        path: __VIEW_PATH__,
+        usesVars: true,
+        hasSections: true,
+        hasSectionPreload: false,
+        hasPrerender: false,
+        renderLongSections: ["section_0","section_1"],
+        renderSections: ["section_0","section_1"],
+        prerenderSections: [],
+        userDefined: {},
+        scripts: [],
+        styles: [],
+        resources: [],
+        commitConstructorData: function() {
+            // Then update states from data
+            
+            // Finally lock state updates
+            
+        },
+        updateVariableData: function(data) {
+            // Update all variables first
+            for (const key in data) {
+                if (data.hasOwnProperty(key)) {
+                    this.updateVariableItem(key, data[key]);
+                }
+            }
+            // Then update states from data
+            
+            // Finally lock state updates
+            
+        },
+        updateVariableItem: function(key, value) {
+            this.data[key] = value;
+            if (typeof __UPDATE_DATA_TRAIT__[key] === "function") {
+                __UPDATE_DATA_TRAIT__[key](value);
+            }
+        },
+        loadServerData: function() {
+    
+},
+        prerender: function() {
+    return null;
+},
+        render: function() {
+                
+    let __outputRenderedContent__ = '';
+            try {
+                __outputRenderedContent__ = `
+
+
+${this.__section('section_0', `<input type="text" ${this.__addEventConfig("input", [{"handler":"handleInput","params":[() => event]}])} value="${App.View.escString(title)}">
+${App.View.execute(() => { if(user.name){ return `
+${App.View.execute(() => { if(App.Helper.count(items) + 7){ return `
+${App.View.execute(() => {
+    local = 31;
+})}
+<p>${App.View.escString(local)}</p>
+<a href="/page/${App.View.escString(page)}" data-id="851">Link</a>
+${App.View.execute(() => { if(flag ? 'yes' : 'no'){ return `
+<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 1]}])}>+</button>
+<a href="/page/${App.View.escString(page)}" data-id="830">Link</a>
+`; } else if(count > 2){ return `
+<p class="c28">${App.View.escString(flag ?? 'none')}</p>
+<input type="text" ${this.__addEventConfig("input", [{"handler":"handleInput","params":[() => event]}])} value="${App.View.escString(title)}">
+<div>${html}</div>
+`; }
+return '';
+})}
+`; } else { return `
+<span>Static text 461</span>
+<div class="c97">${App.View.escString(page ?? 'none')}</div>
+<p>${html}</p>
+<input type="text" ${this.__addEventConfig("input", [{"handler":"handleInput","params":[() => event]}])} value="${App.View.escString(title)}">
+`; }
+return '';
+})}
+${App.View.execute(() => {
+let __forOutputContent__ = [];
+for(let i = 0; i < 2; i++) {
+__forOutputContent__.push(`
+<span>${App.View.escString(i)}</span>
+${App.View.execute(() => { if(flag ? 'yes' : 'no'){ return `
+<span class="c5">${App.View.escString(flag ? 'yes' : 'no')}</span>
+`; }
+return '';
+})}
+${App.View.execute(() => {
+let __forOutputContent__ = [];
+for(let i = 0; i < 4; i++) {
+__forOutputContent__.push(`
+<span>${App.View.escString(i)}</span>
+${App.View.renderView(this.__include('partials.item', {"value":items}))}
+${App.View.renderView(this.__include('partials.item', {"value":"static"}))}
+<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 0]}])}>+</button>
+`);
+}
+return __forOutputContent__.join('');
+})}
+`);
+}
+return __forOutputContent__.join('');
+})}
+${App.View.execute(() => { if(App.Helper.strtoupper(flag)){ return `
+${App.View.execute(() => { if(user['email']){ return `
+<input type="text" ${this.__addEventConfig("input", [{"handler":"handleInput","params":[() => event]}])} value="${App.View.escString(title)}">
+`; } else { return `
+<li>${html}</li>
+${App.View.renderView(this.__include('partials.item', {"value":flag}))}
+<input type="text" ${this.__addEventConfig("input", [{"handler":"handleInput","params":[() => event]}])} value="${App.View.escString(title)}">
+<input type="text" ${this.__addEventConfig("input", [{"handler":"handleInput","params":[() => event]}])} value="${App.View.escString(title)}">
+`; }
+return '';
+})}
+`; }
+return '';
+})}
+`; } else if(count > 3){ return `
+${App.View.execute(() => {
+    local = 90;
+})}
+<p>${App.View.escString(local)}</p>
+<section>${html}</section>
+`; }
+return '';
+})}
+${App.View.execute(() => { if(user['email']){ return `
+<li>${html}</li>
+<div>${html}</div>
+<input type="text" ${this.__addEventConfig("input", [{"handler":"handleInput","params":[() => event]}])} value="${App.View.escString(title)}">
+<input type="text" ${this.__addEventConfig("input", [{"handler":"handleInput","params":[() => event]}])} value="${App.View.escString(title)}">
+`; } else { return `
+${App.View.execute(() => {
+    local = 66;
+})}
+<p>${App.View.escString(local)}</p>
+${App.View.renderView(this.__include('partials.item', {"value":flag}))}
+${App.View.foreach(items, (item, __loopKey, __loopIndex, loop) => `
+<li>${App.View.escString(item)}</li>
+${App.View.foreach(items, (item, __loopKey, __loopIndex, loop) => `
+<li>${App.View.escString(item)}</li>
+<span>${html}</span>
+<input type="text" ${this.__addEventConfig("input", [{"handler":"handleInput","params":[() => event]}])} value="${App.View.escString(title)}">
+<a href="/page/${App.View.escString(page)}" data-id="84">Link</a>
+<li class="c65">${App.View.escString(user['email'] ?? 'none')}</li>
+`)}
+${App.View.execute(() => {
+let __forOutputContent__ = [];
+for(let i = 0; i < 5; i++) {
+__forOutputContent__.push(`
+<span>${App.View.escString(i)}</span>
+<div>Static text 641</div>
+`);
+}
+return __forOutputContent__.join('');
+})}
+<a href="/page/${App.View.escString(page)}" data-id="451">Link</a>
+${App.View.execute(() => {
+    local = 86;
+})}
+<p>${App.View.escString(local)}</p>
+`)}
+`; }
+return '';
+})}`, 'html')}
+${this.__section('section_1', `${App.View.execute(() => {
+    local = 16;
+})}
+<p>${App.View.escString(local)}</p>
+${App.View.execute(() => {
+let __forOutputContent__ = [];
+for(let i = 0; i < 1; i++) {
+__forOutputContent__.push(`
+<span>${App.View.escString(i)}</span>
+${App.View.execute(() => {
+let __forOutputContent__ = [];
+for(let i = 0; i < 5; i++) {
+__forOutputContent__.push(`
+<span>${App.View.escString(i)}</span>
+<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 0]}])}>+</button>
+<p class="c26">${App.View.escString(App.Helper.strtoupper(user.name))}</p>
+<a href="/page/${App.View.escString(page)}" data-id="199">Link</a>
+`);
+}
+return __forOutputContent__.join('');
+})}
+${App.View.renderView(this.__include('partials.item', {"value":"static"}))}
+${App.View.execute(() => { if(user.name ?? 'none'){ return `
+${App.View.execute(() => { if(App.Helper.count(items) + 5){ return `
+${App.View.renderView(this.__include('partials.item', {"value":title}))}
+<p>${html}</p>
+<li>${html}</li>
+<span>${html}</span>
+`; }
+return '';
+})}
+${App.View.execute(() => {
+let __forOutputContent__ = [];
+for(let i = 0; i < 5; i++) {
+__forOutputContent__.push(`
+<span>${App.View.escString(i)}</span>
+<section>${html}</section>
+<li class="c46">${App.View.escString(App.Helper.count(items) + 5)}</li>
+<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 1]}])}>+</button>
+${App.View.renderView(this.__include('partials.item', {"value":"static"}))}
+`);
+}
+return __forOutputContent__.join('');
+})}
+${App.View.renderView(this.__include('partials.item', {"value":items}))}
+${App.View.execute(() => { if(App.Helper.count(items) + 3){ return `
+${App.View.renderView(this.__include('partials.item', {"value":page}))}
+${App.View.renderView(this.__include('partials.item', {"value":title}))}
+<span class="c66">${App.View.escString(App.Helper.strtoupper(items))}</span>
+`; }
+return '';
+})}
+`; }
+return '';
+})}
+<span>${html}</span>
+`);
+}
+return __forOutputContent__.join('');
+})}
+<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 2]}])}>+</button>`, 'html')}`;
+            } catch(e) {
+                __outputRenderedContent__ = this.__showError(e.message);
+                console.warn(e);
+            }
+            return this.__extends('layouts.base');
+            },
+        init: function() {  },
+        destroy: function() {}
+    });
+    return self;
+        }
\ No newline at end of file
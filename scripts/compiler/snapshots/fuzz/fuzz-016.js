@@ -0,0 +1,164 @@
+export function Fuzz016($$$DATA$$$ = {}, systemData = {}) {
+    const {App, View, __base__, __layout__, __page__, __component__, __partial__, __system__, __env = {}, __helper = {}} = systemData;
+    const __VIEW_PATH__ = 'fuzz-016';
+    const __VIEW_ID__ = $$$DATA$$$.__SSR_VIEW_ID__ || App.View.generateViewId();
+    const __VIEW_TYPE__ = 'view';
+    /* wraper.js */
+    const __UPDATE_DATA_TRAIT__ = {};
+    let {title = 'Fuzz', count = 0, items = [], flag = false, page = 1, html = '', user = null} = $$$DATA$$$;
+    __UPDATE_DATA_TRAIT__.title = value => title = value;
+    __UPDATE_DATA_TRAIT__.count = value => count = value;
+    __UPDATE_DATA_TRAIT__.items = value => items = value;
+    __UPDATE_DATA_TRAIT__.flag = value => flag = value;
+    __UPDATE_DATA_TRAIT__.page = value => page = value;
+    __UPDATE_DATA_TRAIT__.html = value => html = value;
+    __UPDATE_DATA_TRAIT__.user = value => user = value;
+    const __VARIABLE_LIST__ = ["title", "count", "items", "flag", "page", "html", "user"];
+
+    self.setup('fuzz-016', {
+        superView: 'layouts.base',
+        hasSuperView: true,
+        viewType: 'view',
+        sections: {
+        "section_0":{
+            "type":"long",
+            "preloader":false,
+            "useVars":true,
+            "script":{}
+        },
+        "section_1":{
+            "type":"long",
+            "preloader":false,
+            "useVars":true,
+            "script":{}
+        },
+        "section_2":{
+            "type":"long",
+            "preloader":false,
+            "useVars":true,
+            "script":{}
+        }
+    },
+        wrapperConfig: { enable: false, tag: null, follow: true, attributes: {} },
+        __props__: ["__WRAPPER_ELEMENT__", "createHtml", "__REFS__", "parseRefs"],
+            __WRAPPER_ELEMENT__: __WRAPPER_ELEMENT__,
+            refs: __REFS__,
+            states: __STATE__,
+            parseRefs: parseRefs,
+            createHtml: createHtml,
+        hasAwaitData: false,
+        hasFetchData: false,
+        subscribe: true,
+        fetch: null,
+        data: $$$DATA$$$,
+        viewId: __VIEW_ID__,
+        path: __VIEW_PATH__,
+        usesVars: true,
+        hasSections: true,
+        hasSectionPreload: false,
+        hasPrerender: false,
+        renderLongSections: ["section_0","section_1","section_2"],
+        renderSections: ["section_0","section_1","section_2"],
+        prerenderSections: [],
+        userDefined: {},
+        scripts: [],
+        styles: [],
+        resources: [],
+        commitConstructorData: function() {
+            // Then update states from data
+            
+            // Finally lock state updates
+            
+        },
+        updateVariableData: function(data) {
+            // Update all variables first
+            for (const key in data) {
+                if (data.hasOwnProperty(key)) {
+                    this.updateVariableItem(key, data[key]);
+                }
+            }
+            // Then update states from data
+            
+            // Finally lock state updates
+            
+        },
+        updateVariableItem: function(key, value) {
+            this.data[key] = value;
+            if (typeof __UPDATE_DATA_TRAIT__[key] === "function") {
+                __UPDATE_DATA_TRAIT__[key](value);
+            }
+        },
+        loadServerData: function() {
+    
+},
+        prerender: function() {
+    return null;
+},
+        render: function() {
+                
+    let __outputRenderedContent__ = '';
+            try {
+                __outputRenderedContent__ = `
+
+
+${this.__section('section_0', `<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 4]}])}>+</button>
+<span>Static text 132</span>`, 'html')}
+${this.__section('section_1', `<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 0]}])}>+</button>
+${App.View.execute(() => { if(count ?? 'none'){ return `
+<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 0]}])}>+</button>
+${App.View.execute(() => {
+    local = 88;
+})}
+<p>${App.View.escString(local)}</p>
+`; } else if(count > 6){ return `
+${App.View.execute(() => { if(title){ return `
+<li class="c18">${App.View.escString(App.Helper.count(items) + 5)}</li>
+${App.View.execute(() => {
+    local = 57;
+})}
+<p>${App.View.escString(local)}</p>
+`; } else if(count > 2){ return `
+${App.View.foreach(items, (item, key, __loopIndex, loop) => `
+<li>${App.View.escString(item)}</li>
+${App.View.renderView(this.__include('partials.item', {"value":42}))}
+<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 0]}])}>+</button>
+`)}
+<input type="text" ${this.__addEventConfig("input", [{"handler":"handleInput","params":[() => event]}])} value="${App.View.escString(title)}">
+`; }
+return '';
+})}
+<input type="text" ${this.__addEventConfig("input", [{"handler":"handleInput","params":[() => event]}])} value="${App.View.escString(title)}">
+`; } else { return `
+<div>Static text 266</div>
+${App.View.execute(() => {
+let __forOutputContent__ = [];
+for(let i = 0; i < 1; i++) {
+__forOutputContent__.push(`
+<span>${App.View.escString(i)}</span>
+${App.View.execute(() => { if(user.name ?? 'none'){ return `
+<div>Static text 567</div>
+${App.View.renderView(this.__include('partials.item', {"value":count}))}
+`; }
+return '';
+})}
+`);
+}
+return __forOutputContent__.join('');
+})}
+`; }
+return '';
+})}
+${App.View.renderView(this.__include('partials.item', {"value":page}))}
+<li>Static text 794</li>`, 'html')}
+${this.__section('section_2', `<p>Static text 605</p>`, 'html')}`;
+            } catch(e) {
+                __outputRenderedContent__ = this.__showError(e.message);
+                console.warn(e);
+            }
+            return this.__extends('layouts.base');
+            },
+        init: function() {  },
+        destroy: function() {}
+    });
+    return self;
+        }
\ No newline at end of file
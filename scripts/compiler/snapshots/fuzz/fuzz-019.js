@@ -0,0 +1,194 @@
+export function Fuzz019($$$DATA$$$ = {}, systemData = {}) {
+    const {App, View, __base__, __layout__, __page__, __component__, __partial__, __system__, __env = {}, __helper = {}} = systemData;
+    const __VIEW_PATH__ = 'fuzz-019';
+    const __VIEW_ID__ = $$$DATA$$$.__SSR_VIEW_ID__ || App.View.generateViewId();
+    const __VIEW_TYPE__ = 'view';
+    /* wraper.js */
+    const __UPDATE_DATA_TRAIT__ = {};
+    let {title = 'Fuzz', count = 0, items = [], flag = false, page = 1, html = '', user = null} = $$$DATA$$$;
+    __UPDATE_DATA_TRAIT__.title = value => title = value;
+    __UPDATE_DATA_TRAIT__.count = value => count = value;
+    __UPDATE_DATA_TRAIT__.items = value => items = value;
+    __UPDATE_DATA_TRAIT__.flag = value => flag = value;
+    __UPDATE_DATA_TRAIT__.page = value => page = value;
+    __UPDATE_DATA_TRAIT__.html = value => html = value;
+    __UPDATE_DATA_TRAIT__.user = value => user = value;
+    const __VARIABLE_LIST__ = ["title", "count", "items", "flag", "page", "html", "user"];
+
+    self.setup('fuzz-019', {
+        superView: null,
+        hasSuperView: false,
+        viewType: 'view',
+        sections: {},
+        wrapperConfig: { enable: false, tag: null, follow: true, attributes: {} },
+        __props__: ["__WRAPPER_ELEMENT__", "createHtml", "__REFS__", "parseRefs"],
+            __WRAPPER_ELEMENT__: __WRAPPER_ELEMENT__,
+            refs: __REFS__,
+            states: __STATE__,
+            parseRefs: parseRefs,
+            createHtml: createHtml,
+        hasAwaitData: false,
+        hasFetchData: false,
+        subscribe: true,
+        fetch: null,
+        data: $$$DATA$$$,
+        viewId: __VIEW_ID__,
+        path: __VIEW_PATH__,
+        usesVars: true,
+        hasSections: false,
+        hasSectionPreload: false,
+        hasPrerender: false,
+        renderLongSections: [],
+        renderSections: [],
+        prerenderSections: [],
+        userDefined: {},
+        scripts: [],
+        styles: [],
+        resources: [],
+        commitConstructorData: function() {
+            // Then update states from data
+            
+            // Finally lock state updates
+            
+        },
+        updateVariableData: function(data) {
+            // Update all variables first
+            for (const key in data) {
+                if (data.hasOwnProperty(key)) {
+                    this.updateVariableItem(key, data[key]);
+                }
+            }
+            // Then update states from data
+            
+            // Finally lock state updates
+            
+        },
+        updateVariableItem: function(key, value) {
+            this.data[key] = value;
+            if (typeof __UPDATE_DATA_TRAIT__[key] === "function") {
+                __UPDATE_DATA_TRAIT__[key](value);
+            }
+        },
+        loadServerData: function() {
+    
+},
+        prerender: function() {
+    return null;
+},
+        render: function() {
+                
+    let __outputRenderedContent__ = '';
+            try {
+                __outputRenderedContent__ = `
+
+<div>
+<input type="text" ${this.__addEventConfig("input", [{"handler":"handleInput","params":[() => event]}])} value="${App.View.escString(title)}">
+${App.View.foreach(items, (item, __loopKey, __loopIndex, loop) => `
+<li>${App.View.escString(item)}</li>
+<a href="/page/${App.View.escString(page)}" data-id="830">Link</a>
+${App.View.execute(() => { if(flag ? 'yes' : 'no'){ return `
+${App.View.execute(() => { if(App.Helper.strtoupper(user.name)){ return `
+<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 0]}])}>+</button>
+${App.View.renderView(this.__include('partials.item', {"value":count}))}
+`; } else { return `
+<li>Static text 600</li>
+<div>${html}</div>
+<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 1]}])}>+</button>
+<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 4]}])}>+</button>
+`; }
+return '';
+})}
+<p class="c62">${App.View.escString(App.Helper.strtoupper(user['email']))}</p>
+${App.View.execute(() => {
+    local = 25;
+})}
+<p>${App.View.escString(local)}</p>
+`; }
+return '';
+})}
+<a href="/page/${App.View.escString(page)}" data-id="983">Link</a>
+${App.View.foreach(items, (item, key, __loopIndex, loop) => `
+<li>${App.View.escString(item)}</li>
+${App.View.execute(() => {
+    local = 2;
+})}
+<p>${App.View.escString(local)}</p>
+${App.View.execute(() => {
+    local = 80;
+})}
+<p>${App.View.escString(local)}</p>
+${App.View.execute(() => {
+let __forOutputContent__ = [];
+for(let i = 0; i < 3; i++) {
+__forOutputContent__.push(`
+<span>${App.View.escString(i)}</span>
+<div>Static text 23</div>
+`);
+}
+return __forOutputContent__.join('');
+})}
+`)}
+`)}
+${App.View.execute(() => { if(title ?? 'none'){ return `
+${App.View.execute(() => {
+let __forOutputContent__ = [];
+for(let i = 0; i < 5; i++) {
+__forOutputContent__.push(`
+<span>${App.View.escString(i)}</span>
+<li>${html}</li>
+<section>${html}</section>
+${App.View.execute(() => {
+let __forOutputContent__ = [];
+for(let i = 0; i < 1; i++) {
+__forOutputContent__.push(`
+<span>${App.View.escString(i)}</span>
+<section>${html}</section>
+`);
+}
+return __forOutputContent__.join('');
+})}
+`);
+}
+return __forOutputContent__.join('');
+})}
+<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 4]}])}>+</button>
+<a href="/page/${App.View.escString(page)}" data-id="387">Link</a>
+<a href="/page/${App.View.escString(page)}" data-id="844">Link</a>
+`; } else if(count > 5){ return `
+<li>Static text 279</li>
+<input type="text" ${this.__addEventConfig("input", [{"handler":"handleInput","params":[() => event]}])} value="${App.View.escString(title)}">
+${App.View.execute(() => {
+let __forOutputContent__ = [];
+for(let i = 0; i < 2; i++) {
+__forOutputContent__.push(`
+<span>${App.View.escString(i)}</span>
+${App.View.foreach(items, (item, key, __loopIndex, loop) => `
+<li>${App.View.escString(item)}</li>
+<input type="text" ${this.__addEventConfig("input", [{"handler":"handleInput","params":[() => event]}])} value="${App.View.escString(title)}">
+<input type="text" ${this.__addEventConfig("input", [{"handler":"handleInput","params":[() => event]}])} value="${App.View.escString(title)}">
+<a href="/page/${App.View.escString(page)}" data-id="537">Link</a>
+<section>${html}</section>
+`)}
+`);
+}
+return __forOutputContent__.join('');
+})}
+`; } else { return `
+<div>Static text 483</div>
+<a href="/page/${App.View.escString(page)}" data-id="69">Link</a>
+${App.View.renderView(this.__include('partials.item', {"value":title}))}
+`; }
+return '';
+})}
+</div>`;
+            } catch(e) {
+                __outputRenderedContent__ = this.__showError(e.message);
+                console.warn(e);
+            }
+            return __outputRenderedContent__;
+            },
+        init: function() {  },
+        destroy: function() {}
+    });
+    return self;
+        }
\ No newline at end of file
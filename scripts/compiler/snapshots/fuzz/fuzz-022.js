@@ -0,0 +1,231 @@
+export function Fuzz022($$$DATA$$$ = {}, systemData = {}) {
+    const {App, View, __base__, __layout__, __page__, __component__, __partial__, __system__, __env = {}, __helper = {}} = systemData;
+    const __VIEW_PATH__ = 'fuzz-022';
+    const __VIEW_ID__ = $$$DATA$$$.__SSR_VIEW_ID__ || App.View.generateViewId();
+    const __VIEW_TYPE__ = 'view';
+    /* wraper.js */
+    const __UPDATE_DATA_TRAIT__ = {};
+    let {title = 'Fuzz', count = 0, items = [], flag = false, page = 1, html = '', user = null} = $$$DATA$$$;
+    __UPDATE_DATA_TRAIT__.title = value => title = value;
+    __UPDATE_DATA_TRAIT__.count = value => count = value;
+    __UPDATE_DATA_TRAIT__.items = value => items = value;
+    __UPDATE_DATA_TRAIT__.flag = value => flag = value;
+    __UPDATE_DATA_TRAIT__.page = value => page = value;
+    __UPDATE_DATA_TRAIT__.html = value => html = value;
+    __UPDATE_DATA_TRAIT__.user = value => user = value;
+    const __VARIABLE_LIST__ = ["title", "count", "items", "flag", "page", "html", "user"];
+
+    self.setup('fuzz-022', {
+        superView: 'layouts.base',
+        hasSuperView: true,
+        viewType: 'view',
+        sections: {
+        "section_0":{
+            "type":"long",
+            "preloader":false,
+            "useVars":true,
+            "script":{}
+        },
+        "section_1":{
+            "type":"long",
+            "preloader":false,
+            "useVars":true,
+            "script":{}
+        },
+        "section_2":{
+            "type":"long",
+            "preloader":false,
+            "useVars":true,
+            "script":{}
+        }
+    },
+        wrapperConfig: { enable: false, tag: null, follow: true, attributes: {} },
+        __props__: ["__WRAPPER_ELEMENT__", "createHtml", "__REFS__", "parseRefs"],
+            __WRAPPER_ELEMENT__: __WRAPPER_ELEMENT__,
+            refs: __REFS__,
+            states: __STATE__,
+            parseRefs: parseRefs,
+            createHtml: createHtml,
+        hasAwaitData: false,
+        hasFetchData: false,
+        subscribe: true,
+        fetch: null,
+        data: $$$DATA$$$,
+        viewId: __VIEW_ID__,
+        path: __VIEW_PATH__,
+        usesVars: true,
+        hasSections: true,
+        hasSectionPreload: false,
+        hasPrerender: false,
+        renderLongSections: ["section_0","section_1","section_2"],
+        renderSections: ["section_0","section_1","section_2"],
+        prerenderSections: [],
+        userDefined: {},
+        scripts: [],
+        styles: [],
+        resources: [],
+        commitConstructorData: function() {
+            // Then update states from data
+            
+            // Finally lock state updates
+            
+        },
+        updateVariableData: function(data) {
+            // Update all variables first
+            for (const key in data) {
+                if (data.hasOwnProperty(key)) {
+                    this.updateVariableItem(key, data[key]);
+                }
+            }
+            // Then update states from data
+            
+            // Finally lock state updates
+            
+        },
+        updateVariableItem: function(key, value) {
+            this.data[key] = value;
+            if (typeof __UPDATE_DATA_TRAIT__[key] === "function") {
+                __UPDATE_DATA_TRAIT__[key](value);
+            }
+        },
+        loadServerData: function() {
+    
+},
+        prerender: function() {
+    return null;
+},
+        render: function() {
+                
+    let __outputRenderedContent__ = '';
+            try {
+                __outputRenderedContent__ = `
+
+${this.__section('section_0', `${App.View.execute(() => {
+    local = 44;
+})}
+<p>${App.View.escString(local)}</p>
+${App.View.execute(() => { if(flag ? 'yes' : 'no'){ return `
+${App.View.foreach(items, (item, key, __loopIndex, loop) => `
+<li>${App.View.escString(item)}</li>
+${App.View.execute(() => {
+    local = 6;
+})}
+<p>${App.View.escString(local)}</p>
+`)}
+<a href="/page/${App.View.escString(page)}" data-id="982">Link</a>
+${App.View.renderView(this.__include('partials.item', {"value":page}))}
+`; } else if(count > 8){ return `
+${App.View.foreach(items, (item, __loopKey, __loopIndex, loop) => `
+<li>${App.View.escString(item)}</li>
+<a href="/page/${App.View.escString(page)}" data-id="736">Link</a>
+${App.View.execute(() => {
+    local = 49;
+})}
+<p>${App.View.escString(local)}</p>
+${App.View.execute(() => {
+    local = 19;
+})}
+<p>${App.View.escString(local)}</p>
+`)}
+`; } else { return `
+${App.View.foreach(items, (item, __loopKey, __loopIndex, loop) => `
+<li>${App.View.escString(item)}</li>
+${App.View.foreach(items, (item, key, __loopIndex, loop) => `
+<li>${App.View.escString(item)}</li>
+<input type="text" ${this.__addEventConfig("input", [{"handler":"handleInput","params":[() => event]}])} value="${App.View.escString(title)}">
+<span>Static text 473</span>
+<a href="/page/${App.View.escString(page)}" data-id="968">Link</a>
+`)}
+<p>${html}</p>
+<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 2]}])}>+</button>
+`)}
+${App.View.execute(() => { if(App.Helper.strtoupper(title)){ return `
+${App.View.execute(() => { if(title){ return `
+<a href="/page/${App.View.escString(page)}" data-id="649">Link</a>
+<input type="text" ${this.__addEventConfig("input", [{"handler":"handleInput","params":[() => event]}])} value="${App.View.escString(title)}">
+`; } else if(count > 8){ return `
+<p class="c57">${App.View.escString(App.Helper.strtoupper(title))}</p>
+<a href="/page/${App.View.escString(page)}" data-id="723">Link</a>
+`; }
+return '';
+})}
+${App.View.renderView(this.__include('partials.item', {"value":42}))}
+${App.View.execute(() => {
+    local = 45;
+})}
+<p>${App.View.escString(local)}</p>
+`; } else { return `
+${App.View.execute(() => { if(App.Helper.count(items) + 3){ return `
+<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 2]}])}>+</button>
+`; } else if(count > 2){ return `
+<input type="text" ${this.__addEventConfig("input", [{"handler":"handleInput","params":[() => event]}])} value="${App.View.escString(title)}">
+<span>${html}</span>
+<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 1]}])}>+</button>
+`; }
+return '';
+})}
+`; }
+return '';
+})}
+<p>${html}</p>
+${App.View.execute(() => {
+    local = 94;
+})}
+<p>${App.View.escString(local)}</p>
+`; }
+return '';
+})}`, 'html')}
+${this.__section('section_1', `<p class="c74">${App.View.escString(user['email'] ?? 'none')}</p>
+<li>Static text 634</li>
+${App.View.foreach(items, (item, __loopKey, __loopIndex, loop) => `
+<li>${App.View.escString(item)}</li>
+<input type="text" ${this.__addEventConfig("input", [{"handler":"handleInput","params":[() => event]}])} value="${App.View.escString(title)}">
+${App.View.execute(() => {
+    local = 63;
+})}
+<p>${App.View.escString(local)}</p>
+${App.View.execute(() => {
+let __forOutputContent__ = [];
+for(let i = 0; i < 1; i++) {
+__forOutputContent__.push(`
+<span>${App.View.escString(i)}</span>
+${App.View.execute(() => { if(flag ? 'yes' : 'no'){ return `
+<section>${html}</section>
+<section>${html}</section>
+<div>${html}</div>
+`; } else if(count > 5){ return `
+<span>Static text 400</span>
+`; }
+return '';
+})}
+`);
+}
+return __forOutputContent__.join('');
+})}
+${App.View.foreach(items, (item, key, __loopIndex, loop) => `
+<li>${App.View.escString(item)}</li>
+${App.View.execute(() => { if(title ?? 'none'){ return `
+<p>${html}</p>
+`; }
+return '';
+})}
+${App.View.execute(() => {
+    local = 39;
+})}
+<p>${App.View.escString(local)}</p>
+<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 3]}])}>+</button>
+`)}
+`)}`, 'html')}
+${this.__section('section_2', `<a href="/page/${App.View.escString(page)}" data-id="315">Link</a>
+<a href="/page/${App.View.escString(page)}" data-id="907">Link</a>`, 'html')}`;
+            } catch(e) {
+                __outputRenderedContent__ = this.__showError(e.message);
+                console.warn(e);
+            }
+            return this.__extends('layouts.base');
+            },
+        init: function() {  },
+        destroy: function() {}
+    });
+    return self;
+        }
\ No newline at end of file
@@ -0,0 +1,292 @@
+export function Fuzz024($$$DATA$$$ = {}, systemData = {}) {
+    const {App, View, __base__, __layout__, __page__, __component__, __partial__, __system__, __env = {}, __helper = {}} = systemData;
+    const __VIEW_PATH__ = 'fuzz-024';
+    const __VIEW_ID__ = $$$DATA$$$.__SSR_VIEW_ID__ || App.View.generateViewId();
+    const __VIEW_TYPE__ = 'view';
+    /* wraper.js */
+    const __UPDATE_DATA_TRAIT__ = {};
+    let {title = 'Fuzz', count = 0, items = [], flag = false, page = 1, html = '', user = null} = $$$DATA$$$;
+    __UPDATE_DATA_TRAIT__.title = value => title = value;
+    __UPDATE_DATA_TRAIT__.count = value => count = value;
+    __UPDATE_DATA_TRAIT__.items = value => items = value;
+    __UPDATE_DATA_TRAIT__.flag = value => flag = value;
+    __UPDATE_DATA_TRAIT__.page = value => page = value;
+    __UPDATE_DATA_TRAIT__.html = value => html = value;
+    __UPDATE_DATA_TRAIT__.user = value => user = value;
+    const __VARIABLE_LIST__ = ["title", "count", "items", "flag", "page", "html", "user"];
+
+    self.setup('fuzz-024', {
+        superView: 'layouts.base',
+        hasSuperView: true,
+        viewType: 'view',
+        sections: {
+        "section_0":{
+            "type":"long",
+            "preloader":false,
+            "useVars":true,
+            "script":{}
+        },
+        "section_1":{
+            "type":"long",
+            "preloader":false,
+            "useVars":true,
+            "script":{}
+        },
+        "section_2":{
+            "type":"long",
+            "preloader":false,
+            "useVars":true,
+            "script":{}
+        }
+    },
+        wrapperConfig: { enable: false, tag: null, follow: true, attributes: {} },
+        __props__: ["__WRAPPER_ELEMENT__", "createHtml", "__REFS__", "parseRefs"],
+            __WRAPPER_ELEMENT__: __WRAPPER_ELEMENT__,
+            refs: __REFS__,
+            states: __STATE__,
+            parseRefs: parseRefs,
+            createHtml: createHtml,
+        hasAwaitData: false,
+        hasFetchData: false,
+        subscribe: true,
+        fetch: null,
+        data: $$$DATA$$$,
+        viewId: __VIEW_ID__,
+        path: __VIEW_PATH__,
+        usesVars: true,
+        hasSections: true,
+        hasSectionPreload: false,
+        hasPrerender: false,
+        renderLongSections: ["section_0","section_1","section_2"],
+        renderSections: ["section_0","section_1","section_2"],
+        prerenderSections: [],
+        userDefined: {},
+        scripts: [],
+        styles: [],
+        resources: [],
+        commitConstructorData: function() {
+            // Then update states from data
+            
+            // Finally lock state updates
+            
+        },
+        updateVariableData: function(data) {
+            // Update all variables first
+            for (const key in data) {
+                if (data.hasOwnProperty(key)) {
+                    this.updateVariableItem(key, data[key]);
+                }
+            }
+            // Then update states from data
+            
+            // Finally lock state updates
+            
+        },
+        updateVariableItem: function(key, value) {
+            this.data[key] = value;
+            if (typeof __UPDATE_DATA_TRAIT__[key] === "function") {
+                __UPDATE_DATA_TRAIT__[key](value);
+            }
+        },
+        loadServerData: function() {
+    
+},
+        prerender: function() {
+    return null;
+},
+        render: function() {
+                
+    let __outputRenderedContent__ = '';
+            try {
+                __outputRenderedContent__ = `
+
+${this.__section('section_0', `${App.View.foreach(items, (item, key, __loopIndex, loop) => `
+<li>${App.View.escString(item)}</li>
+<div>Static text 224</div>
+${App.View.execute(() => {
+let __forOutputContent__ = [];
+for(let i = 0; i < 5; i++) {
+__forOutputContent__.push(`
+<span>${App.View.escString(i)}</span>
+${App.View.foreach(items, (item, key, __loopIndex, loop) => `
+<li>${App.View.escString(item)}</li>
+<a href="/page/${App.View.escString(page)}" data-id="760">Link</a>
+`)}
+${APP.View.execute(() => {
+    local = 41;
+})}
+<p>${App.View.escString(local)}</p>
+<li>Static text 205</li>
+`);
+}
+return __forOutputContent__.join('');
+})}
+${App.View.execute(() => { if(flag){ return `
+${App.View.renderView(this.__include('partials.item', {"value":title}))}
+${App.View.execute(() => {
+let __forOutputContent__ = [];
+for(let i = 0; i < 2; i++) {
+__forOutputContent__.push(`
+<span>${App.View.escString(i)}</span>
+<input type="text" ${this.__addEventConfig("input", [{"handler":"handleInput","params":[() => event]}])} value="${App.View.escString(title)}">
+`);
+}
+return __forOutputContent__.join('');
+})}
+<a href="/page/${App.View.escString(page)}" data-id="83">Link</a>
+${App.View.execute(() => {
+let __forOutputContent__ = [];
+for(let i = 0; i < 4; i++) {
+__forOutputContent__.push(`
+<span>${App.View.escString(i)}</span>
+<a href="/page/${App.View.escString(page)}" data-id="238">Link</a>
+<span>${html}</span>
+<input type="text" ${this.__addEventConfig("input", [{"handler":"handleInput","params":[() => event]}])} value="${App.View.escString(title)}">
+<div>Static text 316</div>
+`);
+}
+return __forOutputContent__.join('');
+})}
+`; } else if(count > 2){ return `
+${App.View.execute(() => { if(flag ? 'yes' : 'no'){ return `
+<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 4]}])}>+</button>
+`; } else if(count > 4){ return `
+<a href="/page/${App.View.escString(page)}" data-id="293">Link</a>
+<p>Static text 157</p>
+<input type="text" ${this.__addEventConfig("input", [{"handler":"handleInput","params":[() => event]}])} value="${App.View.escString(title)}">
+`; } else { return `
+<input type="text" ${this.__addEventConfig("input", [{"handler":"handleInput","params":[() => event]}])} value="${App.View.escString(title)}">
+<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 3]}])}>+</button>
+<span>Static text 921</span>
+`; }
+return '';
+})}
+<section>${html}</section>
+`; } else { return `
+${App.View.execute(() => {
+let __forOutputContent__ = [];
+for(let i = 0; i < 1; i++) {
+__forOutputContent__.push(`
+<span>${App.View.escString(i)}</span>
+<p>Static text 103</p>
+<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 2]}])}>+</button>
+<a href="/page/${App.View.escString(page)}" data-id="798">Link</a>
+<a href="/page/${App.View.escString(page)}" data-id="993">Link</a>
+`);
+}
+return __forOutputContent__.join('');
+})}
+${App.View.foreach(items, (item, __loopKey, __loopIndex, loop) => `
+<li>${App.View.escString(item)}</li>
+<input type="text" ${this.__addEventConfig("input", [{"handler":"handleInput","params":[() => event]}])} value="${App.View.escString(title)}">
+<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 2]}])}>+</button>
+<a href="/page/${App.View.escString(page)}" data-id="24">Link</a>
+`)}
+${App.View.execute(() => { if(count ?? 'none'){ return `
+<span class="c68">${App.View.escString(user.name)}</span>
+${App.View.renderView(this.__include('partials.item', {"value":"static"}))}
+`; } else if(count > 5){ return `
+<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 1]}])}>+</button>
+`; }
+return '';
+})}
+${App.View.foreach(items, (item, __loopKey, __loopIndex, loop) => `
+<li>${App.View.escString(item)}</li>
+<section>${html}</section>
+<div>${html}</div>
+`)}
+`; }
+return '';
+})}
+<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 2]}])}>+</button>
+`)}
+<span class="c85">${App.View.escString(page)}</span>`, 'html')}
+${this.__section('section_1', `${App.View.foreach(items, (item, key, __loopIndex, loop) => `
+<li>${App.View.escString(item)}</li>
+${App.View.execute(() => { if(App.Helper.strtoupper(count)){ return `
+${App.View.execute(() => { if(user['email'] ?? 'none'){ return `
+<input type="text" ${this.__addEventConfig("input", [{"handler":"handleInput","params":[() => event]}])} value="${App.View.escString(title)}">
+`; } else { return `
+<input type="text" ${this.__addEventConfig("input", [{"handler":"handleInput","params":[() => event]}])} value="${App.View.escString(title)}">
+<div class="c26">${App.View.escString(App.Helper.strtoupper(user.name))}</div>
+${App.View.renderView(this.__include('partials.item', {"value":count}))}
+<li>${html}</li>
+`; }
+return '';
+})}
+${App.View.execute(() => { if(App.Helper.strtoupper(flag)){ return `
+<input type="text" ${this.__addEventConfig("input", [{"handler":"handleInput","params":[() => event]}])} value="${App.View.escString(title)}">
+<a href="/page/${App.View.escString(page)}" data-id="884">Link</a>
+`; } else { return `
+<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 0]}])}>+</button>
+<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 4]}])}>+</button>
+`; }
+return '';
+})}
+${App.View.renderView(this.__include('partials.item', {"value":42}))}
+`; } else { return `
+${App.View.foreach(items, (item, key, __loopIndex, loop) => `
+<li>${App.View.escString(item)}</li>
+<a href="/page/${App.View.escString(page)}" data-id="695">Link</a>
+<p>${html}</p>
+<span class="c92">${App.View.escString(flag ? 'yes' : 'no')}</span>
+<input type="text" ${this.__addEventConfig("input", [{"handler":"handleInput","params":[() => event]}])} value="${App.View.escString(title)}">
+`)}
+`; }
+return '';
+})}
+`)}
+<a href="/page/${App.View.escString(page)}" data-id="674">Link</a>`, 'html')}
+${this.__section('section_2', `${App.View.execute(() => { if(App.Helper.count(items) + 6){ return `
+<span>Static text 213</span>
+${App.View.execute(() => {
+let __forOutputContent__ = [];
+for(let i = 0; i < 5; i++) {
+__forOutputContent__.push(`
+<span>${App.View.escString(i)}</span>
+${App.View.execute(() => {
+let __forOutputContent__ = [];
+for(let i = 0; i < 1; i++) {
+__forOutputContent__.push(`
+<span>${App.View.escString(i)}</span>
+<p class="c60">${App.View.escString(user['email'])}</p>
+<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 1]}])}>+</button>
+`);
+}
+return __forOutputContent__.join('');
+})}
+${App.View.execute(() => { if(App.Helper.strtoupper(page)){ return `
+<p class="c50">${App.View.escString(App.Helper.strtoupper(flag))}</p>
+<li class="c38">${App.View.escString(user.name ?? 'none')}</li>
+${App.View.renderView(this.__include('partials.item', {"value":title}))}
+<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 1]}])}>+</button>
+`; } else { return `
+${App.View.renderView(this.__include('partials.item', {"value":count}))}
+<li class="c60">${App.View.escString(App.Helper.strtoupper(title))}</li>
+<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 1]}])}>+</button>
+<li>${html}</li>
+`; }
+return '';
+})}
+`);
+}
+return __forOutputContent__.join('');
+})}
+<span>${html}</span>
+<a href="/page/${App.View.escString(page)}" data-id="637">Link</a>
+`; }
+return '';
+})}
+<button ${this.__addEventConfig("click", [{"handler":"setCount","params":[(event) => count + 3]}])}>+</button>
+${App.View.renderView(this.__include('partials.item', {"value":title}))}`, 'html')}`;
+            } catch(e) {
+                __outputRenderedContent__ = this.__showError(e.message);
+                console.warn(e);
+            }
+            return this.__extends('layouts.base');
+            },
+        init: function() {  },
+        destroy: function() {}
+    });
+    return self;
+        }
\ No newline at end of file
@@ -0,0 +1,134 @@
+import { createViewWrapper } from './_ViewWrapper.js';
+
+export function _systemPageEnd($$$DATA$$$ = {}, systemData = {}) {
+    const {App, View, __base__, __layout__, __page__, __component__, __partial__, __system__, __env = {}, __helper = {}} = systemData;
+    const __VIEW_PATH__ = '_system.page.end';
+    const __VIEW_ID__ = $$$DATA$$$.__SSR_VIEW_ID__ || App.View.generateViewId();
+    const __VIEW_TYPE__ = 'view';
+    const __WRAPPER__ = createViewWrapper($$$DATA$$$, systemData, {__VIEW_PATH__, __VIEW_ID__, __VIEW_TYPE__});
+    const {__WRAPPER_ELEMENT__, __REFS__, self, __STATE__, parseRefs, createHtml, useState, updateRealState, lockUpdateRealState, updateStateByKey} = __WRAPPER__;
+    const __UPDATE_DATA_TRAIT__ = {};
+    const __VARIABLE_LIST__ = [];
+
+    self.setup('_system.page.end', {
+        superView: null,
+        hasSuperView: false,
+        viewType: 'view',
+        sections: {},
+        wrapperConfig: { enable: false, tag: null, follow: true, attributes: {} },
+        ...__WRAPPER__.config,
+        hasAwaitData: false,
+        hasFetchData: false,
+        subscribe: false,
+        fetch: null,
+        data: $$$DATA$$$,
+        viewId: __VIEW_ID__,
+        path: __VIEW_PATH__,
+        usesVars: false,
+        hasSections: false,
+        hasSectionPreload: false,
+        hasPrerender: false,
+        renderLongSections: [],
+        renderSections: [],
+        prerenderSections: [],
+        userDefined: {},
+        scripts: [],
+        styles: [],
+        resources: [],
+        commitConstructorData: function() {
+            // Then update states from data
+            
+            // Finally lock state updates
+            
+        },
+        updateVariableData: function(data) {
+            // Update all variables first
+            for (const key in data) {
+                if (data.hasOwnProperty(key)) {
+                    this.updateVariableItem(key, data[key]);
+                }
+            }
+            // Then update states from data
+            
+            // Finally lock state updates
+            
+        },
+        updateVariableItem: function(key, value) {
+            this.data[key] = value;
+            if (typeof __UPDATE_DATA_TRAIT__[key] === "function") {
+                __UPDATE_DATA_TRAIT__[key](value);
+            }
+        },
+        loadServerData: function() {
+    
+},
+        prerender: function() {
+    return null;
+},
+        render: function() {
+                
+    let __outputRenderedContent__ = '';
+            try {
+                __outputRenderedContent__ = `</div>
+<!-- SPA Configuration - Simple config only, all logic handled in JavaScript -->
+<script>
+window.APP_CONFIGS = {
+api: {
+csrfToken: '${App.View.escString(csrf_token())}',
+baseUrl: '${App.View.escString(App.Helper.url('/'))}'
+},
+env: {
+mode: "${App.View.escString(App.Helper.config('spa.mode') ?? 'web')}",
+debug: "${App.View.escString(App.Helper.config('app.debug') ?? false)}",
+base_url: "${App.View.escString(App.Helper.config('spa.base_url') ?? App.Helper.url('/'))}",
+csrf_token: "${App.View.escString(App.Helper.config('spa.csrf_token') ?? csrf_token())}",
+router_mode: "${App.View.escString(App.Helper.config('spa.router_mode') ?? 'history')}",
+}
+mode: '${App.View.escString(App.Helper.config('app.debug') ? 'development' : 'production')}',
+defaultRoute: '/web',
+container: '#one-app',
+router: {
+mode: 'history',
+base: '/',
+allRoutes: ${App.Helper.json_encode(__helper.exportSpaRoutes(), JSON_UNESCAPED_UNICODE | JSON_UNESCAPED_SLASHES)},
+routes: ${App.Helper.json_encode(__helper.exportComponentRoutes(), JSON_UNESCAPED_UNICODE | JSON_UNESCAPED_SLASHES)}
+},
+view: {
+systemData: {
+ref: 'config',
+title: '${App.View.escString(App.Helper.trim(App.View.view().yieldContent('meta:title') ?: 'One Laravel - Advanced SPA Framework'))}'
+},
+superView: '${App.View.escString(__VIEW_PATH__ ?? null)}',
+
+ssrData: ${App.Helper.json_encode(__helper.exportApplicationViewData(), JSON_UNESCAPED_UNICODE)}
+}
+};
+</script>
+
+<!-- Core JavaScript for SPA - Load after APP_CONFIGS is defined -->
+${App.View.renderView(this.__include("partials.assets-scripts", {}))}
+
+<!-- SPA Ready Handler -->
+<script>
+document.addEventListener('app:ready', function(event) {
+console.log('🎉 SPA is ready!');
+if (window.App && window.App.View) {
+window.App.View.__curentMasterView__ = 'layouts.base';
+}
+});
+</script>
+
+${App.View.yield('scripts')}
+</body>
+</html>`;
+            } catch(e) {
+                __outputRenderedContent__ = this.__showError(e.message);
+                console.warn(e);
+            }
+            return __outputRenderedContent__;
+            },
+        init: function() {  },
+        destroy: function() {}
+    });
+    return self;
+        }
\ No newline at end of file
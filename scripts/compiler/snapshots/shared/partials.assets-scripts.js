@@ -0,0 +1,102 @@
+import { createViewWrapper } from './_ViewWrapper.js';
+
+export function PartialsAssetsScripts($$$DATA$$$ = {}, systemData = {}) {
+    const {App, View, __base__, __layout__, __page__, __component__, __partial__, __system__, __env = {}, __helper = {}} = systemData;
+    const __VIEW_PATH__ = 'partials.assets-scripts';
+    const __VIEW_ID__ = $$$DATA$$$.__SSR_VIEW_ID__ || App.View.generateViewId();
+    const __VIEW_TYPE__ = 'view';
+    const __WRAPPER__ = createViewWrapper($$$DATA$$$, systemData, {__VIEW_PATH__, __VIEW_ID__, __VIEW_TYPE__});
+    const {__WRAPPER_ELEMENT__, __REFS__, self, __STATE__, parseRefs, createHtml, useState, updateRealState, lockUpdateRealState, updateStateByKey} = __WRAPPER__;
+    const __UPDATE_DATA_TRAIT__ = {};
+    const __VARIABLE_LIST__ = [];
+
+    self.setup('partials.assets-scripts', {
+        superView: null,
+        hasSuperView: false,
+        viewType: 'view',
+        sections: {},
+        wrapperConfig: { enable: false, tag: null, follow: true, attributes: {} },
+        ...__WRAPPER__.config,
+        hasAwaitData: false,
+        hasFetchData: false,
+        subscribe: false,
+        fetch: null,
+        data: $$$DATA$$$,
+        viewId: __VIEW_ID__,
+        path: __VIEW_PATH__,
+        usesVars: false,
+        hasSections: false,
+        hasSectionPreload: false,
+        hasPrerender: false,
+        renderLongSections: [],
+        renderSections: [],
+        prerenderSections: [],
+        userDefined: {},
+        scripts: [],
+        styles: [],
+        resources: [],
+        commitConstructorData: function() {
+            // Then update states from data
+            
+            // Finally lock state updates
+            
+        },
+        updateVariableData: function(data) {
+            // Update all variables first
+            for (const key in data) {
+                if (data.hasOwnProperty(key)) {
+                    this.updateVariableItem(key, data[key]);
+                }
+            }
+            // Then update states from data
+            
+            // Finally lock state updates
+            
+        },
+        updateVariableItem: function(key, value) {
+            this.data[key] = value;
+            if (typeof __UPDATE_DATA_TRAIT__[key] === "function") {
+                __UPDATE_DATA_TRAIT__[key](value);
+            }
+        },
+        loadServerData: function() {
+    
+},
+        prerender: function() {
+    return null;
+},
+        render: function() {
+                
+    let __outputRenderedContent__ = '';
+            try {
+                __outputRenderedContent__ = `
+
+
+
+<script src="${App.View.escString(App.Helper.asset('static/app/core-1c191ae7.js'))}" defer></script>
+<script src="${App.View.escString(App.Helper.asset('static/app/core-5836a356.js'))}" defer></script>
+<script src="${App.View.escString(App.Helper.asset('static/app/core-5ab236cd.js'))}" defer></script>
+<script src="${App.View.escString(App.Helper.asset('static/app/core-c492f101.js'))}" defer></script>
+
+
+<script src="${App.View.escString(App.Helper.asset('static/app/views-0875e753.js'))}" defer></script>
+<script src="${App.View.escString(App.Helper.asset('static/app/views-4b7e9c69.js'))}" defer></script>
+<script src="${App.View.escString(App.Helper.asset('static/app/views-b1efdd7b.js'))}" defer></script>
+<script src="${App.View.escString(App.Helper.asset('static/app/views-cf3615ff.js'))}" defer></script>
+<script src="${App.View.escString(App.Helper.asset('static/app/views-dc6bbf0a.js'))}" defer></script>
+<script src="${App.View.escString(App.Helper.asset('static/app/views-e109a6f5.js'))}" defer></script>
+<script src="${App.View.escString(App.Helper.asset('static/app/views-e8f2b5ad.js'))}" defer></script>
+
+
+<script src="${App.View.escString(App.Helper.asset('static/app/main.js'))}" defer></script>`;
+            } catch(e) {
+                __outputRenderedContent__ = this.__showError(e.message);
+                console.warn(e);
+            }
+            return __outputRenderedContent__;
+            },
+        init: function() {  },
+        destroy: function() {}
+    });
+    return self;
+        }
\ No newline at end of file
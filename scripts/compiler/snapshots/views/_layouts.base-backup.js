@@ -0,0 +1,119 @@
+export function _layoutsBaseBackup($$$DATA$$$ = {}, systemData = {}) {
+    const {App, View, __base__, __layout__, __page__, __component__, __partial__, __system__, __env = {}, __helper = {}} = systemData;
+    const __VIEW_PATH__ = '_layouts.base-backup';
+    const __VIEW_ID__ = $$$DATA$$$.__SSR_VIEW_ID__ || App.View.generateViewId();
+    const __VIEW_TYPE__ = 'view';
+    /* wraper.js */
+    const __UPDATE_DATA_TRAIT__ = {};
+    let temp = 'templates';
+    __UPDATE_DATA_TRAIT__.temp = value => temp = value;
+    const __VARIABLE_LIST__ = ["temp"];
+
+    self.setup('_layouts.base-backup', {
+        superView: null,
+        hasSuperView: false,
+        viewType: 'view',
+        sections: {},
+        wrapperConfig: { enable: true, tag: null, follow: false, attributes: {} },
+        __props__: ["__WRAPPER_ELEMENT__", "createHtml", "__REFS__", "parseRefs"],
+            __WRAPPER_ELEMENT__: __WRAPPER_ELEMENT__,
+            refs: __REFS__,
+            states: __STATE__,
+            parseRefs: parseRefs,
+            createHtml: createHtml,
+        hasAwaitData: false,
+        hasFetchData: false,
+        subscribe: false,
+        fetch: null,
+        data: $$$DATA$$$,
+        viewId: __VIEW_ID__,
+        path: __VIEW_PATH__,
+        usesVars: false,
+        hasSections: false,
+        hasSectionPreload: false,
+        hasPrerender: false,
+        renderLongSections: [],
+        renderSections: [],
+        prerenderSections: [],
+        userDefined: {
+    mounted() {
+                    console.log('Welcome', __VIEW_ID__);
+                },
+                init() {
+                    console.log('Welcome', __VIEW_ID__);
+                }
+},
+        scripts: [],
+        styles: [],
+        resources: [],
+        commitConstructorData: function() {
+            // Then update states from data
+            
+            // Finally lock state updates
+            
+        },
+        updateVariableData: function(data) {
+            // Update all variables first
+            for (const key in data) {
+                if (data.hasOwnProperty(key)) {
+                    this.updateVariableItem(key, data[key]);
+                }
+            }
+            // Then update states from data
+            
+            // Finally lock state updates
+            
+        },
+        updateVariableItem: function(key, value) {
+            this.data[key] = value;
+            if (typeof __UPDATE_DATA_TRAIT__[key] === "function") {
+                __UPDATE_DATA_TRAIT__[key](value);
+            }
+        },
+        loadServerData: function() {
+    
+},
+        prerender: function() {
+    return null;
+},
+        render: function() {
+                
+    let __outputRenderedContent__ = '';
+            try {
+                __outputRenderedContent__ = `<!-- Navigation -->
+<nav class="navbar">
+<div class="nav-container">
+<a href="/web" class="nav-brand">SPA App</a>
+<div class="nav-menu">
+<a href="/web" class="nav-link">Home</a>
+<a href="/web/about" class="nav-link">About</a>
+<a href="/web/users" class="nav-link">Users</a>
+<a href="/web/contact" class="nav-link">Contact</a>
+<!-- Test links -->
+<a href="https://google.com" class="nav-link" target="_blank">External</a>
+<a href="mailto:test@example.com" class="nav-link">Email</a>
+<a href="/web/test" class="nav-link" data-nav="disabled">Disabled</a>
+</div>
+</div>
+</nav>
+
+<!-- Main Content -->
+<div id="app-content" ${this.__subscribeBlock('document.body')}>
+${this.__useBlock('document.body')}
+</div>
+
+${App.View.renderView(this.__include(temp+'.ga-js', {"test":"test"}))}
+${App.View.renderView(this.__includeif(temp+'.ga-js', {"test":"test"}))}
+${App.View.renderView(this.__includewhen(__VIEW_PATH__ === 'layouts.base', temp+'.ga-js', {"test":"test"}))}
+`;
+            } catch(e) {
+                __outputRenderedContent__ = this.__showError(e.message);
+                console.warn(e);
+            }
+            return __outputRenderedContent__;
+            },
+        init: function() {  },
+        destroy: function() {}
+    });
+    return self;
+        }
\ No newline at end of file
@@ -0,0 +1,102 @@
+"""
+Staged, diff-aware publishing của một thư mục output (resources/js/app/views)
+
+File mới được ghi vào staging directory; thư mục đích chỉ bị động tới khi commit(),
+khi đó chỉ file có nội dung khác (so sánh bằng content hash) được rename vào chỗ và
+chỉ file không còn được tạo ra mới bị xoá. Build lỗi giữa chừng để nguyên output cũ,
+file không đổi giữ nguyên mtime nên webpack/vite không build lại.
+"""
+
+import os
+import shutil
+
+from build_cache import hash_content
+
+
+def hash_file(file_path):
+    """sha256 of a file's bytes, None if it does not exist"""
+    try:
+        with open(file_path, 'rb') as f:
+            return hash_content(f.read())
+    except (FileNotFoundError, IsADirectoryError):
+        return None
+
+
+class StagedOutputDirectory:
+    """Collects the files of one build and publishes only the differences into target_dir"""
+
+    def __init__(self, target_dir, staging_dir):
+        self.target_dir = target_dir
+        self.staging_dir = staging_dir
+        # file name -> True if staged (changed), False if identical to the published file
+        self.files = {}
+        # Staging còn sót lại từ một build bị dừng giữa chừng
+        self.abort()
+        os.makedirs(self.staging_dir, exist_ok=True)
+
+    def target_path(self, file_name):
+        return os.path.join(self.target_dir, file_name)
+
+    def write(self, file_name, content):
+        """Stage file_name unless the published file already has this content; returns True if staged"""
+        data = content.encode('utf-8')
+        target_path = self.target_path(file_name)
+        try:
+            unchanged = os.path.getsize(target_path) == len(data) and hash_file(target_path) == hash_content(data)
+        except OSError:
+            unchanged = False
+
+        if unchanged:
+            staged_path = os.path.join(self.staging_dir, file_name)
+            if os.path.exists(staged_path):
+                os.remove(staged_path)
+            self.files[file_name] = False
+            return False
+
+        staged_path = os.path.join(self.staging_dir, file_name)
+        os.makedirs(os.path.dirname(staged_path), exist_ok=True)
+        with open(staged_path, 'wb') as f:
+            f.write(data)
+        self.files[file_name] = True
+        return True
+
+    def commit(self):
+        """Move staged files into target_dir (one atomic rename per file), returns the changed file names"""
+        os.makedirs(self.target_dir, exist_ok=True)
+        changed = []
+        for file_name, staged in self.files.items():
+            if not staged:
+                continue
+            staged_path = os.path.join(self.staging_dir, file_name)
+            target_path = self.target_path(file_name)
+            try:
+                os.replace(staged_path, target_path)
+            except OSError:
+                # Staging nằm trên filesystem khác: copy sang file tạm cạnh target rồi rename
+                tmp_path = f"{target_path}.{os.getpid()}.tmp"
+                shutil.copyfile(staged_path, tmp_path)
+                os.replace(tmp_path, target_path)
+            changed.append(file_name)
+        self.abort()
+        return changed
+
+    def remove_stale(self):
+        """Delete entries of target_dir that this build did not produce, returns their names"""
+        removed = []
+        if not os.path.isdir(self.target_dir):
+            return removed
+        for entry in sorted(os.listdir(self.target_dir)):
+            if entry in self.files:
+                continue
+            entry_path = os.path.join(self.target_dir, entry)
+            if os.path.isdir(entry_path):
+                shutil.rmtree(entry_path)
+            else:
+                os.remove(entry_path)
+            removed.append(entry)
+        return removed
+
+    def abort(self):
+        """Drop everything staged; the published directory is left untouched"""
+        if os.path.isdir(self.staging_dir):
+            shutil.rmtree(self.staging_dir)
@@ -145,6 +145,7 @@ class TemplateAnalyzer:
                     f'\${{{var_name}}}',
                     f'\${{{JS_FUNCTION_PREFIX}.escString\({var_name}\)}}',
                     f'\${{{JS_FUNCTION_PREFIX}.foreach\({var_name}',
+                    rf'\${{{JS_FUNCTION_PREFIX}.foreachKeyed\({var_name}',
                     f', {var_name}\)',
                     f'\({var_name}\)',
                     f', {var_name}',
@@ -0,0 +1,314 @@
+"""
+AST cho template content và code generator duyệt cây
+
+TemplateProcessor dựng cây khi đọc từng dòng: node đang mở nằm trên `stack`,
+nội dung mới được thêm vào `body` của node trên cùng. TemplateCodeGenerator
+sinh JS cho cả cây trong một lượt, không còn cắt/ghép lại output theo index.
+
+Phần tử trong body là node hoặc chuỗi JS thô (fragment do directive sinh ra).
+"""
+
+from config import JS_FUNCTION_PREFIX
+import re
+
+
+class TemplateNode:
+    """Container node; children are nodes or raw JS fragments (str)"""
+    kind = 'root'
+
+    def __init__(self):
+        self.children = []
+        self.closed = False
+
+    @property
+    def body(self):
+        """List receiving new content while the node is open"""
+        return self.children
+
+
+class DirectiveBlockNode(TemplateNode):
+    """Paired directive emitting fixed fragments (@php, @empty, @isset, @register)"""
+
+    def __init__(self, kind, opening='', closing=''):
+        super().__init__()
+        self.kind = kind
+        self.opening = opening
+        self.closing = closing
+
+
+class TextNode:
+    """Template literal text of one source line, without interpolation"""
+    kind = 'text'
+
+    def __init__(self, text):
+        self.text = text
+
+
+class EchoNode(TextNode):
+    """Template line containing ${...} interpolations ({{ }}, {!! !!}, inline directives)"""
+    kind = 'echo'
+
+
+class IncludeNode(TextNode):
+    """Template line rendering an included view"""
+    kind = 'include'
+
+
+class EventNode(TextNode):
+    """Template line whose @click/@input/... directives were compiled to event attributes"""
+    kind = 'event'
+
+
+def make_content_node(text):
+    """Leaf node for one processed template line"""
+    if 'this.__include(' in text:
+        return IncludeNode(text)
+    if '${' in text:
+        return EchoNode(text)
+    return TextNode(text)
+
+
+class SectionNode(TemplateNode):
+    kind = 'section'
+
+    def __init__(self, name):
+        super().__init__()
+        self.name = name
+        self.rendered = None
+
+
+class BlockNode(TemplateNode):
+    kind = 'block'
+
+    def __init__(self, name, attributes='{}'):
+        super().__init__()
+        self.name = name
+        self.attributes = attributes
+        self.rendered = None
+
+
+class IfNode(TemplateNode):
+    """@if with its @elseif/@else branches; each branch is [condition or None, children]"""
+    kind = 'if'
+
+    def __init__(self, condition):
+        super().__init__()
+        self.branches = [[condition, self.children]]
+
+    def add_branch(self, condition):
+        self.branches.append([condition, []])
+
+    @property
+    def body(self):
+        return self.branches[-1][1]
+
+
+class ForeachNode(TemplateNode):
+    """@foreach; row_key is the JS expression of `key: ...` (keyed list), None otherwise"""
+    kind = 'foreach'
+
+    def __init__(self, array_expr, value_var, key_var=None, row_key=None):
+        super().__init__()
+        self.array_expr = array_expr
+        self.value_var = value_var
+        self.key_var = key_var
+        self.row_key = row_key
+
+
+def infer_row_key(value_var, body):
+    """`item.id` / `item['id']` if the loop body reads the id field of the loop value, else None"""
+    match = re.search(rf"(?<![\w$.]){re.escape(value_var)}(?:\.id\b(?!\s*\()|\[(['\"])id\1\])", body)
+    return match.group(0) if match else None
+
+
+class ForNode(TemplateNode):
+    kind = 'for'
+
+    def __init__(self, var_name, start_value, operator, end_value):
+        super().__init__()
+        self.var_name = var_name
+        self.start_value = start_value
+        self.operator = operator
+        self.end_value = end_value
+
+
+class WhileNode(TemplateNode):
+    kind = 'while'
+
+    def __init__(self, condition):
+        super().__init__()
+        self.condition = condition
+
+
+class SwitchNode(TemplateNode):
+    kind = 'switch'
+
+    def __init__(self, condition):
+        super().__init__()
+        self.condition = condition
+
+
+class CaseNode(TemplateNode):
+    """@case (condition) or @default (condition None) inside a SwitchNode"""
+    kind = 'case'
+
+    def __init__(self, condition=None):
+        super().__init__()
+        self.condition = condition
+        self.has_break = False
+
+
+class WrapperNode(TemplateNode):
+    kind = 'wrapper'
+
+    def __init__(self, tag, attributes):
+        super().__init__()
+        self.tag = tag
+        self.attributes = attributes
+
+
+def current_body(stack, root):
+    """Body list of the innermost open node"""
+    return stack[-1].body if stack else root.body
+
+
+def innermost_kind(stack):
+    return stack[-1].kind if stack else None
+
+
+class TemplateCodeGenerator:
+    """Single pass over the template AST producing the render template string
+
+    An unclosed node renders the same fragments the line-based processor used to
+    leave in its output (opening fragment and children, no closing part).
+    """
+
+    def __init__(self):
+        # @foreach không có `key:` nhưng đọc item.id/item['id'] cũng được sinh thành keyed list
+        self.infer_foreach_keys = False
+
+    def generate(self, root):
+        return '\n'.join(self.render_items(root.children))
+
+    def render_node(self, node):
+        """Template string for a node (used for the sections list when a section closes)"""
+        return '\n'.join(self._render(node))
+
+    def render_items(self, items):
+        lines = []
+        for item in items:
+            if isinstance(item, str):
+                lines.append(item)
+            elif isinstance(item, TextNode):
+                lines.append(item.text)
+            else:
+                lines.extend(self._render(item))
+        return lines
+
+    def _render(self, node):
+        method = getattr(self, f'_render_{node.kind}', None)
+        if method is None:
+            return self.render_items(node.children)
+        return method(node)
+
+    def _render_directive_block(self, node):
+        lines = [node.opening] if node.opening else []
+        lines.extend(self.render_items(node.children))
+        if node.closed and node.closing:
+            lines.append(node.closing)
+        return lines
+
+    _render_php = _render_directive_block
+    _render_empty = _render_directive_block
+    _render_isset = _render_directive_block
+    _render_register = _render_directive_block
+
+    def _render_section(self, node):
+        if not node.closed:
+            return self.render_items(node.children)
+        if node.rendered is None:
+            content = '\n'.join(self.render_items(node.children))
+            # Determine section type based on content
+            section_type = 'html' if re.search(r'<[a-zA-Z][^>]*>', content) else 'string'
+            node.rendered = '${' + JS_FUNCTION_PREFIX + '.section(\'' + node.name + '\', `' + content + '`, \'' + section_type + '\')}'
+        return [node.rendered]
+
+    def _render_block(self, node):
+        if not node.closed:
+            return self.render_items(node.children)
+        if node.rendered is None:
+            content = '\n'.join(self.render_items(node.children))
+            node.rendered = '${this.__block(\'' + node.name + '\', ' + node.attributes + ', `' + content + '`)}'
+        return [node.rendered]
+
+    def _render_if(self, node):
+        lines = []
+        for index, (condition, children) in enumerate(node.branches):
+            if index == 0:
+                lines.append(f"${{{JS_FUNCTION_PREFIX}.execute(() => {{ if({condition}){{ return `")
+            elif condition is None:
+                lines.append("`; } else { return `")
+            else:
+                lines.append(f"`; }} else if({condition}){{ return `")
+            lines.extend(self.render_items(children))
+        if node.closed:
+            lines.extend(['`; }', "return '';", '})}'])
+        return lines
+
+    def _render_foreach(self, node):
+        key_var = node.key_var or '__loopKey'
+        params = f'({node.value_var}, {key_var}, __loopIndex, loop)'
+        body = self.render_items(node.children)
+        row_key = node.row_key
+        if row_key is None and self.infer_foreach_keys:
+            row_key = infer_row_key(node.value_var, '\n'.join(body))
+        if row_key:
+            # Keyed list: runtime chỉ chèn/di chuyển/xoá các hàng thay đổi
+            lines = [f"${{{JS_FUNCTION_PREFIX}.foreachKeyed({node.array_expr}, {params} => {row_key}, {params} => `"]
+        else:
+            lines = [f"${{{JS_FUNCTION_PREFIX}.foreach({node.array_expr}, {params} => `"]
+        lines.extend(body)
+        if node.closed:
+            lines.append('`)}')
+        return lines
+
+    def _render_for(self, node):
+        header = f"for(let {node.var_name} = {node.start_value}; {node.var_name} {node.operator} {node.end_value}; {node.var_name}++) {{"
+        return self._render_loop(node, header)
+
+    def _render_while(self, node):
+        return self._render_loop(node, f"while({node.condition}) {{")
+
+    def _render_loop(self, node, header):
+        # Mỗi vòng lặp push một template literal cho cả body, join một lần sau vòng lặp
+        output_var = f"__{node.kind}OutputContent__"
+        lines = [f"${{{JS_FUNCTION_PREFIX}.execute(() => {{\nlet {output_var} = [];\n{header}\n{output_var}.push(`"]
+        lines.extend(self.render_items(node.children))
+        if node.closed:
+            lines.append(f"`);\n}}\nreturn {output_var}.join('');\n}})}}")
+        return lines
+
+    def _render_switch(self, node):
+        lines = [f"${{{JS_FUNCTION_PREFIX}.execute(() => {{\nlet __switchOutputContent__ = '';\nswitch({node.condition}) {{"]
+        lines.extend(self.render_items(node.children))
+        if node.closed:
+            lines.append("}\nreturn __switchOutputContent__;\n})}")
+        return lines
+
+    def _render_case(self, node):
+        if node.condition is None:
+            lines = ["\ndefault:\n__switchOutputContent__ += `"]
+        else:
+            lines = [f"\ncase {node.condition}:\n__switchOutputContent__ += `"]
+        lines.extend(self.render_items(node.children))
+        if not node.has_break:
+            # Đóng template literal của case chưa có @break
+            lines.append('`;')
+        return lines
+
+    def _render_wrapper(self, node):
+        lines = ['${' + JS_FUNCTION_PREFIX + '.startWrapper(' + node.tag + ', ' + node.attributes + ', __VIEW_ID__)}']
+        lines.extend(self.render_items(node.children))
+        if node.closed:
+            lines.append('${' + JS_FUNCTION_PREFIX + '.endWrapper(__VIEW_ID__)}')
+        return lines
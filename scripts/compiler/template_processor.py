@@ -3,6 +3,7 @@ Template processor chính xử lý template content
 """
 
 import re
+import tracing
 from utils import extract_balanced_parentheses
 from conditional_handlers import ConditionalHandlers
 from loop_handlers import LoopHandlers
@@ -10,6 +11,8 @@ from section_handlers import SectionHandlers
 from template_processors import TemplateProcessors
 from directive_processors import DirectiveProcessor
 from event_directive_processor import EventDirectiveProcessor
+from template_ast import (TemplateNode, EventNode, TemplateCodeGenerator, make_content_node,
+                          current_body, innermost_kind)
 
 class TemplateProcessor:
     def __init__(self, usestate_variables=None):
@@ -19,6 +22,15 @@ class TemplateProcessor:
         self.template_processors = TemplateProcessors()
         self.directive_processors = DirectiveProcessor()
         self.event_processor = EventDirectiveProcessor(usestate_variables or set())
+        self.code_generator = TemplateCodeGenerator()
+        self._directive_table = self._build_directive_table()
+        self._resolved_directives = {}
+    
+    def reset(self, usestate_variables=None):
+        """Prepare for the next view without rebuilding handlers and the directive table"""
+        self.event_processor.usestate_variables = usestate_variables or set()
+        # Directive có thể được đăng ký giữa hai view
+        self._resolved_directives = {}
     
     def process_template(self, blade_code):
         """Process template content and extract sections"""
@@ -30,88 +42,37 @@ class TemplateProcessor:
         blade_code = self._remove_page_directives(blade_code)
         
         # Remove already processed directives
-        blade_code = re.sub(r'@extends\s*\([^)]*\)', '', blade_code, flags=re.DOTALL)
-        blade_code = re.sub(r'@vars\s*\([^)]*\)', '', blade_code, flags=re.DOTALL)
-        
-        # Remove @let directives with balanced parentheses
-        let_pattern = r'@let\s*\('
-        while re.search(let_pattern, blade_code):
-            match = re.search(let_pattern, blade_code)
-            if match:
-                start_pos = match.end() - 1
-                content, end_pos = extract_balanced_parentheses(blade_code, start_pos)
-                if content is not None:
-                    blade_code = blade_code[:match.start()] + blade_code[start_pos + len(content) + 2:]
-                else:
-                    break
-        
-        # Remove @const directives with balanced parentheses
-        const_pattern = r'@const\s*\('
-        while re.search(const_pattern, blade_code):
-            match = re.search(const_pattern, blade_code)
-            if match:
-                start_pos = match.end() - 1
-                content, end_pos = extract_balanced_parentheses(blade_code, start_pos)
-                if content is not None:
-                    blade_code = blade_code[:match.start()] + blade_code[start_pos + len(content) + 2:]
-                else:
-                    break
+        blade_code = tracing.sub(r'@extends\s*\([^)]*\)', '', blade_code, flags=re.DOTALL)
+        blade_code = tracing.sub(r'@vars\s*\([^)]*\)', '', blade_code, flags=re.DOTALL)
         
-        # Remove @useState directives with balanced parentheses
-        usestate_pattern = r'@useState\s*\('
-        while re.search(usestate_pattern, blade_code):
-            match = re.search(usestate_pattern, blade_code)
-            if match:
-                start_pos = match.end() - 1
-                content, end_pos = extract_balanced_parentheses(blade_code, start_pos)
-                if content is not None:
-                    blade_code = blade_code[:match.start()] + blade_code[start_pos + len(content) + 2:]
-                else:
-                    break
-        # Remove @fetch directive with balanced parentheses
-        fetch_pattern = r'@fetch\s*\('
-        while re.search(fetch_pattern, blade_code):
-            match = re.search(fetch_pattern, blade_code)
-            if match:
-                start_pos = match.end() - 1
-                fetch_content, end_pos = extract_balanced_parentheses(blade_code, start_pos)
-                if fetch_content is not None:
-                    blade_code = blade_code[:match.start()] + blade_code[start_pos + len(fetch_content) + 2:]
-                else:
-                    break
-        blade_code = re.sub(r'@await\s*\([^)]*\)', '', blade_code, flags=re.DOTALL)
+        # Remove @let/@const/@useState/@fetch directives with balanced parentheses
+        blade_code = self._remove_balanced_directives(blade_code, self.DECLARATION_DIRECTIVES_PATTERN)
+        blade_code = tracing.sub(r'@await\s*\([^)]*\)', '', blade_code, flags=re.DOTALL)
 
         # Process @include directives (multiline support) BEFORE processing line by line
         blade_code = self._process_multiline_include_directives(blade_code)
 
         # Remove @subscribe directive with balanced parentheses
-        subscribe_pattern = r'@subscribe\s*\('
-        while re.search(subscribe_pattern, blade_code, flags=re.IGNORECASE):
-            match = re.search(subscribe_pattern, blade_code, flags=re.IGNORECASE)
-            if match:
-                start_pos = match.end() - 1
-                sub_content, end_pos = extract_balanced_parentheses(blade_code, start_pos)
-                if sub_content is not None:
-                    blade_code = blade_code[:match.start()] + blade_code[start_pos + len(sub_content) + 2:]
-                else:
-                    break
+        blade_code = self._remove_balanced_directives(blade_code, self.SUBSCRIBE_DIRECTIVE_PATTERN)
 
         # Remove @dontsubscribe (with or without parentheses)
-        blade_code = re.sub(r'@dontsubscribe\s*\([^)]*\)', '', blade_code, flags=re.DOTALL | re.IGNORECASE)
-        blade_code = re.sub(r'@dontsubscribe\b', '', blade_code, flags=re.IGNORECASE)
+        blade_code = tracing.sub(r'@dontsubscribe\s*\([^)]*\)', '', blade_code, flags=re.DOTALL | re.IGNORECASE)
+        blade_code = tracing.sub(r'@dontsubscribe\b', '', blade_code, flags=re.IGNORECASE)
 
-        blade_code = re.sub(r'@oninit.*?@endoninit', '', blade_code, flags=re.DOTALL | re.IGNORECASE)
+        blade_code = tracing.sub(r'@oninit.*?@endoninit', '', blade_code, flags=re.DOTALL | re.IGNORECASE)
         # Remove @register directive - với hoặc không có parameters
-        blade_code = re.sub(r'@register\s*(?:\([^)]*\))?.*?@endregister', '', blade_code, flags=re.DOTALL | re.IGNORECASE)
+        blade_code = tracing.sub(r'@register\s*(?:\([^)]*\))?.*?@endregister', '', blade_code, flags=re.DOTALL | re.IGNORECASE)
         
         # Remove @setup directive (alias of @register) - với hoặc không có parameters
-        blade_code = re.sub(r'@setup\s*(?:\([^)]*\))?.*?@endsetup', '', blade_code, flags=re.DOTALL | re.IGNORECASE)
+        blade_code = tracing.sub(r'@setup\s*(?:\([^)]*\))?.*?@endsetup', '', blade_code, flags=re.DOTALL | re.IGNORECASE)
         
         # Remove @script directive (xử lý như @register)
-        blade_code = re.sub(r'@script\s*(?:\([^)]*\))?.*?@endscript', '', blade_code, flags=re.DOTALL | re.IGNORECASE)
+        blade_code = tracing.sub(r'@script\s*(?:\([^)]*\))?.*?@endscript', '', blade_code, flags=re.DOTALL | re.IGNORECASE)
         
         lines = blade_code.splitlines()
-        output = []
+        # Cây template: node đang mở nằm trên stack, output là body của node trong cùng
+        root = TemplateNode()
+        output = root.body
         sections = []
         stack = []
         skip_until = None
@@ -120,6 +81,7 @@ class TemplateProcessor:
         
         i = 0
         while i < len(lines):
+            output = current_body(stack, root)
             original_line = lines[i]
             
             # Check if we're entering or leaving <pre> tags
@@ -136,7 +98,7 @@ class TemplateProcessor:
             
             if not line:
                 # Don't add empty lines in loops
-                if not (stack and stack[-1][0] in ['for', 'while']):
+                if innermost_kind(stack) not in ('for', 'while'):
                     output.append('')
                 i += 1
                 continue
@@ -188,7 +150,7 @@ class TemplateProcessor:
                 complete_line, lines_joined = self._join_multiline_event_directive(lines, i)
                 if complete_line:
                     processed = self._process_line_directives(complete_line, stack, output, sections)
-                    if processed:
+                    if processed and processed is not True:
                         output.append(processed)
                     # Skip the lines that were joined
                     i += lines_joined
@@ -208,14 +170,14 @@ class TemplateProcessor:
                     # Skip the @csr line itself
                     i += 1
                     continue
-                else:
+                elif processed is not True:
                     # Append the processed directive result
                     output.append(processed)
                 i += 1
                 continue
             
             # Check if we're inside a php block first
-            if stack and stack[-1][0] == 'php':
+            if innermost_kind(stack) == 'php':
                 # Convert PHP to JavaScript
                 if line.strip():
                     from php_converter import php_to_js
@@ -230,21 +192,17 @@ class TemplateProcessor:
                 processed_line = self.template_processors.process_template_line(line)
                 
                 # Check if we're inside a loop that needs output variable
-                if stack and stack[-1][0] in ['for', 'while']:
+                if innermost_kind(stack) in ('for', 'while'):
                     # Skip empty lines in loops completely
                     if not processed_line.strip():
                         i += 1
                         continue
                     
-                    # Get loop info first
-                    loop_type = stack[-1][0]
-                    output_var = f"__{loop_type}OutputContent__"
-                    
                     # Handle @endwhile/@endfor in loops
                     if line.startswith('@endwhile') or line.startswith('@endfor'):
                         # Process the end directive
                         processed = self._process_line_directives(line, stack, output, sections)
-                        if processed:
+                        if processed and processed is not True:
                             output.append(processed)
                         i += 1
                         continue
@@ -277,108 +235,145 @@ class TemplateProcessor:
                         # Regular content
                         processed_line = self.template_processors.process_template_line(line)
                     
-                    # Now append processed_line to the loop's output variable
-                    # Check if the last item in output is an incomplete template string for this loop
-                    if output and isinstance(output[-1], str) and output[-1].startswith(output_var) and not output[-1].endswith('`;'):
-                        # Append to the existing template string
-                        output[-1] = output[-1].rstrip('`') + '\n' + processed_line + '`;'
-                    else:
-                        # Start a new template string
-                        output.append(f"{output_var} += `{processed_line}`;")
+                    # Content node of the loop - code generator adds it to the loop's output variable
+                    output.append(make_content_node(processed_line))
                     
                     i += 1
                     continue
             
-            output.append(processed_line)
+            output.append(make_content_node(processed_line))
             
             i += 1
         
-        # Filter out boolean values and join strings
-        template_content = '\n'.join([str(item) for item in output if isinstance(item, str)])
+        # Generate template string from the AST in one pass
+        template_content = self.code_generator.generate(root)
         
         # Restore verbatim blocks after all processing is done
         template_content = self._restore_verbatim_blocks(template_content)
         
         return template_content, sections
     
+    # Directive đã được main_compiler xử lý, bị xoá khỏi template cùng phần (...) cân bằng
+    DECLARATION_DIRECTIVES_PATTERN = re.compile(r'@(?:let|const|useState|fetch)\s*\(')
+    SUBSCRIBE_DIRECTIVE_PATTERN = re.compile(r'@subscribe\s*\(', re.IGNORECASE)
+    
+    def _remove_balanced_directives(self, blade_code, pattern):
+        """Remove every pattern match together with its balanced parentheses
+        
+        One forward scan: spans are collected left to right and the result is joined once.
+        Unbalanced parentheses remove the rest of the template, as before.
+        """
+        pieces = []
+        pos = 0
+        while True:
+            match = pattern.search(blade_code, pos)
+            if not match:
+                break
+            _, end_pos = extract_balanced_parentheses(blade_code, match.end() - 1)
+            pieces.append(blade_code[pos:match.start()])
+            pos = end_pos
+        
+        if not pieces:
+            return blade_code
+        pieces.append(blade_code[pos:])
+        return ''.join(pieces)
+    
+    # List of event types to check - comprehensive DOM events
+    EVENT_TYPES = (
+        # Mouse Events
+        'click', 'dblclick', 'mousedown', 'mouseup', 'mouseover', 'mouseout', 'mousemove', 
+        'mouseenter', 'mouseleave', 'wheel', 'auxclick',
+        
+        # Keyboard Events
+        'keydown', 'keyup', 'keypress',
+        
+        # Form Events
+        'input', 'change', 'submit', 'reset', 'invalid', 'search',
+        
+        # Focus Events
+        'focus', 'blur', 'focusin', 'focusout',
+        
+        # Selection Events
+        'select', 'selectstart', 'selectionchange',
+        
+        # Touch Events
+        'touchstart', 'touchmove', 'touchend', 'touchcancel',
+        
+        # Drag & Drop Events
+        'dragstart', 'drag', 'dragend', 'dragenter', 'dragleave', 'dragover', 'drop',
+        
+        # Media Events
+        'play', 'pause', 'ended', 'loadstart', 'loadeddata', 'loadedmetadata', 'canplay',
+        'canplaythrough', 'waiting', 'seeking', 'seeked', 'ratechange', 'durationchange',
+        'volumechange', 'suspend', 'stalled', 'progress', 'emptied', 'encrypted', 'wakeup',
+        
+        # Window Events
+        'load', 'unload', 'beforeunload', 'resize', 'scroll', 'orientationchange',
+        'visibilitychange', 'pagehide', 'pageshow', 'popstate', 'hashchange', 'online', 'offline',
+        
+        # Document Events
+        'DOMContentLoaded', 'readystatechange',
+        
+        # Error Events
+        'error', 'abort',
+        
+        # Context Menu
+        'contextmenu',
+        
+        # Animation Events
+        'animationstart', 'animationend', 'animationiteration',
+        
+        # Transition Events
+        'transitionstart', 'transitionend', 'transitionrun', 'transitioncancel',
+        
+        # Pointer Events (Modern browsers)
+        'pointerdown', 'pointerup', 'pointermove', 'pointerover', 'pointerout',
+        'pointerenter', 'pointerleave', 'pointercancel', 'gotpointercapture', 'lostpointercapture',
+        
+        # Fullscreen Events
+        'fullscreenchange', 'fullscreenerror',
+        
+        # Clipboard Events
+        'copy', 'cut', 'paste',
+        
+        # Gamepad Events
+        'gamepadconnected', 'gamepaddisconnected',
+        
+        # Battery Events
+        'batterychargingchange', 'batterylevelchange',
+        
+        # Device Orientation Events
+        'deviceorientation', 'devicemotion', 'devicelight', 'deviceproximity',
+        
+        # WebGL Events
+        'webglcontextlost', 'webglcontextrestored'
+    )
+    # Một lần quét tìm mọi loại event có trong dòng
+    EVENT_DIRECTIVE_PATTERN = re.compile(r'@(' + '|'.join(EVENT_TYPES) + r')\s*\(', re.IGNORECASE)
+    
+    INCOMPLETE_EVENT_TYPES = (
+        'click', 'change', 'submit', 'focus', 'blur', 'input', 'keydown', 'keyup', 'keypress',
+        'mousedown', 'mouseup', 'mouseover', 'mouseout', 'mousemove', 'mouseenter', 'mouseleave',
+        'dblclick', 'contextmenu', 'wheel', 'scroll', 'resize', 'load', 'unload', 'beforeunload',
+        'error', 'abort', 'select', 'selectstart', 'selectionchange'
+    )
+    INCOMPLETE_EVENT_PATTERN = re.compile(r'@(?:' + '|'.join(INCOMPLETE_EVENT_TYPES) + r')\s*\(', re.IGNORECASE)
+    
     def _process_event_directives(self, line):
         """Process event directives (@click, @change, @submit, etc.)"""
-        # List of event types to check - comprehensive DOM events
-        event_types = [
-            # Mouse Events
-            'click', 'dblclick', 'mousedown', 'mouseup', 'mouseover', 'mouseout', 'mousemove', 
-            'mouseenter', 'mouseleave', 'wheel', 'auxclick',
-            
-            # Keyboard Events
-            'keydown', 'keyup', 'keypress',
-            
-            # Form Events
-            'input', 'change', 'submit', 'reset', 'invalid', 'search',
-            
-            # Focus Events
-            'focus', 'blur', 'focusin', 'focusout',
-            
-            # Selection Events
-            'select', 'selectstart', 'selectionchange',
-            
-            # Touch Events
-            'touchstart', 'touchmove', 'touchend', 'touchcancel',
-            
-            # Drag & Drop Events
-            'dragstart', 'drag', 'dragend', 'dragenter', 'dragleave', 'dragover', 'drop',
-            
-            # Media Events
-            'play', 'pause', 'ended', 'loadstart', 'loadeddata', 'loadedmetadata', 'canplay',
-            'canplaythrough', 'waiting', 'seeking', 'seeked', 'ratechange', 'durationchange',
-            'volumechange', 'suspend', 'stalled', 'progress', 'emptied', 'encrypted', 'wakeup',
-            
-            # Window Events
-            'load', 'unload', 'beforeunload', 'resize', 'scroll', 'orientationchange',
-            'visibilitychange', 'pagehide', 'pageshow', 'popstate', 'hashchange', 'online', 'offline',
-            
-            # Document Events
-            'DOMContentLoaded', 'readystatechange',
-            
-            # Error Events
-            'error', 'abort',
-            
-            # Context Menu
-            'contextmenu',
-            
-            # Animation Events
-            'animationstart', 'animationend', 'animationiteration',
-            
-            # Transition Events
-            'transitionstart', 'transitionend', 'transitionrun', 'transitioncancel',
-            
-            # Pointer Events (Modern browsers)
-            'pointerdown', 'pointerup', 'pointermove', 'pointerover', 'pointerout',
-            'pointerenter', 'pointerleave', 'pointercancel', 'gotpointercapture', 'lostpointercapture',
-            
-            # Fullscreen Events
-            'fullscreenchange', 'fullscreenerror',
-            
-            # Clipboard Events
-            'copy', 'cut', 'paste',
-            
-            # Gamepad Events
-            'gamepadconnected', 'gamepaddisconnected',
-            
-            # Battery Events
-            'batterychargingchange', 'batterylevelchange',
-            
-            # Device Orientation Events
-            'deviceorientation', 'devicemotion', 'devicelight', 'deviceproximity',
-            
-            # WebGL Events
-            'webglcontextlost', 'webglcontextrestored'
-        ]
+        if '@' not in line:
+            return None
+        present = {match.group(1).lower() for match in self.EVENT_DIRECTIVE_PATTERN.finditer(line)}
+        if not present:
+            return None
         
         result = line
         changed = False
         
-        # Process all event directives in the line
-        for event_type in event_types:
+        # Process all event directives in the line, in EVENT_TYPES order
+        for event_type in self.EVENT_TYPES:
+            if event_type.lower() not in present:
+                continue
             # Check for @eventType(...) pattern with balanced parentheses
             pattern = rf'@{event_type}\s*\('
             match = re.search(pattern, result, re.IGNORECASE)
@@ -399,37 +394,33 @@ class TemplateProcessor:
     
     def _is_incomplete_event_directive(self, line):
         """Check if line contains an incomplete event directive"""
-        event_types = [
-            'click', 'change', 'submit', 'focus', 'blur', 'input', 'keydown', 'keyup', 'keypress',
-            'mousedown', 'mouseup', 'mouseover', 'mouseout', 'mousemove', 'mouseenter', 'mouseleave',
-            'dblclick', 'contextmenu', 'wheel', 'scroll', 'resize', 'load', 'unload', 'beforeunload',
-            'error', 'abort', 'select', 'selectstart', 'selectionchange'
-        ]
+        if '@' not in line:
+            return False
         
-        for event_type in event_types:
-            pattern = rf'@{event_type}\s*\('
-            if re.search(pattern, line, re.IGNORECASE):
-                # Check if parentheses are balanced
-                paren_count = 0
+        if not self.INCOMPLETE_EVENT_PATTERN.search(line):
+            return False
+        
+        # Check if parentheses are balanced
+        paren_count = 0
+        in_quotes = False
+        quote_char = ''
+        
+        for char in line:
+            if (char == '"' or char == "'") and not in_quotes:
+                in_quotes = True
+                quote_char = char
+            elif char == quote_char and in_quotes:
                 in_quotes = False
                 quote_char = ''
-                
-                for char in line:
-                    if (char == '"' or char == "'") and not in_quotes:
-                        in_quotes = True
-                        quote_char = char
-                    elif char == quote_char and in_quotes:
-                        in_quotes = False
-                        quote_char = ''
-                    elif not in_quotes:
-                        if char == '(':
-                            paren_count += 1
-                        elif char == ')':
-                            paren_count -= 1
-                
-                # If parentheses are not balanced, it's incomplete
-                if paren_count > 0:
-                    return True
+            elif not in_quotes:
+                if char == '(':
+                    paren_count += 1
+                elif char == ')':
+                    paren_count -= 1
+        
+        # If parentheses are not balanced, it's incomplete
+        if paren_count > 0:
+            return True
         
         return False
     
@@ -499,289 +490,219 @@ class TemplateProcessor:
         
         return None
     
+    # Directive tùy biến đăng ký qua register_directive(), dùng chung cho mọi instance
+    _custom_directives = {}
+    
+    LEADING_DIRECTIVE_PATTERN = re.compile(r'@(\w+)')
+    
+    @classmethod
+    def register_directive(cls, name, handler):
+        """Register a handler for @name lines
+        
+        handler(line, stack, output, sections) returns the JS fragment to append,
+        True when it handled the line itself (e.g. pushed a node), or a falsy value
+        to let the built-in directives and content processing handle the line.
+        Custom directives match the exact name and are tried before built-in ones.
+        """
+        cls._custom_directives[name.lstrip('@')] = handler
+    
+    @classmethod
+    def unregister_directive(cls, name):
+        cls._custom_directives.pop(name.lstrip('@'), None)
+    
+    def _build_directive_table(self):
+        """Built-in directives in the order the old if-chain checked them
+        
+        Each entry is (prefix, handler, final): a line matches when its directive name
+        starts with prefix (same as line.startswith('@' + prefix) before); a final
+        handler ends the lookup even when it returns a falsy value.
+        """
+        tp = self.template_processors
+        dp = self.directive_processors
+        sh = self.section_handlers
+        ch = self.conditional_handlers
+        lh = self.loop_handlers
+        
+        def line_only(method):
+            return lambda line, stack, output, sections: method(line)
+        
+        def with_stack(method):
+            return lambda line, stack, output, sections: method(line, stack, output)
+        
+        def stack_only(method):
+            return lambda line, stack, output, sections: method(stack, output)
+        
+        def outside_loops(handler):
+            # @php/@endphp trong @for/@while được xử lý như content của vòng lặp
+            def handle(line, stack, output, sections):
+                if innermost_kind(stack) in ('for', 'while'):
+                    return None
+                return handler(line, stack, output, sections)
+            return handle
+        
+        table = []
+        for alias in ('serverside', 'serverSide', 'ssr', 'SSR', 'useSSR', 'useSsr'):
+            table.append((alias, line_only(tp.process_serverside_directive), False))
+        for alias in ('clientside', 'clientSide', 'csr', 'CSR', 'useCSR', 'useCsr'):
+            table.append((alias, line_only(tp.process_clientside_directive), False))
+        table += [
+            ('auth', line_only(dp.process_auth_directive), False),
+            ('guest', line_only(dp.process_auth_directive), False),
+            ('endauth', line_only(dp.process_endauth_directive), False),
+            ('endguest', line_only(dp.process_endauth_directive), False),
+            ('can', line_only(dp.process_can_directive), False),
+            ('endcan', line_only(dp.process_endcan_directive), False),
+            ('csrf', line_only(dp.process_csrf_directive), False),
+            ('method', line_only(dp.process_method_directive), False),
+            ('error', line_only(dp.process_error_directive), False),
+            ('enderror', line_only(dp.process_enderror_directive), False),
+            ('hasSection', line_only(dp.process_hassection_directive), False),
+            ('endhassection', line_only(dp.process_endhassection_directive), False),
+            ('empty', with_stack(dp.process_empty_directive), False),
+            ('isset', with_stack(dp.process_isset_directive), False),
+            ('unless', line_only(dp.process_unless_directive), False),
+            ('endunless', line_only(dp.process_endunless_directive), False),
+            ('endempty', stack_only(dp.process_endempty_directive), False),
+            ('endisset', stack_only(dp.process_endisset_directive), False),
+            ('php', outside_loops(with_stack(dp.process_php_directive)), False),
+            ('endphp', outside_loops(stack_only(dp.process_endphp_directive)), False),
+            ('json', line_only(dp.process_json_directive), False),
+            ('lang', line_only(dp.process_lang_directive), False),
+            ('choice', line_only(dp.process_choice_directive), False),
+            ('section', sh.process_section_directive, True),
+            ('endsection', lambda line, stack, output, sections: sh.process_endsection_directive(stack, output, sections), True),
+            ('block', sh.process_block_directive, True),
+            ('endblock', lambda line, stack, output, sections: sh.process_endblock_directive(stack, output, sections), True),
+            ('endBlock', lambda line, stack, output, sections: sh.process_endblock_directive(stack, output, sections), True),
+            ('if', with_stack(ch.process_if_directive), True),
+            ('elseif', with_stack(ch.process_elseif_directive), True),
+            ('else', with_stack(ch.process_else_directive), True),
+            ('endif', stack_only(ch.process_endif_directive), True),
+            ('foreach', with_stack(lh.process_foreach_directive), True),
+            ('endforeach', stack_only(lh.process_endforeach_directive), True),
+            ('for', with_stack(lh.process_for_directive), True),
+            ('endfor', stack_only(lh.process_endfor_directive), True),
+            ('while', with_stack(lh.process_while_directive), True),
+            ('endwhile', stack_only(lh.process_endwhile_directive), True),
+            ('switch', with_stack(ch.process_switch_directive), True),
+            ('case', with_stack(ch.process_case_directive), True),
+            ('default', with_stack(ch.process_default_directive), True),
+            ('break', with_stack(ch.process_break_directive), True),
+            ('endswitch', stack_only(ch.process_endswitch_directive), True),
+        ]
+        # @setup và @script là alias của @register; process_register_directive chỉ nhận '@register'
+        for alias in ('register', 'setup', 'script'):
+            table.append((alias, with_stack(dp.process_register_directive), False))
+        for alias in ('endregister', 'endsetup', 'endscript'):
+            table.append((alias, stack_only(dp.process_endregister_directive), False))
+        for alias in ('wrapper', 'wrap'):
+            table.append((alias, with_stack(dp.process_wrapper_directive), False))
+        for alias in ('endwrapper', 'endwrap'):
+            table.append((alias, stack_only(dp.process_endwrapper_directive), False))
+        return table
+    
+    def _directive_handlers(self, name):
+        """(handler, final) pairs for a directive name, resolved once per name"""
+        handlers = self._resolved_directives.get(name)
+        if handlers is None:
+            custom = self._custom_directives.get(name)
+            handlers = [(custom, False)] if custom else []
+            handlers += [(handler, final) for prefix, handler, final in self._directive_table
+                         if name.startswith(prefix)]
+            self._resolved_directives[name] = handlers
+        return handlers
+    
     def _process_line_directives(self, line, stack, output, sections):
         """Process Blade directives in a line"""
+        # Mọi directive đều bắt đầu bằng '@'
+        if '@' not in line:
+            return False
         
         # Handle event directives (@click, @change, @submit, etc.)
         result = self._process_event_directives(line)
         if result:
             # Process {{ $var }} after event directives
             result = self.template_processors.process_template_line(result)
-            return result
-        
-        # Handle @serverside/@serverSide
-        result = self.template_processors.process_serverside_directive(line)
-        if result:
-            return result
-        
-        # Handle @clientside
-        result = self.template_processors.process_clientside_directive(line)
-        if result:
-            return result
-        
-        # Handle @auth/@guest
-        result = self.directive_processors.process_auth_directive(line)
-        if result:
-            return result
-        
-        # Handle @endauth/@endguest
-        result = self.directive_processors.process_endauth_directive(line)
-        if result:
-            return result
-        
-        # Handle @can/@cannot
-        result = self.directive_processors.process_can_directive(line)
-        if result:
-            return result
-        
-        # Handle @endcan/@endcannot
-        result = self.directive_processors.process_endcan_directive(line)
-        if result:
-            return result
-        
-        # Handle @csrf
-        result = self.directive_processors.process_csrf_directive(line)
-        if result:
-            return result
-        
-        # Handle @method
-        result = self.directive_processors.process_method_directive(line)
-        if result:
-            return result
-        
-        # Handle @error
-        result = self.directive_processors.process_error_directive(line)
-        if result:
-            return result
-        
-        # Handle @enderror
-        result = self.directive_processors.process_enderror_directive(line)
-        if result:
-            return result
-        
-        # Handle @hasSection
-        result = self.directive_processors.process_hassection_directive(line)
-        if result:
-            return result
-        
-        # Handle @endhassection
-        result = self.directive_processors.process_endhassection_directive(line)
-        if result:
-            return result
-        
-        # Handle @empty
-        result = self.directive_processors.process_empty_directive(line, stack, output)
-        if result:
-            return result
-        
-        # Handle @isset
-        result = self.directive_processors.process_isset_directive(line, stack, output)
-        if result:
-            return result
-        
-        # Handle @unless
-        result = self.directive_processors.process_unless_directive(line)
-        if result:
-            return result
-        
-        # Handle @endunless
-        result = self.directive_processors.process_endunless_directive(line)
-        if result:
-            return result
-        
-        # Handle @endempty
-        if line.startswith('@endempty'):
-            result = self.directive_processors.process_endempty_directive(stack, output)
-            if result:
-                return result
-        
-        # Handle @endisset
-        if line.startswith('@endisset'):
-            result = self.directive_processors.process_endisset_directive(stack, output)
-            if result:
-                return result
-        
-        # Handle @php
-        if line.startswith('@php'):
-            # Check if we're inside a loop
-            if stack and stack[-1][0] in ['for', 'while']:
-                # For @php inside loops, don't process as directive, let it be handled as content
-                pass
-            else:
-                result = self.directive_processors.process_php_directive(line, stack, output)
-                if result:
-                    return result
-        
-        # Handle @endphp
-        if line.startswith('@endphp'):
-            # Check if we're inside a loop
-            if stack and stack[-1][0] in ['for', 'while']:
-                # For @endphp inside loops, don't process as directive, let it be handled as content
-                pass
-            else:
-                result = self.directive_processors.process_endphp_directive(stack, output)
-                if result:
-                    return result
-        
-        # Handle @json
-        result = self.directive_processors.process_json_directive(line)
-        if result:
-            return result
-        
-        # Handle @lang
-        result = self.directive_processors.process_lang_directive(line)
-        if result:
-            return result
-        
-        # Handle @choice
-        result = self.directive_processors.process_choice_directive(line)
-        if result:
-            return result
-        
-        # Handle @section
-        if line.startswith('@section'):
-            return self.section_handlers.process_section_directive(line, stack, output, sections)
-        
-        if line.startswith('@endsection'):
-            return self.section_handlers.process_endsection_directive(stack, output, sections)
-        
-        # Handle @block
-        if line.startswith('@block'):
-            return self.section_handlers.process_block_directive(line, stack, output, sections)
-        
-        if line.startswith('@endblock') or line.startswith('@endBlock'):
-            return self.section_handlers.process_endblock_directive(stack, output, sections)
-        
-        # Handle @if/@endif
-        if line.startswith('@if'):
-            return self.conditional_handlers.process_if_directive(line, stack, output)
-        
-        if line.startswith('@elseif'):
-            return self.conditional_handlers.process_elseif_directive(line, stack, output)
-        
-        if line.startswith('@else'):
-            return self.conditional_handlers.process_else_directive(line, stack, output)
-        
-        if line.startswith('@endif'):
-            return self.conditional_handlers.process_endif_directive(stack, output)
-        
-        # Handle @foreach
-        if line.startswith('@foreach'):
-            return self.loop_handlers.process_foreach_directive(line, stack, output)
-        
-        if line.startswith('@endforeach'):
-            return self.loop_handlers.process_endforeach_directive(stack, output)
-        
-        # Handle @for
-        if line.startswith('@for'):
-            return self.loop_handlers.process_for_directive(line, stack, output)
-        
-        if line.startswith('@endfor'):
-            return self.loop_handlers.process_endfor_directive(stack, output)
-        
-        # Handle @while
-        if line.startswith('@while'):
-            return self.loop_handlers.process_while_directive(line, stack, output)
-        
-        if line.startswith('@endwhile'):
-            return self.loop_handlers.process_endwhile_directive(stack, output)
-        
-        # Handle @switch
-        if line.startswith('@switch'):
-            return self.conditional_handlers.process_switch_directive(line, stack, output)
-        
-        if line.startswith('@case'):
-            return self.conditional_handlers.process_case_directive(line, stack, output)
-        
-        if line.startswith('@default'):
-            return self.conditional_handlers.process_default_directive(line, stack, output)
-        
-        if line.startswith('@break'):
-            return self.conditional_handlers.process_break_directive(line, stack, output)
-        
-        if line.startswith('@endswitch'):
-            return self.conditional_handlers.process_endswitch_directive(stack, output)
-        
-        # Handle @register
-        if line.startswith('@register'):
-            result = self.directive_processors.process_register_directive(line, stack, output)
-            if result:
-                return result
-        
-        # Handle @endregister
-        if line.startswith('@endregister'):
-            result = self.directive_processors.process_endregister_directive(stack, output)
-            if result:
-                return result
-                
-        # Handle @setup (alias của @register)
-        if line.startswith('@setup'):
-            result = self.directive_processors.process_register_directive(line, stack, output)
-            if result:
-                return result
-        
-        # Handle @endsetup (alias của @endregister)
-        if line.startswith('@endsetup'):
-            result = self.directive_processors.process_endregister_directive(stack, output)
-            if result:
-                return result
-                
-        # Handle @script (xử lý như @register)
-        if line.startswith('@script'):
-            result = self.directive_processors.process_register_directive(line, stack, output)
-            if result:
-                return result
-        
-        # Handle @endscript (xử lý như @endregister)  
-        if line.startswith('@endscript'):
-            result = self.directive_processors.process_endregister_directive(stack, output)
-            if result:
-                return result
-        
-        # Handle @wrapper and @wrap
-        if line.startswith('@wrapper') or line.startswith('@wrap'):
-            result = self.directive_processors.process_wrapper_directive(line, stack, output)
-            if result:
-                return result
-        
-        # Handle @endwrapper and @endwrap
-        if line.startswith('@endwrapper') or line.startswith('@endwrap'):
-            result = self.directive_processors.process_endwrapper_directive(stack, output)
-            if result:
+            return EventNode(result)
+        
+        # Directive đứng đầu dòng: lấy tên một lần rồi tra bảng handler
+        match = self.LEADING_DIRECTIVE_PATTERN.match(line)
+        if not match:
+            return False
+        for handler, final in self._directive_handlers(match.group(1)):
+            result = handler(line, stack, output, sections)
+            if result or final:
                 return result
         
         return False
     
+    # Patterns cho @include có biến (multiline arrays/objects)
+    INCLUDE_PHP_VARS_PATTERN = re.compile(r'@include\s*\(\s*([^,\'"][^)]*?)\s*,\s*(\[[^\]]*\]|\{[^\}]*\}|[^)]*)\s*\)', re.MULTILINE | re.DOTALL)
+    INCLUDE_STRING_VARS_PATTERN = re.compile(r'@include\s*\(\s*[\'"]([^\'"]*)[\'"]\s*,\s*(\[[^\]]*\]|\{[^\}]*\}|[^)]*)\s*\)', re.MULTILINE | re.DOTALL)
+    
+    def _preprocess_include_variables(self, variables):
+        """Replace PHP function calls and $variables with placeholders so the array can be evaluated by PHP
+        Returns (preprocessed_expression, php_functions)
+        """
+        # Extract PHP function calls to preserve them
+        php_functions = {}
+        func_counter = 0
+        
+        def preserve_function(match):
+            nonlocal func_counter
+            placeholder = f"__FUNC_PLACEHOLDER_{func_counter}__"
+            # Convert PHP function to JavaScript with proper prefix handling
+            func_call = match.group(0)
+            from php_js_converter import php_to_js_advanced
+            func_call_js = php_to_js_advanced(func_call)  # Use advanced converter with function prefixes
+            php_functions[placeholder] = func_call_js
+            func_counter += 1
+            return f'"{placeholder}"'
+        
+        # Preprocess: replace PHP functions with placeholders (improved pattern for various args)
+        variables_preprocessed = tracing.sub(r'\b\w+\([^)]*\)', preserve_function, variables)
+        
+        # Replace remaining PHP variables with quoted versions for PHP execution
+        variables_preprocessed = tracing.sub(r'\$(\w+)', r'"__VAR_\1__"', variables_preprocessed)
+        
+        return variables_preprocessed, php_functions
+    
+    def prefetch_php_arrays(self, blade_code, blade_tokens):
+        """Convert the PHP array literals of every directive of the view in one round trip to the PHP worker
+
+        Keys are the stripped literals the directive handlers convert later (@include/@includeIf/@includeWhen
+        data, @let/@const/@useState values, ...) plus the preprocessed @include variables; results are
+        memoized by php_converter, the handlers then never wait on PHP for them.
+        """
+        from php_converter import find_php_array_literals, prefetch_php_arrays
+        
+        expressions = []
+        for token in blade_tokens.directives():
+            if token.args and '[' in token.args:
+                expressions.extend(find_php_array_literals(token.args))
+        if '@include' in blade_code:
+            for match in self.INCLUDE_STRING_VARS_PATTERN.finditer(blade_code):
+                variables = match.group(2).strip() if match.group(2) else '{}'
+                variables_preprocessed, _ = self._preprocess_include_variables(variables)
+                if '[' in variables_preprocessed:
+                    expressions.append(variables_preprocessed)
+        
+        prefetch_php_arrays(expressions)
+    
     def _process_multiline_include_directives(self, blade_code):
         """Process multiline @include directives before line-by-line processing"""
         from config import APP_VIEW_NAMESPACE
         from php_converter import convert_php_array_to_json
         
+        if '@include' not in blade_code:
+            return blade_code
+        
         # Handle @include directive with string literals and variables (multiline arrays/objects)
         def replace_include_directive(match):
             view_name = match.group(1).strip()
             variables = match.group(2).strip() if match.group(2) else '{}'
             
-            # Extract PHP function calls to preserve them
-            php_functions = {}
-            func_counter = 0
-            
-            def preserve_function(match):
-                nonlocal func_counter
-                placeholder = f"__FUNC_PLACEHOLDER_{func_counter}__"
-                # Convert PHP function to JavaScript with proper prefix handling
-                func_call = match.group(0)
-                from php_js_converter import php_to_js_advanced
-                func_call_js = php_to_js_advanced(func_call)  # Use advanced converter with function prefixes
-                php_functions[placeholder] = func_call_js
-                func_counter += 1
-                return f'"{placeholder}"'
-            
-            # Preprocess: replace PHP functions with placeholders (improved pattern for various args)
-            variables_preprocessed = re.sub(r'\b\w+\([^)]*\)', preserve_function, variables)
-            
-            # Replace remaining PHP variables with quoted versions for PHP execution
-            variables_preprocessed = re.sub(r'\$(\w+)', r'"__VAR_\1__"', variables_preprocessed)
+            variables_preprocessed, php_functions = self._preprocess_include_variables(variables)
             
             variables_js = convert_php_array_to_json(variables_preprocessed)
             
@@ -789,7 +710,7 @@ class TemplateProcessor:
             for placeholder, js_func in php_functions.items():
                 variables_js = variables_js.replace(f'"{placeholder}"', js_func)
             
-            variables_js = re.sub(r'"__VAR_(\w+)__"', r'\1', variables_js)  # Convert "__VAR_items__" back to items
+            variables_js = tracing.sub(r'"__VAR_(\w+)__"', r'\1', variables_js)  # Convert "__VAR_items__" back to items
             
             return "${" + APP_VIEW_NAMESPACE + ".renderView(this.__include('" + view_name + "', " + variables_js + "))}"
         
@@ -799,7 +720,7 @@ class TemplateProcessor:
             variables = match.group(2).strip() if match.group(2) else '{}'
             variables_js = convert_php_array_to_json(variables)
             # Remove $ prefix from variables
-            variables_js = re.sub(r'\$(\w+)', r'\1', variables_js)
+            variables_js = tracing.sub(r'\$(\w+)', r'\1', variables_js)
             # Convert PHP expression to JavaScript
             from php_converter import php_to_js
             view_expr_js = php_to_js(view_expr)
@@ -807,10 +728,10 @@ class TemplateProcessor:
         
         # Process multiline @include directives with proper patterns
         # Handle @include with PHP expressions (must be before string literal patterns)
-        blade_code = re.sub(r'@include\s*\(\s*([^,\'"][^)]*?)\s*,\s*(\[[^\]]*\]|\{[^\}]*\}|[^)]*)\s*\)', replace_include_php_directive, blade_code, flags=re.MULTILINE | re.DOTALL)
+        blade_code = tracing.sub(self.INCLUDE_PHP_VARS_PATTERN, replace_include_php_directive, blade_code)
         
         # Handle @include with string literals (multiline arrays/objects)
-        blade_code = re.sub(r'@include\s*\(\s*[\'"]([^\'"]*)[\'"]\s*,\s*(\[[^\]]*\]|\{[^\}]*\}|[^)]*)\s*\)', replace_include_directive, blade_code, flags=re.MULTILINE | re.DOTALL)
+        blade_code = tracing.sub(self.INCLUDE_STRING_VARS_PATTERN, replace_include_directive, blade_code)
         
         # Handle @include without variables
         def replace_include_no_vars_directive(match):
@@ -819,8 +740,8 @@ class TemplateProcessor:
             view_expr_js = php_to_js(view_expr)
             return "${" + APP_VIEW_NAMESPACE + ".renderView(this.__include(" + view_expr_js + "))}"
         
-        blade_code = re.sub(r'@include\s*\(\s*([^,\'"][^)]*?)\s*\)', replace_include_no_vars_directive, blade_code)
-        blade_code = re.sub(r'@include\s*\(\s*[\'"]([^\'"]*)[\'"]\s*\)', r'${' + APP_VIEW_NAMESPACE + r'.renderView(this.__include("\1", {}))}', blade_code)
+        blade_code = tracing.sub(r'@include\s*\(\s*([^,\'"][^)]*?)\s*\)', replace_include_no_vars_directive, blade_code)
+        blade_code = tracing.sub(r'@include\s*\(\s*[\'"]([^\'"]*)[\'"]\s*\)', r'${' + APP_VIEW_NAMESPACE + r'.renderView(this.__include("\1", {}))}', blade_code)
         
         return blade_code
     
@@ -844,7 +765,7 @@ class TemplateProcessor:
             return placeholder
         
         # Replace all @verbatim blocks with placeholders
-        blade_code = re.sub(verbatim_pattern, replace_verbatim_block, blade_code, flags=re.DOTALL)
+        blade_code = tracing.sub(verbatim_pattern, replace_verbatim_block, blade_code, flags=re.DOTALL)
         
         return blade_code
     
@@ -883,9 +804,9 @@ class TemplateProcessor:
             # @pageStart
             # @pageStart\n
             # @pageStart   \n
-            blade_code = re.sub(pattern + r'\s*\n?', '', blade_code, flags=re.IGNORECASE | re.MULTILINE)
+            blade_code = tracing.sub(pattern + r'\s*\n?', '', blade_code, flags=re.IGNORECASE | re.MULTILINE)
             # Also handle directive at end of line (standalone on a line)
-            blade_code = re.sub(r'^\s*' + pattern + r'\s*$', '', blade_code, flags=re.IGNORECASE | re.MULTILINE)
+            blade_code = tracing.sub(r'^\s*' + pattern + r'\s*$', '', blade_code, flags=re.IGNORECASE | re.MULTILINE)
         
         return blade_code
     
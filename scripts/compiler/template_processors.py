@@ -5,624 +5,599 @@ Processors cho template lines và các directives khác
 from config import JS_FUNCTION_PREFIX, SPA_YIELD_ATTR_PREFIX, SPA_YIELD_SUBSCRIBE_KEY_PREFIX, SPA_YIELD_SUBSCRIBE_TARGET_PREFIX, SPA_YIELD_SUBSCRIBE_ATTR_PREFIX, SPA_YIELD_CONTENT_PREFIX, SPA_YIELD_CHILDREN_PREFIX, SPA_STATECHANGE_PREFIX, APP_VIEW_NAMESPACE
 from php_converter import php_to_js, convert_php_array_to_json
 import re
+import tracing
 import json
 
 class TemplateProcessors:
     def __init__(self):
         pass
     
+    # Pattern của process_template_line, compile một lần thay vì mỗi dòng
+    YIELD_PATTERN = re.compile(r'@yield\s*\(\s*(.*?)\s*\)')
+    INCLUDE_PHP_VARS_PATTERN = re.compile(r'@include\s*\(\s*([^,\'"][^)]*?)\s*,\s*(\[[^\]]*\]|\{[^\}]*\}|[^)]*)\s*\)', re.DOTALL)
+    INCLUDE_STRING_VARS_PATTERN = re.compile(r'@include\s*\(\s*[\'"]([^\'"]*)[\'"]\s*,\s*(\[[^\]]*\]|\{[^\}]*\}|[^)]*)\s*\)', re.DOTALL)
+    INCLUDE_PHP_NO_VARS_PATTERN = re.compile(r'@include\s*\(\s*([^,\'"][^)]*?)\s*\)')
+    INCLUDE_STRING_NO_VARS_PATTERN = re.compile(r'@include\s*\(\s*[\'"]([^\'"]*)[\'"]\s*\)')
+    INCLUDEIF_2PARAMS_PATTERN = re.compile(r'@includeif\s*\(\s*([^,]+?)\s*,\s*(\[.*?\])\s*\)', re.IGNORECASE)
+    INCLUDEIF_VARS_PATTERN = re.compile(r'@includeif\s*\(\s*[\'"]([^\'"]*)[\'"]\s*,\s*(.*?)\s*\)', re.DOTALL | re.IGNORECASE)
+    INCLUDEIF_NO_VARS_PATTERN = re.compile(r'@includeif\s*\(\s*[\'"]([^\'"]*)[\'"]\s*\)', re.IGNORECASE)
+    INCLUDEWHEN_PATTERN = re.compile(r'@includewhen\s*\(\s*([^,]+?)\s*,\s*([^,]+?)\s*,\s*([^)]+?)\s*\)', re.IGNORECASE)
+    WRAP_PARAMS_PATTERN = re.compile(r'@(?:wrap|wrapper)\s*\(\s*([^)]*?)\s*\)', re.IGNORECASE)
+    WRAP_NO_PARAMS_PATTERN = re.compile(r'@(?:wrap|wrapper)(?:\s*\(\s*\))?\s*$', re.IGNORECASE)
+    ENDWRAP_PATTERN = re.compile(r'@end(?:wrap|wrapper)(?:\s*\(\s*\))?\s*$', re.IGNORECASE)
+    TEMPLATE_PARAMS_PATTERN = re.compile(r'@template\s*\(([^)]*)\)', re.IGNORECASE | re.DOTALL)
+    TEMPLATE_NO_PARAMS_PATTERN = re.compile(r'@template(?:\s*\(\s*\))?\s*$', re.IGNORECASE)
+    ENDTEMPLATE_PATTERN = re.compile(r'@endtemplate(?:\s*\(\s*\))?\s*$', re.IGNORECASE)
+    YIELDON_ARRAY_PATTERN = re.compile(r'@(?:yieldon|onyield|yieldlisten|yieldwatch)\s*\(\s*\[([^\[\]]*(?:\[[^\[\]]*\][^\[\]]*)*)\]\s*\)', re.DOTALL | re.IGNORECASE)
+    YIELDON_PATTERN = re.compile(r'@(?:yieldon|onyield|yieldlisten|yieldwatch)\s*\(\s*[\'"]([^\'"]*)[\'"]\s*,\s*[\'"]([^\'"]*)[\'"]\s*(?:,\s*[\'"]([^\'"]*)[\'"])?\s*\)', re.IGNORECASE)
+    YIELDATTR_PATTERN = re.compile(r'@yieldattr\s*\(\s*[\'"]([^\'"]*)[\'"]\s*,\s*[\'"]([^\'"]*)[\'"]\s*(?:,\s*[\'"]([^\'"]*)[\'"])?\s*\)', re.IGNORECASE)
+    SUBSCRIBE_PATTERN = re.compile(r'@subscribe\s*\([^)]*\)', re.IGNORECASE)
+    WRAP_ATTR_PATTERN = re.compile(r'<([^>]*?)\s@(?:wrap|wrapAttr|wrapattr)\s*(?:\([^)]*\))?\s*([^>]*?)>', re.IGNORECASE)
+    YIELD_ATTR_ATTRIBUTE_PATTERN = re.compile(r'on-yield-attr="([^"]*)"')
+    UNESCAPED_ECHO_PATTERN = re.compile(r'{\!!\s*(.*?)\s*!!}')
+    ECHO_PATTERN = re.compile(r'{{\s*(.*?)\s*}}')
+    SIMPLE_VAR_PATTERN = re.compile(r'{\s*\$(\w+)\s*}')
+    PHP_VARIABLE_ECHO_PATTERN = re.compile(r'\{\{\s*\$(\w+)\s*\}\}')
+    USESTATE_PATTERN = re.compile(r'@useState\s*\([^)]*\)', re.IGNORECASE)
+    
+    # Một lần quét tìm các directive inline có trong dòng; tên dài đứng trước tên là prefix của nó
+    INLINE_DIRECTIVE_PATTERN = re.compile(
+        r'@(yieldon|onyield|yieldlisten|yieldwatch|yieldattr|yield|includeif|includewhen|include'
+        r'|endwrap|endtemplate|wrap|template|subscribe|viewid|usestate)', re.IGNORECASE)
+    
     def process_template_line(self, line):
-        """Process a regular template line"""
+        """Process a regular template line
+        
+        Các bước chạy theo thứ tự cũ, nhưng chỉ những bước có directive/echo xuất hiện trong dòng.
+        """
+        # Dòng HTML thuần: không directive, không echo, không on-yield-attr cần gộp
+        if '@' not in line and '{' not in line and 'on-yield-attr' not in line:
+            return line
+        
         processed_line = line
+        directives = set()
+        if '@' in line:
+            directives = {name.lower() for name in self.INLINE_DIRECTIVE_PATTERN.findall(line)}
         
         # Handle @yield directive in HTML content
-        def replace_yield_directive(match):
-            yield_content = match.group(1).strip()
-            dollar_char = '$'
-            yield_content_js = php_to_js(yield_content) if yield_content.startswith(dollar_char) else yield_content
-            return "${" + JS_FUNCTION_PREFIX + ".yield(" + yield_content_js + ")}"
-        
-        processed_line = re.sub(r'@yield\s*\(\s*(.*?)\s*\)', replace_yield_directive, processed_line)
-        
-        # Handle @include directive
-        def replace_include_directive(match):
-            view_name = match.group(1).strip()
-            variables = match.group(2).strip() if match.group(2) else '{}'
-            variables_js = convert_php_array_to_json(variables)
-            # Remove $ prefix from variables
-            variables_js = re.sub(r'\$(\w+)', r'\1', variables_js)
-            return "${" + APP_VIEW_NAMESPACE + ".renderView(this.__include('" + view_name + "', " + variables_js + "))}"
-        
-        # Handle @include directive with PHP expressions (like $temp.'.ga-js')
-        def replace_include_php_directive(match):
-            view_expr = match.group(1).strip()
-            variables = match.group(2).strip() if match.group(2) else '{}'
-            variables_js = convert_php_array_to_json(variables)
-            # Remove $ prefix from variables
-            variables_js = re.sub(r'\$(\w+)', r'\1', variables_js)
-            # Convert PHP expression to JavaScript
-            view_expr_js = php_to_js(view_expr)
-            return "${" + APP_VIEW_NAMESPACE + ".renderView(this.__include(" + view_expr_js + ", " + variables_js + "))}"
-        
-        # Handle @include directive with PHP expressions and variables (improved for multiline)
-        processed_line = re.sub(r'@include\s*\(\s*([^,\'"][^)]*?)\s*,\s*(\[[^\]]*\]|\{[^\}]*\}|[^)]*)\s*\)', replace_include_php_directive, processed_line, flags=re.DOTALL)
-        
-        # Handle @include directive with string literals and variables (improved for multiline arrays/objects)
-        processed_line = re.sub(r'@include\s*\(\s*[\'"]([^\'"]*)[\'"]\s*,\s*(\[[^\]]*\]|\{[^\}]*\}|[^)]*)\s*\)', replace_include_directive, processed_line, flags=re.DOTALL)
-        
-        # Handle @include directive with PHP expressions without variables
-        def replace_include_php_no_vars_directive(match):
-            view_expr = match.group(1).strip()
-            view_expr_js = php_to_js(view_expr)
-            return "${" + APP_VIEW_NAMESPACE + ".renderView(this.__include(" + view_expr_js + "))}"
-        
-        processed_line = re.sub(r'@include\s*\(\s*([^,\'"][^)]*?)\s*\)', replace_include_php_no_vars_directive, processed_line)
-        
-        # Handle @include directive with string literals without variables
-        processed_line = re.sub(r'@include\s*\(\s*[\'"]([^\'"]*)[\'"]\s*\)', r'${' + APP_VIEW_NAMESPACE + r'.renderView(this.__include("\1", {}))}', processed_line)
-        
-        # Handle @includeif/@includeFf directive with path and data (2 parameters)
-        def replace_includeif_2params_directive(match):
-            view_path = match.group(1).strip()
-            data = match.group(2).strip()
-            
-            # Convert view path to JavaScript
-            if view_path.startswith('"') and view_path.endswith('"'):
-                view_path_js = view_path
-            elif view_path.startswith("'") and view_path.endswith("'"):
-                view_path_js = f'"{view_path[1:-1]}"'
-            else:
-                view_path_js = php_to_js(view_path)
-            
-            # Convert data to JavaScript
-            data_js = convert_php_array_to_json(data)
-            data_js = re.sub(r'\$(\w+)', r'\1', data_js)
-            
-            return "${" + APP_VIEW_NAMESPACE + ".renderView(this.__includeif(" + view_path_js + ", " + data_js + "))}"
-        
-        # Handle @includeif directive with variables
-        def replace_includeif_directive(match):
-            view_name = match.group(1).strip()
-            variables = match.group(2).strip() if match.group(2) else '{}'
-            variables_js = convert_php_array_to_json(variables)
-            # Remove $ prefix from variables
-            variables_js = re.sub(r'\$(\w+)', r'\1', variables_js)
-            return "${" + APP_VIEW_NAMESPACE + ".renderView(this.__includeif('" + view_name + "', " + variables_js + "))}"
-        
-        # Handle @includeif with PHP expressions (must be before string literal patterns)
-        processed_line = re.sub(r'@includeif\s*\(\s*([^,]+?)\s*,\s*(\[.*?\])\s*\)', replace_includeif_2params_directive, processed_line, flags=re.IGNORECASE)
-        
-        processed_line = re.sub(r'@includeif\s*\(\s*[\'"]([^\'"]*)[\'"]\s*,\s*(.*?)\s*\)', replace_includeif_directive, processed_line, flags=re.DOTALL | re.IGNORECASE)
-        
-        # Handle @includeIf directive without variables (case insensitive)
-        processed_line = re.sub(r'@includeif\s*\(\s*[\'"]([^\'"]*)[\'"]\s*\)', r'${' + APP_VIEW_NAMESPACE + r'.renderView(this.__includeif("\1", {}))}', processed_line, flags=re.IGNORECASE)
-        
-        # Handle @includeWhen/@includewhen directive with condition, path, and data
-        def replace_includewhen_directive(match):
-            condition = match.group(1).strip()
-            view_path = match.group(2).strip()
-            data = match.group(3).strip() if match.group(3) else '{}'
-            
-            # Convert condition to JavaScript
-            condition_js = php_to_js(condition)
-            
-            # Convert view path to JavaScript
-            if view_path.startswith('"') and view_path.endswith('"'):
-                view_path_js = view_path
-            elif view_path.startswith("'") and view_path.endswith("'"):
-                view_path_js = f'"{view_path[1:-1]}"'
-            else:
-                view_path_js = php_to_js(view_path)
-            
-            # Convert data to JavaScript
-            data_js = convert_php_array_to_json(data)
-            data_js = re.sub(r'\$(\w+)', r'\1', data_js)
-            
-            return "${" + APP_VIEW_NAMESPACE + ".renderView(this.__includewhen(" + condition_js + ", " + view_path_js + ", " + data_js + "))}"
+        if 'yield' in directives:
+            processed_line = tracing.sub(self.YIELD_PATTERN, self._replace_yield_directive, processed_line)
+        
+        if 'include' in directives:
+            # Handle @include directive with PHP expressions and variables (improved for multiline)
+            processed_line = tracing.sub(self.INCLUDE_PHP_VARS_PATTERN, self._replace_include_php_directive, processed_line)
+            # Handle @include directive with string literals and variables (improved for multiline arrays/objects)
+            processed_line = tracing.sub(self.INCLUDE_STRING_VARS_PATTERN, self._replace_include_directive, processed_line)
+            # Handle @include directive with PHP expressions without variables
+            processed_line = tracing.sub(self.INCLUDE_PHP_NO_VARS_PATTERN, self._replace_include_php_no_vars_directive, processed_line)
+            # Handle @include directive with string literals without variables
+            processed_line = tracing.sub(self.INCLUDE_STRING_NO_VARS_PATTERN, r'${' + APP_VIEW_NAMESPACE + r'.renderView(this.__include("\1", {}))}', processed_line)
+        
+        if 'includeif' in directives:
+            # Handle @includeif with PHP expressions (must be before string literal patterns)
+            processed_line = tracing.sub(self.INCLUDEIF_2PARAMS_PATTERN, self._replace_includeif_2params_directive, processed_line)
+            processed_line = tracing.sub(self.INCLUDEIF_VARS_PATTERN, self._replace_includeif_directive, processed_line)
+            # Handle @includeIf directive without variables (case insensitive)
+            processed_line = tracing.sub(self.INCLUDEIF_NO_VARS_PATTERN, r'${' + APP_VIEW_NAMESPACE + r'.renderView(this.__includeif("\1", {}))}', processed_line)
         
         # Handle @includeWhen/@includewhen with 3 parameters
-        processed_line = re.sub(r'@includewhen\s*\(\s*([^,]+?)\s*,\s*([^,]+?)\s*,\s*([^)]+?)\s*\)', replace_includewhen_directive, processed_line, flags=re.IGNORECASE)
+        if 'includewhen' in directives:
+            processed_line = tracing.sub(self.INCLUDEWHEN_PATTERN, self._replace_includewhen_directive, processed_line)
         
-        # Handle @wrap/@wrapper directive
-        def replace_wrap_directive(match):
-            expression = match.group(1).strip() if match.group(1) else ''
-            
-            # Case 1: @wrap() or @wrap (no parameters)
-            if not expression:
-                return '__WRAPPER_CONFIG__ = { enable: true };'
-            
-            # Parse expression to determine case
-            if expression.startswith('[') and expression.endswith(']'):
-                # Case 3: @wrap($attributes)
-                attributes = self._parse_wrap_attributes(expression)
-                return self._generate_wrapper_config(attributes)
-            else:
-                # Case 2: @wrap($tag, $attributes)
-                parts = self._parse_wrap_expression(expression)
-                tag = parts['tag']
-                attributes = parts['attributes']
-                return self._generate_wrapper_config(attributes, tag)
+        if 'wrap' in directives:
+            # Handle @wrap/@wrapper with parameters
+            processed_line = tracing.sub(self.WRAP_PARAMS_PATTERN, self._replace_wrap_directive, processed_line)
+            # Handle @wrap/@wrapper without parameters
+            processed_line = tracing.sub(self.WRAP_NO_PARAMS_PATTERN, '__WRAPPER_CONFIG__ = { enable: true };', processed_line)
         
-        # Handle @wrap/@wrapper with parameters
-        processed_line = re.sub(r'@(?:wrap|wrapper)\s*\(\s*([^)]*?)\s*\)', replace_wrap_directive, processed_line, flags=re.IGNORECASE)
+        # Handle @endWrap/@endWrapper - keep as marker
+        if 'endwrap' in directives:
+            processed_line = tracing.sub(self.ENDWRAP_PATTERN, '__WRAPPER_END__', processed_line)
         
-        # Handle @wrap/@wrapper without parameters
-        processed_line = re.sub(r'@(?:wrap|wrapper)(?:\s*\(\s*\))?\s*$', '__WRAPPER_CONFIG__ = { enable: true };', processed_line, flags=re.IGNORECASE)
+        if 'template' in directives:
+            # Handle @template with parameters (multiline support)
+            processed_line = tracing.sub(self.TEMPLATE_PARAMS_PATTERN, self._replace_template_directive, processed_line)
+            # Handle @template without parameters
+            processed_line = tracing.sub(self.TEMPLATE_NO_PARAMS_PATTERN, '__WRAPPER_CONFIG__ = { enable: true };', processed_line)
         
-        # Handle @endWrap/@endWrapper - keep as marker
-        processed_line = re.sub(r'@end(?:wrap|wrapper)(?:\s*\(\s*\))?\s*$', '__WRAPPER_END__', processed_line, flags=re.IGNORECASE)
+        # Handle @endtemplate - keep as marker
+        if 'endtemplate' in directives:
+            processed_line = tracing.sub(self.ENDTEMPLATE_PATTERN, '__WRAPPER_END__', processed_line)
         
-        # Handle @template directive - alias of @wrap with enhanced parameter syntax
-        def replace_template_directive(match):
-            expression = match.group(1).strip() if match.group(1) else ''
-            
-            if not expression:
-                return '__WRAPPER_CONFIG__ = { enable: true };'
-            
-            # Parse template parameters and convert to wrapper format
-            attributes = self._parse_template_parameters(expression)
-            tag = attributes.pop('tag', None)
-            
-            # Process subscribe parameter specially
-            if 'subscribe' in attributes:
-                subscribe_value = attributes['subscribe']
-                attributes['subscribe'] = self._process_subscribe_value(subscribe_value)
+        # Handle @yieldon/@onyield/@yieldListen/@yieldWatch directive (array syntax first, then simple syntax)
+        if directives & {'yieldon', 'onyield', 'yieldlisten', 'yieldwatch'}:
+            processed_line = tracing.sub(self.YIELDON_ARRAY_PATTERN, self._replace_yieldon_array_directive, processed_line)
+            processed_line = tracing.sub(self.YIELDON_PATTERN, self._replace_yieldon_directive, processed_line)
+        
+        # Handle @yieldAttr directive - process after @yieldon to avoid conflicts
+        if 'yieldattr' in directives:
+            processed_line = self._process_multiple_yieldattr(processed_line)
+        
+        # Handle @subscribe directive
+        if 'subscribe' in directives:
+            processed_line = tracing.sub(self.SUBSCRIBE_PATTERN, self._replace_subscribe_directive, processed_line)
+        
+        # Only match @wrap directives that are in HTML tag attributes (not in text content)
+        # Look for patterns like: <tag @wrap class="..."> or <tag @wrap>
+        if 'wrap' in directives:
+            processed_line = tracing.sub(self.WRAP_ATTR_PATTERN, r'<\1 \2 ${this.wrapattr()}>', processed_line)
+        
+        # Merge multiple on-yield-attr attributes into one
+        if 'on-yield-attr="' in processed_line:
+            processed_line = self._merge_yield_attr_attributes(processed_line)
+        
+        # Handle @viewId directive
+        if 'viewid' in directives:
+            processed_line = processed_line.replace('@viewId', "${" + JS_FUNCTION_PREFIX + ".generateViewId()}")
+        
+        # Handle {!! ... !!} (unescaped output)
+        if '{!!' in processed_line:
+            processed_line = tracing.sub(self.UNESCAPED_ECHO_PATTERN, self._replace_unescaped, processed_line)
+        
+        # Handle {{ ... }} (escaped output)
+        if '{{' in processed_line:
+            processed_line = tracing.sub(self.ECHO_PATTERN, self._replace_echo, processed_line)
+        
+        # Handle { ... } (simple variable output)
+        if '{' in processed_line and '$' in processed_line:
+            processed_line = tracing.sub(self.SIMPLE_VAR_PATTERN, self._replace_simple_var, processed_line)
             
+            # Handle {{ $var }} syntax - convert to ${App.View.escString(var)}
+            processed_line = tracing.sub(self.PHP_VARIABLE_ECHO_PATTERN, self._replace_php_variable, processed_line)
+        
+        # Handle @useState directive - remove from template (already processed in main_compiler.py)
+        if 'usestate' in directives:
+            processed_line = tracing.sub(self.USESTATE_PATTERN, '', processed_line)
+        
+        return processed_line
+    
+    def _replace_yield_directive(self, match):
+        yield_content = match.group(1).strip()
+        dollar_char = '$'
+        yield_content_js = php_to_js(yield_content) if yield_content.startswith(dollar_char) else yield_content
+        return "${" + JS_FUNCTION_PREFIX + ".yield(" + yield_content_js + ")}"
+    
+    def _replace_include_directive(self, match):
+        view_name = match.group(1).strip()
+        variables = match.group(2).strip() if match.group(2) else '{}'
+        variables_js = convert_php_array_to_json(variables)
+        # Remove $ prefix from variables
+        variables_js = tracing.sub(r'\$(\w+)', r'\1', variables_js)
+        return "${" + APP_VIEW_NAMESPACE + ".renderView(this.__include('" + view_name + "', " + variables_js + "))}"
+    
+    def _replace_include_php_directive(self, match):
+        view_expr = match.group(1).strip()
+        variables = match.group(2).strip() if match.group(2) else '{}'
+        variables_js = convert_php_array_to_json(variables)
+        # Remove $ prefix from variables
+        variables_js = tracing.sub(r'\$(\w+)', r'\1', variables_js)
+        # Convert PHP expression to JavaScript
+        view_expr_js = php_to_js(view_expr)
+        return "${" + APP_VIEW_NAMESPACE + ".renderView(this.__include(" + view_expr_js + ", " + variables_js + "))}"
+    
+    def _replace_include_php_no_vars_directive(self, match):
+        view_expr = match.group(1).strip()
+        view_expr_js = php_to_js(view_expr)
+        return "${" + APP_VIEW_NAMESPACE + ".renderView(this.__include(" + view_expr_js + "))}"
+    
+    def _replace_includeif_2params_directive(self, match):
+        view_path = match.group(1).strip()
+        data = match.group(2).strip()
+        
+        # Convert view path to JavaScript
+        if view_path.startswith('"') and view_path.endswith('"'):
+            view_path_js = view_path
+        elif view_path.startswith("'") and view_path.endswith("'"):
+            view_path_js = f'"{view_path[1:-1]}"'
+        else:
+            view_path_js = php_to_js(view_path)
+        
+        # Convert data to JavaScript
+        data_js = convert_php_array_to_json(data)
+        data_js = tracing.sub(r'\$(\w+)', r'\1', data_js)
+        
+        return "${" + APP_VIEW_NAMESPACE + ".renderView(this.__includeif(" + view_path_js + ", " + data_js + "))}"
+    
+    def _replace_includeif_directive(self, match):
+        view_name = match.group(1).strip()
+        variables = match.group(2).strip() if match.group(2) else '{}'
+        variables_js = convert_php_array_to_json(variables)
+        # Remove $ prefix from variables
+        variables_js = tracing.sub(r'\$(\w+)', r'\1', variables_js)
+        return "${" + APP_VIEW_NAMESPACE + ".renderView(this.__includeif('" + view_name + "', " + variables_js + "))}"
+    
+    def _replace_includewhen_directive(self, match):
+        condition = match.group(1).strip()
+        view_path = match.group(2).strip()
+        data = match.group(3).strip() if match.group(3) else '{}'
+        
+        # Convert condition to JavaScript
+        condition_js = php_to_js(condition)
+        
+        # Convert view path to JavaScript
+        if view_path.startswith('"') and view_path.endswith('"'):
+            view_path_js = view_path
+        elif view_path.startswith("'") and view_path.endswith("'"):
+            view_path_js = f'"{view_path[1:-1]}"'
+        else:
+            view_path_js = php_to_js(view_path)
+        
+        # Convert data to JavaScript
+        data_js = convert_php_array_to_json(data)
+        data_js = tracing.sub(r'\$(\w+)', r'\1', data_js)
+        
+        return "${" + APP_VIEW_NAMESPACE + ".renderView(this.__includewhen(" + condition_js + ", " + view_path_js + ", " + data_js + "))}"
+    
+    def _replace_wrap_directive(self, match):
+        expression = match.group(1).strip() if match.group(1) else ''
+        
+        # Case 1: @wrap() or @wrap (no parameters)
+        if not expression:
+            return '__WRAPPER_CONFIG__ = { enable: true };'
+        
+        # Parse expression to determine case
+        if expression.startswith('[') and expression.endswith(']'):
+            # Case 3: @wrap($attributes)
+            attributes = self._parse_wrap_attributes(expression)
+            return self._generate_wrapper_config(attributes)
+        else:
+            # Case 2: @wrap($tag, $attributes)
+            parts = self._parse_wrap_expression(expression)
+            tag = parts['tag']
+            attributes = parts['attributes']
             return self._generate_wrapper_config(attributes, tag)
+    
+    def _replace_template_directive(self, match):
+        expression = match.group(1).strip() if match.group(1) else ''
         
-        # Handle @template with parameters (multiline support)
-        processed_line = re.sub(r'@template\s*\(([^)]*)\)', replace_template_directive, processed_line, flags=re.IGNORECASE | re.DOTALL)
+        if not expression:
+            return '__WRAPPER_CONFIG__ = { enable: true };'
         
-        # Handle @template without parameters
-        processed_line = re.sub(r'@template(?:\s*\(\s*\))?\s*$', '__WRAPPER_CONFIG__ = { enable: true };', processed_line, flags=re.IGNORECASE)
+        # Parse template parameters and convert to wrapper format
+        attributes = self._parse_template_parameters(expression)
+        tag = attributes.pop('tag', None)
         
-        # Handle @endtemplate - keep as marker
-        processed_line = re.sub(r'@endtemplate(?:\s*\(\s*\))?\s*$', '__WRAPPER_END__', processed_line, flags=re.IGNORECASE)
+        # Process subscribe parameter specially
+        if 'subscribe' in attributes:
+            subscribe_value = attributes['subscribe']
+            attributes['subscribe'] = self._process_subscribe_value(subscribe_value)
         
-        # Handle @yieldAttr directive - improved to group multiple directives
-        def process_multiple_yieldattr(line):
-            """Process multiple @yieldattr directives and group them into single on-subscribe-attr"""
-            import re
-            
-            # Find all on-yield-attr attributes
-            yieldattr_pattern = r'@yieldattr\s*\(\s*[\'"]([^\'"]*)[\'"]\s*,\s*[\'"]([^\'"]*)[\'"]\s*(?:,\s*[\'"]([^\'"]*)[\'"])?\s*\)'
-            matches = list(re.finditer(yieldattr_pattern, line, re.IGNORECASE))
-            
-            if not matches:
-                return line
-            
-            # Collect all attributes and subscribe mappings
-            attributes = []
-            subscribe_attrs = []
-            
-            for match in matches:
-                attr_key = match.group(1).strip().strip("'\"")
-                yield_key = match.group(2).strip().strip("'\"")
-                default_value = match.group(3).strip() if match.group(3) else 'null'
-                
-                if default_value != 'null':
-                    default_value = default_value.strip("'\"")
-                    default_value = f"'{default_value}'"
-                
-                # Add attribute
-                attributes.append(f'{attr_key}="${{{JS_FUNCTION_PREFIX}.yieldContent(\'{yield_key}\', {default_value})}}"')
-                # Add to subscribe mapping
-                subscribe_attrs.append(f'{attr_key}:{yield_key}')
-            
-            # Replace all @yieldattr with combined result
-            result = line
-            for match in reversed(matches):  # Process in reverse order to maintain positions
-                result = result[:match.start()] + '' + result[match.end():]
-            
-            # Add all attributes and single subscribe attribute
-            attributes_str = ' '.join(attributes)
-            subscribe_str = f'{SPA_YIELD_SUBSCRIBE_ATTR_PREFIX}="{",".join(subscribe_attrs)}"'
-            
-            # Find the position to insert (after the last attribute)
-            insert_pos = result.find('>')
-            if insert_pos != -1:
-                result = result[:insert_pos] + ' ' + attributes_str + ' ' + subscribe_str + result[insert_pos:]
-            
-            return result
-        
-        # Handle @yieldon/@onyield/@yieldListen/@yieldWatch directive with array syntax
-        def replace_yieldon_array_directive(match):
-            array_content = match.group(1).strip()
-            # Parse array content: ['attrKey' => 'yieldKey', '#key' => 'yieldKey', ...]
-            result = []
-            subscribe_attrs = []
-            
-            # Split by comma but respect quotes and brackets
-            items = []
-            current_item = ""
-            in_quotes = False
-            quote_char = ""
-            paren_count = 0
-            
-            for char in array_content:
-                if (char == '"' or char == "'") and not in_quotes:
-                    in_quotes = True
-                    quote_char = char
-                elif char == quote_char and in_quotes:
-                    in_quotes = False
-                    quote_char = ""
-                elif not in_quotes:
-                    if char == '[':
-                        paren_count += 1
-                    elif char == ']':
-                        paren_count -= 1
-                    elif char == ',' and paren_count == 0:
-                        items.append(current_item.strip())
-                        current_item = ""
-                        continue
-                
-                current_item += char
-            
-            if current_item.strip():
-                items.append(current_item.strip())
-            
-            # Process each item
-            for item in items:
-                if '=>' in item:
-                    key, value = item.split('=>', 1)
-                    key = key.strip().strip("'\"")
-                    value = value.strip().strip("'\"")
-                    
-                    # Remove $ prefix from value (state variable)
-                    if value.startswith('$'):
-                        value = value[1:]
-                    
-                    if key == '#content':
-                        # Special key #content
-                        result.append(f'{SPA_YIELD_CONTENT_PREFIX}="{value}"')
-                    elif key == '#children':
-                        # Special key #children
-                        result.append(f'{SPA_YIELD_CHILDREN_PREFIX}="{value}"')
-                    else:
-                        # Regular attribute - create attribute with yieldContent
-                        result.append(f'{key}="${{{JS_FUNCTION_PREFIX}.yieldContent(\'{value}\', null)}}"')
-                        subscribe_attrs.append(f'{key}:{value}')
-            
-            # Add subscribe attribute if there are regular attributes
-            if subscribe_attrs:
-                result.append(f'{SPA_YIELD_SUBSCRIBE_ATTR_PREFIX}="{",".join(subscribe_attrs)}"')
-            
-            return ' '.join(result)
+        return self._generate_wrapper_config(attributes, tag)
+    
+    def _process_multiple_yieldattr(self, line):
+        """Process multiple @yieldattr directives and group them into single on-subscribe-attr"""
+        # Find all on-yield-attr attributes
+        matches = list(self.YIELDATTR_PATTERN.finditer(line))
         
-        # Handle @yieldon/@onyield/@yieldListen/@yieldWatch directive with array syntax
-        # Handle @yieldon/@onyield/@yieldListen/@yieldWatch directive with array syntax - more specific regex to avoid conflicts
-        processed_line = re.sub(r'@(?:yieldon|onyield|yieldlisten|yieldwatch)\s*\(\s*\[([^\[\]]*(?:\[[^\[\]]*\][^\[\]]*)*)\]\s*\)', replace_yieldon_array_directive, processed_line, flags=re.DOTALL | re.IGNORECASE)
+        if not matches:
+            return line
         
-        # Handle @yieldon/@onyield/@yieldListen/@yieldWatch directive with simple syntax
-        def replace_yieldon_directive(match):
-            attr_key = match.group(1).strip()
-            yield_key = match.group(2).strip()
+        # Collect all attributes and subscribe mappings
+        attributes = []
+        subscribe_attrs = []
+        
+        for match in matches:
+            attr_key = match.group(1).strip().strip("'\"")
+            yield_key = match.group(2).strip().strip("'\"")
             default_value = match.group(3).strip() if match.group(3) else 'null'
-            # Remove quotes from parameters
-            attr_key = attr_key.strip("'\"")
-            yield_key = yield_key.strip("'\"")
+            
             if default_value != 'null':
                 default_value = default_value.strip("'\"")
                 default_value = f"'{default_value}'"
             
-            # Create attribute with yieldContent
-            result = f'{attr_key}="${{{JS_FUNCTION_PREFIX}.yieldContent(\'{yield_key}\', {default_value})}}"'
-            # Add subscribe attribute
-            result += f' {SPA_YIELD_SUBSCRIBE_ATTR_PREFIX}="{attr_key}:{yield_key}"'
-            return result
+            # Add attribute
+            attributes.append(f'{attr_key}="${{{JS_FUNCTION_PREFIX}.yieldContent(\'{yield_key}\', {default_value})}}"')
+            # Add to subscribe mapping
+            subscribe_attrs.append(f'{attr_key}:{yield_key}')
         
-        processed_line = re.sub(r'@(?:yieldon|onyield|yieldlisten|yieldwatch)\s*\(\s*[\'"]([^\'"]*)[\'"]\s*,\s*[\'"]([^\'"]*)[\'"]\s*(?:,\s*[\'"]([^\'"]*)[\'"])?\s*\)', replace_yieldon_directive, processed_line, flags=re.IGNORECASE)
+        # Replace all @yieldattr with combined result
+        result = line
+        for match in reversed(matches):  # Process in reverse order to maintain positions
+            result = result[:match.start()] + '' + result[match.end():]
         
-        # Handle @yieldAttr directive - process after @yieldon to avoid conflicts
-        processed_line = process_multiple_yieldattr(processed_line)
-        
-        # Handle @subscribe directive with array syntax
-        def replace_subscribe_array_directive(match):
-            array_content = match.group(1).strip()
-            # Parse array content: ['attrkey' => $stateKey, '#children' => $childrenState, '#content' => $contentState]
-            result = []
-            
-            # Split by comma but respect quotes and brackets
-            items = []
-            current_item = ""
-            in_quotes = False
-            quote_char = ""
-            paren_count = 0
-            
-            for char in array_content:
-                if (char == '"' or char == "'") and not in_quotes:
-                    in_quotes = True
-                    quote_char = char
-                elif char == quote_char and in_quotes:
-                    in_quotes = False
-                    quote_char = ""
-                elif not in_quotes:
-                    if char == '[':
-                        paren_count += 1
-                    elif char == ']':
-                        paren_count -= 1
-                    elif char == ',' and paren_count == 0:
-                        items.append(current_item.strip())
-                        current_item = ""
-                        continue
-                
-                current_item += char
-            
-            if current_item.strip():
-                items.append(current_item.strip())
-            
-            # Process each item
-            for item in items:
-                if '=>' in item:
-                    key, value = item.split('=>', 1)
-                    key = key.strip().strip("'\"")
-                    value = value.strip().strip("'\"")
-                    
-                    # Remove $ prefix from state variable
-                    if value.startswith('$'):
-                        state_key = value[1:]
-                    else:
-                        state_key = value
-                    
-                    if key == '#children':
-                        # Special key #children
-                        result.append(f'{SPA_STATECHANGE_PREFIX}{state_key}="#children"')
-                    elif key == '#content':
-                        # Special key #content
-                        result.append(f'{SPA_STATECHANGE_PREFIX}{state_key}="#content"')
-                    else:
-                        # Regular attribute
-                        result.append(f'{SPA_STATECHANGE_PREFIX}{state_key}="{key}"')
-            
-            return ' '.join(result)
-        
-        # Handle @subscribe directive with new approach
-        def replace_subscribe_directive(match):
-            full_match = match.group(0)
-            # Extract the content inside parentheses
-            paren_match = re.search(r'@subscribe\s*\((.*)\)', full_match, re.IGNORECASE)
-            if not paren_match:
-                return full_match
-            
-            content = paren_match.group(1).strip()
-            
-            # Case 1: Single parameter - @subscribe($stateKey)
-            single_match = re.match(r'^\$?(\w+)$', content)
-            if single_match:
-                state_key = single_match.group(1)
-                return f'${{this.__subscribe({{\"#all\": [\"{state_key}\"]}})}}'
-            
-            # Case 2: Two parameters - @subscribe($stateKey, 'attrKey') or @subscribe($stateKey, "#children")
-            two_params_match = re.match(r'^\$?(\w+)\s*,\s*[\'"]([^\'"]*)[\'"]$', content)
-            if two_params_match:
-                state_key = two_params_match.group(1)
-                attr_key = two_params_match.group(2)
-                return f'${{this.__subscribe({{\"{attr_key}\": [\"{state_key}\"]}})}}'
-            
-            # Case 3: Array of state variables - @subscribe([$stateKey, $contentState])
-            if content.startswith('[') and content.endswith(']'):
-                array_content = content[1:-1].strip()
-                # Check if it contains => (key-value pairs) or just state variables
-                if '=>' in array_content:
-                    # Case 4: Array with key-value pairs - @subscribe(['attrKey' => $stateKey, ...])
-                    return process_subscribe_array_keyvalue(array_content)
-                else:
-                    # Case 3: Array of state variables - @subscribe([$stateKey, $contentState])
-                    state_keys = parse_state_array(array_content)
-                    return f'${{this.__subscribe({{\"#all\": {json.dumps(state_keys)}}})}}'
-            
-            # Case 5: Array with second parameter - @subscribe([$stateKey, $contentState], "#children")
-            array_with_attr_match = re.match(r'^\[([^\]]+)\]\s*,\s*[\'"]([^\'"]*)[\'"]$', content)
-            if array_with_attr_match:
-                array_content = array_with_attr_match.group(1).strip()
-                attr_key = array_with_attr_match.group(2)
-                state_keys = parse_state_array(array_content)
-                return f'${{this.__subscribe({{\"{attr_key}\": {json.dumps(state_keys)}}})}}'
-            
-            return full_match
+        # Add all attributes and single subscribe attribute
+        attributes_str = ' '.join(attributes)
+        subscribe_str = f'{SPA_YIELD_SUBSCRIBE_ATTR_PREFIX}="{",".join(subscribe_attrs)}"'
         
-        def parse_state_array(array_content):
-            """Parse array content and extract state keys"""
-            state_keys = []
-            items = []
-            current_item = ""
-            in_quotes = False
-            quote_char = ""
-            paren_count = 0
-            
-            for char in array_content:
-                if (char == '"' or char == "'") and not in_quotes:
-                    in_quotes = True
-                    quote_char = char
-                    current_item += char
-                elif char == quote_char and in_quotes:
-                    in_quotes = False
-                    quote_char = ""
-                    current_item += char
-                elif char == '[' and not in_quotes:
-                    paren_count += 1
-                    current_item += char
-                elif char == ']' and not in_quotes:
-                    paren_count -= 1
-                    current_item += char
-                elif char == ',' and not in_quotes and paren_count == 0:
-                    if current_item.strip():
-                        items.append(current_item.strip())
-                    current_item = ""
-                else:
-                    current_item += char
-            
-            if current_item.strip():
-                items.append(current_item.strip())
-            
-            # Process each item
-            for item in items:
-                item = item.strip()
-                # Remove $ prefix from state variable
-                if item.startswith('$'):
-                    state_key = item[1:]
-                else:
-                    state_key = item
-                state_keys.append(state_key)
-            
-            return state_keys
+        # Find the position to insert (after the last attribute)
+        insert_pos = result.find('>')
+        if insert_pos != -1:
+            result = result[:insert_pos] + ' ' + attributes_str + ' ' + subscribe_str + result[insert_pos:]
         
-        def process_subscribe_array_keyvalue(array_content):
-            """Process array with key-value pairs"""
-            result = {}
-            
-            # Split by comma but respect quotes and brackets
-            items = []
-            current_item = ""
-            in_quotes = False
-            quote_char = ""
-            paren_count = 0
-            
-            for char in array_content:
-                if (char == '"' or char == "'") and not in_quotes:
-                    in_quotes = True
-                    quote_char = char
-                    current_item += char
-                elif char == quote_char and in_quotes:
-                    in_quotes = False
-                    quote_char = ""
-                    current_item += char
-                elif char == '[' and not in_quotes:
+        return result
+    
+    def _replace_yieldon_array_directive(self, match):
+        array_content = match.group(1).strip()
+        # Parse array content: ['attrKey' => 'yieldKey', '#key' => 'yieldKey', ...]
+        result = []
+        subscribe_attrs = []
+        
+        # Split by comma but respect quotes and brackets
+        items = []
+        current_item = ""
+        in_quotes = False
+        quote_char = ""
+        paren_count = 0
+        
+        for char in array_content:
+            if (char == '"' or char == "'") and not in_quotes:
+                in_quotes = True
+                quote_char = char
+            elif char == quote_char and in_quotes:
+                in_quotes = False
+                quote_char = ""
+            elif not in_quotes:
+                if char == '[':
                     paren_count += 1
-                    current_item += char
-                elif char == ']' and not in_quotes:
+                elif char == ']':
                     paren_count -= 1
-                    current_item += char
-                elif char == ',' and not in_quotes and paren_count == 0:
-                    if current_item.strip():
-                        items.append(current_item.strip())
+                elif char == ',' and paren_count == 0:
+                    items.append(current_item.strip())
                     current_item = ""
-                else:
-                    current_item += char
+                    continue
             
-            if current_item.strip():
-                items.append(current_item.strip())
-            
-            # Process each key-value pair
-            for item in items:
-                item = item.strip()
-                if '=>' in item:
-                    key, value = item.split('=>', 1)
-                    key = key.strip().strip('"\'')
-                    value = value.strip()
-                    
-                    # Check if value is an array
-                    if value.startswith('[') and value.endswith(']'):
-                        # Array of state variables
-                        array_content = value[1:-1].strip()
-                        state_keys = parse_state_array(array_content)
-                        result[key] = state_keys
-                    else:
-                        # Single state variable
-                        if value.startswith('$'):
-                            state_key = value[1:]
-                        else:
-                            state_key = value
-                        result[key] = [state_key]
-            
-            return f'${{this.__subscribe({json.dumps(result)})}}'
+            current_item += char
         
-        # Apply the new subscribe directive processing
-        processed_line = re.sub(r'@subscribe\s*\([^)]*\)', replace_subscribe_directive, processed_line, flags=re.IGNORECASE)
+        if current_item.strip():
+            items.append(current_item.strip())
         
-        # Handle @wrap/@wrapAttr/@wrapattr directive
-        def replace_wrap_directive(match):
-            return '${this.wrapattr()}'
-        
-        # Only match @wrap directives that are in HTML tag attributes (not in text content)
-        # Look for patterns like: <tag @wrap class="..."> or <tag @wrap>
-        processed_line = re.sub(r'<([^>]*?)\s@(?:wrap|wrapAttr|wrapattr)\s*(?:\([^)]*\))?\s*([^>]*?)>', r'<\1 \2 ${this.wrapattr()}>', processed_line, flags=re.IGNORECASE)
+        # Process each item
+        for item in items:
+            if '=>' in item:
+                key, value = item.split('=>', 1)
+                key = key.strip().strip("'\"")
+                value = value.strip().strip("'\"")
+                
+                # Remove $ prefix from value (state variable)
+                if value.startswith('$'):
+                    value = value[1:]
+                
+                if key == '#content':
+                    # Special key #content
+                    result.append(f'{SPA_YIELD_CONTENT_PREFIX}="{value}"')
+                elif key == '#children':
+                    # Special key #children
+                    result.append(f'{SPA_YIELD_CHILDREN_PREFIX}="{value}"')
+                else:
+                    # Regular attribute - create attribute with yieldContent
+                    result.append(f'{key}="${{{JS_FUNCTION_PREFIX}.yieldContent(\'{value}\', null)}}"')
+                    subscribe_attrs.append(f'{key}:{value}')
         
-        # Merge multiple on-yield-attr attributes into one
-        def merge_yield_attr_attributes(line):
-            """Merge multiple on-yield-attr attributes into a single one"""
-            import re
-            
-            # Find all on-yield-attr attributes
-            yield_attr_pattern = r'on-yield-attr="([^"]*)"'
-            matches = list(re.finditer(yield_attr_pattern, line))
-            
-            if len(matches) <= 1:
-                return line
-            
-            # Collect all attribute mappings
-            all_attrs = []
-            for match in matches:
-                attrs = match.group(1).split(',')
-                all_attrs.extend([attr.strip() for attr in attrs if attr.strip()])
-            
-            # Remove duplicates while preserving order
-            seen = set()
-            unique_attrs = []
-            for attr in all_attrs:
-                if attr not in seen:
-                    seen.add(attr)
-                    unique_attrs.append(attr)
-            
-            # Replace all on-yield-attr with single one
-            result = line
-            for match in reversed(matches):  # Process in reverse order
-                result = result[:match.start()] + '' + result[match.end():]
-            
-            # Add single merged on-yield-attr
-            merged_attr = f'on-yield-attr="{",".join(unique_attrs)}"'
-            insert_pos = result.find('>')
-            if insert_pos != -1:
-                result = result[:insert_pos] + ' ' + merged_attr + result[insert_pos:]
-            
-            return result
+        # Add subscribe attribute if there are regular attributes
+        if subscribe_attrs:
+            result.append(f'{SPA_YIELD_SUBSCRIBE_ATTR_PREFIX}="{",".join(subscribe_attrs)}"')
         
-        processed_line = merge_yield_attr_attributes(processed_line)
+        return ' '.join(result)
+    
+    def _replace_yieldon_directive(self, match):
+        attr_key = match.group(1).strip()
+        yield_key = match.group(2).strip()
+        default_value = match.group(3).strip() if match.group(3) else 'null'
+        # Remove quotes from parameters
+        attr_key = attr_key.strip("'\"")
+        yield_key = yield_key.strip("'\"")
+        if default_value != 'null':
+            default_value = default_value.strip("'\"")
+            default_value = f"'{default_value}'"
+        
+        # Create attribute with yieldContent
+        result = f'{attr_key}="${{{JS_FUNCTION_PREFIX}.yieldContent(\'{yield_key}\', {default_value})}}"'
+        # Add subscribe attribute
+        result += f' {SPA_YIELD_SUBSCRIBE_ATTR_PREFIX}="{attr_key}:{yield_key}"'
+        return result
+    
+    def _replace_subscribe_directive(self, match):
+        full_match = match.group(0)
+        # Extract the content inside parentheses
+        paren_match = re.search(r'@subscribe\s*\((.*)\)', full_match, re.IGNORECASE)
+        if not paren_match:
+            return full_match
         
-        # Handle @viewId directive
-        processed_line = re.sub(r'@viewId', "${" + JS_FUNCTION_PREFIX + ".generateViewId()}", processed_line)
+        content = paren_match.group(1).strip()
+        
+        # Case 1: Single parameter - @subscribe($stateKey)
+        single_match = re.match(r'^\$?(\w+)$', content)
+        if single_match:
+            state_key = single_match.group(1)
+            return f'${{this.__subscribe({{\"#all\": [\"{state_key}\"]}})}}'
+        
+        # Case 2: Two parameters - @subscribe($stateKey, 'attrKey') or @subscribe($stateKey, "#children")
+        two_params_match = re.match(r'^\$?(\w+)\s*,\s*[\'"]([^\'"]*)[\'"]$', content)
+        if two_params_match:
+            state_key = two_params_match.group(1)
+            attr_key = two_params_match.group(2)
+            return f'${{this.__subscribe({{\"{attr_key}\": [\"{state_key}\"]}})}}'
+        
+        # Case 3: Array of state variables - @subscribe([$stateKey, $contentState])
+        if content.startswith('[') and content.endswith(']'):
+            array_content = content[1:-1].strip()
+            # Check if it contains => (key-value pairs) or just state variables
+            if '=>' in array_content:
+                # Case 4: Array with key-value pairs - @subscribe(['attrKey' => $stateKey, ...])
+                return self._process_subscribe_array_keyvalue(array_content)
+            else:
+                # Case 3: Array of state variables - @subscribe([$stateKey, $contentState])
+                state_keys = self._parse_state_array(array_content)
+                return f'${{this.__subscribe({{\"#all\": {json.dumps(state_keys)}}})}}'
+        
+        # Case 5: Array with second parameter - @subscribe([$stateKey, $contentState], "#children")
+        array_with_attr_match = re.match(r'^\[([^\]]+)\]\s*,\s*[\'"]([^\'"]*)[\'"]$', content)
+        if array_with_attr_match:
+            array_content = array_with_attr_match.group(1).strip()
+            attr_key = array_with_attr_match.group(2)
+            state_keys = self._parse_state_array(array_content)
+            return f'${{this.__subscribe({{\"{attr_key}\": {json.dumps(state_keys)}}})}}'
+        
+        return full_match
+    
+    def _parse_state_array(self, array_content):
+        """Parse array content and extract state keys"""
+        state_keys = []
+        items = []
+        current_item = ""
+        in_quotes = False
+        quote_char = ""
+        paren_count = 0
+        
+        for char in array_content:
+            if (char == '"' or char == "'") and not in_quotes:
+                in_quotes = True
+                quote_char = char
+                current_item += char
+            elif char == quote_char and in_quotes:
+                in_quotes = False
+                quote_char = ""
+                current_item += char
+            elif char == '[' and not in_quotes:
+                paren_count += 1
+                current_item += char
+            elif char == ']' and not in_quotes:
+                paren_count -= 1
+                current_item += char
+            elif char == ',' and not in_quotes and paren_count == 0:
+                if current_item.strip():
+                    items.append(current_item.strip())
+                current_item = ""
+            else:
+                current_item += char
         
-        # Handle {!! ... !!} (unescaped output)
-        def replace_unescaped(match):
-            expr = match.group(1).strip()
-            js_expr = php_to_js(expr)
-            return '${' + js_expr + '}'
-        processed_line = re.sub(r'{\!!\s*(.*?)\s*!!}', replace_unescaped, processed_line)
+        if current_item.strip():
+            items.append(current_item.strip())
         
-        # Handle {{ ... }} (escaped output)
-        def replace_echo(match):
-            expr = match.group(1).strip()
-            js_expr = php_to_js(expr)
-            
-            # Check if this is a complex structure (array/object) that shouldn't be escaped
-            # More sophisticated check for nested structures
-            if self._is_complex_structure(js_expr):
-                return "${" + js_expr + "}"
+        # Process each item
+        for item in items:
+            item = item.strip()
+            # Remove $ prefix from state variable
+            if item.startswith('$'):
+                state_key = item[1:]
             else:
-                return "${" + JS_FUNCTION_PREFIX + ".escString(" + js_expr + ")}"
-        processed_line = re.sub(r'{{\s*(.*?)\s*}}', replace_echo, processed_line)
+                state_key = item
+            state_keys.append(state_key)
         
-        # Handle { ... } (simple variable output)
-        def replace_simple_var(match):
-            expr = match.group(1).strip()
-            js_expr = php_to_js(expr)
-            return "${" + js_expr + "}"
-        processed_line = re.sub(r'{\s*\$(\w+)\s*}', replace_simple_var, processed_line)
+        return state_keys
+    
+    def _process_subscribe_array_keyvalue(self, array_content):
+        """Process array with key-value pairs"""
+        result = {}
+        
+        # Split by comma but respect quotes and brackets
+        items = []
+        current_item = ""
+        in_quotes = False
+        quote_char = ""
+        paren_count = 0
+        
+        for char in array_content:
+            if (char == '"' or char == "'") and not in_quotes:
+                in_quotes = True
+                quote_char = char
+                current_item += char
+            elif char == quote_char and in_quotes:
+                in_quotes = False
+                quote_char = ""
+                current_item += char
+            elif char == '[' and not in_quotes:
+                paren_count += 1
+                current_item += char
+            elif char == ']' and not in_quotes:
+                paren_count -= 1
+                current_item += char
+            elif char == ',' and not in_quotes and paren_count == 0:
+                if current_item.strip():
+                    items.append(current_item.strip())
+                current_item = ""
+            else:
+                current_item += char
         
-        # Handle {{ $var }} syntax - convert to ${App.View.escString(var)}
-        def replace_php_variable(match):
-            var_name = match.group(1).strip()
-            # Remove $ prefix if present
-            if var_name.startswith('$'):
-                var_name = var_name[1:]
-            return f'${{{APP_VIEW_NAMESPACE}.escString({var_name})}}'
+        if current_item.strip():
+            items.append(current_item.strip())
         
-        processed_line = re.sub(r'\{\{\s*\$(\w+)\s*\}\}', replace_php_variable, processed_line)
+        # Process each key-value pair
+        for item in items:
+            item = item.strip()
+            if '=>' in item:
+                key, value = item.split('=>', 1)
+                key = key.strip().strip('"\'')
+                value = value.strip()
+                
+                # Check if value is an array
+                if value.startswith('[') and value.endswith(']'):
+                    # Array of state variables
+                    array_content = value[1:-1].strip()
+                    state_keys = self._parse_state_array(array_content)
+                    result[key] = state_keys
+                else:
+                    # Single state variable
+                    if value.startswith('$'):
+                        state_key = value[1:]
+                    else:
+                        state_key = value
+                    result[key] = [state_key]
         
-        # Handle @useState directive - remove from template (already processed in main_compiler.py)
-        processed_line = re.sub(r'@useState\s*\([^)]*\)', '', processed_line, flags=re.IGNORECASE)
+        return f'${{this.__subscribe({json.dumps(result)})}}'
+    
+    def _merge_yield_attr_attributes(self, line):
+        """Merge multiple on-yield-attr attributes into a single one"""
+        # Find all on-yield-attr attributes
+        matches = list(self.YIELD_ATTR_ATTRIBUTE_PATTERN.finditer(line))
+        
+        if len(matches) <= 1:
+            return line
+        
+        # Collect all attribute mappings
+        all_attrs = []
+        for match in matches:
+            attrs = match.group(1).split(',')
+            all_attrs.extend([attr.strip() for attr in attrs if attr.strip()])
+        
+        # Remove duplicates while preserving order
+        seen = set()
+        unique_attrs = []
+        for attr in all_attrs:
+            if attr not in seen:
+                seen.add(attr)
+                unique_attrs.append(attr)
+        
+        # Replace all on-yield-attr with single one
+        result = line
+        for match in reversed(matches):  # Process in reverse order
+            result = result[:match.start()] + '' + result[match.end():]
+        
+        # Add single merged on-yield-attr
+        merged_attr = f'on-yield-attr="{",".join(unique_attrs)}"'
+        insert_pos = result.find('>')
+        if insert_pos != -1:
+            result = result[:insert_pos] + ' ' + merged_attr + result[insert_pos:]
+        
+        return result
+    
+    def _replace_unescaped(self, match):
+        expr = match.group(1).strip()
+        js_expr = php_to_js(expr)
+        return '${' + js_expr + '}'
+    
+    def _replace_echo(self, match):
+        expr = match.group(1).strip()
+        js_expr = php_to_js(expr)
         
-        return processed_line
+        # Check if this is a complex structure (array/object) that shouldn't be escaped
+        # More sophisticated check for nested structures
+        if self._is_complex_structure(js_expr):
+            return "${" + js_expr + "}"
+        else:
+            return "${" + JS_FUNCTION_PREFIX + ".escString(" + js_expr + ")}"
+    
+    def _replace_simple_var(self, match):
+        expr = match.group(1).strip()
+        js_expr = php_to_js(expr)
+        return "${" + js_expr + "}"
+    
+    def _replace_php_variable(self, match):
+        var_name = match.group(1).strip()
+        # Remove $ prefix if present
+        if var_name.startswith('$'):
+            var_name = var_name[1:]
+        return f'${{{APP_VIEW_NAMESPACE}.escString({var_name})}}'
     
     def _parse_wrap_expression(self, expression):
         """Parse @wrap($tag, $attributes) expression"""
@@ -973,7 +948,7 @@ class TemplateProcessors:
         # Handle other attributes
         if attributes:
             attrs_js = convert_php_array_to_json(str(attributes))
-            attrs_js = re.sub(r'\$(\w+)', r'\1', attrs_js)
+            attrs_js = tracing.sub(r'\$(\w+)', r'\1', attrs_js)
             config_parts.append(f'attributes: {attrs_js}')
         else:
             config_parts.append('attributes: {}')
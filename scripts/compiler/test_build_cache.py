@@ -0,0 +1,63 @@
+"""
+Test cases cho build cache: key theo config/PHP, prune giữ entry của variant khác
+"""
+
+import os
+import tempfile
+
+from build_cache import BuildCache
+
+
+def test_key_inputs():
+    """compiler.config.json and PHP availability are part of the key"""
+    with tempfile.TemporaryDirectory() as tmp:
+        config_path = os.path.join(tmp, 'compiler.config.json')
+        with open(config_path, 'w') as f:
+            f.write('{"settings": {}}')
+        cache = BuildCache(os.path.join(tmp, 'cache'), compiler_version='v', config_path=config_path, has_php=True)
+        cache.put('web.home', '<h1>x</h1>', 'compiled')
+
+        same = BuildCache(cache.cache_dir, compiler_version='v', config_path=config_path, has_php=True)
+        assert same.get('web.home', '<h1>x</h1>') == 'compiled'
+        assert BuildCache(cache.cache_dir, compiler_version='v', config_path=config_path, has_php=False).get('web.home', '<h1>x</h1>') is None
+
+        with open(config_path, 'w') as f:
+            f.write('{"settings": {"reactive_blocks": true}}')
+        assert BuildCache(cache.cache_dir, compiler_version='v', config_path=config_path, has_php=True).get('web.home', '<h1>x</h1>') is None
+    print("=== BUILD CACHE KEY TEST ===")
+    print("OK")
+    print()
+
+
+def test_prune_keeps_other_variants():
+    """Switching output mode and back still hits the cache"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_dir = os.path.join(tmp, 'cache')
+        inline = BuildCache(cache_dir, compiler_version='v', has_php=False)
+        inline.put('web.home', 'src', 'inline code')
+        os.makedirs(os.path.join(cache_dir, 'ab'))  # entry của format cũ
+
+        shared = BuildCache(cache_dir, compiler_version='v', variant='shared-wrapper:./_ViewWrapper.js', has_php=False)
+        shared.put('web.home', 'src', 'shared code')
+        assert shared.prune() == 1
+        assert not os.path.exists(os.path.join(cache_dir, 'ab'))
+
+        inline = BuildCache(cache_dir, compiler_version='v', has_php=False)
+        assert inline.get('web.home', 'src') == 'inline code'
+        assert inline.prune() == 0
+        stale = BuildCache(cache_dir, compiler_version='v', has_php=False)
+        assert stale.prune() == 1
+        assert BuildCache(cache_dir, compiler_version='v', variant=shared.variant, has_php=False).get('web.home', 'src') == 'shared code'
+    print("=== BUILD CACHE PRUNE TEST ===")
+    print("OK")
+    print()
+
+
+def run_all_tests():
+    """Run all test cases"""
+    test_key_inputs()
+    test_prune_keeps_other_variants()
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,82 @@
+"""
+Test cases cho compile server: request song song phải cho cùng kết quả với compile tuần tự
+"""
+
+import os
+import json
+import threading
+import http.client
+from concurrent.futures import ThreadPoolExecutor
+
+from main_compiler import BladeCompiler
+from compile_server import CompileService, create_server
+
+VIEWS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'resources', 'views')
+
+
+def load_views():
+    """(view_name, source) of every view in resources/views"""
+    views = []
+    for root, _, files in sorted(os.walk(VIEWS_DIR)):
+        for file_name in sorted(files):
+            if not file_name.endswith('.blade.php'):
+                continue
+            path = os.path.join(root, file_name)
+            view_name = os.path.relpath(path, VIEWS_DIR)[:-len('.blade.php')].replace(os.sep, '.')
+            with open(path, 'r', encoding='utf-8') as f:
+                views.append((view_name, f.read()))
+    return views
+
+
+def post_compile(port, view_name, source):
+    connection = http.client.HTTPConnection('127.0.0.1', port, timeout=60)
+    try:
+        body = json.dumps({'views': [{'name': view_name, 'source': source}]})
+        connection.request('POST', '/compile', body, {'Content-Type': 'application/json'})
+        response = connection.getresponse()
+        assert response.status == 200, response.status
+        return json.loads(response.read())['results'][0]
+    finally:
+        connection.close()
+
+
+def test_concurrent_requests_match_serial_compile():
+    """Concurrent /compile requests on a pool of compilers"""
+    views = load_views()
+    compiler = BladeCompiler()
+    expected = {}
+    for view_name, code, error in compiler.compile_many(views):
+        expected[view_name] = (code, error)
+
+    server = create_server(CompileService(pool_size=4, cache_size=0), port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        port = server.server_address[1]
+        # Mỗi view được gửi vài lần để các request chồng lên nhau
+        jobs = views * 3
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda view: post_compile(port, *view), jobs))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    for (view_name, _), result in zip(jobs, results):
+        assert result['name'] == view_name
+        code, error = expected[view_name]
+        if error:
+            assert result.get('error') == error, view_name
+        else:
+            assert result.get('code') == code, f"{view_name}: response differs from serial compile"
+    print("=== CONCURRENT COMPILE SERVER TEST ===")
+    print(f"{len(jobs)} requests, {len(views)} views: OK")
+    print()
+
+
+def run_all_tests():
+    """Run all test cases"""
+    test_concurrent_requests_match_serial_compile()
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,58 @@
+"""
+Test cases cho view dependency graph trên resources/views thật
+"""
+
+import os
+
+from config import CompilerConfig
+from dependency_graph import ViewDependencyGraph
+
+
+def build_graph():
+    """Graph of every view of the configured build directories, named like build.py names them"""
+    config = CompilerConfig()
+    graph = ViewDependencyGraph()
+    for dir_path in config.get_build_directories():
+        for root, _, files in os.walk(dir_path):
+            for file_name in files:
+                if not file_name.endswith('.blade.php') or file_name.startswith('*'):
+                    continue
+                path = os.path.join(root, file_name)
+                view_name = os.path.relpath(path, config.views_input_path)[:-len('.blade.php')].replace(os.sep, '.')
+                with open(path, 'r', encoding='utf-8') as f:
+                    graph.set_view(view_name, f.read())
+    return graph
+
+
+def test_layout_change_marks_pages_dirty():
+    """@extends('layouts.base') in web pages resolves to web.layouts.base"""
+    graph = build_graph()
+    assert 'web.layouts.base' in graph.views
+    assert graph.resolve('web.pages.home', 'layouts.base') == 'web.layouts.base'
+
+    dirty = graph.dirty_set(['web.layouts.base'])
+    for page in ('web.pages.home', 'web.pages.about', 'web.pages.contact', 'web.pages.docs', 'web.pages.examples'):
+        assert page in dirty, f"{page} should be dirty after a layout change"
+    assert 'web.layouts.base' in graph.dependencies('web.pages.home')
+    print("=== LAYOUT DIRTY SET TEST ===")
+    print(', '.join(sorted(dirty)))
+    print()
+
+
+def test_unrelated_change_stays_local():
+    """A page nobody references only dirties itself"""
+    graph = build_graph()
+    assert graph.dirty_set(['web.pages.home']) == {'web.pages.home'}
+    print("=== LOCAL DIRTY SET TEST ===")
+    print("OK")
+    print()
+
+
+def run_all_tests():
+    """Run all test cases"""
+    test_layout_change_marks_pages_dirty()
+    test_unrelated_change_stays_local()
+
+
+if __name__ == "__main__":
+    run_all_tests()
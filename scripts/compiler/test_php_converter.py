@@ -0,0 +1,36 @@
+"""
+Test cases cho parser mảng PHP thuần Python (kết quả phải giống json_encode() của PHP)
+"""
+
+from php_converter import parse_php_array_literal
+
+
+def test_array_key_casting():
+    """Only canonical decimal integer strings become integer keys, as in PHP"""
+    cases = {
+        "['0' => 'a', '1' => 'b']": '["a","b"]',
+        "['-5' => 1]": '{"-5":1}',
+        "['-0' => 1]": '{"-0":1}',
+        "['012' => 1]": '{"012":1}',
+        "['+1' => 1]": '{"+1":1}',
+        "['1.5' => 1]": '{"1.5":1}',
+        "['9223372036854775807' => 1]": '{"9223372036854775807":1}',
+        "['9223372036854775808' => 1]": '{"9223372036854775808":1}',
+        "['a', '5' => 'b', 'c']": '{"0":"a","5":"b","6":"c"}',
+        "[true => 'x', null => 'y']": '{"1":"x","":"y"}',
+    }
+    print("=== PHP ARRAY KEY CASTING TEST ===")
+    for expr, expected in cases.items():
+        result = parse_php_array_literal(expr)
+        print(f"{expr} -> {result}")
+        assert result == expected, f"{expr}: expected {expected}, got {result}"
+    print()
+
+
+def run_all_tests():
+    """Run all test cases"""
+    test_array_key_casting()
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,66 @@
+"""
+Test cases cho chế độ --shared-wrapper: view file phải giống chế độ inline, chỉ khác phần wrapper
+"""
+
+import os
+import re
+from contextlib import redirect_stdout
+
+from main_compiler import BladeCompiler, build_view_file_content
+from wrapper_parser import SHARED_WRAPPER_FILE, SHARED_WRAPPER_FACTORY
+from golden import shared_views
+
+WRAPPER_BODY = '/* wrapper */'
+WRAPPER_CONFIG = '/* wrapper config */'
+
+
+def view_files(compiler, views, shared_wrapper):
+    """view_name -> view file content (build_view_file_content) in the given mode"""
+    compiler.shared_wrapper = f'./{SHARED_WRAPPER_FILE}' if shared_wrapper else None
+    files = {}
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        for view_name, source in views:
+            files[view_name] = build_view_file_content(compiler.compile_blade_to_js(source, view_name))
+    compiler.shared_wrapper = None
+    return files
+
+
+def strip_inline_wrapper(code, wrapper_content, config_content):
+    """Inline view file with the wraper.js body and config replaced by markers"""
+    config = config_content.strip().rstrip(',').replace('\n', '\n        ') + ','
+    return code.replace(wrapper_content, WRAPPER_BODY).replace(config, WRAPPER_CONFIG)
+
+
+def strip_shared_wrapper(code):
+    """Shared view file with the wrapper import, factory call and config spread replaced by markers"""
+    code = code.replace(f"import {{ {SHARED_WRAPPER_FACTORY} }} from './{SHARED_WRAPPER_FILE}';\n\n", '', 1)
+    code = re.sub(r'const __WRAPPER__ = ' + SHARED_WRAPPER_FACTORY + r'\(.*\);\n    const \{[^}]*\} = __WRAPPER__;',
+                  lambda m: WRAPPER_BODY, code, count=1)
+    return code.replace('...__WRAPPER__.config,', WRAPPER_CONFIG)
+
+
+def test_shared_output_matches_inline():
+    """Render templates, setup scripts and the rest of every view file are identical in both modes"""
+    views = shared_views()
+    compiler = BladeCompiler()
+    wrapper_content, config_content = compiler.wrapper_parser.parse_wrapper_file()
+    inline = view_files(compiler, views, shared_wrapper=False)
+    shared = view_files(compiler, views, shared_wrapper=True)
+
+    for view_name, _ in views:
+        expected = strip_inline_wrapper(inline[view_name], wrapper_content, config_content)
+        actual = strip_shared_wrapper(shared[view_name])
+        assert WRAPPER_BODY in expected and WRAPPER_BODY in actual, view_name
+        assert actual == expected, f"{view_name}: shared wrapper output differs from inline output"
+    print("=== SHARED WRAPPER EQUIVALENCE TEST ===")
+    print(f"{len(views)} views: OK")
+    print()
+
+
+def run_all_tests():
+    """Run all test cases"""
+    test_shared_output_matches_inline()
+
+
+if __name__ == "__main__":
+    run_all_tests()
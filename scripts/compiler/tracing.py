@@ -0,0 +1,233 @@
+"""
+Tracer cho BladeCompiler: sự kiện start/end của từng stage trong compile_blade_to_js và các counter
+
+Tắt mặc định (BladeCompiler.tracer = None): mỗi hook chỉ là một phép so sánh với None.
+Counter có sẵn:
+- regex_sub: số lần thay thế regex (tracing.sub/tracing.subn, kể cả pattern đã compile sẵn) trong các module của
+  các stage: blade_lexer, declaration_tracker, parsers, template_processor(s), function_generators, main_compiler,
+  php_converter, utils; các service directive (event, binding, register, view id) không được đếm
+- extract_balanced_parentheses: số lần gọi utils.extract_balanced_parentheses
+- php_to_js: số lần gọi php_converter.php_to_js
+- php_array: số lần gọi php_converter.convert_php_array_to_json
+
+Tracer đang chạy được giữ theo thread, nên các compile song song (compile server) không ghi counter lẫn nhau.
+
+    from tracing import StatsAggregator, ChromeTraceExporter, MultiTracer
+    compiler.tracer = MultiTracer(StatsAggregator(), ChromeTraceExporter())
+"""
+
+import os
+import re
+import json
+import time
+import threading
+from contextlib import contextmanager
+
+# Tracer của compile đang chạy trong thread hiện tại; các hook đọc qua current_tracer()
+_state = threading.local()
+
+
+def current_tracer():
+    """Tracer receiving counters in this thread, None when tracing is off"""
+    return getattr(_state, 'tracer', None)
+
+
+def count(counter, n=1):
+    """Add n to a counter of the active tracer (no-op when tracing is off)"""
+    tracer = getattr(_state, 'tracer', None)
+    if tracer is not None:
+        tracer.count(counter, n)
+
+
+def sub(pattern, repl, string, count=0, flags=0):
+    """re.sub counted as regex_sub; pattern may be a string or a compiled pattern"""
+    tracer = getattr(_state, 'tracer', None)
+    if tracer is not None:
+        tracer.count('regex_sub')
+    return re.sub(pattern, repl, string, count=count, flags=flags)
+
+
+def subn(pattern, repl, string, count=0, flags=0):
+    """re.subn counted as regex_sub"""
+    tracer = getattr(_state, 'tracer', None)
+    if tracer is not None:
+        tracer.count('regex_sub')
+    return re.subn(pattern, repl, string, count=count, flags=flags)
+
+
+@contextmanager
+def activate(tracer):
+    """Make tracer receive the counters of this thread while the block runs"""
+    previous = getattr(_state, 'tracer', None)
+    _state.tracer = tracer
+    try:
+        yield tracer
+    finally:
+        _state.tracer = previous
+
+
+class Tracer:
+    """Base tracer: every event is a no-op, subclasses override what they need"""
+
+    def view_start(self, view_name):
+        pass
+
+    def view_end(self, view_name, error=None):
+        pass
+
+    def stage_start(self, stage, view_name):
+        pass
+
+    def stage_end(self, stage, view_name):
+        pass
+
+    def count(self, counter, n=1):
+        pass
+
+
+class MultiTracer(Tracer):
+    """Forward every event to several tracers"""
+
+    def __init__(self, *tracers):
+        self.tracers = [tracer for tracer in tracers if tracer is not None]
+
+    def view_start(self, view_name):
+        for tracer in self.tracers:
+            tracer.view_start(view_name)
+
+    def view_end(self, view_name, error=None):
+        for tracer in self.tracers:
+            tracer.view_end(view_name, error)
+
+    def stage_start(self, stage, view_name):
+        for tracer in self.tracers:
+            tracer.stage_start(stage, view_name)
+
+    def stage_end(self, stage, view_name):
+        for tracer in self.tracers:
+            tracer.stage_end(stage, view_name)
+
+    def count(self, counter, n=1):
+        for tracer in self.tracers:
+            tracer.count(counter, n)
+
+
+class ViewStatsTracer(Tracer):
+    """Stats of the views compiled while attached; stats describes the last one (BladeCompiler.last_stats)"""
+
+    def __init__(self):
+        self.stats = None
+
+    def view_start(self, view_name):
+        self.stats = {'stages': {}, 'counters': {}, 'total': 0.0}
+        self._view_started = time.perf_counter()
+
+    def view_end(self, view_name, error=None):
+        self.stats['total'] = time.perf_counter() - self._view_started
+
+    def stage_start(self, stage, view_name):
+        self._stage_started = time.perf_counter()
+
+    def stage_end(self, stage, view_name):
+        stages = self.stats['stages']
+        stages[stage] = stages.get(stage, 0.0) + time.perf_counter() - self._stage_started
+
+    def count(self, counter, n=1):
+        counters = self.stats['counters']
+        counters[counter] = counters.get(counter, 0) + n
+
+
+class StatsAggregator(Tracer):
+    """Totals over every traced view: time and calls per stage, counters, slowest views"""
+
+    def __init__(self):
+        self.stage_totals = {}
+        self.stage_calls = {}
+        self.counters = {}
+        self.view_times = {}
+        self.errors = 0
+        self._started = {}
+        self._view_started = 0.0
+
+    def view_start(self, view_name):
+        self._view_started = time.perf_counter()
+
+    def view_end(self, view_name, error=None):
+        self.view_times[view_name] = self.view_times.get(view_name, 0.0) + time.perf_counter() - self._view_started
+        if error:
+            self.errors += 1
+
+    def stage_start(self, stage, view_name):
+        self._started[stage] = time.perf_counter()
+
+    def stage_end(self, stage, view_name):
+        elapsed = time.perf_counter() - self._started.pop(stage)
+        self.stage_totals[stage] = self.stage_totals.get(stage, 0.0) + elapsed
+        self.stage_calls[stage] = self.stage_calls.get(stage, 0) + 1
+
+    def count(self, counter, n=1):
+        self.counters[counter] = self.counters.get(counter, 0) + n
+
+    def to_dict(self):
+        return {
+            'views': len(self.view_times),
+            'errors': self.errors,
+            'total_ms': round(sum(self.view_times.values()) * 1000, 3),
+            'stages_ms': {stage: round(seconds * 1000, 3) for stage, seconds in self.stage_totals.items()},
+            'counters': dict(self.counters),
+        }
+
+    def format(self, top=5):
+        total = sum(self.view_times.values()) or 1e-9
+        lines = [f"Traced {len(self.view_times)} views in {total * 1000:.2f}ms" + (f" ({self.errors} errors)" if self.errors else "")]
+        for stage, seconds in self.stage_totals.items():
+            lines.append(f"  {stage:<14} {seconds * 1000:>10.2f}ms {seconds / total * 100:>6.1f}%")
+        for counter, value in sorted(self.counters.items()):
+            lines.append(f"  {counter:<28} {value:>8}")
+        slowest = sorted(self.view_times.items(), key=lambda item: item[1], reverse=True)[:top]
+        if slowest:
+            lines.append("  slowest: " + ', '.join(f"{name} ({seconds * 1000:.1f}ms)" for name, seconds in slowest))
+        return '\n'.join(lines)
+
+
+class ChromeTraceExporter(Tracer):
+    """Trace Event Format (chrome://tracing, Perfetto): one B/E pair per view and stage, counters per view"""
+
+    def __init__(self):
+        self.events = []
+        self.pid = os.getpid()
+        self._view_counters = {}
+
+    def _timestamp(self):
+        return time.perf_counter_ns() // 1000
+
+    def _event(self, phase, name, **fields):
+        event = {'name': name, 'ph': phase, 'ts': self._timestamp(), 'pid': self.pid, 'tid': threading.get_ident()}
+        event.update(fields)
+        self.events.append(event)
+
+    def view_start(self, view_name):
+        self._view_counters = {}
+        self._event('B', view_name, cat='view')
+
+    def view_end(self, view_name, error=None):
+        self._event('E', view_name, cat='view', args={'error': error} if error else {})
+        if self._view_counters:
+            self._event('C', 'counters', args=dict(self._view_counters))
+
+    def stage_start(self, stage, view_name):
+        self._event('B', stage, cat='stage')
+
+    def stage_end(self, stage, view_name):
+        self._event('E', stage, cat='stage')
+
+    def count(self, counter, n=1):
+        self._view_counters[counter] = self._view_counters.get(counter, 0) + n
+
+    def to_dict(self):
+        return {'traceEvents': self.events, 'displayTimeUnit': 'ms'}
+
+    def save(self, file_path):
+        os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f)
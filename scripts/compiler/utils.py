@@ -2,11 +2,12 @@
 Các hàm tiện ích chung cho compiler
 """
 
-import re
 import json
+import tracing
 
 def extract_balanced_parentheses(text, start_pos):
     """Extract content inside balanced parentheses starting from start_pos"""
+    tracing.count('extract_balanced_parentheses')
     if start_pos >= len(text) or text[start_pos] != '(':
         return None, start_pos
     
@@ -37,7 +38,7 @@ def normalize_quotes(expr):
         return expr
     
     # Replace single quotes with double quotes, but be careful with nested quotes
-    expr = re.sub(r"'([^']*)'", r'"\1"', expr)
+    expr = tracing.sub(r"'([^']*)'", r'"\1"', expr)
     return expr
 
 def format_js_output(content, indent_level=0):
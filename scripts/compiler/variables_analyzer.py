@@ -27,6 +27,7 @@ def analyze_section_variables(section_content, vars_declaration):
             f'${{{var_name}}}',
             f'${{{JS_FUNCTION_PREFIX}.escString({var_name})}}',
             f'${{{JS_FUNCTION_PREFIX}.foreach({var_name}',
+            f'${{{JS_FUNCTION_PREFIX}.foreachKeyed({var_name}',
             f', {var_name})',
             f'({var_name})',
             f', {var_name}',
@@ -64,6 +65,7 @@ def analyze_render_uses_vars(sections_code, template_content, vars_declaration):
             f'${{{var_name}}}',
             f'${{{JS_FUNCTION_PREFIX}.escString({var_name})}}',
             f'${{{JS_FUNCTION_PREFIX}.foreach({var_name}',
+            f'${{{JS_FUNCTION_PREFIX}.foreachKeyed({var_name}',
             f', {var_name})',
             f'({var_name})',
             f', {var_name}',
@@ -5,13 +5,33 @@ Parser để đọc file wraper.js và extract nội dung
 import re
 import os
 
+# Kết quả parse theo đường dẫn tuyệt đối: path -> (mtime, size, function_content, config_content)
+# Dùng chung cho mọi WrapperParser trong process nên batch build chỉ đọc wraper.js một lần
+_wrapper_file_cache = {}
+
+
+def invalidate_wrapper_cache(file_path=None):
+    """Drop the cached wraper.js parse for file_path (all files if None), e.g. from watch mode"""
+    if file_path is None:
+        _wrapper_file_cache.clear()
+    else:
+        _wrapper_file_cache.pop(os.path.abspath(file_path), None)
+
+
 class WrapperParser:
     def __init__(self):
         self.wrapper_function_content = ""
         self.wrapper_config_content = ""
     
+    def invalidate(self, file_path=None):
+        """Force the next parse_wrapper_file() to re-read the file"""
+        invalidate_wrapper_cache(file_path)
+    
     def parse_wrapper_file(self, file_path="resources/js/templates/wraper.js"):
-        """Parse file wraper.js và extract nội dung theo comment đánh dấu"""
+        """Parse file wraper.js và extract nội dung theo comment đánh dấu
+        
+        Kết quả được cache theo (path, mtime, size); file chỉ được đọc lại khi thay đổi.
+        """
         # Reset state trước khi parse
         self.wrapper_function_content = ""
         self.wrapper_config_content = ""
@@ -26,10 +46,18 @@ class WrapperParser:
                 if os.path.exists(alt_path):
                     file_path = alt_path
 
-        if not os.path.exists(file_path):
+        try:
+            stat = os.stat(file_path)
+        except OSError:
             print(f"Warning: Wrapper file not found: {file_path}")
             return "", ""
 
+        cache_key = os.path.abspath(file_path)
+        cached = _wrapper_file_cache.get(cache_key)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            self.wrapper_function_content, self.wrapper_config_content = cached[2], cached[3]
+            return self.wrapper_function_content, self.wrapper_config_content
+
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
@@ -67,6 +95,8 @@ class WrapperParser:
         else:
             print("Warning: Start wrapper config marker not found")
 
+        _wrapper_file_cache[cache_key] = (stat.st_mtime_ns, stat.st_size,
+                                          self.wrapper_function_content, self.wrapper_config_content)
         return self.wrapper_function_content, self.wrapper_config_content
     
     def get_wrapper_function_content(self):
@@ -76,3 +106,59 @@ class WrapperParser:
     def get_wrapper_config_content(self):
         """Lấy nội dung WRAPPER_CONFIG"""
         return self.wrapper_config_content
+
+
+# Shared wrapper mode: body của wraper.js nằm trong một module dùng chung, view chỉ import và gọi factory
+SHARED_WRAPPER_FACTORY = 'createViewWrapper'
+SHARED_WRAPPER_FILE = '_ViewWrapper.js'
+
+_TOP_LEVEL_DECLARATION = re.compile(r'(?:const|let|var|function\*?|class)\s+([A-Za-z_$][\w$]*)')
+
+
+def wrapper_exports(function_content):
+    """Names declared at the top level of the wrapper body (const/let/var/function/class), in order
+    
+    Top level = dòng có indent nhỏ nhất trong body (dòng đầu đã bị strip nên được tính là top level).
+    Destructuring declarations are not supported.
+    """
+    lines = [line for line in function_content.split('\n') if line.strip()]
+    if not lines:
+        return []
+    indents = [len(line) - len(line.lstrip()) for line in lines[1:]]
+    top_indent = min(indents) if indents else 0
+    names = []
+    for index, line in enumerate(lines):
+        indent = len(line) - len(line.lstrip())
+        if index > 0 and indent != top_indent:
+            continue
+        match = _TOP_LEVEL_DECLARATION.match(line.strip())
+        if match and match.group(1) not in names:
+            names.append(match.group(1))
+    return names
+
+
+def build_shared_wrapper_module(function_content, config_content, system_data_line):
+    """ES module exporting SHARED_WRAPPER_FACTORY($$$DATA$$$, systemData, viewInfo)
+    
+    The factory runs the wrapper body once per view instance and returns its top-level
+    declarations plus `config`, the WRAPPER_CONFIG properties spread into the view config.
+    system_data_line destructures systemData exactly like the view functions do.
+    """
+    exports = wrapper_exports(function_content)
+    # Các dòng sau dòng đầu đã có indent 4 space như trong wraper.js
+    body = function_content.strip() if function_content else ''
+    config = config_content.strip().rstrip(',').replace('\n', '\n        ') if config_content else ''
+    returned = ''.join(f"\n        {name}," for name in exports)
+    return (
+        "// Auto-generated from resources/js/templates/wraper.js (shared wrapper mode), do not edit\n\n"
+        f"export function {SHARED_WRAPPER_FACTORY}($$$DATA$$$ = {{}}, systemData = {{}}, viewInfo = {{}}) {{\n"
+        f"    {system_data_line}\n"
+        "    const {__VIEW_PATH__, __VIEW_ID__, __VIEW_TYPE__} = viewInfo;\n"
+        f"    {body}\n"
+        f"    return {{{returned}\n"
+        "        config: {\n"
+        f"            {config}\n"
+        "        }\n"
+        "    };\n"
+        "}\n"
+    )
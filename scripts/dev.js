@@ -10,12 +10,9 @@ import { watch } from 'fs';
 import path from 'path';
 
 const config = {
-    watchPaths: [
-        'resources/views',
-        'resources/js/app',
-        'scripts/compiler'
-    ],
-    buildCommand: 'cd scripts && python3 build.py',
+    // Views và wraper.js do build.py --watch tự theo dõi; chỉ restart khi code compiler thay đổi
+    compilerPath: 'scripts/compiler',
+    buildCommand: ['python3', 'build.py', '--watch'],
     viteCommand: 'npm run dev'
 };
 
@@ -23,52 +20,55 @@ class DevServer {
     constructor() {
         this.buildProcess = null;
         this.viteProcess = null;
-        this.isBuilding = false;
+        this.restartTimer = null;
     }
 
     async start() {
         console.log('🚀 Starting Blade Compiler Development Server...\n');
         
-        // Initial build
-        await this.runBuild();
+        // Initial build, then the compiler stays warm and rebuilds changed views
+        this.startBuildWatcher();
         
         // Start Vite dev server
         this.startVite();
         
-        // Start file watcher
+        // Restart the build watcher when the compiler itself changes
         this.startWatcher();
         
         console.log('✅ Development server started!');
-        console.log('📝 Watching for changes in:', config.watchPaths.join(', '));
+        console.log('📝 Watching compiler sources in:', config.compilerPath);
         console.log('🌐 Vite dev server: http://localhost:5173');
-        console.log('⚡ Blade compiler: Auto-rebuild on file changes\n');
+        console.log('⚡ Blade compiler: build.py --watch recompiles changed views in-process\n');
     }
 
-    async runBuild() {
-        if (this.isBuilding) return;
+    startBuildWatcher() {
+        console.log('🔨 Building Blade templates (watch mode)...');
         
-        this.isBuilding = true;
-        console.log('🔨 Building Blade templates...');
+        // Spawn python directly (no shell) so kill() stops the watcher itself
+        const [command, ...args] = config.buildCommand;
+        const build = spawn(command, args, {
+            stdio: 'inherit',
+            cwd: path.join(process.cwd(), 'scripts')
+        });
+        this.buildProcess = build;
         
-        return new Promise((resolve, reject) => {
-            const build = spawn('sh', ['-c', 'cd scripts && python3 build.py'], { 
-                stdio: 'inherit',
-                cwd: process.cwd()
-            });
-            
-            build.on('close', (code) => {
-                this.isBuilding = false;
-                if (code === 0) {
-                    console.log('✅ Build completed successfully\n');
-                    resolve();
-                } else {
-                    console.log('❌ Build failed\n');
-                    reject(new Error(`Build failed with code ${code}`));
-                }
-            });
+        build.on('close', (code) => {
+            if (this.buildProcess !== build) return;
+            this.buildProcess = null;
+            if (code !== 0 && code !== null) {
+                console.log(`❌ Build watcher exited with code ${code}\n`);
+            }
         });
     }
 
+    restartBuildWatcher() {
+        if (this.buildProcess) {
+            this.buildProcess.kill();
+            this.buildProcess = null;
+        }
+        this.startBuildWatcher();
+    }
+
     startVite() {
         this.viteProcess = spawn('npm', ['run', 'dev'], {
             stdio: 'inherit',
@@ -77,13 +77,15 @@ class DevServer {
     }
 
     startWatcher() {
-        config.watchPaths.forEach(watchPath => {
-            watch(watchPath, { recursive: true }, (eventType, filename) => {
-                if (filename && (filename.endsWith('.blade.php') || filename.endsWith('.js'))) {
-                    console.log(`📝 File changed: ${filename}`);
-                    this.runBuild().catch(console.error);
-                }
-            });
+        watch(config.compilerPath, { recursive: true }, (eventType, filename) => {
+            if (filename && filename.endsWith('.py')) {
+                // Gom nhiều event của cùng một lần lưu thành một lần restart
+                clearTimeout(this.restartTimer);
+                this.restartTimer = setTimeout(() => {
+                    console.log(`📝 Compiler changed: ${filename}, restarting build watcher`);
+                    this.restartBuildWatcher();
+                }, 100);
+            }
         });
     }
 
@@ -146,6 +146,7 @@ public function boot(): void
         $this->registerVueDirective();
         $this->registerRegisterDirective();
         $this->registerViewTypeDirective();
+        $this->registerKeyedForeachPrecompiler();
         $this->templateService->registerDirectives();
         $this->blockService->registerDirectives();
         $this->followService->registerDirectives();
@@ -182,6 +183,21 @@ protected function registerDirectives(): void
 
     }
 
+    /**
+     * @foreach($items as $item, key: $item->id) - `key:` chỉ dùng cho keyed list phía client,
+     * bỏ đi trước khi Blade compile @foreach thành PHP
+     */
+    protected function registerKeyedForeachPrecompiler(): void
+    {
+        Blade::precompiler(function ($value) {
+            return preg_replace_callback('/@foreach\s*(\((?:[^()]++|(?1))*\))/', function ($matches) {
+                $expression = substr($matches[1], 1, -1);
+                $stripped = preg_replace('/^(.*?\s+as\s+.*?)\s*,\s*key\s*:\s*.+$/s', '$1', $expression);
+                return '@foreach(' . $stripped . ')';
+            }, $value);
+        });
+    }
+
     protected function registerViewTypeDirective(): void
     {
         Blade::directive('viewType', function ($expression) {